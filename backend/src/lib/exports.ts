@@ -0,0 +1,94 @@
+// JSON snapshots written to S3 by the ETL export phase, read over HTTP (S3 or a CDN in front of it)
+// from EXPORT_BASE_URL, e.g. https://<bucket>.s3.amazonaws.com/fpl-data/exports
+
+interface ExportPointer {
+  dataset: string;
+  version: string;
+  count: number;
+  page_size: number;
+  pages: number;
+  all: string;
+  page_template: string;
+}
+
+// How long a dataset's latest.json is trusted before it is fetched again
+const POINTER_TTL_MS = 60 * 1000;
+
+class ExportClient {
+  private baseUrl: string | null;
+  private pointers = new Map<string, { pointer: ExportPointer; fetchedAt: number }>();
+  // Versioned documents never change, so they are kept until a newer version replaces them
+  private documents = new Map<string, any>();
+
+  constructor() {
+    this.baseUrl = process.env.EXPORT_BASE_URL?.replace(/\/+$/, "") || null;
+  }
+
+  private async fetchJson(url: string): Promise<any> {
+    const response = await fetch(url);
+    if (!response.ok) {
+      throw new Error(`GET ${url} returned ${response.status}`);
+    }
+    return response.json();
+  }
+
+  private async latest(dataset: string): Promise<ExportPointer> {
+    const cached = this.pointers.get(dataset);
+    if (cached && Date.now() - cached.fetchedAt < POINTER_TTL_MS) {
+      return cached.pointer;
+    }
+    const pointer: ExportPointer = await this.fetchJson(`${this.baseUrl}/${dataset}/latest.json`);
+    if (cached && cached.pointer.version !== pointer.version) {
+      for (const key of this.documents.keys()) {
+        if (key.startsWith(`${dataset}/${cached.pointer.version}/`)) {
+          this.documents.delete(key);
+        }
+      }
+    }
+    this.pointers.set(dataset, { pointer, fetchedAt: Date.now() });
+    return pointer;
+  }
+
+  private async document(dataset: string, path: string): Promise<any> {
+    const key = `${dataset}/${path}`;
+    if (!this.documents.has(key)) {
+      this.documents.set(key, await this.fetchJson(`${this.baseUrl}/${key}`));
+    }
+    return this.documents.get(key);
+  }
+
+  /**
+   * A dataset's whole list as { data, count }, or null when exports are not configured
+   * or cannot be read, in which case the caller queries Snowflake.
+   */
+  async getAll(dataset: string): Promise<any | null> {
+    if (!this.baseUrl) return null;
+    try {
+      const pointer = await this.latest(dataset);
+      return await this.document(dataset, pointer.all);
+    } catch (error) {
+      console.warn(`Export ${dataset} unavailable, falling back to Snowflake:`, error);
+      return null;
+    }
+  }
+
+  /**
+   * One pre-paginated page as { data, pagination }, or null when it was not exported with
+   * this page size (or exports are unavailable).
+   */
+  async getPage(dataset: string, page: number, limit: number): Promise<any | null> {
+    if (!this.baseUrl) return null;
+    try {
+      const pointer = await this.latest(dataset);
+      if (pointer.page_size !== limit || page > Math.max(pointer.pages, 1)) {
+        return null;
+      }
+      return await this.document(dataset, pointer.page_template.replace("{page}", String(page)));
+    } catch (error) {
+      console.warn(`Export ${dataset} page ${page} unavailable, falling back to Snowflake:`, error);
+      return null;
+    }
+  }
+}
+
+export const exportClient = new ExportClient();
\ No newline at end of file
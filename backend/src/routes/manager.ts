@@ -1,5 +1,6 @@
 import { Router } from "express";
 import { authenticateToken } from "@/middleware/auth";
+import { snowflakeClient } from "@/lib/snowflake";
 
 const router = Router();
 
@@ -7,12 +8,43 @@ const router = Router();
 router.get("/:managerId", authenticateToken, async (req, res) => {
   try {
     const { managerId } = req.params;
+    const managerIdNum = parseInt(managerId, 10);
+    if (Number.isNaN(managerIdNum)) {
+      return res.status(400).json({
+        error: {
+          code: "INVALID_MANAGER_ID",
+          message: "managerId must be a number",
+        },
+      });
+    }
+
+    // Tracked managers' history is refreshed by the ETL once per gameweek
+    try {
+      const rows = await snowflakeClient.execute(
+        `
+        SELECT current_history, past_seasons, chips
+        FROM SOURCE_MANAGER_HISTORY
+        WHERE manager_id = ?
+        `,
+        [managerIdNum]
+      );
+      if (rows.length > 0) {
+        return res.status(200).json({
+          data: {
+            current: rows[0].CURRENT_HISTORY ?? [],
+            past: rows[0].PAST_SEASONS ?? [],
+            chips: rows[0].CHIPS ?? [],
+          },
+        });
+      }
+    } catch (error) {
+      console.warn("Manager history store unavailable, falling back to the FPL API:", error);
+    }
 
-    // Fetch manager history from FPL API
+    // Managers the ETL does not track are fetched from the FPL API
     const response = await fetch(
-      `https://fantasy.premierleague.com/api/entry/${managerId}/history/`
+      `https://fantasy.premierleague.com/api/entry/${managerIdNum}/history/`
     );
-    console.log(response)
 
     if (!response.ok) {
       return res.status(404).json({
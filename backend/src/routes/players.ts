@@ -1,9 +1,18 @@
 import { Router } from "express";
 import { authenticateToken } from "@/middleware/auth";
 import { snowflakeClient } from "@/lib/snowflake";
+import { exportClient } from "@/lib/exports";
 
 const router = Router();
 
+// Rank column paging each team/position filter, precomputed in SERVE_PLAYERS by the ETL serve phase
+const RANK_COLUMNS: Record<string, string> = {
+  "": "overall_rank",
+  team: "team_rank",
+  position: "position_rank",
+  "team,position": "team_position_rank",
+};
+
 // GET /api/v1/players
 router.get("/", authenticateToken, async (req, res) => {
   try {
@@ -14,40 +23,91 @@ router.get("/", authenticateToken, async (req, res) => {
     const limitNum = Math.min(100, Math.max(1, parseInt(limit as string, 10))); // Max 100 per page
     const offset = (pageNum - 1) * limitNum;
 
-    // Build dynamic WHERE clause based on filters
-    const conditions: string[] = [];
-
-    if (team) {
-      conditions.push(`team = ${team}`);
+    // Parse filters; prices are stored in 0.1M units (e.g., 65 = £6.5M)
+    const filters = { team, position, minPrice, maxPrice };
+    const parsed: Record<string, number | null> = {};
+    for (const [name, value] of Object.entries(filters)) {
+      parsed[name] = value ? parseInt(value as string, 10) : null;
+      if (value && Number.isNaN(parsed[name])) {
+        return res.status(400).json({
+          error: {
+            code: "INVALID_FILTER",
+            message: `${name} must be a number`,
+          },
+        });
+      }
     }
+    const teamNum = parsed.team;
+    const positionNum = parsed.position;
+    const minPriceNum = parsed.minPrice;
+    const maxPriceNum = parsed.maxPrice;
+
+    // Unfiltered pages are served from the ETL's pre-paginated JSON snapshot when exports are configured
+    if (Object.values(parsed).every((value) => value === null)) {
+      const exported = await exportClient.getPage("players", pageNum, limitNum);
+      if (exported) {
+        return res.status(200).json({
+          data: exported.data,
+          pagination: exported.pagination,
+        });
+      }
+    }
+
+    // Total count for pagination: a sum over the precomputed counts, 0 meaning any team or position
+    const countQuery = `
+      SELECT COALESCE(SUM(player_count), 0) as total
+      FROM SERVE_PLAYER_COUNTS
+      WHERE team = ?
+        AND element_type = ?
+        AND (? IS NULL OR now_cost >= ?)
+        AND (? IS NULL OR now_cost <= ?)
+    `;
+
+    const countResult = await snowflakeClient.execute(countQuery, [
+      teamNum ?? 0,
+      positionNum ?? 0,
+      minPriceNum, minPriceNum,
+      maxPriceNum, maxPriceNum,
+    ]);
+    const totalCount = Number(countResult[0]?.TOTAL || 0);
+
+    // Team and position filters page by their rank column; price ranges page by overall rank
+    const conditions: string[] = [];
+    const binds: (number | null)[] = [];
 
-    if (position) {
-      conditions.push(`element_type = ${position}`);
+    if (teamNum !== null) {
+      conditions.push("team = ?");
+      binds.push(teamNum);
     }
 
-    if (minPrice) {
-      // Prices are stored in 0.1M units (e.g., 65 = £6.5M)
-      conditions.push(`now_cost >= ${minPrice}`);
+    if (positionNum !== null) {
+      conditions.push("element_type = ?");
+      binds.push(positionNum);
     }
 
-    if (maxPrice) {
-      conditions.push(`now_cost <= ${maxPrice}`);
+    let orderColumn = "overall_rank";
+    let pageClause = `LIMIT ${limitNum} OFFSET ${offset}`;
+    if (minPriceNum !== null || maxPriceNum !== null) {
+      if (minPriceNum !== null) {
+        conditions.push("now_cost >= ?");
+        binds.push(minPriceNum);
+      }
+      if (maxPriceNum !== null) {
+        conditions.push("now_cost <= ?");
+        binds.push(maxPriceNum);
+      }
+    } else {
+      const filterKey = [teamNum !== null && "team", positionNum !== null && "position"].filter(Boolean).join(",");
+      orderColumn = RANK_COLUMNS[filterKey];
+      conditions.push(`${orderColumn} BETWEEN ? AND ?`);
+      binds.push(offset + 1, offset + limitNum);
+      pageClause = "";
     }
 
     const whereClause = conditions.length > 0
       ? `WHERE ${conditions.join(" AND ")}`
       : "";
 
-    // Get total count for pagination
-    const countQuery = `
-      SELECT COUNT(*) as total
-      FROM SOURCE_PLAYERS
-      ${whereClause}
-    `;
-
-    const countResult = await snowflakeClient.execute(countQuery);
-    const totalCount = countResult[0]?.TOTAL || 0;
-
     // Select relevant columns for player analytics
     const query = `
       SELECT
@@ -85,18 +145,17 @@ router.get("/", authenticateToken, async (req, res) => {
         penalties_saved,
         penalties_missed,
         status
-      FROM SOURCE_PLAYERS
+      FROM SERVE_PLAYERS
       ${whereClause}
-      ORDER BY total_points DESC
-      LIMIT ${limitNum}
-      OFFSET ${offset}
+      ORDER BY ${orderColumn}
+      ${pageClause}
     `;
 
-    const players = await snowflakeClient.execute(query);
+    const players = await snowflakeClient.execute(query, binds);
 
     const totalPages = Math.ceil(totalCount / limitNum);
 
-    res.status(200).json({
+    return res.status(200).json({
       data: players,
       pagination: {
         page: pageNum,
@@ -109,7 +168,7 @@ router.get("/", authenticateToken, async (req, res) => {
     });
   } catch (error) {
     console.error("Error fetching players:", error);
-    res.status(500).json({
+    return res.status(500).json({
       error: {
         code: "INTERNAL_ERROR",
         message: "Failed to fetch players from Snowflake",
@@ -1,12 +1,22 @@
 import { Router } from "express";
 import { authenticateToken } from "@/middleware/auth";
 import { snowflakeClient } from "@/lib/snowflake";
+import { exportClient } from "@/lib/exports";
 
 const router = Router();
 
 // GET /api/v1/teams
 router.get("/", authenticateToken, async (req, res) => {
   try {
+    // Served from the ETL's JSON snapshot when exports are configured
+    const exported = await exportClient.getAll("teams");
+    if (exported) {
+      return res.status(200).json({
+        data: exported.data,
+        count: exported.count,
+      });
+    }
+
     const query = `
       SELECT
         team_id,
@@ -38,13 +48,13 @@ router.get("/", authenticateToken, async (req, res) => {
 
     const teams = await snowflakeClient.execute(query);
 
-    res.status(200).json({
+    return res.status(200).json({
       data: teams,
       count: teams.length,
     });
   } catch (error) {
     console.error("Error fetching teams:", error);
-    res.status(500).json({
+    return res.status(500).json({
       error: {
         code: "INTERNAL_ERROR",
         message: "Failed to fetch teams from Snowflake",
@@ -53,6 +63,62 @@ router.get("/", authenticateToken, async (req, res) => {
   }
 });
 
+// GET /api/v1/teams/fixture-difficulty?event=12
+// Fixture runs starting at a gameweek (default: the next one), one precomputed row per team
+router.get("/fixture-difficulty", authenticateToken, async (req, res) => {
+  try {
+    const { event } = req.query;
+    const eventNum = event ? parseInt(event as string, 10) : null;
+    if (event && Number.isNaN(eventNum)) {
+      return res.status(400).json({
+        error: {
+          code: "INVALID_EVENT",
+          message: "event must be a gameweek number",
+        },
+      });
+    }
+
+    const query = `
+      SELECT
+        d.team_id,
+        t.name,
+        t.short_name,
+        d.event,
+        d.fixture_count,
+        d.difficulty,
+        d.opponents,
+        d.next_3_fixtures,
+        d.next_3_difficulty,
+        d.next_3_avg_difficulty,
+        d.next_5_fixtures,
+        d.next_5_difficulty,
+        d.next_5_avg_difficulty,
+        d.next_8_fixtures,
+        d.next_8_difficulty,
+        d.next_8_avg_difficulty
+      FROM DIM_FIXTURE_DIFFICULTY d
+      JOIN SOURCE_TEAMS t ON t.team_id = d.team_id
+      WHERE d.event = COALESCE(?, (SELECT MIN(event_id) FROM SOURCE_EVENTS WHERE is_next = TRUE))
+      ORDER BY d.next_5_avg_difficulty
+    `;
+
+    const teams = await snowflakeClient.execute(query, [eventNum]);
+
+    res.status(200).json({
+      data: teams,
+      count: teams.length,
+    });
+  } catch (error) {
+    console.error("Error fetching fixture difficulty:", error);
+    res.status(500).json({
+      error: {
+        code: "INTERNAL_ERROR",
+        message: "Failed to fetch fixture difficulty from Snowflake",
+      },
+    });
+  }
+});
+
 router.get("/test", async (req, res) => {
   try {
     const teams = await snowflakeClient.execute(
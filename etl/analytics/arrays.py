@@ -0,0 +1,18 @@
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+def fetch_arrays(snowflake_client, sql: str, params: Optional[tuple] = None) -> Dict[str, np.ndarray]:
+    """Run a query through the Arrow fetch path and return one NumPy array per column, keyed by lower-case name"""
+    table = snowflake_client.fetch_arrow(sql, params)
+    return {
+        name.lower(): table.column(name).to_numpy(zero_copy_only=False)
+        for name in table.column_names
+    }
+
+
+def to_rows(arrays: Dict[str, np.ndarray], columns: List[str], mask: Any = None) -> list:
+    """Rows of plain Python values in column order, optionally filtered by a boolean mask"""
+    selected = [arrays[name] if mask is None else arrays[name][mask] for name in columns]
+    return list(zip(*(column.tolist() for column in selected)))
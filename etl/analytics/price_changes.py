@@ -0,0 +1,104 @@
+import sys
+import os
+import logging
+from datetime import date
+from typing import Dict, Optional
+
+import numpy as np
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics.arrays import fetch_arrays
+
+logger = logging.getLogger(__name__)
+
+# Daily snapshot columns read from SOURCE_TRANSFER_HISTORY, nulls already replaced
+SNAPSHOTS_SQL = """
+SELECT
+    player_id,
+    extraction_date,
+    COALESCE(now_cost, 0) AS now_cost,
+    COALESCE(transfers_in, 0) AS transfers_in,
+    COALESCE(transfers_out, 0) AS transfers_out,
+    COALESCE(total_ownership, 0) AS total_ownership,
+    COALESCE(selected_by_percent, 0) AS selected_by_percent
+FROM FPL_STATS.FPL_SCHEMA.SOURCE_TRANSFER_HISTORY
+"""
+
+# Columns of SOURCE_PRICE_CHANGES, in the order compute_price_changes returns them
+PRICE_CHANGE_COLUMNS = [
+    "player_id",
+    "date",
+    "previous_date",
+    "now_cost",
+    "price_change",
+    "net_transfers",
+    "net_transfers_since_change",
+    "transfer_momentum",
+    "ownership_change",
+    "selected_by_percent_change",
+]
+
+
+def load_snapshots(snowflake_client, since: Optional[date] = None) -> Dict[str, np.ndarray]:
+    """
+    Daily snapshots in SOURCE_TRANSFER_HISTORY as one NumPy array per column: all of them, or
+    those from a date on. The date itself is included so the first day after it still has the
+    snapshot it is compared with.
+    """
+    if since:
+        return fetch_arrays(snowflake_client, f"{SNAPSHOTS_SQL}WHERE extraction_date >= %s", (since,))
+    return fetch_arrays(snowflake_client, SNAPSHOTS_SQL)
+
+
+def compute_price_changes(snapshots: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Day-over-day changes for every player, from snapshots in any order.
+
+    Snapshots are sorted by player and date once, so each row's previous snapshot is the row
+    before it; every column is then a single array operation over the whole history. A
+    player's first snapshot has nothing to diff against and produces no row.
+
+    net_transfers is the change in (transfers_in - transfers_out) since the previous snapshot,
+    and transfer_momentum the same as a fraction of the previous day's ownership.
+    net_transfers_since_change accumulates net transfers since the player's last price change
+    (or first snapshot), the quantity FPL's price changes are driven by.
+    """
+    player_ids = snapshots["player_id"].astype(np.int64)
+    dates = snapshots["extraction_date"].astype("datetime64[D]")
+    order = np.lexsort((dates, player_ids))
+    player_ids = player_ids[order]
+    dates = dates[order]
+    cost = snapshots["now_cost"].astype(np.int64)[order]
+    net = (snapshots["transfers_in"].astype(np.int64) - snapshots["transfers_out"].astype(np.int64))[order]
+    ownership = snapshots["total_ownership"].astype(np.int64)[order]
+    selected = snapshots["selected_by_percent"].astype(np.float64)[order]
+
+    # Rows whose previous row is the same player's previous snapshot
+    current = np.flatnonzero(player_ids[1:] == player_ids[:-1]) + 1
+    previous = current - 1
+
+    price_change = cost[current] - cost[previous]
+    net_transfers = net[current] - net[previous]
+
+    # Segmented cumulative sum: restart at each player's first diff and after each price change
+    restart = np.ones(len(current), dtype=bool)
+    restart[1:] = (previous[1:] != current[:-1]) | (price_change[:-1] != 0)
+    running = np.cumsum(net_transfers)
+    offsets = np.maximum.accumulate(np.where(restart, np.arange(len(current)), 0))
+    net_since_change = running - running[offsets] + net_transfers[offsets]
+
+    return {
+        "player_id": player_ids[current],
+        "date": dates[current],
+        "previous_date": dates[previous],
+        "now_cost": cost[current],
+        "price_change": price_change,
+        "net_transfers": net_transfers,
+        "net_transfers_since_change": net_since_change,
+        "transfer_momentum": net_transfers / np.maximum(ownership[previous], 1),
+        "ownership_change": ownership[current] - ownership[previous],
+        "selected_by_percent_change": np.round(selected[current] - selected[previous], 2),
+    }
+
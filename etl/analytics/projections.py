@@ -0,0 +1,252 @@
+import sys
+import os
+import logging
+from dataclasses import dataclass
+from typing import Dict
+
+import numpy as np
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics.arrays import fetch_arrays
+
+logger = logging.getLogger(__name__)
+
+# Availability is FPL's chance of playing where given, otherwise 0 for injured, suspended or unavailable players
+PLAYERS_SQL = """
+SELECT
+    player_id,
+    team,
+    element_type,
+    COALESCE(chance_of_playing_next_round, CASE WHEN status IN ('i', 's', 'u', 'n') THEN 0 ELSE 100 END) / 100 AS availability
+FROM FPL_STATS.FPL_SCHEMA.SOURCE_PLAYERS
+"""
+
+HISTORY_SQL = """
+SELECT
+    element AS player_id,
+    round,
+    COALESCE(minutes, 0) AS minutes,
+    COALESCE(expected_goals, 0) AS expected_goals,
+    COALESCE(expected_assists, 0) AS expected_assists,
+    COALESCE(expected_goals_conceded, 0) AS expected_goals_conceded,
+    COALESCE(saves, 0) AS saves,
+    COALESCE(bonus, 0) AS bonus
+FROM FPL_STATS.FPL_SCHEMA.SOURCE_PLAYER_HISTORY
+WHERE round IS NOT NULL
+"""
+
+# DIM_STANDINGS carries SOURCE_TEAMS' strength ratings alongside the league table
+TEAMS_SQL = """
+SELECT
+    team_id,
+    strength_attack_home,
+    strength_attack_away,
+    strength_defence_home,
+    strength_defence_away,
+    played,
+    points
+FROM FPL_STATS.FPL_SCHEMA.DIM_STANDINGS
+"""
+
+FIXTURES_SQL = """
+SELECT
+    fixture_id,
+    event,
+    team_h,
+    team_a
+FROM FPL_STATS.FPL_SCHEMA.SOURCE_FIXTURES
+WHERE finished = FALSE AND event IS NOT NULL
+"""
+
+# Scoring by element_type (1 GK, 2 DEF, 3 MID, 4 FWD); index 0 is unused
+GOAL_POINTS = np.array([0, 6, 6, 5, 4])
+ASSIST_POINTS = 3
+CLEAN_SHEET_POINTS = np.array([0, 4, 4, 1, 0])
+# Goalkeepers and defenders lose a point per two goals conceded
+GOALS_CONCEDED_POINTS = np.array([0, -0.5, -0.5, 0, 0])
+SAVES_PER_POINT = 3
+
+# Minutes expectations weight recent rounds more: each round back counts this much less
+MINUTES_DECAY = 0.7
+RECENT_ROUNDS = 6
+
+# Per-90 rates are shrunk towards the position average as if the player had also played this long at it
+PRIOR_MINUTES = 270
+
+# How strongly opponent strength moves rates: (league average / opponent strength) ** elasticity
+STRENGTH_ELASTICITY = 2.0
+
+# League form: points per game relative to the league average, shrunk towards it as if every team had
+# also played this many average games, moves rates by form ** elasticity on top of the strength ratings
+FORM_PRIOR_GAMES = 5
+FORM_ELASTICITY = 0.5
+
+# Columns of SOURCE_PLAYER_PROJECTIONS, in the order compute_projections returns them
+PROJECTION_COLUMNS = [
+    "player_id",
+    "event",
+    "fixture_count",
+    "expected_minutes",
+    "expected_goals",
+    "expected_assists",
+    "expected_goals_conceded",
+    "clean_sheet_probability",
+    "expected_points",
+]
+
+
+@dataclass
+class ProjectionInputs:
+    """Column arrays for each input of the projection, as returned by their queries"""
+    players: Dict[str, np.ndarray]
+    history: Dict[str, np.ndarray]
+    teams: Dict[str, np.ndarray]
+    fixtures: Dict[str, np.ndarray]
+
+
+def load_projection_inputs(snowflake_client) -> ProjectionInputs:
+    """Fetch every input once through the Arrow path"""
+    return ProjectionInputs(
+        players=fetch_arrays(snowflake_client, PLAYERS_SQL),
+        history=fetch_arrays(snowflake_client, HISTORY_SQL),
+        teams=fetch_arrays(snowflake_client, TEAMS_SQL),
+        fixtures=fetch_arrays(snowflake_client, FIXTURES_SQL),
+    )
+
+
+def _player_rates(inputs: ProjectionInputs, player_ids: np.ndarray, positions: np.ndarray) -> Dict[str, np.ndarray]:
+    """Per-90 rates over the season and recency-weighted minutes, one value per player"""
+    history = inputs.history
+    count = len(player_ids)
+    known = np.isin(history["player_id"].astype(np.int64), player_ids)
+    index = np.searchsorted(player_ids, history["player_id"].astype(np.int64)[known])
+    minutes = history["minutes"].astype(np.float64)[known]
+    rounds = history["round"].astype(np.int64)[known]
+
+    total_minutes = np.bincount(index, minutes, count)
+    rates = {}
+    for name in ("expected_goals", "expected_assists", "expected_goals_conceded", "saves", "bonus"):
+        totals = np.bincount(index, history[name].astype(np.float64)[known], count)
+        # Position averages per 90, then each player's rate shrunk towards theirs
+        position_totals = np.bincount(positions, totals, 5)
+        position_minutes = np.bincount(positions, total_minutes, 5)
+        prior = np.divide(position_totals, position_minutes, out=np.zeros(5), where=position_minutes > 0)
+        rates[name] = (totals + prior[positions] * PRIOR_MINUTES) / (total_minutes + PRIOR_MINUTES) * 90
+
+    # Recent rounds, most recent weighted 1 and each earlier round MINUTES_DECAY times less
+    latest = rounds.max() if len(rounds) else 0
+    recent = rounds > latest - RECENT_ROUNDS
+    weights = np.where(recent, MINUTES_DECAY ** (latest - rounds), 0)
+    weight_totals = np.bincount(index, weights, count)
+
+    def weighted_mean(values: np.ndarray) -> np.ndarray:
+        sums = np.bincount(index, weights * values, count)
+        return np.divide(sums, weight_totals, out=np.zeros(count), where=weight_totals > 0)
+
+    rates["minutes"] = weighted_mean(minutes)
+    rates["appearance_probability"] = weighted_mean((minutes > 0).astype(np.float64))
+    rates["sixty_probability"] = weighted_mean((minutes >= 60).astype(np.float64))
+    return rates
+
+
+def _team_form(teams: Dict[str, np.ndarray], team_order: np.ndarray) -> np.ndarray:
+    """Each team's shrunk points per game over the league average, 1 for every team before a game is played"""
+    played = teams["played"].astype(np.float64)[team_order]
+    points = teams["points"].astype(np.float64)[team_order]
+    if played.sum() == 0 or points.sum() == 0:
+        return np.ones(len(played))
+    league_rate = points.sum() / played.sum()
+    return (points + league_rate * FORM_PRIOR_GAMES) / (played + FORM_PRIOR_GAMES) / league_rate
+
+
+def compute_projections(inputs: ProjectionInputs) -> Dict[str, np.ndarray]:
+    """
+    Expected points for every player in every upcoming gameweek they have a fixture in.
+
+    Each fixture gives one side per team; players are paired with their team's sides by
+    a players x sides comparison, and every quantity is then an array over those pairs:
+    per-90 xG, xA and xGC scaled by expected minutes and the opponent's home or away
+    strength and league form, a Poisson clean sheet probability, and FPL scoring by position. Pairs are
+    summed into players x gameweeks with one bincount per column, so double gameweeks add
+    up and blank gameweeks produce no row.
+    """
+    players = inputs.players
+    order = np.argsort(players["player_id"].astype(np.int64))
+    player_ids = players["player_id"].astype(np.int64)[order]
+    player_teams = players["team"].astype(np.int64)[order]
+    positions = np.clip(players["element_type"].astype(np.int64)[order], 0, 4)
+    availability = players["availability"].astype(np.float64)[order]
+    rates = _player_rates(inputs, player_ids, positions)
+
+    teams = inputs.teams
+    team_order = np.argsort(teams["team_id"].astype(np.int64))
+    team_ids = teams["team_id"].astype(np.int64)[team_order]
+    strength = {name: teams[name].astype(np.float64)[team_order] for name in teams if name.startswith("strength_")}
+    average_attack = np.mean([strength["strength_attack_home"], strength["strength_attack_away"]])
+    average_defence = np.mean([strength["strength_defence_home"], strength["strength_defence_away"]])
+    form = _team_form(teams, team_order)
+
+    # Both sides of every fixture: the team, its opponent, whether it is at home, and the gameweek
+    fixtures = inputs.fixtures
+    team_h = fixtures["team_h"].astype(np.int64)
+    team_a = fixtures["team_a"].astype(np.int64)
+    side_team = np.concatenate([team_h, team_a])
+    side_opponent = np.searchsorted(team_ids, np.concatenate([team_a, team_h]))
+    side_home = np.concatenate([np.ones(len(team_h), dtype=bool), np.zeros(len(team_a), dtype=bool)])
+    events, side_event = np.unique(fixtures["event"].astype(np.int64), return_inverse=True)
+    side_event = np.concatenate([side_event, side_event])
+
+    # Opponent strength faced: its away ratings when the player is at home, and vice versa
+    opponent_attack = np.where(side_home, strength["strength_attack_away"][side_opponent], strength["strength_attack_home"][side_opponent])
+    opponent_defence = np.where(side_home, strength["strength_defence_away"][side_opponent], strength["strength_defence_home"][side_opponent])
+    # and its league form: in-form opponents concede less and score more
+    opponent_form = form[side_opponent]
+    attack_multiplier = (average_defence / opponent_defence) ** STRENGTH_ELASTICITY / opponent_form ** FORM_ELASTICITY
+    conceded_multiplier = (opponent_attack / average_attack) ** STRENGTH_ELASTICITY * opponent_form ** FORM_ELASTICITY
+
+    pair_player, pair_side = np.nonzero(player_teams[:, None] == side_team[None, :])
+    position = positions[pair_player]
+    available = availability[pair_player]
+    minutes = rates["minutes"][pair_player] * available
+    share = minutes / 90
+
+    goals = rates["expected_goals"][pair_player] * share * attack_multiplier[pair_side]
+    assists = rates["expected_assists"][pair_player] * share * attack_multiplier[pair_side]
+    conceded_per_90 = rates["expected_goals_conceded"][pair_player] * conceded_multiplier[pair_side]
+    conceded = conceded_per_90 * share
+    clean_sheet = np.exp(-conceded_per_90)
+    sixty = rates["sixty_probability"][pair_player] * available
+
+    points = (
+        rates["appearance_probability"][pair_player] * available
+        + sixty
+        + GOAL_POINTS[position] * goals
+        + ASSIST_POINTS * assists
+        + CLEAN_SHEET_POINTS[position] * clean_sheet * sixty
+        + GOALS_CONCEDED_POINTS[position] * conceded
+        + np.where(position == 1, rates["saves"][pair_player] * share / SAVES_PER_POINT, 0)
+        + rates["bonus"][pair_player] * share
+    )
+
+    # Sum pairs into players x gameweeks
+    cell = pair_player * len(events) + side_event[pair_side]
+    size = len(player_ids) * len(events)
+
+    def per_gameweek(values: np.ndarray) -> np.ndarray:
+        return np.bincount(cell, values, size).reshape(len(player_ids), len(events))
+
+    fixture_count = per_gameweek(np.ones(len(cell)))
+    rows, columns = np.nonzero(fixture_count)
+    return {
+        "player_id": player_ids[rows],
+        "event": events[columns],
+        "fixture_count": fixture_count[rows, columns].astype(np.int64),
+        "expected_minutes": np.round(per_gameweek(minutes)[rows, columns], 1),
+        "expected_goals": np.round(per_gameweek(goals)[rows, columns], 3),
+        "expected_assists": np.round(per_gameweek(assists)[rows, columns], 3),
+        "expected_goals_conceded": np.round(per_gameweek(conceded)[rows, columns], 3),
+        "clean_sheet_probability": np.round(per_gameweek(clean_sheet)[rows, columns] / fixture_count[rows, columns], 3),
+        "expected_points": np.round(per_gameweek(points)[rows, columns], 2),
+    }
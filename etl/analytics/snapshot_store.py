@@ -0,0 +1,194 @@
+import sys
+import os
+import re
+import logging
+import argparse
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pyarrow as pa
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger(__name__)
+
+# Local directory the store lives in unless one is given
+DEFAULT_STORE_DIR = os.getenv("SNAPSHOT_STORE_DIR", "snapshots")
+
+BOOTSTRAP_FILENAME = re.compile(r"^bootstrap_(\d{8})\.json\.gz$")
+DAY_FILENAME = re.compile(r"^players_(\d{8})\.arrow$")
+
+# Bootstrap element fields kept per player per day, and their column types
+SNAPSHOT_SCHEMA = pa.schema([
+    ("date", pa.date32()),
+    ("player_id", pa.int32()),
+    ("now_cost", pa.int32()),
+    ("transfers_in", pa.int64()),
+    ("transfers_out", pa.int64()),
+    ("transfers_in_event", pa.int64()),
+    ("transfers_out_event", pa.int64()),
+    ("selected_by_percent", pa.float64()),
+    ("form", pa.float64()),
+])
+
+
+def _number(value: Any, cast=float):
+    # The API sends selected_by_percent and form as strings, and some fields as null
+    if value in (None, ""):
+        return cast(0)
+    return cast(float(value))
+
+
+def snapshot_table(day: date, elements: List[Dict[str, Any]]) -> pa.Table:
+    """One day's bootstrap elements as a table sorted by player_id"""
+    elements = sorted(elements, key=lambda element: element["id"])
+    columns = {"date": [day] * len(elements), "player_id": [element["id"] for element in elements]}
+    for field in SNAPSHOT_SCHEMA.names[2:]:
+        cast = float if pa.types.is_floating(SNAPSHOT_SCHEMA.field(field).type) else int
+        columns[field] = [_number(element.get(field), cast) for element in elements]
+    return pa.table(columns, schema=SNAPSHOT_SCHEMA)
+
+
+class SnapshotStore:
+    """
+    Daily player snapshots as one uncompressed Arrow IPC file per day, {root}/players_{YYYYMMDD}.arrow.
+
+    The filename indexes the date and rows are sorted by player_id, so a date range is a
+    list of files and a player is a binary search within each. Files are opened with memory
+    mapping and sliced without copying; only the pages a query touches are read from disk.
+    """
+
+    def __init__(self, root: str = DEFAULT_STORE_DIR):
+        self.root = root
+
+    def path_for(self, day: date) -> str:
+        return os.path.join(self.root, f"players_{day.strftime('%Y%m%d')}.arrow")
+
+    def dates(self) -> List[date]:
+        if not os.path.isdir(self.root):
+            return []
+        days = []
+        for name in os.listdir(self.root):
+            match = DAY_FILENAME.match(name)
+            if match:
+                days.append(datetime.strptime(match.group(1), "%Y%m%d").date())
+        return sorted(days)
+
+    def append(self, day: date, elements: List[Dict[str, Any]]) -> int:
+        """Write one day's snapshot, replacing any earlier file for that day; returns the player count"""
+        table = snapshot_table(day, elements)
+        os.makedirs(self.root, exist_ok=True)
+        path = self.path_for(day)
+        # Readers may have the old file mapped, so write aside and rename over it
+        temp_path = f"{path}.tmp"
+        with pa.OSFile(temp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, SNAPSHOT_SCHEMA) as writer:
+                writer.write_table(table)
+        os.replace(temp_path, path)
+        return table.num_rows
+
+    def open_day(self, day: date) -> pa.Table:
+        """A day's snapshot, memory-mapped; its buffers point into the file rather than being copied"""
+        source = pa.memory_map(self.path_for(day), "r")
+        return pa.ipc.open_file(source).read_all()
+
+    def read_range(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        player_ids: Optional[Iterable[int]] = None,
+        columns: Optional[List[str]] = None
+    ) -> pa.Table:
+        """
+        Snapshots from start to end inclusive, ordered by date then player_id.
+
+        Without player_ids the result is a zero-copy concatenation of the mapped day files.
+        With them, each day is reduced to those players by binary search on player_id.
+        """
+        days = [day for day in self.dates() if (start is None or day >= start) and (end is None or day <= end)]
+        wanted = np.unique(np.fromiter(player_ids, dtype=np.int32)) if player_ids is not None else None
+        tables = []
+        for day in days:
+            table = self.open_day(day)
+            if columns:
+                table = table.select(columns if "player_id" in columns else ["player_id", *columns])
+            if wanted is not None:
+                table = _take_players(table, wanted)
+            tables.append(table.select(columns) if columns else table)
+        if not tables:
+            schema = pa.schema([SNAPSHOT_SCHEMA.field(name) for name in columns]) if columns else SNAPSHOT_SCHEMA
+            return schema.empty_table()
+        return pa.concat_tables(tables)
+
+    def player_history(self, player_id: int, start: Optional[date] = None, end: Optional[date] = None) -> pa.Table:
+        """Every snapshot of one player; each day contributes a zero-copy slice of its file"""
+        return self.read_range(start, end, [player_id])
+
+
+def _take_players(table: pa.Table, player_ids: np.ndarray) -> pa.Table:
+    ids = table.column("player_id").to_numpy()
+    lo = np.searchsorted(ids, player_ids, side="left")
+    hi = np.searchsorted(ids, player_ids, side="right")
+    found = lo < hi
+    if found.sum() == 1:
+        index = int(np.flatnonzero(found)[0])
+        return table.slice(int(lo[index]), int(hi[index] - lo[index]))
+    return table.take(pa.array(lo[found]))
+
+
+def build_snapshot_store(store: SnapshotStore, s3_datalake=None, rebuild: bool = False) -> List[date]:
+    """
+    Add every daily bootstrap artifact in S3 that the store does not have yet.
+
+    Days already in the store are skipped, so running this after each daily extract only
+    downloads the new artifact. Returns the days added.
+    """
+    if s3_datalake is None:
+        from s3.s3_datalake import S3DataLake
+        s3_datalake = S3DataLake()
+
+    existing = set() if rebuild else set(store.dates())
+    added = []
+    for filename in s3_datalake.list_json("bootstrap"):
+        match = BOOTSTRAP_FILENAME.match(filename)
+        if not match:
+            continue
+        day = datetime.strptime(match.group(1), "%Y%m%d").date()
+        if day in existing:
+            continue
+        data = s3_datalake.load_json("bootstrap", filename)
+        if not data or not data.get("elements"):
+            logger.warning(f"No players in {filename}, skipping")
+            continue
+        players = store.append(day, data["elements"])
+        added.append(day)
+        logger.info(f"Added {players} players for {day} to {store.root}")
+    logger.info(f"Snapshot store has {len(existing) + len(added)} days, {len(added)} new")
+    return added
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Build or query the local Arrow store of daily player snapshots"
+    )
+    parser.add_argument("command", choices=["build", "show"])
+    parser.add_argument("--dir", default=DEFAULT_STORE_DIR, help=f"Store directory (default: {DEFAULT_STORE_DIR})")
+    parser.add_argument("--rebuild", action="store_true", help="With build, rewrite days already in the store")
+    parser.add_argument("--player", type=int, action="append", help="With show, players to show (default: all)")
+    parser.add_argument("--start", type=date.fromisoformat, help="With show, first date (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, help="With show, last date (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    store = SnapshotStore(args.dir)
+    if args.command == "build":
+        build_snapshot_store(store, rebuild=args.rebuild)
+    else:
+        print(store.read_range(args.start, args.end, args.player).to_string(preview_cols=20))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+import sys
+import os
+import logging
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger(__name__)
+
+# Trailing windows, in daily snapshots, that net transfers are summed over
+WINDOWS = (1, 3, 7)
+
+# Daily net transfers kept in the state so the longest window can span runs
+HISTORY_DAYS = max(WINDOWS) - 1
+
+FEATURE_STATE_DATA_TYPE = "analytics"
+FEATURE_STATE_FILENAME = "transfer_features_state.json"
+
+# Columns of SOURCE_TRANSFER_FEATURES, in the order compute_transfer_features returns them
+FEATURE_COLUMNS = [
+    "player_id",
+    "date",
+    "now_cost",
+    *(f"net_transfers_{window}d" for window in WINDOWS),
+    *(f"transfer_share_{window}d" for window in WINDOWS),
+    "days_since_price_change",
+    "ownership_change",
+    "ownership_acceleration",
+]
+
+
+@dataclass
+class FeatureState:
+    """
+    Per-player values at the last processed snapshot, enough to continue every window.
+
+    Lists are aligned with player_ids; recent_net_transfers holds the last HISTORY_DAYS
+    daily net transfers, oldest first, one list per day.
+    """
+    last_date: Optional[str] = None
+    player_ids: List[int] = field(default_factory=list)
+    now_cost: List[int] = field(default_factory=list)
+    net_transfers: List[int] = field(default_factory=list)
+    ownership: List[int] = field(default_factory=list)
+    ownership_change: List[int] = field(default_factory=list)
+    days_since_price_change: List[int] = field(default_factory=list)
+    recent_net_transfers: List[List[int]] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FeatureState":
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in names})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _aligned(player_ids: np.ndarray, state: FeatureState, values: List[Any], default: float) -> np.ndarray:
+    """A state list spread over player_ids, with default for players the state has not seen"""
+    aligned = np.full(len(player_ids), default, dtype=np.float64)
+    if state.player_ids:
+        aligned[np.searchsorted(player_ids, state.player_ids)] = values
+    return aligned
+
+
+def compute_transfer_features(
+    snapshots: Dict[str, np.ndarray],
+    state: Optional[FeatureState] = None
+) -> Tuple[Dict[str, np.ndarray], FeatureState]:
+    """
+    Features for every player on every snapshot day after state.last_date, and the state after them.
+
+    Snapshots are pivoted into day x player grids, one row per new day plus a first row
+    from the state, and carried forward over days a player is missing. Each feature is then
+    one array operation over the grid:
+
+    - net_transfers_{1,3,7}d: change in (transfers_in - transfers_out) over the trailing window
+    - transfer_share_{1,3,7}d: the same as a fraction of ownership at the previous snapshot
+    - days_since_price_change: snapshots since now_cost last moved (0 on the day it moves)
+    - ownership_change and ownership_acceleration: first and second differences of ownership
+
+    Players first seen in these snapshots start with no movement. Without a state the whole
+    history is processed; with one, only snapshots after its last_date are used.
+    """
+    state = state or FeatureState()
+    dates = snapshots["extraction_date"].astype("datetime64[D]")
+    keep = dates > np.datetime64(state.last_date, "D") if state.last_date else np.ones(len(dates), dtype=bool)
+    dates = dates[keep]
+    snapshot_ids = snapshots["player_id"].astype(np.int64)[keep]
+
+    days = np.unique(dates)
+    if len(days) == 0:
+        return {name: np.empty(0) for name in FEATURE_COLUMNS}, state
+
+    player_ids = np.union1d(np.asarray(state.player_ids, dtype=np.int64), snapshot_ids)
+    rows = np.searchsorted(days, dates)
+    columns = np.searchsorted(player_ids, snapshot_ids)
+    observed = np.zeros((len(days), len(player_ids)), dtype=bool)
+    observed[rows, columns] = True
+
+    # Players without a state row take their first observation, so they start with no movement
+    is_new = ~np.isin(player_ids, state.player_ids)
+    first_seen = observed.argmax(axis=0)
+    grid_rows = np.arange(len(days) + 1)[:, None]
+
+    def pivot(values: np.ndarray, previous: np.ndarray) -> np.ndarray:
+        grid = np.full((len(days) + 1, len(player_ids)), np.nan)
+        grid[0] = previous
+        grid[rows + 1, columns] = values[keep]
+        grid[0, is_new] = grid[first_seen[is_new] + 1, np.flatnonzero(is_new)]
+        # Carry the last observation forward over days a player is missing
+        last_valid = np.maximum.accumulate(np.where(np.isnan(grid), 0, grid_rows), axis=0)
+        return grid[last_valid, np.arange(len(player_ids))]
+
+    cost = pivot(snapshots["now_cost"].astype(np.float64), _aligned(player_ids, state, state.now_cost, np.nan))
+    net = pivot(
+        (snapshots["transfers_in"].astype(np.int64) - snapshots["transfers_out"].astype(np.int64)).astype(np.float64),
+        _aligned(player_ids, state, state.net_transfers, np.nan)
+    )
+    ownership = pivot(snapshots["total_ownership"].astype(np.float64), _aligned(player_ids, state, state.ownership, np.nan))
+
+    price_change = np.diff(cost, axis=0)
+    daily_net = np.diff(net, axis=0)
+    ownership_change = np.diff(ownership, axis=0)
+    previous_ownership_change = np.vstack([
+        _aligned(player_ids, state, state.ownership_change, 0)[None, :],
+        ownership_change[:-1],
+    ])
+
+    # Trailing window sums from one cumulative sum over the state's recent days and the new ones
+    recent = np.zeros((HISTORY_DAYS, len(player_ids)))
+    for day, values in enumerate(state.recent_net_transfers):
+        recent[day] = _aligned(player_ids, state, values, 0)
+    history = np.vstack([recent, daily_net])
+    running = np.vstack([np.zeros((1, len(player_ids))), np.cumsum(history, axis=0)])
+    end = slice(HISTORY_DAYS + 1, HISTORY_DAYS + len(days) + 1)
+    window_sums = {
+        window: running[end] - running[HISTORY_DAYS + 1 - window:HISTORY_DAYS + len(days) + 1 - window]
+        for window in WINDOWS
+    }
+
+    # Days since the last price change, continuing the state's count until the first change here
+    day_index = np.arange(len(days))[:, None]
+    last_change = np.maximum.accumulate(np.where(price_change != 0, day_index, -1), axis=0)
+    previous_days_since = _aligned(player_ids, state, state.days_since_price_change, 0)
+    # New players count from their first snapshot
+    previous_days_since[is_new] = -(first_seen[is_new] + 1)
+    days_since_change = np.where(
+        last_change >= 0,
+        day_index - last_change,
+        previous_days_since[None, :] + day_index + 1
+    )
+
+    day_rows, player_columns = np.nonzero(observed)
+    ownership_base = np.maximum(ownership[:-1], 1)
+    features = {
+        "player_id": player_ids[player_columns],
+        "date": days[day_rows],
+        "now_cost": cost[1:][day_rows, player_columns].astype(np.int64),
+        **{
+            f"net_transfers_{window}d": sums[day_rows, player_columns].astype(np.int64)
+            for window, sums in window_sums.items()
+        },
+        **{
+            f"transfer_share_{window}d": (sums / ownership_base)[day_rows, player_columns]
+            for window, sums in window_sums.items()
+        },
+        "days_since_price_change": days_since_change[day_rows, player_columns].astype(np.int64),
+        "ownership_change": ownership_change[day_rows, player_columns].astype(np.int64),
+        "ownership_acceleration": (ownership_change - previous_ownership_change)[day_rows, player_columns].astype(np.int64),
+    }
+
+    new_state = FeatureState(
+        last_date=str(days[-1]),
+        player_ids=player_ids.tolist(),
+        now_cost=cost[-1].astype(np.int64).tolist(),
+        net_transfers=net[-1].astype(np.int64).tolist(),
+        ownership=ownership[-1].astype(np.int64).tolist(),
+        ownership_change=ownership_change[-1].astype(np.int64).tolist(),
+        days_since_price_change=days_since_change[-1].astype(np.int64).tolist(),
+        recent_net_transfers=history[-HISTORY_DAYS:].astype(np.int64).tolist(),
+    )
+    return features, new_state
+
+
+def load_feature_state(s3_datalake) -> Optional[FeatureState]:
+    data = s3_datalake.load_json(FEATURE_STATE_DATA_TYPE, FEATURE_STATE_FILENAME)
+    return FeatureState.from_dict(data) if data else None
+
+
+def save_feature_state(s3_datalake, state: FeatureState) -> None:
+    s3_datalake.save_json(state.to_dict(), FEATURE_STATE_DATA_TYPE, FEATURE_STATE_FILENAME)
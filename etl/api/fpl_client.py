@@ -1,32 +1,57 @@
 import requests
 import time
 import logging
-from typing import List, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, List, Dict, Iterable, Iterator, Optional, Tuple, TypeVar
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
 logger = logging.getLogger(__name__)
 
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+@dataclass
+class ConditionalResponse:
+    """
+    Outcome of a conditional GET: status 200 with a payload, 304 when unchanged since the
+    validators sent, 404 when the resource does not exist, or None when every attempt failed.
+    """
+    status: Optional[int]
+    payload: Optional[Dict] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
 
 class FPLAPIClient:
     def __init__(
             self,
             base_url: str = "https://fantasy.premierleague.com/api", 
             rate_limit_delay: float = 0.1,
-            max_retries: int = 3
+            max_retries: int = 3,
+            rate_limiter=None
         ):
         self.base_url = base_url
         self.rate_limit_delay = rate_limit_delay
         self.max_retries = max_retries
+        # A shared RateLimiter bounds the request rate across threads; without one each call sleeps rate_limit_delay
+        self.rate_limiter = rate_limiter
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'FPL-ETL-Pipeline/1.0'
         })
     
+    def _wait_for_slot(self) -> None:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        else:
+            time.sleep(self.rate_limit_delay)
+
     def get_with_retry(self, url: str) -> Optional[Dict]:
         """Get data from URL with retry logic and exponential backoff"""
         for attempt in range(self.max_retries):
             try:
-                time.sleep(self.rate_limit_delay)
+                self._wait_for_slot()
                 response = self.session.get(url, timeout=30)
                 response.raise_for_status()
                 return response.json()
@@ -38,6 +63,42 @@ class FPLAPIClient:
                 time.sleep(2 ** attempt)
         return None
     
+    def get_conditional(
+            self, url: str,
+            etag: Optional[str] = None,
+            last_modified: Optional[str] = None
+        ) -> ConditionalResponse:
+        """
+        GET with If-None-Match / If-Modified-Since from an earlier response, retrying like get_with_retry.
+
+        A 304 is returned without a payload, and a 404 without retrying.
+        """
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        for attempt in range(self.max_retries):
+            try:
+                self._wait_for_slot()
+                response = self.session.get(url, headers=headers, timeout=30)
+                if response.status_code in (304, 404):
+                    return ConditionalResponse(response.status_code, etag=etag, last_modified=last_modified)
+                response.raise_for_status()
+                return ConditionalResponse(
+                    response.status_code,
+                    payload=response.json(),
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified')
+                )
+            except (requests.exceptions.RequestException, ValueError) as e:
+                logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
+                if attempt == self.max_retries - 1:
+                    logger.error(f"All attempts failed for {url}")
+                    return ConditionalResponse(None)
+                time.sleep(2 ** attempt)
+        return ConditionalResponse(None)
+
     def get_bootstrap_data(self) -> Optional[Dict]:
         """Fetch bootstrap-static data containing all player information"""
         url = f"{self.base_url}/bootstrap-static/"
@@ -53,7 +114,84 @@ class FPLAPIClient:
         """Fetch fixture list for the season"""
         url = f"{self.base_url}/fixtures/"
         return self.get_with_retry(url)
+
+    def get_event_live(self, event_id: int) -> Optional[Dict]:
+        """Fetch live per-player stats for every player in a single gameweek"""
+        url = f"{self.base_url}/event/{event_id}/live/"
+        return self.get_with_retry(url)
     
+    def get_manager_history(
+            self, manager_id: int,
+            etag: Optional[str] = None,
+            last_modified: Optional[str] = None
+        ) -> ConditionalResponse:
+        """Fetch a manager's season-by-season and gameweek history, unless unchanged since the validators given"""
+        url = f"{self.base_url}/entry/{manager_id}/history/"
+        return self.get_conditional(url, etag, last_modified)
+
+    def get_manager_entry(self, manager_id: int) -> Optional[Dict]:
+        """Fetch a manager's team summary, including the leagues they are in"""
+        url = f"{self.base_url}/entry/{manager_id}/"
+        return self.get_with_retry(url)
+
+    def get_league_standings(self, league_id: int, page: int = 1) -> Optional[Dict]:
+        """Fetch one page (of 50 entries) of a classic league's standings"""
+        url = f"{self.base_url}/leagues-classic/{league_id}/standings/?page_standings={page}"
+        return self.get_with_retry(url)
+
+    def get_manager_picks(self, manager_id: int, event_id: int) -> ConditionalResponse:
+        """Fetch a manager's 15 picks for one gameweek; a 404 (no team that gameweek) is returned without retrying"""
+        url = f"{self.base_url}/entry/{manager_id}/event/{event_id}/picks/"
+        return self.get_conditional(url)
+
+    def iter_parallel(
+            self, fetch: Callable[[K], V], keys: Iterable[K],
+            max_workers: int = 10,
+            max_in_flight: Optional[int] = None
+        ) -> Iterator[Tuple[K, Optional[V]]]:
+        """
+        Call fetch for each key on a thread pool, yielding (key, result) as each completes.
+
+        At most max_in_flight calls are outstanding (default 2 x max_workers); the next
+        call is only submitted once the consumer has taken a result, so a slow consumer
+        applies backpressure instead of completed payloads piling up in memory. Calls that
+        raise are yielded with a result of None.
+        """
+        max_in_flight = max_in_flight or max_workers * 2
+        pending_keys = iter(keys)
+        exhausted = object()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            in_flight = {}
+
+            def submit_next() -> None:
+                key = next(pending_keys, exhausted)
+                if key is not exhausted:
+                    in_flight[executor.submit(fetch, key)] = key
+
+            for _ in range(max_in_flight):
+                submit_next()
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = in_flight.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"Error fetching {key}: {e}")
+                        result = None
+                    yield key, result
+                    submit_next()
+
+    def iter_players_parallel(
+            self, player_ids: List[int],
+            max_workers: int = 10,
+            max_in_flight: Optional[int] = None
+        ) -> Iterator[Tuple[int, Optional[Dict]]]:
+        """Fetch player details in parallel, yielding (player_id, payload) as each completes; see iter_parallel"""
+        return self.iter_parallel(self.get_player_details, player_ids, max_workers, max_in_flight)
+
     def get_multiple_players_parallel(
             self, player_ids: List[int], 
             max_workers: int = 10
@@ -64,25 +202,11 @@ class FPLAPIClient:
         
         logger.info(f"Fetching details for {len(player_ids)} players with {max_workers} workers...")
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all requests
-            future_to_id = {
-                executor.submit(self.get_player_details, player_id): player_id 
-                for player_id in player_ids
-            }
-            
-            # Collect results
-            for future in as_completed(future_to_id):
-                player_id = future_to_id[future]
-                try:
-                    result = future.result()
-                    if result:
-                        results[player_id] = result
-                    else:
-                        failed_ids.append(player_id)
-                except Exception as e:
-                    logger.error(f"Error fetching player {player_id}: {e}")
-                    failed_ids.append(player_id)
+        for player_id, result in self.iter_players_parallel(player_ids, max_workers=max_workers):
+            if result:
+                results[player_id] = result
+            else:
+                failed_ids.append(player_id)
         
         if failed_ids:
             logger.warning(f"Failed to fetch {len(failed_ids)} players: {failed_ids[:10]}...")
@@ -0,0 +1,27 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Spaces requests from any number of threads and clients at least 1 / requests_per_second apart.
+
+    Each acquire() reserves the next free slot under a lock and sleeps outside it until that
+    slot, so a crawl's total request rate stays bounded however many workers it uses. Share
+    one limiter between every client that calls the same upstream.
+    """
+
+    def __init__(self, requests_per_second: float):
+        if requests_per_second <= 0:
+            raise ValueError(f"Invalid rate {requests_per_second}. Must be greater than 0")
+        self.interval = 1.0 / requests_per_second
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
\ No newline at end of file
@@ -0,0 +1,253 @@
+import os
+import sys
+import gzip
+import json
+import time
+import random
+import shutil
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Page size of leagues-classic/{id}/standings/, as on the real API
+STANDINGS_PAGE_SIZE = 50
+
+
+class StubFPLData:
+    """
+    Deterministic stand-in data for the FPL API endpoints the crawlers call.
+
+    Every league has league_entries entries and every gameweek up to finished_events is
+    finished. Entry ids are league_id * 1,000,000 + position, so they are distinct across leagues.
+    Picks are 15 of players elements, seeded by entry and gameweek; entries whose id is a
+    multiple of missing_every have no team (404) in gameweek 1, as if they joined later.
+    """
+
+    def __init__(self, league_entries: int = 5000, finished_events: int = 10, players: int = 700,
+                 missing_every: int = 20):
+        self.league_entries = league_entries
+        self.finished_events = finished_events
+        self.players = players
+        self.missing_every = missing_every
+        self.requests_served = 0
+        self._lock = threading.Lock()
+
+    def bootstrap(self) -> Dict[str, Any]:
+        return {
+            "events": [
+                {
+                    "id": event,
+                    "finished": event <= self.finished_events,
+                    "data_checked": event <= self.finished_events,
+                    "is_current": event == self.finished_events,
+                }
+                for event in range(1, 39)
+            ]
+        }
+
+    def standings(self, league_id: int, page: int) -> Dict[str, Any]:
+        first = (page - 1) * STANDINGS_PAGE_SIZE + 1
+        last = min(page * STANDINGS_PAGE_SIZE, self.league_entries)
+        return {
+            "league": {"id": league_id, "name": f"League {league_id}"},
+            "standings": {
+                "has_next": last < self.league_entries,
+                "page": page,
+                "results": [
+                    {
+                        "id": position,
+                        "entry": league_id * 1_000_000 + position,
+                        "entry_name": f"Team {position}",
+                        "player_name": f"Manager {position}",
+                        "rank": position,
+                        "last_rank": position,
+                        "rank_sort": position,
+                        "total": 2500 - position // 10,
+                        "event_total": 50 + position % 40,
+                    }
+                    for position in range(first, last + 1)
+                ],
+            },
+        }
+
+    def entry(self, entry_id: int) -> Dict[str, Any]:
+        return {
+            "id": entry_id,
+            "leagues": {
+                "classic": [
+                    {"id": 314, "name": "Overall", "league_type": "s"},
+                    {"id": 1000 + entry_id % 10, "name": f"League {1000 + entry_id % 10}", "league_type": "x"},
+                ]
+            },
+        }
+
+    def picks(self, entry_id: int, event: int) -> Optional[Dict[str, Any]]:
+        if event > self.finished_events or (event == 1 and entry_id % self.missing_every == 0):
+            return None
+        rng = random.Random(entry_id * 100 + event)
+        elements = rng.sample(range(1, self.players + 1), 15)
+        captain = rng.randrange(11)
+        return {
+            "active_chip": None,
+            "picks": [
+                {
+                    "element": element,
+                    "position": position + 1,
+                    "multiplier": 2 if position == captain else int(position < 11),
+                    "is_captain": position == captain,
+                    "is_vice_captain": position == (captain + 1) % 11,
+                }
+                for position, element in enumerate(elements)
+            ],
+        }
+
+    def route(self, path: str, query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Response for a request path under /api/, or None for a 404"""
+        with self._lock:
+            self.requests_served += 1
+        parts = [part for part in path.split("/") if part]
+        if parts[:1] != ["api"]:
+            return None
+        parts = parts[1:]
+        if parts == ["bootstrap-static"]:
+            return self.bootstrap()
+        if len(parts) == 3 and parts[0] == "leagues-classic" and parts[2] == "standings":
+            page = int(query.get("page_standings", ["1"])[0])
+            return self.standings(int(parts[1]), page)
+        if len(parts) == 2 and parts[0] == "entry":
+            return self.entry(int(parts[1]))
+        if len(parts) == 5 and parts[0] == "entry" and parts[2] == "event" and parts[4] == "picks":
+            return self.picks(int(parts[1]), int(parts[3]))
+        return None
+
+
+def start_stub_server(data: StubFPLData, latency_ms: float = 0.0, port: int = 0) -> Tuple[ThreadingHTTPServer, str]:
+    """Serve data on a background thread; returns the server and the base URL to give FPLAPIClient"""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            if latency_ms:
+                time.sleep(latency_ms / 1000)
+            url = urlparse(self.path)
+            payload = data.route(url.path, parse_qs(url.query))
+            body = json.dumps(payload if payload is not None else {"detail": "Not found."}).encode("utf-8")
+            self.send_response(200 if payload is not None else 404)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/api"
+
+
+class LocalObjectStore:
+    """The upload_fileobj call of a boto3 S3 client, writing objects under a local directory instead"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def upload_fileobj(self, fileobj, bucket_name: str, s3_key: str, ExtraArgs: Optional[Dict[str, Any]] = None) -> None:
+        path = os.path.join(self.directory, s3_key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as target:
+            shutil.copyfileobj(fileobj, target)
+
+
+class LocalDataLake:
+    """
+    The parts of S3DataLake the crawlers use, backed by a local directory, so a benchmark
+    measures the crawl and its writers rather than S3.
+    """
+
+    bucket_name = "local"
+    prefix = "fpl-data"
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.s3_client = LocalObjectStore(directory)
+
+    def _path(self, data_type: str, filename: str) -> str:
+        filename = filename if filename.endswith(".gz") else filename.replace(".json", ".json.gz")
+        return os.path.join(self.directory, self.prefix, data_type, filename)
+
+    def load_json(self, data_type: str, filename: str) -> Optional[Dict[str, Any]]:
+        path = self._path(data_type, filename)
+        if not os.path.exists(path):
+            return None
+        with gzip.open(path, "rb") as source:
+            return json.loads(source.read())
+
+    def save_json(self, data: Dict[str, Any], data_type: str, filename: str) -> str:
+        path = self._path(data_type, filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with gzip.open(path, "wb") as target:
+            target.write(json.dumps(data).encode("utf-8"))
+        return path
+
+    def put_bytes(self, data_type: str, filename: str, body: bytes, **headers) -> str:
+        path = os.path.join(self.directory, self.prefix, data_type, filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as target:
+            target.write(body)
+        return path
+
+    def get_bytes(self, data_type: str, filename: str) -> Optional[bytes]:
+        path = os.path.join(self.directory, self.prefix, data_type, filename)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as source:
+            return source.read()
+
+    def download_file(self, data_type: str, filename: str, path: str) -> bool:
+        source = os.path.join(self.directory, self.prefix, data_type, filename)
+        if not os.path.exists(source):
+            return False
+        shutil.copyfile(source, path)
+        return True
+
+    def upload_file(self, data_type: str, path: str, filename: str, **headers) -> str:
+        target = os.path.join(self.directory, self.prefix, data_type, filename)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(path, target)
+        return target
+
+    def open_ndjson_writer(self, data_type: str, filename_prefix: str, rows_per_shard: int = 100_000):
+        from s3.s3_datalake import NDJSONShardWriter
+        key_prefix = f"{self.prefix}/{data_type}/{filename_prefix}"
+        return NDJSONShardWriter(self.s3_client, self.bucket_name, key_prefix, rows_per_shard)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Serve deterministic stand-in FPL API data locally for crawler benchmarks")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--league-entries", type=int, default=5000, help="Entries in every classic league")
+    parser.add_argument("--finished-events", type=int, default=10, help="Gameweeks that are finished")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every response")
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(
+        StubFPLData(args.league_entries, args.finished_events), args.latency_ms, args.port
+    )
+    print(f"Serving stand-in FPL API at {base_url} (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+import sys
+import os
+import json
+import argparse
+import subprocess
+from typing import Any, Dict, List, Tuple
+
+# Add the etl directory to Python path for imports
+ETL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ETL_DIR)
+
+from main import PHASE_RUNNERS
+
+SCHEDULES = ["daily", "weekly"]
+PHASES = ["entry", "extract", "stage", "source", "serve", "export", "backfill", "streaming", "all"]
+
+# Clients constructed outside the phase runners, by planning and the run manifest
+CLIENT_MODULES = ["api.fpl_client", "s3.s3_datalake"]
+
+
+def phase_modules(schedule: str, phase: str) -> List[str]:
+    """Modules a Lambda invocation imports to run one phase of a schedule, beyond main itself"""
+    if phase == "entry":
+        return []
+    if phase == "streaming":
+        return [
+            "orchestration.streaming",
+            *(PHASE_RUNNERS[(schedule, name)][0] for name in ("extract", "stage", "source")),
+        ]
+    if phase == "all":
+        modules = {module for (runner_schedule, _), (module, _) in PHASE_RUNNERS.items() if runner_schedule == schedule}
+        return sorted(modules) + CLIENT_MODULES
+    return [PHASE_RUNNERS[(schedule, phase)][0]]
+
+
+def parse_importtime(stderr: str) -> Tuple[int, List[Tuple[str, int]]]:
+    """Total self time and the cumulative time of each top-level import, in microseconds"""
+    total_us = 0
+    top_level = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        total_us += int(self_us)
+        # Nested imports are indented under the module that triggered them
+        if not name[1:].startswith(" "):
+            top_level.append((name.strip(), int(cumulative_us)))
+    return total_us, top_level
+
+
+def measure(schedule: str, phase: str, python: str = sys.executable) -> Dict[str, Any]:
+    """Import main and a phase's modules in a fresh interpreter, as a cold Lambda would"""
+    modules = phase_modules(schedule, phase)
+    statement = "; ".join(f"import {module}" for module in ["main", *modules])
+    completed = subprocess.run(
+        [python, "-X", "importtime", "-c", statement],
+        cwd=ETL_DIR,
+        capture_output=True,
+        text=True
+    )
+    total_us, top_level = parse_importtime(completed.stderr)
+    result = {
+        "schedule": schedule,
+        "phase": phase,
+        "modules": modules,
+        "total_ms": round(total_us / 1000, 1),
+        "heaviest": [
+            {"module": name, "cumulative_ms": round(us / 1000, 1)}
+            for name, us in sorted(top_level, key=lambda item: item[1], reverse=True)[:5]
+        ],
+    }
+    if completed.returncode != 0:
+        result["error"] = completed.stderr.strip().splitlines()[-1]
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure import time of the ETL entry point for each schedule and phase"
+    )
+    parser.add_argument("--schedule", choices=SCHEDULES, action="append", help="Schedules to measure (default: all)")
+    parser.add_argument("--phase", choices=PHASES, action="append", help="Phases to measure (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per combination; the fastest is reported")
+    parser.add_argument("--budget-ms", type=float, help="Exit with status 1 if any combination imports slower than this")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    for schedule in args.schedule or SCHEDULES:
+        for phase in args.phase or PHASES:
+            # The serve and export phases only run on the weekly schedule
+            if phase not in ("entry", "streaming", "all") and (schedule, phase) not in PHASE_RUNNERS:
+                continue
+            runs = [measure(schedule, phase) for _ in range(max(args.repeat, 1))]
+            results.append(min(runs, key=lambda run: run["total_ms"]))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            heaviest = ", ".join(f"{item['module']} {item['cumulative_ms']}ms" for item in result["heaviest"][:3])
+            status = f"  ERROR: {result['error']}" if "error" in result else ""
+            print(f"{result['schedule']:<7} {result['phase']:<10} {result['total_ms']:>8.1f}ms  {heaviest}{status}")
+
+    failed = [result for result in results if "error" in result]
+    over_budget = [
+        result for result in results
+        if args.budget_ms is not None and result["total_ms"] > args.budget_ms
+    ]
+    for result in over_budget:
+        print(f"Over budget: {result['schedule']} {result['phase']} {result['total_ms']}ms > {args.budget_ms}ms", file=sys.stderr)
+    return 1 if failed or over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
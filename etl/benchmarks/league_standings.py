@@ -0,0 +1,101 @@
+import sys
+import os
+import json
+import time
+import argparse
+import tempfile
+from typing import Any, Dict, Optional
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.fpl_client import FPLAPIClient
+from api.rate_limiter import RateLimiter
+from benchmarks.fpl_stub_server import LocalDataLake, StubFPLData, start_stub_server
+from extract.league_standings.pipeline import LeagueStandingsETLPipelineExtract
+
+# League ids the stand-in server is asked for; any id is served
+FIRST_LEAGUE_ID = 1001
+
+
+def measure(leagues: int, league_entries: int, workers: int, latency_ms: float,
+            requests_per_second: Optional[float]) -> Dict[str, Any]:
+    data = StubFPLData(league_entries=league_entries)
+    server, base_url = start_stub_server(data, latency_ms)
+    try:
+        api_client = FPLAPIClient(
+            base_url=base_url,
+            rate_limit_delay=0,
+            max_retries=1,
+            rate_limiter=RateLimiter(requests_per_second) if requests_per_second else None
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            pipeline = LeagueStandingsETLPipelineExtract(
+                api_client=api_client,
+                s3_client=LocalDataLake(directory),
+                league_ids=range(FIRST_LEAGUE_ID, FIRST_LEAGUE_ID + leagues),
+                max_workers=workers
+            )
+            start = time.perf_counter()
+            result = pipeline.run()
+            elapsed = time.perf_counter() - start
+    finally:
+        server.shutdown()
+
+    if not result["success"]:
+        raise RuntimeError(f"League standings crawl failed: {result['error']}")
+    return {
+        "leagues": leagues,
+        "league_entries": league_entries,
+        "workers": workers,
+        "latency_ms": latency_ms,
+        "requests_per_second_limit": requests_per_second,
+        "pages": result["pages_fetched"],
+        "requests": data.requests_served,
+        "entries": result["entries_written"],
+        "shards": result["shards_written"],
+        "seconds": round(elapsed, 3),
+        "pages_per_sec": round(result["pages_fetched"] / elapsed, 1),
+        "requests_per_sec": round(data.requests_served / elapsed, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Time the classic league standings crawl against a local stand-in FPL API"
+    )
+    parser.add_argument("--leagues", type=int, default=20)
+    parser.add_argument("--league-entries", type=int, default=5000, help="Entries per league (50 per page)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16], help="Fetch pool sizes to compare")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Delay the stand-in server adds to every response")
+    parser.add_argument("--rps", type=float, help="Shared rate limit, as in production (default: unlimited)")
+    parser.add_argument("--min-pages-per-sec", type=float, help="Exit with status 1 if any run is slower than this")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = [
+        measure(args.leagues, args.league_entries, workers, args.latency_ms, args.rps)
+        for workers in args.workers
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            print(
+                f"{result['leagues']} leagues x {result['league_entries']} entries, {result['workers']:>2} workers"
+                f"  {result['pages']:>6} pages ({result['requests']:>6} requests) in {result['seconds']:>7.2f}s"
+                f"  {result['pages_per_sec']:>8.1f} pages/s  {result['shards']} shards"
+            )
+
+    too_slow = [
+        result for result in results
+        if args.min_pages_per_sec is not None and result["pages_per_sec"] < args.min_pages_per_sec
+    ]
+    for result in too_slow:
+        print(f"Too slow: {result['workers']} workers {result['pages_per_sec']} pages/s < {args.min_pages_per_sec}", file=sys.stderr)
+    return 1 if too_slow else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+import sys
+import os
+import json
+import time
+import argparse
+import tempfile
+from typing import Any, Dict, Optional
+
+import pyarrow.parquet as pq
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.fpl_client import FPLAPIClient
+from api.rate_limiter import RateLimiter
+from benchmarks.fpl_stub_server import LocalDataLake, StubFPLData, start_stub_server
+from extract.manager_picks.pipeline import MANAGER_PICKS_DATA_TYPE, ManagerPicksETLPipelineExtract
+
+# Manager ids the stand-in server is asked for; any id is served
+FIRST_MANAGER_ID = 1
+
+
+def measure(managers: int, gameweeks: int, workers: int, latency_ms: float, rows_per_shard: int,
+            requests_per_second: Optional[float]) -> Dict[str, Any]:
+    data = StubFPLData(finished_events=gameweeks)
+    server, base_url = start_stub_server(data, latency_ms)
+    try:
+        api_client = FPLAPIClient(
+            base_url=base_url,
+            rate_limit_delay=0,
+            max_retries=1,
+            rate_limiter=RateLimiter(requests_per_second) if requests_per_second else None
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            pipeline = ManagerPicksETLPipelineExtract(
+                api_client=api_client,
+                s3_client=LocalDataLake(directory),
+                manager_ids=range(FIRST_MANAGER_ID, FIRST_MANAGER_ID + managers),
+                first_event=1,
+                max_workers=workers,
+                rows_per_shard=rows_per_shard
+            )
+            start = time.perf_counter()
+            result = pipeline.run()
+            elapsed = time.perf_counter() - start
+            shard_dir = os.path.join(directory, "fpl-data", MANAGER_PICKS_DATA_TYPE)
+            shard_files = [os.path.join(shard_dir, name) for name in os.listdir(shard_dir) if name.endswith(".parquet")]
+            parquet_bytes = sum(os.path.getsize(path) for path in shard_files)
+            parquet_rows = sum(pq.ParquetFile(path).metadata.num_rows for path in shard_files)
+
+            # A second run finds every pair already fetched and makes no picks requests
+            requests_before = data.requests_served
+            rerun = pipeline.run()
+            rerun_requests = data.requests_served - requests_before
+    finally:
+        server.shutdown()
+
+    if not result["success"]:
+        raise RuntimeError(f"Manager picks crawl failed: {result['error']}")
+    if parquet_rows != result["picks_written"] or rerun["pairs_fetched"]:
+        raise RuntimeError("Shards or work queue out of step with the crawl")
+    pairs = result["pairs_fetched"] + result["pairs_missing"]
+    return {
+        "managers": managers,
+        "gameweeks": gameweeks,
+        "workers": workers,
+        "latency_ms": latency_ms,
+        "requests_per_second_limit": requests_per_second,
+        "pairs": pairs,
+        "picks": result["picks_written"],
+        "shards": result["shards_written"],
+        "parquet_bytes_per_pick": round(parquet_bytes / max(parquet_rows, 1), 2),
+        "rerun_requests": rerun_requests,
+        "seconds": round(elapsed, 3),
+        "pairs_per_sec": round(pairs / elapsed, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Time the manager picks crawl against a local stand-in FPL API"
+    )
+    parser.add_argument("--managers", type=int, default=500)
+    parser.add_argument("--gameweeks", type=int, default=4, help="Finished gameweeks queued per manager")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 8, 16], help="Fetch pool sizes to compare")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Delay the stand-in server adds to every response")
+    parser.add_argument("--rows-per-shard", type=int, default=10_000, help="Picks per Parquet shard (and queue checkpoint)")
+    parser.add_argument("--rps", type=float, help="Shared rate limit, as in production (default: unlimited)")
+    parser.add_argument("--min-pairs-per-sec", type=float, help="Exit with status 1 if any run is slower than this")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = [
+        measure(args.managers, args.gameweeks, workers, args.latency_ms, args.rows_per_shard, args.rps)
+        for workers in args.workers
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            print(
+                f"{result['managers']} managers x {result['gameweeks']} gameweeks, {result['workers']:>2} workers"
+                f"  {result['pairs']:>6} pairs in {result['seconds']:>7.2f}s  {result['pairs_per_sec']:>8.1f} pairs/s"
+                f"  {result['picks']} picks in {result['shards']} shards ({result['parquet_bytes_per_pick']} B/pick)"
+                f"  rerun: {result['rerun_requests']} requests"
+            )
+
+    too_slow = [
+        result for result in results
+        if args.min_pairs_per_sec is not None and result["pairs_per_sec"] < args.min_pairs_per_sec
+    ]
+    for result in too_slow:
+        print(f"Too slow: {result['workers']} workers {result['pairs_per_sec']} pairs/s < {args.min_pairs_per_sec}", file=sys.stderr)
+    return 1 if too_slow else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+import sys
+import os
+import json
+import time
+import argparse
+from typing import Any, Dict
+
+import numpy as np
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics.projections import ProjectionInputs, compute_projections
+
+TEAMS = 20
+
+
+def synthetic_inputs(players: int, played: int, upcoming: int, seed: int = 0) -> ProjectionInputs:
+    """A season's worth of inputs shaped like the Snowflake queries return them"""
+    rng = np.random.default_rng(seed)
+    player_ids = np.arange(1, players + 1)
+    player_teams = rng.integers(1, TEAMS + 1, players)
+
+    history_players = np.repeat(player_ids, played)
+    rounds = np.tile(np.arange(1, played + 1), players)
+    minutes = rng.choice([0, 20, 65, 90], len(rounds), p=[0.25, 0.15, 0.2, 0.4])
+
+    # Round-robin pairings, ten fixtures per gameweek, for the gameweeks still to play
+    events, team_h, team_a = [], [], []
+    teams = np.arange(1, TEAMS + 1)
+    for event in range(played + 1, played + upcoming + 1):
+        rotated = np.roll(teams[1:], event)
+        pairing = np.concatenate([[teams[0]], rotated])
+        events += [event] * (TEAMS // 2)
+        team_h += list(pairing[:TEAMS // 2])
+        team_a += list(pairing[TEAMS // 2:][::-1])
+
+    return ProjectionInputs(
+        players={
+            "player_id": player_ids,
+            "team": player_teams,
+            "element_type": rng.choice([1, 2, 3, 4], players, p=[0.1, 0.35, 0.4, 0.15]),
+            "availability": rng.choice([1.0, 0.75, 0.0], players, p=[0.85, 0.1, 0.05]),
+        },
+        history={
+            "player_id": history_players,
+            "round": rounds,
+            "minutes": minutes,
+            "expected_goals": rng.gamma(0.3, 0.4, len(rounds)) * (minutes > 0),
+            "expected_assists": rng.gamma(0.3, 0.3, len(rounds)) * (minutes > 0),
+            "expected_goals_conceded": rng.gamma(1.5, 0.8, len(rounds)) * (minutes / 90),
+            "saves": rng.poisson(1.0, len(rounds)) * (minutes > 0),
+            "bonus": rng.choice([0, 1, 2, 3], len(rounds), p=[0.85, 0.06, 0.05, 0.04]),
+        },
+        teams={
+            "team_id": teams,
+            "strength_attack_home": rng.integers(1050, 1350, TEAMS),
+            "strength_attack_away": rng.integers(1050, 1350, TEAMS),
+            "strength_defence_home": rng.integers(1050, 1350, TEAMS),
+            "strength_defence_away": rng.integers(1050, 1350, TEAMS),
+            "played": np.full(TEAMS, played),
+            "points": rng.integers(0, 3 * played + 1, TEAMS),
+        },
+        fixtures={
+            "fixture_id": np.arange(1, len(events) + 1),
+            "event": np.array(events),
+            "team_h": np.array(team_h),
+            "team_a": np.array(team_a),
+        },
+    )
+
+
+def measure(players: int, played: int, upcoming: int, repeat: int) -> Dict[str, Any]:
+    inputs = synthetic_inputs(players, played, upcoming)
+    timings = []
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        projections = compute_projections(inputs)
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "players": players,
+        "played_gameweeks": played,
+        "upcoming_gameweeks": upcoming,
+        "rows": len(projections["player_id"]),
+        "best_ms": round(min(timings), 2),
+        "median_ms": round(float(np.median(timings)), 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Time the expected-points projection over synthetic season-sized inputs"
+    )
+    parser.add_argument("--players", type=int, default=700)
+    parser.add_argument("--played", type=int, default=0, help="Gameweeks of history (default: 0 to 38 in steps)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per size; best and median are reported")
+    parser.add_argument("--budget-ms", type=float, help="Exit with status 1 if any size is slower than this")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    # Early season has little history and many fixtures to project; late season the reverse
+    sizes = [(args.played, 38 - args.played)] if args.played else [(1, 37), (19, 19), (37, 1)]
+    results = [measure(args.players, played, upcoming, args.repeat) for played, upcoming in sizes]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            print(
+                f"{result['players']} players, {result['played_gameweeks']:>2} played / {result['upcoming_gameweeks']:>2} upcoming"
+                f"  {result['rows']:>6} rows  best {result['best_ms']:>8.2f}ms  median {result['median_ms']:>8.2f}ms"
+            )
+
+    over_budget = [result for result in results if args.budget_ms is not None and result["best_ms"] > args.budget_ms]
+    for result in over_budget:
+        print(f"Over budget: {result['played_gameweeks']} played {result['best_ms']}ms > {args.budget_ms}ms", file=sys.stderr)
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
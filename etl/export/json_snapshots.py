@@ -0,0 +1,210 @@
+import sys
+import os
+import json
+import gzip
+import hashlib
+import logging
+import math
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger(__name__)
+
+EXPORT_DATA_TYPE = "exports"
+LATEST_FILENAME = "latest.json"
+
+# Rows per pre-paginated page, the backend's default page size
+PAGE_SIZE = 50
+
+# Versioned documents never change once written; the pointer is re-read shortly after each run
+VERSION_CACHE_CONTROL = "public, max-age=31536000, immutable"
+LATEST_CACHE_CONTROL = "public, max-age=60"
+
+# Queries rendered for each dataset, selecting and ordering rows as the backend serves them
+EXPORT_DATASETS = {
+    "teams": """
+SELECT
+    team_id,
+    code,
+    name,
+    short_name,
+    position,
+    played,
+    win,
+    draw,
+    loss,
+    points,
+    form,
+    strength,
+    strength_overall_home,
+    strength_overall_away,
+    strength_attack_home,
+    strength_attack_away,
+    strength_defence_home,
+    strength_defence_away,
+    pulse_id,
+    unavailable,
+    team_division,
+    extraction_timestamp,
+    extraction_date
+FROM FPL_STATS.FPL_SCHEMA.SOURCE_TEAMS
+ORDER BY position
+""",
+    "standings": """
+SELECT
+    team_id,
+    name,
+    short_name,
+    position,
+    played,
+    win,
+    draw,
+    loss,
+    points,
+    form
+FROM FPL_STATS.FPL_SCHEMA.DIM_STANDINGS
+ORDER BY position
+""",
+    "players": """
+SELECT
+    player_id,
+    first_name,
+    second_name,
+    web_name,
+    team,
+    element_type,
+    now_cost,
+    total_points,
+    points_per_game,
+    form,
+    goals_scored,
+    assists,
+    expected_goals,
+    expected_assists,
+    expected_goal_involvements,
+    expected_goals_conceded,
+    clean_sheets,
+    goals_conceded,
+    minutes,
+    selected_by_percent,
+    transfers_in_event,
+    transfers_out_event,
+    ict_index,
+    influence,
+    creativity,
+    threat,
+    bonus,
+    bps,
+    yellow_cards,
+    red_cards,
+    saves,
+    penalties_saved,
+    penalties_missed,
+    status
+FROM FPL_STATS.FPL_SCHEMA.SERVE_PLAYERS
+ORDER BY overall_rank
+""",
+}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(document: Any) -> bytes:
+    return json.dumps(document, default=_json_default, separators=(',', ':')).encode('utf-8')
+
+
+def rows_sha256(rows: List[Dict[str, Any]]) -> str:
+    """Content hash of the rows alone, so an unchanged dataset keeps its version"""
+    return hashlib.sha256(_dumps(rows)).hexdigest()
+
+
+def render_documents(rows: List[Dict[str, Any]], version: str, page_size: int = PAGE_SIZE) -> Dict[str, bytes]:
+    """
+    Uncompressed JSON documents for one version of a dataset, keyed by filename.
+
+    all.json holds every row as {"data", "count"}, like the backend's list endpoints, and
+    pages/{n}.json holds each page of page_size rows as {"data", "pagination"}, like its
+    paginated ones. An empty dataset still has an empty page 1.
+    """
+    exported_at = datetime.now(ZoneInfo("Australia/Sydney")).strftime("%Y-%m-%d %H:%M:%S")
+    total_pages = math.ceil(len(rows) / page_size)
+    documents = {
+        "all.json": _dumps({"data": rows, "count": len(rows), "version": version, "exported_at": exported_at})
+    }
+    for page in range(1, max(total_pages, 1) + 1):
+        documents[f"pages/{page}.json"] = _dumps({
+            "data": rows[(page - 1) * page_size:page * page_size],
+            "pagination": {
+                "page": page,
+                "limit": page_size,
+                "total": len(rows),
+                "totalPages": total_pages,
+                "hasNextPage": page < total_pages,
+                "hasPreviousPage": page > 1,
+            },
+            "version": version,
+            "exported_at": exported_at,
+        })
+    return documents
+
+
+def load_latest(s3_datalake, dataset: str) -> Optional[Dict[str, Any]]:
+    """The pointer to a dataset's current version, or None before its first export"""
+    body = s3_datalake.get_bytes(f"{EXPORT_DATA_TYPE}/{dataset}", LATEST_FILENAME)
+    return json.loads(body) if body else None
+
+
+def export_dataset(snowflake_client, s3_datalake, dataset: str, page_size: int = PAGE_SIZE) -> Dict[str, Any]:
+    """
+    Render a dataset from Snowflake into a new version of its documents under
+    fpl-data/exports/{dataset}/{version}/, then point latest.json at it.
+
+    The pointer is written last, so readers switch to a complete version at once. When the
+    rows are unchanged since the current version nothing is written and it stays current.
+    Returns the pointer with the number of rows and documents written.
+    """
+    rows = snowflake_client.fetch_arrow(EXPORT_DATASETS[dataset]).to_pylist()
+    sha256 = rows_sha256(rows)
+
+    latest = load_latest(s3_datalake, dataset)
+    if latest and latest.get("sha256") == sha256 and latest.get("page_size") == page_size:
+        logger.info(f"{dataset} export unchanged since version {latest['version']}, keeping it")
+        return {**latest, "rows": len(rows), "documents_written": 0}
+
+    version = datetime.now(ZoneInfo("Australia/Sydney")).strftime("%Y%m%dT%H%M%S")
+    data_type = f"{EXPORT_DATA_TYPE}/{dataset}"
+    documents = render_documents(rows, version, page_size)
+    for filename, body in documents.items():
+        s3_datalake.put_bytes(
+            data_type,
+            f"{version}/{filename}.gz",
+            gzip.compress(body),
+            content_encoding='gzip',
+            cache_control=VERSION_CACHE_CONTROL
+        )
+
+    pointer = {
+        "dataset": dataset,
+        "version": version,
+        "sha256": sha256,
+        "count": len(rows),
+        "page_size": page_size,
+        "pages": len(documents) - 1,
+        "all": f"{version}/all.json.gz",
+        "page_template": f"{version}/pages/{{page}}.json.gz",
+        "exported_at": datetime.now(ZoneInfo("Australia/Sydney")).strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    s3_datalake.put_bytes(data_type, LATEST_FILENAME, _dumps(pointer), cache_control=LATEST_CACHE_CONTROL)
+    logger.info(f"Exported {len(rows)} {dataset} rows as version {version} in {len(documents)} documents")
+    return {**pointer, "rows": len(rows), "documents_written": len(documents)}
\ No newline at end of file
@@ -0,0 +1,67 @@
+import sys
+import os
+import logging
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snowflake_client.snowflake_client import SnowflakeClient
+from s3.s3_datalake import S3DataLake
+from export.json_snapshots import export_dataset
+
+logger = logging.getLogger(__name__)
+
+def run_snapshot_export(dataset: str):
+    """
+    Execute JSON snapshot export pipeline for one dataset
+
+    1. Query the dataset once from Snowflake
+    2. Write a new version of its whole-list and paginated documents to S3 and point latest.json at it
+    """
+
+    snowflake_client = None
+    result = {
+        "success": False,
+        "error": None,
+        "rows_loaded": 0
+    }
+
+    try:
+        # Initialize clients
+        snowflake_client = SnowflakeClient()
+        s3_datalake = S3DataLake()
+
+        # Step 1: Render and upload the dataset's documents
+        logger.info(f"Exporting {dataset} snapshot to S3")
+        export = export_dataset(snowflake_client, s3_datalake, dataset)
+
+        result["rows_loaded"] = export["rows"]
+        result["version"] = export["version"]
+        result["documents_written"] = export["documents_written"]
+        result["success"] = True
+
+        logger.info(f"Successfully exported {result['rows_loaded']} {dataset} records as version {result['version']}")
+
+    except Exception as e:
+        result["error"] = str(e)
+        logger.error(f"{dataset.capitalize()} export pipeline failed: {e}")
+        raise
+
+    finally:
+        if snowflake_client:
+            snowflake_client.close()
+
+    return result
+
+def run_teams_export():
+    return run_snapshot_export("teams")
+
+def run_standings_export():
+    return run_snapshot_export("standings")
+
+def run_players_export():
+    return run_snapshot_export("players")
+
+if __name__ == "__main__":
+    for dataset in sys.argv[1:] or ["teams", "standings", "players"]:
+        run_snapshot_export(dataset)
\ No newline at end of file
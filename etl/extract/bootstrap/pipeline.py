@@ -1,15 +1,20 @@
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
 from zoneinfo import ZoneInfo
 
+from extract.projection import DatasetManifest, project_payload
+
 logger = logging.getLogger(__name__)
 
 
 class BootstrapETLPipelineExtract:
-    def __init__(self, api_client, s3_client):
+    def __init__(self, api_client, s3_client, projection: Optional[DatasetManifest] = None, archive_raw: bool = False):
         self.api_client = api_client
         self.s3_client = s3_client
+        # Keys and fields read by the source loaders; None writes the full response
+        self.projection = projection
+        self.archive_raw = archive_raw
     
     def run(self) -> Dict[str, Any]:
         """Execute the bootstrap ETL pipeline"""
@@ -29,25 +34,33 @@ class BootstrapETLPipelineExtract:
             now = datetime.now(ZoneInfo("Australia/Sydney"))
             filename = f"bootstrap_{now.strftime('%Y%m%d')}.json"
             
-            # Step 3: Save to S3 (S3DataLake will handle enrichment with timestamps)
-            logger.info(f"[STEP] BOOTSTRAP EXTRACT - Saving bootstrap data to S3 with filename: {filename}")
-            s3_path = self.s3_client.save_json(bootstrap_data, "bootstrap", filename)
-            
-            # Step 4: Calculate success metrics
+            # Step 3: Calculate success metrics
             players_count = len(bootstrap_data.get("elements", []))
             teams_count = len(bootstrap_data.get("teams", []))
             gameweeks_count = len(bootstrap_data.get("events", []))
             
+            # Step 4: Archive the full response and keep only what the loaders read
+            raw_s3_path = None
+            if self.archive_raw:
+                raw_s3_path = self.s3_client.save_json(bootstrap_data, "raw/bootstrap", filename)
+                logger.info(f"[STEP_COMPLETE] BOOTSTRAP EXTRACT - Raw archive - Path: {raw_s3_path}")
+            if self.projection is not None:
+                bootstrap_data = project_payload(bootstrap_data, self.projection)
+            
+            # Step 5: Save to S3 (S3DataLake will handle enrichment with timestamps)
+            logger.info(f"[STEP] BOOTSTRAP EXTRACT - Saving bootstrap data to S3 with filename: {filename}")
+            s3_path = self.s3_client.save_json(bootstrap_data, "bootstrap", filename)
+            
             logger.info(f"[STEP_COMPLETE] BOOTSTRAP EXTRACT - Data processing completed - Players: {players_count}, Teams: {teams_count}, Gameweeks: {gameweeks_count}")
             logger.info(f"[STEP_COMPLETE] BOOTSTRAP EXTRACT - S3 upload completed - Path: {s3_path}")
             
             return {
                 "success": True,
-                "data": bootstrap_data,
                 "players_count": players_count,
                 "teams_count": teams_count,
                 "gameweeks_count": gameweeks_count,
                 "s3_path": s3_path,
+                "raw_s3_path": raw_s3_path,
                 "extraction_timestamp": now.strftime("%Y-%m-%dT%H:%M:%S")
             }
             
@@ -0,0 +1 @@
+# Event Live ETL package
\ No newline at end of file
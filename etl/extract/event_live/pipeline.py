@@ -0,0 +1,102 @@
+from datetime import datetime
+from typing import Dict, Any
+import logging
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+STATE_DATA_TYPE = "run_state"
+STATE_FILENAME = "event_live_state.json"
+
+
+def record_loaded_event(s3_client, event_id: int) -> None:
+    """Advance the last gameweek loaded into SOURCE_PLAYER_HISTORY, never moving it back"""
+    state = s3_client.load_json(STATE_DATA_TYPE, STATE_FILENAME) or {}
+    if event_id > state.get("last_event", 0):
+        s3_client.save_json({"last_event": event_id}, STATE_DATA_TYPE, STATE_FILENAME)
+
+
+class EventLiveETLPipelineExtract:
+    """
+    Extracts per-player gameweek stats from event/{gw}/live/, one call per gameweek.
+
+    Only gameweeks that are finished and data_checked and newer than the last one
+    loaded are fetched, so a weekly run usually makes a single call. The last loaded
+    gameweek is only advanced by the source load (record_loaded_event), so gameweeks
+    whose stage or source load failed are extracted again on the next run.
+    """
+
+    def __init__(self, api_client, s3_client):
+        self.api_client = api_client
+        self.s3_client = s3_client
+
+    def run(self) -> Dict[str, Any]:
+        """Execute the event live ETL pipeline"""
+        try:
+            # Step 1: Work out which gameweeks have final data we have not loaded yet
+            logger.info("[STEP] EVENT LIVE EXTRACT - Fetching bootstrap data for gameweek state")
+            bootstrap_data = self.api_client.get_bootstrap_data()
+
+            if bootstrap_data is None:
+                return {
+                    "success": False,
+                    "error": "Failed to fetch bootstrap data from FPL API"
+                }
+
+            state = self.s3_client.load_json(STATE_DATA_TYPE, STATE_FILENAME) or {}
+            last_event = state.get("last_event", 0)
+            new_events = sorted(
+                event["id"] for event in bootstrap_data.get("events", [])
+                if event.get("finished") and event.get("data_checked") and event["id"] > last_event
+            )
+
+            now = datetime.now(ZoneInfo("Australia/Sydney"))
+            if not new_events:
+                logger.info(f"[STEP_COMPLETE] EVENT LIVE EXTRACT - No finished gameweeks newer than loaded gameweek {last_event}")
+                return {
+                    "success": True,
+                    "events_fetched": 0,
+                    "elements_count": 0,
+                    "s3_path": None,
+                    "extraction_timestamp": now.strftime("%Y-%m-%dT%H:%M:%S")
+                }
+
+            # Step 2: Fetch each new gameweek's live data
+            events = []
+            elements_count = 0
+            for event_id in new_events:
+                logger.info(f"[STEP] EVENT LIVE EXTRACT - Fetching live data for gameweek {event_id}")
+                live_data = self.api_client.get_event_live(event_id)
+                if live_data is None:
+                    return {
+                        "success": False,
+                        "error": f"Failed to fetch live data for gameweek {event_id} from FPL API"
+                    }
+                elements = [
+                    {"id": element["id"], "stats": element.get("stats", {}), "explain": element.get("explain", [])}
+                    for element in live_data.get("elements", [])
+                ]
+                elements_count += len(elements)
+                events.append({"event": event_id, "elements": elements})
+
+            # Step 3: Save to S3; the loaded gameweek marker is advanced once the source load succeeds
+            filename = f"event_live_{now.strftime('%Y%m%d')}.json"
+            logger.info(f"[STEP] EVENT LIVE EXTRACT - Saving gameweeks {new_events} to S3 with filename: {filename}")
+            s3_path = self.s3_client.save_json({"events": events}, "event_live", filename)
+
+            logger.info(f"[STEP_COMPLETE] EVENT LIVE EXTRACT - Gameweeks: {len(events)}, Player rows: {elements_count}, Path: {s3_path}")
+
+            return {
+                "success": True,
+                "events_fetched": len(events),
+                "elements_count": elements_count,
+                "s3_path": s3_path,
+                "extraction_timestamp": now.strftime("%Y-%m-%dT%H:%M:%S")
+            }
+
+        except Exception as e:
+            logger.error(f"[PIPELINE_FAILED] EVENT LIVE EXTRACT - {str(e)}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
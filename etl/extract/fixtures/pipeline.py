@@ -1,15 +1,20 @@
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
 from zoneinfo import ZoneInfo
 
+from extract.projection import DatasetManifest, project_payload
+
 logger = logging.getLogger(__name__)
 
 
 class FixturesETLPipelineExtract:
-    def __init__(self, api_client, s3_client):
+    def __init__(self, api_client, s3_client, projection: Optional[DatasetManifest] = None, archive_raw: bool = False):
         self.api_client = api_client
         self.s3_client = s3_client
+        # Keys and fields read by the source loaders; None writes the full response
+        self.projection = projection
+        self.archive_raw = archive_raw
     
     def run(self) -> Dict[str, Any]:
         """Execute the fixtures ETL pipeline"""
@@ -39,11 +44,19 @@ class FixturesETLPipelineExtract:
             now = datetime.now(ZoneInfo("Australia/Sydney"))
             filename = f"fixtures_{now.strftime('%Y%m%d')}.json"
             
-            # Step 4: Save to S3 (S3DataLake will handle enrichment with timestamps)
+            # Step 4: Archive the full response and keep only what the loaders read
+            raw_s3_path = None
+            if self.archive_raw:
+                raw_s3_path = self.s3_client.save_json(processed_data, "raw/fixtures", filename)
+                logger.info(f"Raw fixtures archived to: {raw_s3_path}")
+            if self.projection is not None:
+                processed_data = project_payload(processed_data, self.projection)
+            
+            # Step 5: Save to S3 (S3DataLake will handle enrichment with timestamps)
             logger.info(f"Saving fixtures data to S3 with filename: {filename}")
             s3_path = self.s3_client.save_json(processed_data, "fixtures", filename)
             
-            # Step 5: Calculate success metrics
+            # Step 6: Calculate success metrics
             fixtures_count = len(fixtures_data) if isinstance(fixtures_data, list) else len(fixtures_data.get("fixtures", []))
             
             logger.info(f"Fixtures ETL completed successfully.")
@@ -52,9 +65,9 @@ class FixturesETLPipelineExtract:
             
             return {
                 "success": True,
-                "data": processed_data,
                 "fixtures_count": fixtures_count,
                 "s3_path": s3_path,
+                "raw_s3_path": raw_s3_path,
                 "extraction_timestamp": now.strftime("%Y-%m-%dT%H:%M:%S")
             }
             
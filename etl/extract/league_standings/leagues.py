@@ -0,0 +1,29 @@
+import logging
+from typing import Iterable, List
+
+logger = logging.getLogger(__name__)
+
+# league_type of invitational (mini) leagues in entry/{id}/; system leagues ("s") such as
+# Overall or a country have millions of entries and are never crawled
+PRIVATE_LEAGUE_TYPE = "x"
+
+
+def parse_league_ids(value: str) -> List[int]:
+    """League ids from a comma-separated list, e.g. "314,2718" """
+    return [int(league_id) for league_id in value.split(",") if league_id.strip()]
+
+
+def manager_league_ids(api_client, manager_ids: Iterable[int], max_workers: int = 8) -> List[int]:
+    """Ids of the private classic leagues any of the given managers is in, from their entry/{id}/ summaries"""
+    league_ids = set()
+    failed = 0
+    for manager_id, entry in api_client.iter_parallel(api_client.get_manager_entry, manager_ids, max_workers=max_workers):
+        if entry is None:
+            failed += 1
+            continue
+        for league in (entry.get("leagues") or {}).get("classic", []):
+            if league.get("league_type") == PRIVATE_LEAGUE_TYPE:
+                league_ids.add(int(league["id"]))
+    if failed:
+        logger.warning(f"Failed to fetch the leagues of {failed} managers")
+    return sorted(league_ids)
@@ -0,0 +1,301 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Set, Tuple
+import logging
+from zoneinfo import ZoneInfo
+
+from extract.league_standings.leagues import manager_league_ids
+from extract.manager_history.managers import tracked_manager_ids
+from extract.manager_history.pipeline import STATE_DATA_TYPE, latest_finished_event
+
+logger = logging.getLogger(__name__)
+
+LEAGUE_STANDINGS_DATA_TYPE = "league_standings"
+
+STATE_FILENAME = "league_standings_state.json"
+# Leagues crawled completely by the last run, moved into STATE_FILENAME by the source load (commit_league_standings_state)
+PENDING_STATE_FILENAME = "league_standings_state_pending.json"
+
+# Rows per NDJSON shard; a page holds 50, so a shard is 2,000 pages
+ROWS_PER_SHARD = 100_000
+
+# Fields kept from each entry of standings.results
+STANDING_FIELDS = ("entry", "entry_name", "player_name", "rank", "last_rank", "rank_sort", "total", "event_total")
+
+
+def manifest_filename(run_date: str) -> str:
+    return f"league_standings_{run_date}.json"
+
+
+def commit_league_standings_state(s3_client, loaded_ids) -> int:
+    """
+    Mark the leagues of the last crawl refreshed once SOURCE_LEAGUE_STANDINGS has merged them.
+    Leagues not in loaded_ids keep their old state, so the next run crawls them again.
+    Returns the number of leagues marked refreshed.
+    """
+    pending = s3_client.load_json(STATE_DATA_TYPE, PENDING_STATE_FILENAME)
+    if not pending:
+        return 0
+    loaded = {str(league_id) for league_id in loaded_ids}
+    committed = {
+        league_id: league_state for league_id, league_state in pending["leagues"].items()
+        if league_id in loaded
+    }
+    state = s3_client.load_json(STATE_DATA_TYPE, STATE_FILENAME) or {}
+    s3_client.save_json(
+        {**state, "leagues": {**state.get("leagues", {}), **committed}},
+        STATE_DATA_TYPE,
+        STATE_FILENAME
+    )
+    return len(committed)
+
+
+def has_results(payload: Dict[str, Any]) -> bool:
+    return bool((payload.get("standings") or {}).get("results"))
+
+
+def has_next(payload: Dict[str, Any]) -> bool:
+    return bool((payload.get("standings") or {}).get("has_next"))
+
+
+class LeagueStandingsETLPipelineExtract:
+    """
+    Crawls leagues-classic/{id}/standings/ for tracked leagues, once per finished gameweek each.
+
+    The API pages standings 50 entries at a time and only says whether a next page exists, so
+    each due league's page count is discovered first: page 1, then doubling page numbers until
+    one is the last or past the end, then a binary search between the last two. That costs
+    about 2 x log2(pages) requests, and the pages it hits are kept. The remaining pages of every
+    due league are then fetched concurrently on one bounded pool, paced by the API client's
+    (shared) rate limiter, and each page's entries are streamed to NDJSON shards as soon as it
+    arrives, so no league has to fit in memory however large it is.
+
+    Every row carries its page and the league's page count, so loaders can tell a league whose
+    pages all arrived from one cut short by a failed page or should_stop; only complete leagues
+    are marked refreshed in fpl-data/run_state/league_standings_state.json, and only once the
+    source load has merged them (commit_league_standings_state). The day's shards are listed in
+    the manifest fpl-data/league_standings/league_standings_YYYYMMDD.json.gz.
+
+    Leagues are the ids given, otherwise the private classic leagues of the tracked managers
+    (see extract.manager_history.managers), looked up once per gameweek.
+    """
+
+    def __init__(self, api_client, s3_client, league_ids: Optional[Iterable[int]] = None,
+                 manager_ids: Optional[Iterable[int]] = None, max_workers: int = 8,
+                 rows_per_shard: int = ROWS_PER_SHARD, should_stop: Optional[Callable[[], bool]] = None):
+        self.api_client = api_client
+        self.s3_client = s3_client
+        self.league_ids = league_ids
+        self.manager_ids = manager_ids
+        self.max_workers = max_workers
+        self.rows_per_shard = rows_per_shard
+        self.should_stop = should_stop
+
+    def _stopping(self) -> bool:
+        return self.should_stop is not None and self.should_stop()
+
+    def _fetch_page(self, key: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        league_id, page = key
+        return self.api_client.get_league_standings(league_id, page)
+
+    def _discover(self, league_id: int) -> Optional[Dict[str, Any]]:
+        """
+        A league's page count and the pages fetched to find it, as {"pages": n, "fetched": {page: payload}},
+        or None if a request failed
+        """
+        first = self._fetch_page((league_id, 1))
+        if first is None:
+            return None
+        fetched = {1: first}
+        if not has_next(first):
+            return {"pages": 1, "fetched": fetched}
+
+        # Double the page number until a page has no next page: the last page, or one past the end
+        low, probe = 1, 2
+        while True:
+            payload = self._fetch_page((league_id, probe))
+            if payload is None:
+                return None
+            if has_results(payload):
+                fetched[probe] = payload
+            if not has_next(payload):
+                break
+            low, probe = probe, probe * 2
+        if has_results(payload):
+            return {"pages": probe, "fetched": fetched}
+
+        # Page low has a next page and page high is past the end; the last page is between them
+        high = probe
+        while high - low > 1:
+            middle = (low + high) // 2
+            payload = self._fetch_page((league_id, middle))
+            if payload is None:
+                return None
+            if not has_results(payload):
+                high = middle
+                continue
+            fetched[middle] = payload
+            if not has_next(payload):
+                return {"pages": middle, "fetched": fetched}
+            low = middle
+        logger.warning(f"League {league_id} standings changed while its pages were counted")
+        return None
+
+    def _write_page(self, writer, league_id: int, event: int, page: int, pages: int, payload: Dict[str, Any]) -> None:
+        league_name = (payload.get("league") or {}).get("name")
+        for standing in (payload.get("standings") or {}).get("results", []):
+            writer.write_row({
+                "league_id": league_id,
+                "league_name": league_name,
+                "event": event,
+                "page": page,
+                "pages": pages,
+                **{field: standing.get(field) for field in STANDING_FIELDS}
+            })
+
+    def _tracked_league_ids(self, event: int, state: Dict[str, Any]) -> list:
+        """The leagues given, or the tracked managers' private leagues, reusing the lookup made for this gameweek"""
+        if self.league_ids:
+            return sorted(set(self.league_ids))
+        lookup = state.get("manager_leagues", {})
+        if lookup.get("event") == event:
+            return lookup["league_ids"]
+        manager_ids = tracked_manager_ids(self.manager_ids)
+        if not manager_ids:
+            return []
+        league_ids = manager_league_ids(self.api_client, manager_ids, self.max_workers)
+        state["manager_leagues"] = {"event": event, "league_ids": league_ids}
+        logger.info(f"Found {len(league_ids)} private leagues among {len(manager_ids)} tracked managers")
+        return league_ids
+
+    def run(self) -> Dict[str, Any]:
+        """Execute the league standings ETL pipeline"""
+        writer = None
+        try:
+            # Step 1: Work out the gameweek to refresh for and which leagues are behind it
+            now = datetime.now(ZoneInfo("Australia/Sydney"))
+            run_date = now.strftime('%Y%m%d')
+            result = {
+                "success": True,
+                "leagues_tracked": 0,
+                "leagues_fetched": 0,
+                "leagues_failed": 0,
+                "pages_fetched": 0,
+                "entries_written": 0,
+                "shards_written": 0,
+                "s3_path": None,
+                "extraction_timestamp": now.strftime("%Y-%m-%dT%H:%M:%S")
+            }
+            bootstrap_data = self.api_client.get_bootstrap_data()
+            if bootstrap_data is None:
+                return {
+                    "success": False,
+                    "error": "Failed to fetch bootstrap data from FPL API"
+                }
+            event = latest_finished_event(bootstrap_data)
+
+            state = self.s3_client.load_json(STATE_DATA_TYPE, STATE_FILENAME) or {}
+            leagues_state = state.get("leagues", {})
+            league_ids = self._tracked_league_ids(event, state)
+            result["leagues_tracked"] = len(league_ids)
+            due = [
+                league_id for league_id in league_ids
+                if leagues_state.get(str(league_id), {}).get("event", -1) < event
+            ]
+            if not due:
+                logger.info(f"[STEP_COMPLETE] LEAGUE STANDINGS EXTRACT - All {len(league_ids)} leagues already refreshed for gameweek {event}")
+                self.s3_client.save_json({**state, "leagues": leagues_state}, STATE_DATA_TYPE, STATE_FILENAME)
+                return result
+
+            # Step 2: Count each due league's pages concurrently, writing the pages hit on the way
+            logger.info(f"[STEP] LEAGUE STANDINGS EXTRACT - Refreshing {len(due)} of {len(league_ids)} leagues for gameweek {event}")
+            writer = self.s3_client.open_ndjson_writer(
+                LEAGUE_STANDINGS_DATA_TYPE, f"league_standings_{now.strftime('%Y%m%d_%H%M%S')}", self.rows_per_shard
+            )
+            pages: Dict[int, int] = {}
+            fetched_pages: Dict[int, Set[int]] = {}
+            failed: Set[int] = set()
+            stopped = False
+            discoveries = self.api_client.iter_parallel(self._discover, due, max_workers=self.max_workers)
+            try:
+                for league_id, discovered in discoveries:
+                    if self._stopping():
+                        stopped = True
+                        break
+                    if discovered is None:
+                        failed.add(league_id)
+                        continue
+                    pages[league_id] = discovered["pages"]
+                    fetched_pages[league_id] = set(discovered["fetched"])
+                    for page, payload in discovered["fetched"].items():
+                        self._write_page(writer, league_id, event, page, discovered["pages"], payload)
+                    result["pages_fetched"] += len(discovered["fetched"])
+            finally:
+                discoveries.close()
+
+            # Step 3: Fetch every league's remaining pages concurrently and stream them to the shards
+            def remaining_pages() -> Iterator[Tuple[int, int]]:
+                for league_id, count in pages.items():
+                    for page in range(1, count + 1):
+                        if page not in fetched_pages[league_id]:
+                            yield league_id, page
+
+            if not stopped:
+                responses = self.api_client.iter_parallel(self._fetch_page, remaining_pages(), max_workers=self.max_workers)
+                try:
+                    for (league_id, page), payload in responses:
+                        if self._stopping():
+                            stopped = True
+                            break
+                        if payload is None:
+                            failed.add(league_id)
+                            continue
+                        self._write_page(writer, league_id, event, page, pages[league_id], payload)
+                        fetched_pages[league_id].add(page)
+                        result["pages_fetched"] += 1
+                finally:
+                    # Closing the generator waits for in-flight requests and shuts down the fetch pool
+                    responses.close()
+            if stopped:
+                logger.warning("[STEP] LEAGUE STANDINGS EXTRACT - Stopping early, remaining leagues are refreshed next run")
+
+            # Step 4: Upload the last shard, add this run's shards to the day's manifest, then save the
+            # complete leagues as pending until they are loaded
+            result["entries_written"] = writer.rows_written
+            shards = writer.close()
+            writer = None
+            complete = sorted(
+                league_id for league_id, count in pages.items()
+                if league_id not in failed and len(fetched_pages[league_id]) == count
+            )
+            result["leagues_fetched"] = len(complete)
+            result["leagues_failed"] = len(failed)
+            result["shards_written"] = len(shards)
+            if shards:
+                manifest = self.s3_client.load_json(LEAGUE_STANDINGS_DATA_TYPE, manifest_filename(run_date)) or {"shards": []}
+                result["s3_path"] = self.s3_client.save_json(
+                    {"event": event, "shards": manifest["shards"] + shards},
+                    LEAGUE_STANDINGS_DATA_TYPE,
+                    manifest_filename(run_date)
+                )
+            self.s3_client.save_json(
+                {"event": event, "leagues": {str(league_id): {"event": event, "pages": pages[league_id]} for league_id in complete}},
+                STATE_DATA_TYPE,
+                PENDING_STATE_FILENAME
+            )
+            self.s3_client.save_json({**state, "leagues": leagues_state}, STATE_DATA_TYPE, STATE_FILENAME)
+
+            logger.info(
+                f"[STEP_COMPLETE] LEAGUE STANDINGS EXTRACT - Leagues: {result['leagues_fetched']}, "
+                f"Failed: {result['leagues_failed']}, Pages: {result['pages_fetched']}, "
+                f"Entries: {result['entries_written']}, Shards: {result['shards_written']}, Path: {result['s3_path']}"
+            )
+            return result
+
+        except Exception as e:
+            if writer is not None:
+                writer.abort()
+            logger.error(f"[STEP_FAILED] LEAGUE STANDINGS EXTRACT - {str(e)}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
@@ -0,0 +1,44 @@
+import os
+import logging
+from typing import Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Connection string of the backend's database; its users table holds each registered user's FPL manager id
+USERS_DATABASE_URL_ENV = "USERS_DATABASE_URL"
+
+TRACKED_MANAGERS_SQL = """
+SELECT DISTINCT manager_id
+FROM users
+WHERE is_active AND manager_id ~ '^[0-9]+$'
+"""
+
+
+def parse_manager_ids(value: str) -> List[int]:
+    """Manager ids from a comma-separated list, e.g. "123,456" """
+    return [int(manager_id) for manager_id in value.split(",") if manager_id.strip()]
+
+
+def load_registered_manager_ids(database_url: str) -> List[int]:
+    """Manager ids of active users in the backend's users table"""
+    # Only needed where the users database is reachable, so psycopg is an optional dependency
+    import psycopg
+    with psycopg.connect(database_url) as connection:
+        rows = connection.execute(TRACKED_MANAGERS_SQL).fetchall()
+    return sorted(int(row[0]) for row in rows)
+
+
+def tracked_manager_ids(manager_ids: Optional[Iterable[int]] = None) -> List[int]:
+    """
+    Managers whose history is crawled: the ids given, otherwise the backend's registered users
+    when USERS_DATABASE_URL is set, otherwise none.
+    """
+    if manager_ids:
+        return sorted(set(manager_ids))
+    database_url = os.getenv(USERS_DATABASE_URL_ENV)
+    if not database_url:
+        logger.info(f"No manager ids given and {USERS_DATABASE_URL_ENV} is not set, no managers to crawl")
+        return []
+    manager_ids = load_registered_manager_ids(database_url)
+    logger.info(f"Found {len(manager_ids)} registered managers in the users table")
+    return manager_ids
\ No newline at end of file
@@ -0,0 +1,185 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional
+import logging
+from zoneinfo import ZoneInfo
+
+from extract.manager_history.managers import tracked_manager_ids
+
+logger = logging.getLogger(__name__)
+
+MANAGER_HISTORY_DATA_TYPE = "manager_history"
+
+STATE_DATA_TYPE = "run_state"
+STATE_FILENAME = "manager_history_state.json"
+# State of the last crawl, moved into STATE_FILENAME by the source load (commit_manager_history_state)
+PENDING_STATE_FILENAME = "manager_history_state_pending.json"
+
+# entry/{id}/history/ sections kept per manager
+MANAGER_HISTORY_SECTIONS = ("current", "past", "chips")
+
+
+def latest_finished_event(bootstrap_data: Dict[str, Any]) -> int:
+    """Id of the last gameweek whose data is final, or 0 before the first one"""
+    finished = [
+        event["id"] for event in bootstrap_data.get("events", [])
+        if event.get("finished") and event.get("data_checked")
+    ]
+    return max(finished, default=0)
+
+
+def commit_manager_history_state(s3_client, loaded_ids) -> int:
+    """
+    Save the state of the last crawl for managers whose history is now in SOURCE_MANAGER_HISTORY,
+    and for those that needed no load (unchanged or not found). A manager whose changed history
+    was written but not loaded keeps its old state and validators, so the next run fetches it
+    again. Returns the number of managers whose state was saved.
+    """
+    pending = s3_client.load_json(STATE_DATA_TYPE, PENDING_STATE_FILENAME)
+    if not pending:
+        return 0
+    loaded = {str(manager_id) for manager_id in loaded_ids}
+    written = set(pending["written"])
+    committed = {
+        manager_id: manager_state for manager_id, manager_state in pending["managers"].items()
+        if manager_id not in written or manager_id in loaded
+    }
+    state = s3_client.load_json(STATE_DATA_TYPE, STATE_FILENAME) or {}
+    s3_client.save_json({"managers": {**state.get("managers", {}), **committed}}, STATE_DATA_TYPE, STATE_FILENAME)
+    return len(committed)
+
+
+class ManagerHistoryETLPipelineExtract:
+    """
+    Crawls entry/{id}/history/ for tracked managers, once per finished gameweek each.
+
+    The state at fpl-data/run_state/manager_history_state.json records, per manager, the
+    gameweek it was last refreshed for and the ETag / Last-Modified of that response. Only
+    managers not yet refreshed for the latest finished gameweek are requested, with those
+    validators, so an unchanged history costs a 304 and writes nothing. The crawl's own
+    state is saved as pending and only replaces a manager's state once the source load has
+    merged its history (commit_manager_history_state). Fetches run on a
+    bounded pool, paced by the API client's (shared) rate limiter, and each changed history
+    is streamed to the S3 writer as a compact record of its sections as soon as it arrives.
+
+    With should_stop, the crawl stops taking results when it returns True; managers not
+    reached keep their old state and are requested on the next run.
+    """
+
+    def __init__(self, api_client, s3_client, manager_ids: Optional[Iterable[int]] = None, max_workers: int = 8,
+                 should_stop: Optional[Callable[[], bool]] = None):
+        self.api_client = api_client
+        self.s3_client = s3_client
+        self.manager_ids = manager_ids
+        self.max_workers = max_workers
+        self.should_stop = should_stop
+
+    def _fetch(self, manager: Dict[str, Any]):
+        return self.api_client.get_manager_history(manager["id"], manager.get("etag"), manager.get("last_modified"))
+
+    def run(self) -> Dict[str, Any]:
+        """Execute the manager history ETL pipeline"""
+        writer = None
+        try:
+            # Step 1: Work out the gameweek to refresh for and which managers are behind it
+            now = datetime.now(ZoneInfo("Australia/Sydney"))
+            result = {
+                "success": True,
+                "managers_tracked": 0,
+                "managers_fetched": 0,
+                "managers_unchanged": 0,
+                "managers_not_found": 0,
+                "managers_failed": 0,
+                "s3_path": None,
+                "extraction_timestamp": now.strftime("%Y-%m-%dT%H:%M:%S")
+            }
+            manager_ids = tracked_manager_ids(self.manager_ids)
+            result["managers_tracked"] = len(manager_ids)
+            if not manager_ids:
+                logger.info("[STEP_COMPLETE] MANAGER HISTORY EXTRACT - No tracked managers")
+                return result
+
+            bootstrap_data = self.api_client.get_bootstrap_data()
+            if bootstrap_data is None:
+                return {
+                    "success": False,
+                    "error": "Failed to fetch bootstrap data from FPL API"
+                }
+            event = latest_finished_event(bootstrap_data)
+
+            state = self.s3_client.load_json(STATE_DATA_TYPE, STATE_FILENAME) or {}
+            managers_state = state.get("managers", {})
+            refreshed = {}
+            written = []
+            due = [
+                {"id": manager_id, **managers_state.get(str(manager_id), {})}
+                for manager_id in manager_ids
+                if managers_state.get(str(manager_id), {}).get("event", -1) < event
+            ]
+            if not due:
+                logger.info(f"[STEP_COMPLETE] MANAGER HISTORY EXTRACT - All {len(manager_ids)} managers already refreshed for gameweek {event}")
+                return result
+
+            # Step 2: Fetch due managers concurrently and stream changed histories to S3
+            filename = f"manager_history_{now.strftime('%Y%m%d')}.json"
+            logger.info(f"[STEP] MANAGER HISTORY EXTRACT - Refreshing {len(due)} of {len(manager_ids)} managers for gameweek {event}")
+            writer = self.s3_client.open_json_writer(MANAGER_HISTORY_DATA_TYPE, filename)
+            responses = self.api_client.iter_parallel(self._fetch, due, max_workers=self.max_workers)
+            try:
+                for manager, response in responses:
+                    if self.should_stop is not None and self.should_stop():
+                        logger.warning("[STEP] MANAGER HISTORY EXTRACT - Stopping early, remaining managers are refreshed next run")
+                        break
+                    manager_id = str(manager["id"])
+                    if response is None or response.status is None:
+                        result["managers_failed"] += 1
+                        continue
+                    if response.status == 404:
+                        result["managers_not_found"] += 1
+                        refreshed[manager_id] = {"event": event}
+                        continue
+                    if response.status == 304:
+                        result["managers_unchanged"] += 1
+                    else:
+                        payload = response.payload if isinstance(response.payload, dict) else {}
+                        writer.write_item(manager_id, {
+                            "event": event,
+                            **{section: payload.get(section) or [] for section in MANAGER_HISTORY_SECTIONS}
+                        })
+                        written.append(manager_id)
+                        result["managers_fetched"] += 1
+                    refreshed[manager_id] = {
+                        "event": event,
+                        "etag": response.etag,
+                        "last_modified": response.last_modified,
+                    }
+            finally:
+                # Closing the generator waits for in-flight requests and shuts down the fetch pool
+                responses.close()
+
+            # Step 3: Save changed histories, then the state they were fetched with as pending until they are loaded
+            if writer.items_written:
+                result["s3_path"] = writer.close()
+            else:
+                writer.abort()
+            writer = None
+            self.s3_client.save_json(
+                {"event": event, "managers": refreshed, "written": written},
+                STATE_DATA_TYPE,
+                PENDING_STATE_FILENAME
+            )
+
+            logger.info(
+                f"[STEP_COMPLETE] MANAGER HISTORY EXTRACT - Fetched: {result['managers_fetched']}, "
+                f"Unchanged: {result['managers_unchanged']}, Not found: {result['managers_not_found']}, "
+                f"Failed: {result['managers_failed']}, Path: {result['s3_path']}"
+            )
+            return result
+
+        except Exception as e:
+            if writer is not None:
+                writer.abort()
+            logger.error(f"[STEP_FAILED] MANAGER HISTORY EXTRACT - {str(e)}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
\ No newline at end of file
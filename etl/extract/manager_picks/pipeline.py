@@ -0,0 +1,262 @@
+import os
+import io
+import gzip
+import shutil
+import hashlib
+import logging
+import tempfile
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from extract.manager_history.managers import tracked_manager_ids
+from extract.manager_history.pipeline import STATE_DATA_TYPE, latest_finished_event
+from extract.manager_picks.queue import DONE, MISSING, PicksWorkQueue
+
+logger = logging.getLogger(__name__)
+
+MANAGER_PICKS_DATA_TYPE = "manager_picks"
+
+# The work queue's SQLite file, gzip-compressed, between runs
+QUEUE_FILENAME = "manager_picks_queue.sqlite.gz"
+
+# Rows per Parquet shard; 15 picks per manager-gameweek, so about 16,700 pairs
+ROWS_PER_SHARD = 250_000
+
+PICKS_SCHEMA = pa.schema([
+    ("entry_id", pa.int32()),
+    ("gw", pa.int16()),
+    ("element", pa.int16()),
+    ("multiplier", pa.int8()),
+    ("is_captain", pa.bool_()),
+])
+
+
+def manifest_filename(run_date: str) -> str:
+    return f"manager_picks_{run_date}.json"
+
+
+class PicksShardBuffer:
+    """One shard's picks as column lists, turned into a Parquet file sorted by gw then entry_id"""
+
+    def __init__(self):
+        self.columns: Dict[str, List[Any]] = {name: [] for name in PICKS_SCHEMA.names}
+        self.pairs: List[Tuple[int, int]] = []
+
+    @property
+    def rows(self) -> int:
+        return len(self.columns["entry_id"])
+
+    def add(self, entry_id: int, gw: int, picks: Iterable[Dict[str, Any]]) -> None:
+        for pick in picks:
+            self.columns["entry_id"].append(entry_id)
+            self.columns["gw"].append(gw)
+            self.columns["element"].append(pick["element"])
+            self.columns["multiplier"].append(pick.get("multiplier", 0))
+            self.columns["is_captain"].append(bool(pick.get("is_captain")))
+        self.pairs.append((entry_id, gw))
+
+    def to_parquet(self) -> bytes:
+        table = pa.table(self.columns, schema=PICKS_SCHEMA).sort_by([("gw", "ascending"), ("entry_id", "ascending")])
+        sink = io.BytesIO()
+        pq.write_table(table, sink, compression="zstd")
+        return sink.getvalue()
+
+
+class ManagerPicksETLPipelineExtract:
+    """
+    Crawls entry/{id}/event/{gw}/picks/ for every tracked manager and finished gameweek.
+
+    The (entry_id, gw) pairs to fetch live in a persistent SQLite work queue
+    (extract.manager_picks.queue), kept at fpl-data/run_state/manager_picks_queue.sqlite.gz
+    between runs. Each run enqueues the tracked managers x the latest finished gameweek (or every
+    finished gameweek from first_event, to backfill); pairs already fetched are deduplicated by
+    the queue, so a new gameweek only adds one pair per manager and a crawl cut short by
+    should_stop resumes where it stopped. Pending pairs are fetched on
+    a bounded pool, paced by the API client's (shared) rate limiter.
+
+    Picks are buffered into Parquet shards of rows_per_shard rows (entry_id, gw, element,
+    multiplier, is_captain), fpl-data/manager_picks/manager_picks_YYYYMMDD_HHMMSS_shard_NNN.parquet.
+    A shard is uploaded and added to the day's manifest before its pairs are marked done and
+    the queue is saved, so a pair is never recorded as done without its picks in S3; at worst
+    a crash between the two fetches a pair again into a later shard.
+    """
+
+    def __init__(self, api_client, s3_client, manager_ids: Optional[Iterable[int]] = None,
+                 first_event: Optional[int] = None, max_workers: int = 8, rows_per_shard: int = ROWS_PER_SHARD,
+                 should_stop: Optional[Callable[[], bool]] = None):
+        self.api_client = api_client
+        self.s3_client = s3_client
+        self.manager_ids = manager_ids
+        self.first_event = first_event
+        self.max_workers = max_workers
+        self.rows_per_shard = rows_per_shard
+        self.should_stop = should_stop
+
+    def _fetch(self, pair: Tuple[int, int]):
+        entry_id, gw = pair
+        return self.api_client.get_manager_picks(entry_id, gw)
+
+    def _open_queue(self, directory: str) -> PicksWorkQueue:
+        """The work queue saved by the last run, or a new one, streamed through disk rather than memory"""
+        path = os.path.join(directory, "manager_picks_queue.sqlite")
+        compressed_path = f"{path}.gz"
+        if self.s3_client.download_file(STATE_DATA_TYPE, QUEUE_FILENAME, compressed_path):
+            with gzip.open(compressed_path, "rb") as source, open(path, "wb") as target:
+                shutil.copyfileobj(source, target)
+            os.remove(compressed_path)
+        return PicksWorkQueue(path)
+
+    def _save_queue(self, queue: PicksWorkQueue) -> None:
+        """Prune finished gameweeks, then compress and upload the queue file a block at a time"""
+        if queue.prune():
+            # Deleted rows only free pages; rewriting the file is what makes it smaller
+            queue.vacuum()
+        queue.commit()
+        compressed_path = f"{queue.path}.gz"
+        with open(queue.path, "rb") as source, gzip.open(compressed_path, "wb") as target:
+            shutil.copyfileobj(source, target)
+        try:
+            self.s3_client.upload_file(STATE_DATA_TYPE, compressed_path, QUEUE_FILENAME, content_type="application/gzip")
+        finally:
+            os.remove(compressed_path)
+
+    def _checkpoint(self, queue: PicksWorkQueue, shard: PicksShardBuffer, missing: List[Tuple[int, int]],
+                    failed: List[Tuple[int, int]], filename: str, run_date: str) -> Optional[str]:
+        """
+        Upload a shard and add it to the day's manifest, then record its pairs and save the queue.
+
+        Returns the manifest's S3 path, or None if the shard was empty.
+        """
+        manifest_path = None
+        if shard.rows:
+            body = shard.to_parquet()
+            self.s3_client.put_bytes(
+                MANAGER_PICKS_DATA_TYPE, filename, body, content_type="application/vnd.apache.parquet"
+            )
+            manifest = self.s3_client.load_json(MANAGER_PICKS_DATA_TYPE, manifest_filename(run_date)) or {"shards": []}
+            manifest_path = self.s3_client.save_json(
+                {"shards": manifest["shards"] + [{
+                    "filename": filename,
+                    "rows": shard.rows,
+                    "pairs": len(shard.pairs),
+                    "sha256": hashlib.sha256(body).hexdigest(),
+                }]},
+                MANAGER_PICKS_DATA_TYPE,
+                manifest_filename(run_date)
+            )
+        queue.mark(shard.pairs, DONE)
+        queue.mark(missing, MISSING)
+        queue.record_failures(failed)
+        self._save_queue(queue)
+        return manifest_path
+
+    def run(self) -> Dict[str, Any]:
+        """Execute the manager picks ETL pipeline"""
+        directory = None
+        queue = None
+        try:
+            # Step 1: Work out which gameweeks are finished for the tracked managers
+            now = datetime.now(ZoneInfo("Australia/Sydney"))
+            run_date = now.strftime('%Y%m%d')
+            result = {
+                "success": True,
+                "managers_tracked": 0,
+                "pairs_queued": 0,
+                "pairs_fetched": 0,
+                "pairs_missing": 0,
+                "pairs_failed": 0,
+                "picks_written": 0,
+                "shards_written": 0,
+                "s3_path": None,
+                "extraction_timestamp": now.strftime("%Y-%m-%dT%H:%M:%S")
+            }
+            manager_ids = tracked_manager_ids(self.manager_ids)
+            result["managers_tracked"] = len(manager_ids)
+            if not manager_ids:
+                logger.info("[STEP_COMPLETE] MANAGER PICKS EXTRACT - No tracked managers")
+                return result
+
+            bootstrap_data = self.api_client.get_bootstrap_data()
+            if bootstrap_data is None:
+                return {
+                    "success": False,
+                    "error": "Failed to fetch bootstrap data from FPL API"
+                }
+            event = latest_finished_event(bootstrap_data)
+
+            # Step 2: Add the new (manager, gameweek) pairs to the saved work queue
+            directory = tempfile.mkdtemp(prefix="manager_picks_")
+            queue = self._open_queue(directory)
+            if event:
+                result["pairs_queued"] = queue.enqueue(manager_ids, range(self.first_event or event, event + 1))
+            pending = queue.counts()["pending"]
+            if not pending:
+                self._save_queue(queue)
+                logger.info(f"[STEP_COMPLETE] MANAGER PICKS EXTRACT - Picks of {len(manager_ids)} managers already fetched up to gameweek {event}")
+                return result
+            logger.info(f"[STEP] MANAGER PICKS EXTRACT - {pending} manager-gameweeks pending, {result['pairs_queued']} new")
+
+            # Step 3: Fetch pending pairs concurrently, checkpointing a shard at a time
+            shard_prefix = f"manager_picks_{now.strftime('%Y%m%d_%H%M%S')}"
+            shard = PicksShardBuffer()
+            missing: List[Tuple[int, int]] = []
+            failed: List[Tuple[int, int]] = []
+
+            def checkpoint() -> None:
+                filename = f"{shard_prefix}_shard_{result['shards_written']:03d}.parquet"
+                manifest_path = self._checkpoint(queue, shard, missing, failed, filename, run_date)
+                if manifest_path:
+                    result["s3_path"] = manifest_path
+                    result["shards_written"] += 1
+
+            responses = self.api_client.iter_parallel(self._fetch, queue.iter_pending(), max_workers=self.max_workers)
+            try:
+                for pair, response in responses:
+                    if self.should_stop is not None and self.should_stop():
+                        logger.warning("[STEP] MANAGER PICKS EXTRACT - Stopping early, pending pairs are fetched next run")
+                        break
+                    if response is None or response.status is None:
+                        failed.append(pair)
+                        result["pairs_failed"] += 1
+                        continue
+                    if response.status == 404:
+                        missing.append(pair)
+                        result["pairs_missing"] += 1
+                        continue
+                    rows_before = shard.rows
+                    shard.add(pair[0], pair[1], (response.payload or {}).get("picks", []))
+                    result["pairs_fetched"] += 1
+                    result["picks_written"] += shard.rows - rows_before
+                    if shard.rows >= self.rows_per_shard:
+                        checkpoint()
+                        shard, missing, failed = PicksShardBuffer(), [], []
+            finally:
+                # Closing the generator waits for in-flight requests and shuts down the fetch pool
+                responses.close()
+
+            # Step 4: Write the last, partly filled shard and save the queue
+            checkpoint()
+
+            logger.info(
+                f"[STEP_COMPLETE] MANAGER PICKS EXTRACT - Pairs fetched: {result['pairs_fetched']}, "
+                f"Missing: {result['pairs_missing']}, Failed: {result['pairs_failed']}, "
+                f"Picks: {result['picks_written']}, Shards: {result['shards_written']}, Left: {queue.counts()['pending']}"
+            )
+            return result
+
+        except Exception as e:
+            logger.error(f"[STEP_FAILED] MANAGER PICKS EXTRACT - {str(e)}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+        finally:
+            if queue is not None:
+                queue.close()
+            if directory is not None:
+                shutil.rmtree(directory, ignore_errors=True)
@@ -0,0 +1,151 @@
+import sqlite3
+from typing import Dict, Iterable, Iterator, Tuple
+
+# Status of each (entry, gameweek) pair in the queue
+PENDING = 0
+DONE = 1
+# The API has no picks for the pair, e.g. a gameweek before the manager joined
+MISSING = 2
+# Failed max_attempts times; not fetched again
+FAILED = 3
+
+STATUS_NAMES = {PENDING: "pending", DONE: "done", MISSING: "missing", FAILED: "failed"}
+
+Pair = Tuple[int, int]
+
+
+class PicksWorkQueue:
+    """
+    Persistent queue of (entry_id, gw) pairs to fetch picks for, in a SQLite file.
+
+    Each pair is stored once, so enqueueing the tracked managers x every finished gameweek on
+    every run only adds the new pairs; pairs already done or missing are never fetched again.
+    prune() drops each manager's leading run of finished pairs and keeps only the gameweek it
+    reached in picks_entries, so the file stays about one row per manager however many
+    gameweeks have been crawled.
+    Pending pairs are read in (entry_id, gw) order in batches from a keyset cursor, so the
+    queue never has to be loaded into memory, and a crawl that stops part way resumes where it
+    left off. Status changes are only made durable by commit(), which the crawler calls once
+    the picks they record have been written.
+    """
+
+    def __init__(self, path: str, max_attempts: int = 3):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS picks_queue (
+                entry_id INTEGER NOT NULL,
+                gw INTEGER NOT NULL,
+                status INTEGER NOT NULL DEFAULT 0,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (entry_id, gw)
+            ) WITHOUT ROWID
+            """
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS picks_queue_status ON picks_queue (status, entry_id, gw)")
+        # Every gameweek up to done_through is finished for the entry; its rows have been pruned
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS picks_entries (
+                entry_id INTEGER PRIMARY KEY,
+                done_through INTEGER NOT NULL
+            )
+            """
+        )
+        self.connection.commit()
+
+    def enqueue(self, entry_ids: Iterable[int], gameweeks: Iterable[int]) -> int:
+        """Add every entry x gameweek pair not already queued or pruned as finished; returns how many were new"""
+        gameweeks = list(gameweeks)
+        before = self.connection.total_changes
+        self.connection.executemany(
+            """
+            INSERT OR IGNORE INTO picks_queue (entry_id, gw)
+            SELECT ?, ?
+            WHERE ? > COALESCE((SELECT done_through FROM picks_entries WHERE entry_id = ?), 0)
+            """,
+            ((entry_id, gw, gw, entry_id) for entry_id in entry_ids for gw in gameweeks)
+        )
+        self.connection.commit()
+        return self.connection.total_changes - before
+
+    def iter_pending(self, batch_size: int = 1000) -> Iterator[Pair]:
+        """Pending pairs in (entry_id, gw) order, read batch_size at a time"""
+        after = (-1, -1)
+        while True:
+            batch = self.connection.execute(
+                """
+                SELECT entry_id, gw FROM picks_queue
+                WHERE status = ? AND (entry_id, gw) > (?, ?)
+                ORDER BY entry_id, gw
+                LIMIT ?
+                """,
+                (PENDING, *after, batch_size)
+            ).fetchall()
+            yield from batch
+            if len(batch) < batch_size:
+                return
+            after = batch[-1]
+
+    def mark(self, pairs: Iterable[Pair], status: int) -> None:
+        self.connection.executemany(
+            "UPDATE picks_queue SET status = ? WHERE entry_id = ? AND gw = ?",
+            ((status, entry_id, gw) for entry_id, gw in pairs)
+        )
+
+    def record_failures(self, pairs: Iterable[Pair]) -> None:
+        """Count a failed attempt for each pair, giving up on those that reached max_attempts"""
+        self.connection.executemany(
+            """
+            UPDATE picks_queue
+            SET attempts = attempts + 1,
+                status = CASE WHEN attempts + 1 >= ? THEN ? ELSE status END
+            WHERE entry_id = ? AND gw = ?
+            """,
+            ((self.max_attempts, FAILED, entry_id, gw) for entry_id, gw in pairs)
+        )
+
+    def prune(self) -> int:
+        """
+        Move each entry's finished pairs below its first pending one (all of them if none is pending)
+        into picks_entries.done_through and delete them; returns the number of rows deleted
+        """
+        self.connection.execute(
+            """
+            INSERT INTO picks_entries (entry_id, done_through)
+            SELECT entry_id, COALESCE(MIN(CASE WHEN status = ? THEN gw END) - 1, MAX(gw))
+            FROM picks_queue
+            GROUP BY entry_id
+            ON CONFLICT (entry_id) DO UPDATE SET done_through = MAX(done_through, excluded.done_through)
+            """,
+            (PENDING,)
+        )
+        before = self.connection.total_changes
+        self.connection.execute(
+            """
+            DELETE FROM picks_queue
+            WHERE gw <= (SELECT done_through FROM picks_entries WHERE picks_entries.entry_id = picks_queue.entry_id)
+            """
+        )
+        return self.connection.total_changes - before
+
+    def commit(self) -> None:
+        self.connection.commit()
+
+    def vacuum(self) -> None:
+        """Rewrite the file without the pages freed by deletes"""
+        self.connection.commit()
+        self.connection.execute("VACUUM")
+
+    def counts(self) -> Dict[str, int]:
+        counts = dict.fromkeys(STATUS_NAMES.values(), 0)
+        for status, count in self.connection.execute("SELECT status, COUNT(*) FROM picks_queue GROUP BY status"):
+            counts[STATUS_NAMES[status]] = count
+        return counts
+
+    def close(self) -> None:
+        self.connection.commit()
+        self.connection.close()
+
@@ -1,77 +1,271 @@
 from datetime import datetime
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Iterator, List, Optional, Set, Tuple
 import logging
 from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
+# element-summary sections read by the source loaders
+PLAYER_DETAIL_SECTIONS = ("fixtures", "history", "history_past")
+
+HISTORY_PAST_DATA_TYPE = "player_history_past"
+TEAM_FIXTURES_DATA_TYPE = "team_fixtures"
+
+# Season of the last history_past extract, whose staged players join that season's index once loaded
+HISTORY_PAST_PENDING_FILENAME = "index_pending.json"
+
+
+def season_label(bootstrap_data: Dict[str, Any], now: datetime) -> str:
+    """Season a bootstrap snapshot belongs to, e.g. "2025-26", from the first gameweek deadline"""
+    events = bootstrap_data.get("events") or []
+    if events and events[0].get("deadline_time"):
+        start_year = int(events[0]["deadline_time"][:4])
+    else:
+        # Seasons start in August; before July we are still in the previous one
+        start_year = now.year if now.month >= 7 else now.year - 1
+    return f"{start_year}-{(start_year + 1) % 100:02d}"
+
+
+def history_past_index_filename(season: str) -> str:
+    return f"index_{season}.json"
+
+
+def commit_history_past_index(s3_client, player_ids) -> Optional[str]:
+    """
+    Add players whose history_past is now in SOURCE_PLAYER_HISTORY_PAST to the index of the
+    season the last extract belonged to. Returns the season, or None if nothing was extracted.
+    """
+    pending = s3_client.load_json(HISTORY_PAST_DATA_TYPE, HISTORY_PAST_PENDING_FILENAME)
+    if not pending:
+        return None
+    season = pending["season"]
+    index = s3_client.load_json(HISTORY_PAST_DATA_TYPE, history_past_index_filename(season)) or {}
+    s3_client.save_json(
+        {"season": season, "player_ids": sorted(set(index.get("player_ids", [])) | set(player_ids))},
+        HISTORY_PAST_DATA_TYPE,
+        history_past_index_filename(season)
+    )
+    return season
+
 
 class PlayerDetailsETLPipelineExtract:
-    def __init__(self, api_client, s3_client):
+    """
+    Streams element-summary payloads from the API to S3.
+
+    fetch -> validate/prune -> serialize -> spool: each payload is written to the S3
+    writer as soon as it arrives and is then dropped, so memory stays flat regardless
+    of the number of players or the length of their history.
+
+    With cache_history_past, previous seasons' totals are left out of the weekly artifact.
+    They cannot change mid-season, so they are written to a separate player_history_past
+    artifact only for players missing from the season index in S3: every player on the
+    first run of a season, then only newly added players. Players only join the index once
+    the cached source load has loaded them (commit_history_past_index), so a failed stage
+    or source load extracts them again on the next run.
+
+    With team_fixtures, upcoming fixtures are left out of the weekly artifact. Every
+    player in a squad has the same list, so it is kept once per team, from the first
+    player of that team, in a small team_fixtures artifact.
+    """
+
+    def __init__(self, api_client, s3_client, max_workers: int = 20, sections=PLAYER_DETAIL_SECTIONS,
+                 cache_history_past: bool = False, team_fixtures: bool = False):
         self.api_client = api_client
         self.s3_client = s3_client
-    
+        self.max_workers = max_workers
+        self.cache_history_past = cache_history_past
+        self.team_fixtures = team_fixtures
+        # Sections fetched for side artifacts rather than the player details artifact
+        self.side_sections = tuple(
+            section for section, enabled in (("history_past", cache_history_past), ("fixtures", team_fixtures))
+            if enabled
+        )
+        self.sections = tuple(section for section in sections if section not in self.side_sections)
+
+    def _validated_payloads(self, player_ids) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+        """Yield (player_id, pruned payload), with None for fetches that failed or are malformed"""
+        sections = self.sections + self.side_sections
+        for player_id, payload in self.api_client.iter_players_parallel(
+            player_ids=player_ids,
+            max_workers=self.max_workers
+        ):
+            if not isinstance(payload, dict) or not all(
+                isinstance(payload.get(section), list) for section in sections
+            ):
+                yield player_id, None
+                continue
+            yield player_id, {section: payload[section] for section in sections}
+
+    def _history_past_refresh_ids(self, season: str, player_ids) -> Set[int]:
+        """Return the players whose history_past is not yet loaded for this season"""
+        index = self.s3_client.load_json(HISTORY_PAST_DATA_TYPE, history_past_index_filename(season))
+        cached_ids = set(index.get("player_ids", [])) if index else set()
+        refresh_ids = set(player_ids) - cached_ids
+        if index is None:
+            logger.info(f"No history_past index for season {season}, extracting history_past for all {len(refresh_ids)} players")
+        else:
+            logger.info(f"history_past cached for {len(cached_ids)} players in season {season}, {len(refresh_ids)} new")
+        return refresh_ids
+
+    def _save_history_past_pending(self, season: str) -> None:
+        """Record the season of this extract for the cached source load to commit its players to"""
+        self.s3_client.save_json({"season": season}, HISTORY_PAST_DATA_TYPE, HISTORY_PAST_PENDING_FILENAME)
+
+    def _save_team_fixtures(self, team_fixtures: Dict[str, Any], now: datetime) -> str:
+        # Nested under "teams" so team ids never sit next to the extraction metadata save_json adds
+        s3_path = self.s3_client.save_json(
+            {"teams": team_fixtures}, TEAM_FIXTURES_DATA_TYPE, f"team_fixtures_{now.strftime('%Y%m%d')}.json"
+        )
+        logger.info(f"Fixtures saved for {len(team_fixtures)} teams: {s3_path}")
+        return s3_path
+
+    def _load_players(self) -> Optional[Tuple[List[int], Dict[int, Any], str, datetime]]:
+        """Player ids, their teams, the season and the extraction time, or None if bootstrap could not be fetched"""
+        logger.info("Fetching bootstrap data to get player IDs...")
+        bootstrap_data = self.api_client.get_bootstrap_data()
+        if bootstrap_data is None:
+            return None
+
+        players = bootstrap_data.get("elements", [])
+        player_ids = [player["id"] for player in players]
+        player_teams = {player["id"]: player.get("team") for player in players}
+        now = datetime.now(ZoneInfo("Australia/Sydney"))
+        season = season_label(bootstrap_data, now)
+        logger.info(f"Found {len(player_ids)} players to fetch detailed data for")
+        return player_ids, player_teams, season, now
+
+    def _stream_players(self, player_ids, player_teams: Dict[int, Any], refresh_ids: Set[int],
+                        writer, history_past_writer,
+                        should_stop: Optional[Callable[[], bool]] = None) -> Tuple[List[int], Dict[str, Any], List[int]]:
+        """
+        Fetch players and write each payload as it arrives, splitting off the side sections.
+
+        Returns the ids that failed, the upcoming fixtures of each team seen, and the ids not
+        reached because should_stop returned True (payloads already in flight are dropped).
+        """
+        failed_ids = []
+        team_fixtures = {}
+        attempted_ids = set()
+        payloads = self._validated_payloads(player_ids)
+        try:
+            for player_id, payload in payloads:
+                if should_stop is not None and should_stop():
+                    break
+                attempted_ids.add(player_id)
+                if payload is None:
+                    failed_ids.append(player_id)
+                    continue
+                if self.cache_history_past:
+                    history_past = payload.pop("history_past")
+                    if player_id in refresh_ids:
+                        history_past_writer.write_item(str(player_id), {"history_past": history_past})
+                if self.team_fixtures:
+                    fixtures = payload.pop("fixtures")
+                    team_id = player_teams.get(player_id)
+                    if team_id is not None and str(team_id) not in team_fixtures:
+                        team_fixtures[str(team_id)] = {"fixtures": fixtures}
+                writer.write_item(str(player_id), payload)
+        finally:
+            # Closing the generator waits for in-flight requests and shuts down the fetch pool
+            payloads.close()
+        remaining_ids = [player_id for player_id in player_ids if player_id not in attempted_ids]
+        return failed_ids, team_fixtures, remaining_ids
+
     def run(self) -> Dict[str, Any]:
         """Execute the player details ETL pipeline"""
+        writer = None
+        history_past_writer = None
         try:
-            # Step 1: Fetch bootstrap data to get all player IDs
-            logger.info("Fetching bootstrap data to get player IDs...")
-            bootstrap_data = self.api_client.get_bootstrap_data()
-            
-            if bootstrap_data is None:
+            # Steps 1-2: Fetch bootstrap data and extract the player IDs
+            players = self._load_players()
+            if players is None:
                 return {
                     "success": False,
                     "error": "Failed to fetch bootstrap data from FPL API"
                 }
-            
-            # Step 2: Extract player IDs from bootstrap data
-            players = bootstrap_data.get("elements", [])
-            player_ids = [player["id"] for player in players]
-            
-            logger.info(f"Found {len(player_ids)} players to fetch detailed data for")
-            
-            # Step 3: Fetch detailed player data in parallel
-            logger.info("Fetching detailed player data...")
-            player_details = self.api_client.get_multiple_players_parallel(
-                player_ids=player_ids,
-                max_workers=20  # Same as weekly for consistency
+            player_ids, player_teams, season, now = players
+
+            refresh_ids = set()
+            if self.cache_history_past:
+                refresh_ids = self._history_past_refresh_ids(season, player_ids)
+
+            # Step 3: Generate filename with timestamp
+            filename = f"player_details_{now.strftime('%Y%m%d')}.json"
+
+            # Step 4: Stream detailed player data straight into the S3 writer
+            logger.info(f"Streaming player details to S3 with filename: {filename}")
+            writer = self.s3_client.open_json_writer("player_details", filename)
+            if refresh_ids:
+                history_past_writer = self.s3_client.open_json_writer(
+                    HISTORY_PAST_DATA_TYPE, f"player_history_past_{now.strftime('%Y%m%d')}.json"
+                )
+            failed_ids, team_fixtures, _ = self._stream_players(
+                player_ids, player_teams, refresh_ids, writer, history_past_writer
             )
-            
-            if not player_details:
+
+            if writer.items_written == 0:
+                writer.abort()
+                writer = None
+                if history_past_writer is not None:
+                    history_past_writer.abort()
+                    history_past_writer = None
                 return {
                     "success": False,
                     "error": "No player details were successfully fetched"
                 }
-            
-            # Step 4: Generate filename with timestamp
-            now = datetime.now(ZoneInfo("Australia/Sydney"))
-            filename = f"player_details_{now.strftime('%Y%m%d')}.json"
-            
-            # Step 5: Save to S3 (S3DataLake will handle enrichment with timestamps)
-            logger.info(f"Saving {len(player_details)} player details to S3 with filename: {filename}")
-            s3_path = self.s3_client.save_json(player_details, "player_details", filename)
-            
-            # Step 6: Calculate success metrics
-            successful_players = len(player_details)
-            failed_players = len(player_ids) - successful_players
-            
+
+            successful_players = writer.items_written
+            uncompressed_bytes = writer.bytes_written
+            s3_path = writer.close()
+            writer = None
+
+            # Step 5: Save newly extracted history_past; its players join the season index once loaded
+            history_past_players = 0
+            history_past_s3_path = None
+            if history_past_writer is not None:
+                history_past_players = history_past_writer.items_written
+                if history_past_players:
+                    history_past_s3_path = history_past_writer.close()
+                else:
+                    history_past_writer.abort()
+                history_past_writer = None
+                self._save_history_past_pending(season)
+                logger.info(f"history_past extracted for {history_past_players} players: {history_past_s3_path}")
+
+            # Step 6: Save one upcoming fixture list per team
+            team_fixtures_s3_path = None
+            if self.team_fixtures:
+                team_fixtures_s3_path = self._save_team_fixtures(team_fixtures, now)
+
+            # Step 7: Calculate success metrics
+            failed_players = len(failed_ids)
+            if failed_ids:
+                logger.warning(f"Failed to fetch {failed_players} players: {failed_ids[:10]}...")
+
             logger.info(f"Player Details ETL completed successfully.")
             logger.info(f"Players fetched: {successful_players}, Failed: {failed_players}")
             logger.info(f"S3 path: {s3_path}")
-            
+
             return {
                 "success": True,
-                "data": player_details,
                 "players_fetched": successful_players,
                 "players_failed": failed_players,
                 "total_players": len(player_ids),
+                "uncompressed_bytes": uncompressed_bytes,
                 "s3_path": s3_path,
+                "history_past_players": history_past_players,
+                "history_past_s3_path": history_past_s3_path,
+                "team_fixtures_s3_path": team_fixtures_s3_path,
                 "extraction_timestamp": now.strftime("%Y-%m-%dT%H:%M:%S")
             }
-            
+
         except Exception as e:
+            if writer is not None:
+                writer.abort()
+            if history_past_writer is not None:
+                history_past_writer.abort()
             logger.error(f"Player Details ETL pipeline failed: {str(e)}")
             return {
                 "success": False,
                 "error": str(e)
-            }
\ No newline at end of file
+            }
@@ -0,0 +1,492 @@
+import os
+import sys
+import json
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from extract.player_details.pipeline import (
+    HISTORY_PAST_DATA_TYPE,
+    PLAYER_DETAIL_SECTIONS,
+    PlayerDetailsETLPipelineExtract,
+)
+from orchestration.deadline import DEFAULT_MARGIN_SECONDS, Deadline, DeadlineExceeded, check_deadline
+
+logger = logging.getLogger(__name__)
+
+# Shard artifacts and the day's shard manifest live under fpl-data/player_details_shards/
+SHARDS_DATA_TYPE = "player_details_shards"
+
+# Lambda function that runs shards; defaults to the function running the coordinator
+SHARD_FUNCTION_ENV = "SHARD_FUNCTION_NAME"
+
+
+def shard_filename(dataset: str, run_date: str, shard_index: int) -> str:
+    return f"{dataset}_{run_date}_shard_{shard_index:03d}.json"
+
+
+def manifest_filename(run_date: str) -> str:
+    return f"player_details_{run_date}_manifest.json"
+
+
+def progress_filename(run_date: str) -> str:
+    return f"player_details_{run_date}_progress.json"
+
+
+def partition_player_ids(player_ids: List[int], shard_count: int) -> List[List[int]]:
+    """Split player ids into at most shard_count contiguous shards whose sizes differ by at most one"""
+    ids = sorted(player_ids)
+    shard_count = max(1, min(shard_count, len(ids)))
+    size, remainder = divmod(len(ids), shard_count)
+    shards = []
+    start = 0
+    for index in range(shard_count):
+        end = start + size + (1 if index < remainder else 0)
+        shards.append(ids[start:end])
+        start = end
+    return shards
+
+
+def extract_player_details_shard(task: Dict[str, Any], api_client, s3_client,
+                                 should_stop: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+    """
+    Fetch one shard of players and write its artifacts.
+
+    The task is plain JSON so it can be sent to another process or Lambda invocation. Player
+    details go to a per-shard artifact, previous seasons for the shard's players in refresh_ids
+    to a per-shard history_past artifact, and upcoming fixtures per team are returned for the
+    coordinator to merge. If should_stop returns True the shard is closed early with the
+    players written so far, and the rest are returned as remaining_ids.
+    """
+    shard_index = task["shard_index"]
+    run_date = task["run_date"]
+    refresh_ids = set(task.get("refresh_ids", []))
+    player_teams = {int(player_id): team for player_id, team in task.get("player_teams", {}).items()}
+    pipeline = PlayerDetailsETLPipelineExtract(
+        api_client=api_client,
+        s3_client=s3_client,
+        max_workers=task.get("max_workers", 20),
+        sections=tuple(task.get("sections", PLAYER_DETAIL_SECTIONS)),
+        cache_history_past=task.get("cache_history_past", False),
+        team_fixtures=task.get("team_fixtures", False)
+    )
+
+    writer = None
+    history_past_writer = None
+    try:
+        logger.info(f"Extracting player details shard {shard_index}: {len(task['player_ids'])} players")
+        writer = s3_client.open_json_writer(SHARDS_DATA_TYPE, shard_filename("player_details", run_date, shard_index))
+        if refresh_ids:
+            history_past_writer = s3_client.open_json_writer(
+                SHARDS_DATA_TYPE, shard_filename(HISTORY_PAST_DATA_TYPE, run_date, shard_index)
+            )
+        failed_ids, team_fixtures, remaining_ids = pipeline._stream_players(
+            task["player_ids"], player_teams, refresh_ids, writer, history_past_writer, should_stop
+        )
+
+        players_fetched = writer.items_written
+        uncompressed_bytes = writer.bytes_written
+        writer.close()
+        sha256 = writer.sha256
+        s3_key = writer.s3_key
+        writer = None
+
+        history_past_filename = None
+        history_past_players = 0
+        if history_past_writer is not None:
+            history_past_players = history_past_writer.items_written
+            if history_past_players:
+                history_past_writer.close()
+                history_past_filename = os.path.basename(history_past_writer.s3_key)
+            else:
+                history_past_writer.abort()
+            history_past_writer = None
+
+        return {
+            "success": True,
+            "shard_index": shard_index,
+            "s3_key": s3_key,
+            "filename": os.path.basename(s3_key),
+            "sha256": sha256,
+            "players_fetched": players_fetched,
+            "failed_ids": failed_ids,
+            "remaining_ids": remaining_ids,
+            "uncompressed_bytes": uncompressed_bytes,
+            "history_past_players": history_past_players,
+            "history_past_filename": history_past_filename,
+            "team_fixtures": team_fixtures,
+        }
+
+    except Exception as e:
+        if writer is not None:
+            writer.abort()
+        if history_past_writer is not None:
+            history_past_writer.abort()
+        logger.error(f"Player details shard {shard_index} failed: {str(e)}")
+        return {
+            "success": False,
+            "shard_index": shard_index,
+            "error": str(e)
+        }
+
+
+def shard_should_stop(task: Dict[str, Any], context: Any = None) -> Optional[Callable[[], bool]]:
+    """
+    When a shard should close early: at the task's stop_at (epoch seconds, set by a coordinator
+    with a deadline so it gets every result back in time), or near the worker's own Lambda timeout
+    """
+    stop_at = task.get("stop_at")
+    deadline = Deadline.from_context(context, task.get("margin_seconds", DEFAULT_MARGIN_SECONDS))
+    if stop_at is None and deadline is None:
+        return None
+    return lambda: (stop_at is not None and time.time() >= stop_at) or (deadline is not None and deadline.expired)
+
+
+def run_player_details_shard(task: Dict[str, Any], context: Any = None) -> Dict[str, Any]:
+    """Worker entry point: build this process's own clients and extract one shard, stopping in time for the coordinator"""
+    from api.fpl_client import FPLAPIClient
+    from s3.s3_datalake import S3DataLake
+
+    api_client = FPLAPIClient(
+        rate_limit_delay=0.05,
+        max_retries=3
+    )
+    return extract_player_details_shard(task, api_client, S3DataLake(), shard_should_stop(task, context))
+
+
+def run_shards_locally(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Run every shard on a thread of this process"""
+    with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="shard") as executor:
+        return list(executor.map(run_player_details_shard, tasks))
+
+
+def run_shards_in_processes(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Run each shard in its own worker process; Lambda has no /dev/shm, so this is for local runs"""
+    with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as executor:
+        return list(executor.map(run_player_details_shard, tasks))
+
+
+def run_shards_on_lambda(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Invoke the ETL function once per shard with {"detail": {"shard": task}} and wait for every result"""
+    import boto3
+    from botocore.config import Config
+
+    function_name = os.getenv(SHARD_FUNCTION_ENV) or os.getenv("AWS_LAMBDA_FUNCTION_NAME")
+    if not function_name:
+        raise ValueError(f"Set {SHARD_FUNCTION_ENV} to run shards on Lambda outside of Lambda")
+    # Shards can run for most of the Lambda timeout, longer than the default read timeout
+    lambda_client = boto3.client("lambda", config=Config(read_timeout=900, retries={"max_attempts": 0}))
+
+    def invoke(task: Dict[str, Any]) -> Dict[str, Any]:
+        response = lambda_client.invoke(
+            FunctionName=function_name,
+            InvocationType="RequestResponse",
+            Payload=json.dumps({"detail": {"shard": task}}).encode("utf-8")
+        )
+        payload = json.loads(response["Payload"].read() or b"{}")
+        if response.get("FunctionError"):
+            return {"success": False, "shard_index": task["shard_index"], "error": payload.get("errorMessage", "Lambda error")}
+        return payload
+
+    with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="shard") as executor:
+        return list(executor.map(invoke, tasks))
+
+
+SHARD_EXECUTORS: Dict[str, Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]] = {
+    "local": run_shards_locally,
+    "process": run_shards_in_processes,
+    "lambda": run_shards_on_lambda,
+}
+
+
+def player_details_head(s3_client, run_date: str) -> Optional[Dict[str, Any]]:
+    """Head of the day's player details: the single artifact or the shard manifest, whichever was written last"""
+    heads = [
+        head for head in (
+            s3_client.head_json("player_details", f"player_details_{run_date}.json"),
+            s3_client.head_json(SHARDS_DATA_TYPE, manifest_filename(run_date)),
+        )
+        if head
+    ]
+    return max(heads, key=lambda head: head.get("last_modified") or "", default=None)
+
+
+def load_shard_manifest(s3_client, run_date: str) -> Optional[Dict[str, Any]]:
+    """The day's shard manifest, or None if the latest player details extract was not sharded"""
+    head = player_details_head(s3_client, run_date)
+    if head is None or not head["s3_key"].endswith(f"/{manifest_filename(run_date)}.gz"):
+        return None
+    return s3_client.load_json(SHARDS_DATA_TYPE, manifest_filename(run_date))
+
+
+class ShardedPlayerDetailsExtract(PlayerDetailsETLPipelineExtract):
+    """
+    Map/reduce version of the player details extract.
+
+    The coordinator fetches bootstrap once and partitions the player ids into shards. Each
+    shard is fetched and written to its own artifact by a worker: a thread or process here, or
+    a separate Lambda invocation, so the crawl is no longer bounded by one process and one
+    15-minute timeout. The reducer writes a shard manifest listing every shard artifact, which
+    the staging load copies in one statement, and merges the small side artifacts
+    (history_past and team fixtures) into the files the unsharded extract writes.
+
+    With a deadline, the fan-out is not started once it is near, and every shard is told to
+    stop by the coordinator's deadline; the reducer fails, listing the shards that stopped
+    before finishing, rather than the coordinator timing out while it waits for them.
+    """
+
+    def __init__(self, api_client, s3_client, shard_count: int, executor: str = "local", max_workers: int = 20,
+                 sections=PLAYER_DETAIL_SECTIONS, cache_history_past: bool = False, team_fixtures: bool = False,
+                 deadline: Optional[Deadline] = None):
+        super().__init__(api_client, s3_client, max_workers, sections, cache_history_past, team_fixtures)
+        if executor not in SHARD_EXECUTORS:
+            raise ValueError(f"Invalid shard executor '{executor}'. Must be one of: {', '.join(SHARD_EXECUTORS)}")
+        self.shard_count = shard_count
+        self.executor = executor
+        self.deadline = deadline
+
+    def run(self) -> Dict[str, Any]:
+        """Partition, fan out the shards and reduce their results"""
+        try:
+            players = self._load_players()
+            if players is None:
+                return {
+                    "success": False,
+                    "error": "Failed to fetch bootstrap data from FPL API"
+                }
+            player_ids, player_teams, season, now = players
+            run_date = now.strftime('%Y%m%d')
+
+            refresh_ids = set()
+            if self.cache_history_past:
+                refresh_ids = self._history_past_refresh_ids(season, player_ids)
+
+            # Shards stop in time for the coordinator to collect them before its own deadline
+            check_deadline(self.deadline, "extract:player_details")
+            stop_at = None
+            if self.deadline is not None:
+                stop_at = time.time() + self.deadline.remaining_seconds() - self.deadline.margin_seconds
+
+            # Map: one task per shard, each carrying only its own players
+            tasks = [
+                {
+                    "shard_index": index,
+                    "shard_count": self.shard_count,
+                    "run_date": run_date,
+                    "player_ids": shard_ids,
+                    "player_teams": {str(player_id): player_teams.get(player_id) for player_id in shard_ids},
+                    "refresh_ids": sorted(refresh_ids.intersection(shard_ids)),
+                    "sections": list(self.sections),
+                    "max_workers": self.max_workers,
+                    "cache_history_past": self.cache_history_past,
+                    "team_fixtures": self.team_fixtures,
+                    "stop_at": stop_at,
+                    "margin_seconds": self.deadline.margin_seconds if self.deadline is not None else DEFAULT_MARGIN_SECONDS,
+                }
+                for index, shard_ids in enumerate(partition_player_ids(player_ids, self.shard_count))
+            ]
+            logger.info(f"Extracting {len(player_ids)} players in {len(tasks)} shards with the {self.executor} executor")
+            shard_results = SHARD_EXECUTORS[self.executor](tasks)
+
+            failed_shards = [result for result in shard_results if not result.get("success", False)]
+            if failed_shards:
+                return {
+                    "success": False,
+                    "error": f"{len(failed_shards)} of {len(tasks)} shards failed: "
+                             + "; ".join(f"shard {result.get('shard_index')}: {result.get('error')}" for result in failed_shards)
+                }
+
+            return self._reduce(shard_results, player_ids, season, now, refresh_ids)
+
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"Sharded Player Details ETL pipeline failed: {str(e)}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+    def _reduce(self, shard_results: List[Dict[str, Any]], player_ids: List[int], season: str, now: datetime,
+                refresh_ids: Set[int]) -> Dict[str, Any]:
+        """Write the shard manifest and the merged side artifacts, and total up the shard results"""
+        run_date = now.strftime('%Y%m%d')
+        unfinished = [result for result in shard_results if result.get("remaining_ids")]
+        if unfinished:
+            return {
+                "success": False,
+                "error": f"{len(unfinished)} of {len(shard_results)} shards stopped at the deadline before finishing: "
+                         + "; ".join(f"shard {result['shard_index']}: {len(result['remaining_ids'])} players left" for result in unfinished)
+            }
+        failed_ids = [player_id for result in shard_results for player_id in result["failed_ids"]]
+        successful_players = sum(result["players_fetched"] for result in shard_results)
+        if successful_players == 0:
+            return {
+                "success": False,
+                "error": "No player details were successfully fetched"
+            }
+
+        history_past_players = 0
+        history_past_s3_path = None
+        if refresh_ids:
+            history_past_players, history_past_s3_path = self._merge_history_past(shard_results, run_date)
+            self._save_history_past_pending(season)
+            logger.info(f"history_past extracted for {history_past_players} players: {history_past_s3_path}")
+
+        team_fixtures_s3_path = None
+        if self.team_fixtures:
+            team_fixtures = {}
+            for result in shard_results:
+                for team_id, fixtures in result["team_fixtures"].items():
+                    team_fixtures.setdefault(team_id, fixtures)
+            team_fixtures_s3_path = self._save_team_fixtures(team_fixtures, now)
+
+        manifest = {
+            "run_date": run_date,
+            "shard_count": len(shard_results),
+            "players_fetched": successful_players,
+            "players_failed": len(failed_ids),
+            "shards": [
+                {
+                    "shard_index": result["shard_index"],
+                    "s3_key": result["s3_key"],
+                    "filename": result["filename"],
+                    "sha256": result["sha256"],
+                    "players_fetched": result["players_fetched"],
+                    "uncompressed_bytes": result["uncompressed_bytes"],
+                }
+                for result in sorted(shard_results, key=lambda result: result["shard_index"])
+            ],
+        }
+        s3_path = self.s3_client.save_json(manifest, SHARDS_DATA_TYPE, manifest_filename(run_date))
+
+        if failed_ids:
+            logger.warning(f"Failed to fetch {len(failed_ids)} players: {failed_ids[:10]}...")
+
+        logger.info(f"Player Details ETL completed successfully across {len(shard_results)} shards.")
+        logger.info(f"Players fetched: {successful_players}, Failed: {len(failed_ids)}")
+        logger.info(f"Shard manifest: {s3_path}")
+
+        return {
+            "success": True,
+            "players_fetched": successful_players,
+            "players_failed": len(failed_ids),
+            "total_players": len(player_ids),
+            "uncompressed_bytes": sum(result["uncompressed_bytes"] for result in shard_results),
+            "s3_path": s3_path,
+            "shards": len(shard_results),
+            "history_past_players": history_past_players,
+            "history_past_s3_path": history_past_s3_path,
+            "team_fixtures_s3_path": team_fixtures_s3_path,
+            "extraction_timestamp": now.strftime("%Y-%m-%dT%H:%M:%S")
+        }
+
+    def _merge_history_past(self, shard_results: List[Dict[str, Any]], run_date: str):
+        """Combine the shards' history_past artifacts into the single artifact the staging load reads"""
+        filenames = [result["history_past_filename"] for result in shard_results if result.get("history_past_filename")]
+        if not filenames:
+            return 0, None
+        writer = self.s3_client.open_json_writer(HISTORY_PAST_DATA_TYPE, f"player_history_past_{run_date}.json")
+        try:
+            for filename in filenames:
+                shard = self.s3_client.load_json(SHARDS_DATA_TYPE, filename) or {}
+                shard.pop("extraction_timestamp", None)
+                shard.pop("extraction_date", None)
+                for player_id, value in shard.items():
+                    writer.write_item(player_id, value)
+            players = writer.items_written
+            return players, writer.close()
+        except Exception:
+            writer.abort()
+            raise
+
+
+class CheckpointedPlayerDetailsExtract(ShardedPlayerDetailsExtract):
+    """
+    Player details extract that stops cleanly before a Lambda deadline and resumes on the next invocation.
+
+    Each invocation fetches the players not yet extracted today as one sequential shard. When
+    the deadline is near it stops taking payloads, closes its shard with the players written
+    so far, saves the shards and extracted ids to a progress file and raises DeadlineExceeded.
+    The invocation that fetches the last players reduces every shard like a sharded extract.
+    """
+
+    def __init__(self, api_client, s3_client, deadline: Deadline, max_workers: int = 20,
+                 sections=PLAYER_DETAIL_SECTIONS, cache_history_past: bool = False, team_fixtures: bool = False):
+        super().__init__(api_client, s3_client, 1, "local", max_workers, sections, cache_history_past, team_fixtures)
+        self.deadline = deadline
+
+    def run(self) -> Dict[str, Any]:
+        """Extract the players left from earlier invocations, or raise DeadlineExceeded with progress saved"""
+        try:
+            players = self._load_players()
+            if players is None:
+                return {
+                    "success": False,
+                    "error": "Failed to fetch bootstrap data from FPL API"
+                }
+            player_ids, player_teams, season, now = players
+            run_date = now.strftime('%Y%m%d')
+
+            refresh_ids = set()
+            if self.cache_history_past:
+                refresh_ids = self._history_past_refresh_ids(season, player_ids)
+
+            # A progress file marked complete belongs to an earlier run today, not this one
+            progress = self.s3_client.load_json(SHARDS_DATA_TYPE, progress_filename(run_date)) or {}
+            if progress.get("complete", True):
+                progress = {"shards": [], "done_ids": []}
+            shard_results = progress["shards"]
+            done_ids = set(progress["done_ids"])
+            todo_ids = [player_id for player_id in player_ids if player_id not in done_ids]
+            logger.info(f"{len(done_ids)} players extracted by earlier invocations, {len(todo_ids)} to go")
+
+            result = extract_player_details_shard(
+                {
+                    "shard_index": len(shard_results),
+                    "run_date": run_date,
+                    "player_ids": todo_ids,
+                    "player_teams": {str(player_id): player_teams.get(player_id) for player_id in todo_ids},
+                    "refresh_ids": sorted(refresh_ids.intersection(todo_ids)),
+                    "sections": list(self.sections),
+                    "max_workers": self.max_workers,
+                    "cache_history_past": self.cache_history_past,
+                    "team_fixtures": self.team_fixtures,
+                },
+                self.api_client,
+                self.s3_client,
+                should_stop=lambda: self.deadline.expired
+            )
+            if not result["success"]:
+                return result
+
+            shard_results.append(result)
+            remaining_ids = set(result.pop("remaining_ids"))
+            done_ids |= set(todo_ids) - remaining_ids
+            complete = not remaining_ids
+            self.s3_client.save_json(
+                {"shards": shard_results, "done_ids": sorted(done_ids), "complete": complete},
+                SHARDS_DATA_TYPE,
+                progress_filename(run_date)
+            )
+            if not complete:
+                raise DeadlineExceeded(
+                    "extract:player_details",
+                    f"{len(done_ids)} of {len(player_ids)} players extracted, progress saved"
+                )
+
+            return self._reduce(shard_results, player_ids, season, now, refresh_ids)
+
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"Checkpointed Player Details ETL pipeline failed: {str(e)}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
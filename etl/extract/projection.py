@@ -0,0 +1,137 @@
+import os
+import re
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+LOADER_SQL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "load", "source")
+
+# Extract datasets that can be projected, and the staging table their loaders read
+PROJECTED_DATASETS = {
+    "bootstrap": "STAGING_BOOTSTRAP",
+    "fixtures": "STAGING_FIXTURES",
+}
+
+# A dataset manifest maps each top-level key a loader reads to the item fields it reads,
+# or to None when the value is used whole (scalars, objects, or arrays read as a VARIANT)
+DatasetManifest = Dict[str, Optional[List[str]]]
+
+_COMMENT = re.compile(r"--[^\n]*")
+_BARE_RAW_DATA = re.compile(r"\braw_data\b(?!\s*:)", re.IGNORECASE)
+_RAW_DATA_KEY = re.compile(r"\braw_data:(\w+)", re.IGNORECASE)
+_FLATTEN_KEY = re.compile(r"FLATTEN\s*\(\s*input\s*=>\s*raw_data:(\w+)\s*\)\s+as\s+(\w+)", re.IGNORECASE)
+
+
+def _alias_fields(sql: str, alias: str) -> Optional[set]:
+    """Fields read from a FLATTEN alias as alias.value:field, or None if alias.value is used whole"""
+    fields = set()
+    for match in re.finditer(rf"\b{alias}\.value\b(:(\w+))?", sql, re.IGNORECASE):
+        if match.group(2) is None:
+            return None
+        fields.add(match.group(2))
+    return fields
+
+
+def parse_loader_sql(sql: str) -> Optional[Dict[str, Optional[set]]]:
+    """
+    Derive the raw_data keys and item fields a loader reads.
+
+    Returns None when the loader uses raw_data as a whole (e.g. flattening it as a map),
+    in which case nothing can safely be projected away.
+    """
+    sql = _COMMENT.sub("", sql)
+    if _BARE_RAW_DATA.search(sql):
+        return None
+
+    keys: Dict[str, Optional[set]] = {}
+    flattened = _FLATTEN_KEY.findall(sql)
+    for key, alias in flattened:
+        fields = _alias_fields(sql, alias)
+        keys[key] = _merge_fields(keys[key], fields) if key in keys else fields
+
+    flattened_keys = {key for key, _ in flattened}
+    for match in _RAW_DATA_KEY.finditer(sql):
+        key = match.group(1)
+        # Keys read outside a FLATTEN are kept whole
+        if key not in flattened_keys:
+            keys[key] = None
+
+    return keys
+
+
+def _merge_fields(left: Optional[set], right: Optional[set]) -> Optional[set]:
+    if left is None or right is None:
+        return None
+    return left | right
+
+
+def _loader_sql(sql_dir: str, staging_table: str) -> Iterable[str]:
+    """Yield every loader SQL file that reads the given staging table"""
+    pattern = re.compile(rf"\bFPL_SCHEMA\.{staging_table}\b", re.IGNORECASE)
+    for root, _, files in sorted(os.walk(sql_dir)):
+        for name in sorted(files):
+            if not name.endswith(".sql"):
+                continue
+            with open(os.path.join(root, name), "r") as f:
+                sql = f.read()
+            if pattern.search(sql):
+                yield sql
+
+
+def build_manifest(sql_dir: str = LOADER_SQL_DIR) -> Dict[str, DatasetManifest]:
+    """
+    Field manifest for each projectable dataset, derived from the source loaders.
+
+    Datasets with no loader, or with a loader that reads raw_data as a whole, are left out
+    and written unprojected.
+    """
+    manifest = {}
+    for dataset, staging_table in PROJECTED_DATASETS.items():
+        merged: Dict[str, Optional[set]] = {}
+        projectable = False
+        for sql in _loader_sql(sql_dir, staging_table):
+            keys = parse_loader_sql(sql)
+            if keys is None:
+                projectable = False
+                break
+            projectable = True
+            for key, fields in keys.items():
+                merged[key] = _merge_fields(merged[key], fields) if key in merged else fields
+        if not projectable or not merged:
+            logger.warning(f"No projectable loaders found for {staging_table}, {dataset} will not be projected")
+            continue
+        manifest[dataset] = {
+            key: sorted(fields) if fields is not None else None
+            for key, fields in sorted(merged.items())
+        }
+    return manifest
+
+
+@lru_cache(maxsize=1)
+def load_manifest() -> Dict[str, DatasetManifest]:
+    """Manifest for the loaders shipped with this package, parsed once per process"""
+    return build_manifest()
+
+
+def project_payload(payload: Dict[str, Any], dataset_manifest: DatasetManifest) -> Dict[str, Any]:
+    """Keep only the keys, and for arrays of objects only the item fields, that the loaders read"""
+    projected = {}
+    for key, fields in dataset_manifest.items():
+        if key not in payload:
+            continue
+        value = payload[key]
+        if fields is None or not isinstance(value, list):
+            projected[key] = value
+            continue
+        projected[key] = [
+            {field: item[field] for field in fields if field in item} if isinstance(item, dict) else item
+            for item in value
+        ]
+    return projected
+
+
+if __name__ == "__main__":
+    print(json.dumps(build_manifest(), indent=2))
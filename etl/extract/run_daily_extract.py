@@ -1,6 +1,7 @@
 import os
 import sys
 import logging
+from typing import Any, Callable, Dict, Optional, Set
 
 # Add the etl directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -10,15 +11,33 @@ from api.fpl_client import FPLAPIClient
 from extract.player_details.pipeline import PlayerDetailsETLPipelineExtract
 from extract.fixtures.pipeline import FixturesETLPipelineExtract
 from extract.bootstrap.pipeline import BootstrapETLPipelineExtract
+from orchestration.run_options import RunOptions
+from orchestration.profiling import RunProfiler, profile_phase
 
-def run_daily_extract_pipelines():
-    """Run all extract pipelines in sequence."""
+def run_daily_extract_pipelines(
+    on_artifact: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    options: Optional[RunOptions] = None,
+    skip_steps: Optional[Set[str]] = None,
+    profiler: Optional[RunProfiler] = None
+):
+    """
+    Run all extract pipelines in sequence.
+
+    on_artifact is called with the dataset name and pipeline result as soon as each
+    artifact has been written to S3, so downstream loads can start early.
+    """
+    options = options or RunOptions()
+    skip_steps = skip_steps or set()
     
     # Configure logging
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     logger = logging.getLogger(__name__)
     logger.info("[PIPELINE_START] DAILY EXTRACT - Starting extract staging pipeline")
 
+    if "extract:bootstrap" in skip_steps:
+        logger.info("[STEP_SKIPPED] BOOTSTRAP EXTRACT - Artifact already extracted today")
+        return {"success": True, "skipped": True}
+
     s3_client = S3DataLake()
     api_client = FPLAPIClient(
         rate_limit_delay=0.05,
@@ -27,12 +46,20 @@ def run_daily_extract_pipelines():
 
     try:
         # Run Bootstrap pipeline
-        pipeline = BootstrapETLPipelineExtract(api_client=api_client, s3_client=s3_client)
-        result = pipeline.run()
+        pipeline = BootstrapETLPipelineExtract(
+            api_client=api_client,
+            s3_client=s3_client,
+            projection=options.projection_for("bootstrap"),
+            archive_raw=options.archive_raw
+        )
+        with profile_phase(profiler, "extract:bootstrap"):
+            result = pipeline.run()
         if result["success"]:
             logger.info(f"[PIPELINE_COMPLETE] BOOTSTRAP EXTRACT - Completed successfully - Players: {result['players_count']}, Teams: {result['teams_count']}, Gameweeks: {result['gameweeks_count']}")
             logger.info(f"[STEP_COMPLETE] BOOTSTRAP EXTRACT - S3 upload - Path: {result['s3_path']}")
             logger.info(f"[STEP_COMPLETE] BOOTSTRAP EXTRACT - Extraction timestamp: {result['extraction_timestamp']}")
+            if on_artifact:
+                on_artifact("bootstrap", result)
             return result
         else:
             logger.error(f"[PIPELINE_FAILED] BOOTSTRAP EXTRACT - {result['error']}")
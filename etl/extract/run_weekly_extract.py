@@ -1,18 +1,48 @@
 import os
 import sys
 import logging
+from typing import Any, Callable, Dict, Optional, Set
 
 # Add the etl directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from s3.s3_datalake import S3DataLake
 from api.fpl_client import FPLAPIClient
+from api.rate_limiter import RateLimiter
 from extract.player_details.pipeline import PlayerDetailsETLPipelineExtract
+from extract.player_details.sharding import CheckpointedPlayerDetailsExtract, ShardedPlayerDetailsExtract
 from extract.fixtures.pipeline import FixturesETLPipelineExtract
 from extract.bootstrap.pipeline import BootstrapETLPipelineExtract
+from extract.event_live.pipeline import EventLiveETLPipelineExtract
+from extract.manager_history.pipeline import ManagerHistoryETLPipelineExtract
+from extract.league_standings.pipeline import LeagueStandingsETLPipelineExtract
+from extract.manager_picks.pipeline import ManagerPicksETLPipelineExtract
+from orchestration.run_options import RunOptions
+from orchestration.deadline import Deadline, DeadlineExceeded, check_deadline
+from orchestration.profiling import RunProfiler, profile_phase
 
-def run_weekly_extract_pipelines():
-    """Run all extract pipelines in sequence."""
+# Combined request rate of the per-manager crawls, which share one rate limiter
+CRAWL_REQUESTS_PER_SECOND = 10.0
+
+def run_weekly_extract_pipelines(
+    on_artifact: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    skip_steps: Optional[Set[str]] = None,
+    options: Optional[RunOptions] = None,
+    deadline: Optional[Deadline] = None,
+    profiler: Optional[RunProfiler] = None
+):
+    """
+    Run all extract pipelines in sequence.
+
+    on_artifact is called with the dataset name and pipeline result as soon as each
+    artifact has been written to S3, so downstream loads can start early. Pipelines
+    named in skip_steps (e.g. "extract:player_details") are not run. With a deadline,
+    DeadlineExceeded is raised instead of starting a pipeline too close to it, and the
+    player details crawl checkpoints its progress and stops early. With a profiler, each
+    pipeline is profiled as its own section.
+    """
+    skip_steps = skip_steps or set()
+    options = options or RunOptions()
 
     # Configure logging
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -24,46 +54,204 @@ def run_weekly_extract_pipelines():
         rate_limit_delay=0.05,
         max_retries=3
     )
+    crawl_client = FPLAPIClient(
+        max_retries=3,
+        rate_limiter=RateLimiter(CRAWL_REQUESTS_PER_SECOND)
+    )
 
     results = []
 
     try:
         # Run Bootstrap pipeline
-        logger.info("[STEP] WEEKLY EXTRACT - Running Bootstrap pipeline")
-        pipeline = BootstrapETLPipelineExtract(api_client=api_client, s3_client=s3_client)
-        result = pipeline.run()
-        if result["success"]:
-            logger.info(f"[STEP_COMPLETE] BOOTSTRAP EXTRACT - Completed successfully - Players: {result['players_count']}, Teams: {result['teams_count']}, Gameweeks: {result['gameweeks_count']}")
-            results.append(result)
+        if "extract:bootstrap" in skip_steps:
+            logger.info("[STEP_SKIPPED] BOOTSTRAP EXTRACT - Skipped")
         else:
-            logger.error(f"[STEP_FAILED] BOOTSTRAP EXTRACT - {result['error']}")
-            raise Exception(f"Bootstrap extract failed: {result['error']}")
+            check_deadline(deadline, "extract:bootstrap")
+            logger.info("[STEP] WEEKLY EXTRACT - Running Bootstrap pipeline")
+            pipeline = BootstrapETLPipelineExtract(
+                api_client=api_client,
+                s3_client=s3_client,
+                projection=options.projection_for("bootstrap"),
+                archive_raw=options.archive_raw
+            )
+            with profile_phase(profiler, "extract:bootstrap"):
+                result = pipeline.run()
+            if result["success"]:
+                logger.info(f"[STEP_COMPLETE] BOOTSTRAP EXTRACT - Completed successfully - Players: {result['players_count']}, Teams: {result['teams_count']}, Gameweeks: {result['gameweeks_count']}")
+                results.append(result)
+                if on_artifact:
+                    on_artifact("bootstrap", result)
+            else:
+                logger.error(f"[STEP_FAILED] BOOTSTRAP EXTRACT - {result['error']}")
+                raise Exception(f"Bootstrap extract failed: {result['error']}")
 
         # Run fixtures pipeline
-        logger.info("[STEP] WEEKLY EXTRACT - Running Fixtures pipeline")
-        pipeline = FixturesETLPipelineExtract(api_client=api_client, s3_client=s3_client)
-        result = pipeline.run()
-        if result["success"]:
-            logger.info(f"[STEP_COMPLETE] FIXTURES EXTRACT - Completed successfully - Fixtures: {result['fixtures_count']}")
-            results.append(result)
+        if "extract:fixtures" in skip_steps:
+            logger.info("[STEP_SKIPPED] FIXTURES EXTRACT - Skipped")
         else:
-            logger.error(f"[STEP_FAILED] FIXTURES EXTRACT - {result['error']}")
-            raise Exception(f"Fixtures extract failed: {result['error']}")
+            check_deadline(deadline, "extract:fixtures")
+            logger.info("[STEP] WEEKLY EXTRACT - Running Fixtures pipeline")
+            pipeline = FixturesETLPipelineExtract(
+                api_client=api_client,
+                s3_client=s3_client,
+                projection=options.projection_for("fixtures"),
+                archive_raw=options.archive_raw
+            )
+            with profile_phase(profiler, "extract:fixtures"):
+                result = pipeline.run()
+            if result["success"]:
+                logger.info(f"[STEP_COMPLETE] FIXTURES EXTRACT - Completed successfully - Fixtures: {result['fixtures_count']}")
+                results.append(result)
+                if on_artifact:
+                    on_artifact("fixtures", result)
+            else:
+                logger.error(f"[STEP_FAILED] FIXTURES EXTRACT - {result['error']}")
+                raise Exception(f"Fixtures extract failed: {result['error']}")
 
         # Run player details pipeline
-        logger.info("[STEP] WEEKLY EXTRACT - Running Player Details pipeline")
-        pipeline = PlayerDetailsETLPipelineExtract(api_client=api_client, s3_client=s3_client)
-        result = pipeline.run()
-        if result["success"]:
-            logger.info(f"[STEP_COMPLETE] PLAYER DETAILS EXTRACT - Completed successfully - Players fetched: {result['players_fetched']}, Failed: {result['players_failed']}")
-            results.append(result)
+        if "extract:player_details" in skip_steps:
+            logger.info("[STEP_SKIPPED] PLAYER DETAILS EXTRACT - Skipped")
+        else:
+            check_deadline(deadline, "extract:player_details")
+            logger.info("[STEP] WEEKLY EXTRACT - Running Player Details pipeline")
+            if options.shards > 1:
+                pipeline = ShardedPlayerDetailsExtract(
+                    api_client=api_client,
+                    s3_client=s3_client,
+                    shard_count=options.shards,
+                    executor=options.shard_executor,
+                    sections=options.player_detail_sections,
+                    cache_history_past=options.cache_history_past,
+                    team_fixtures=options.team_fixtures,
+                    deadline=deadline
+                )
+            elif deadline is not None:
+                pipeline = CheckpointedPlayerDetailsExtract(
+                    api_client=api_client,
+                    s3_client=s3_client,
+                    deadline=deadline,
+                    sections=options.player_detail_sections,
+                    cache_history_past=options.cache_history_past,
+                    team_fixtures=options.team_fixtures
+                )
+            else:
+                pipeline = PlayerDetailsETLPipelineExtract(
+                    api_client=api_client,
+                    s3_client=s3_client,
+                    sections=options.player_detail_sections,
+                    cache_history_past=options.cache_history_past,
+                    team_fixtures=options.team_fixtures
+                )
+            with profile_phase(profiler, "extract:player_details"):
+                result = pipeline.run()
+            if result["success"]:
+                logger.info(f"[STEP_COMPLETE] PLAYER DETAILS EXTRACT - Completed successfully - Players fetched: {result['players_fetched']}, Failed: {result['players_failed']}")
+                results.append(result)
+                if on_artifact:
+                    on_artifact("player_details", result)
+                    if options.cache_history_past:
+                        on_artifact("player_history_past", {"s3_path": result["history_past_s3_path"]})
+                    if options.team_fixtures:
+                        on_artifact("team_fixtures", {"s3_path": result["team_fixtures_s3_path"]})
+            else:
+                logger.error(f"[STEP_FAILED] PLAYER DETAILS EXTRACT - {result['error']}")
+                raise Exception(f"Player details extract failed: {result['error']}")
+
+        # Run event live pipeline
+        if "extract:event_live" in skip_steps:
+            logger.info("[STEP_SKIPPED] EVENT LIVE EXTRACT - Skipped")
+        else:
+            check_deadline(deadline, "extract:event_live")
+            logger.info("[STEP] WEEKLY EXTRACT - Running Event Live pipeline")
+            pipeline = EventLiveETLPipelineExtract(api_client=api_client, s3_client=s3_client)
+            with profile_phase(profiler, "extract:event_live"):
+                result = pipeline.run()
+            if result["success"]:
+                logger.info(f"[STEP_COMPLETE] EVENT LIVE EXTRACT - Completed successfully - Gameweeks fetched: {result['events_fetched']}")
+                results.append(result)
+                if on_artifact:
+                    on_artifact("event_live", result)
+            else:
+                logger.error(f"[STEP_FAILED] EVENT LIVE EXTRACT - {result['error']}")
+                raise Exception(f"Event live extract failed: {result['error']}")
+
+        # Run manager history crawl
+        if "extract:manager_history" in skip_steps:
+            logger.info("[STEP_SKIPPED] MANAGER HISTORY EXTRACT - Skipped")
+        else:
+            check_deadline(deadline, "extract:manager_history")
+            logger.info("[STEP] WEEKLY EXTRACT - Running Manager History pipeline")
+            pipeline = ManagerHistoryETLPipelineExtract(
+                api_client=crawl_client,
+                s3_client=s3_client,
+                manager_ids=options.manager_ids,
+                should_stop=(lambda: deadline.expired) if deadline is not None else None
+            )
+            with profile_phase(profiler, "extract:manager_history"):
+                result = pipeline.run()
+            if result["success"]:
+                logger.info(f"[STEP_COMPLETE] MANAGER HISTORY EXTRACT - Completed successfully - Managers fetched: {result['managers_fetched']}, Unchanged: {result['managers_unchanged']}")
+                results.append(result)
+                if on_artifact:
+                    on_artifact("manager_history", result)
+            else:
+                logger.error(f"[STEP_FAILED] MANAGER HISTORY EXTRACT - {result['error']}")
+                raise Exception(f"Manager history extract failed: {result['error']}")
+
+        # Run league standings crawl
+        if "extract:league_standings" in skip_steps:
+            logger.info("[STEP_SKIPPED] LEAGUE STANDINGS EXTRACT - Skipped")
         else:
-            logger.error(f"[STEP_FAILED] PLAYER DETAILS EXTRACT - {result['error']}")
-            raise Exception(f"Player details extract failed: {result['error']}")
+            check_deadline(deadline, "extract:league_standings")
+            logger.info("[STEP] WEEKLY EXTRACT - Running League Standings pipeline")
+            pipeline = LeagueStandingsETLPipelineExtract(
+                api_client=crawl_client,
+                s3_client=s3_client,
+                league_ids=options.league_ids,
+                manager_ids=options.manager_ids,
+                should_stop=(lambda: deadline.expired) if deadline is not None else None
+            )
+            with profile_phase(profiler, "extract:league_standings"):
+                result = pipeline.run()
+            if result["success"]:
+                logger.info(f"[STEP_COMPLETE] LEAGUE STANDINGS EXTRACT - Completed successfully - Leagues fetched: {result['leagues_fetched']}, Pages: {result['pages_fetched']}")
+                results.append(result)
+                if on_artifact:
+                    on_artifact("league_standings", result)
+            else:
+                logger.error(f"[STEP_FAILED] LEAGUE STANDINGS EXTRACT - {result['error']}")
+                raise Exception(f"League standings extract failed: {result['error']}")
+
+        # Run manager picks crawl
+        if "extract:manager_picks" in skip_steps:
+            logger.info("[STEP_SKIPPED] MANAGER PICKS EXTRACT - Skipped")
+        else:
+            check_deadline(deadline, "extract:manager_picks")
+            logger.info("[STEP] WEEKLY EXTRACT - Running Manager Picks pipeline")
+            pipeline = ManagerPicksETLPipelineExtract(
+                api_client=crawl_client,
+                s3_client=s3_client,
+                manager_ids=options.manager_ids,
+                first_event=options.picks_first_event,
+                should_stop=(lambda: deadline.expired) if deadline is not None else None
+            )
+            with profile_phase(profiler, "extract:manager_picks"):
+                result = pipeline.run()
+            if result["success"]:
+                logger.info(f"[STEP_COMPLETE] MANAGER PICKS EXTRACT - Completed successfully - Manager-gameweeks fetched: {result['pairs_fetched']}, Picks: {result['picks_written']}")
+                results.append(result)
+                if on_artifact:
+                    on_artifact("manager_picks", result)
+            else:
+                logger.error(f"[STEP_FAILED] MANAGER PICKS EXTRACT - {result['error']}")
+                raise Exception(f"Manager picks extract failed: {result['error']}")
 
         logger.info("[PIPELINE_COMPLETE] WEEKLY EXTRACT - All pipelines completed successfully")
         return {"success": True, "results": results}
 
+    except DeadlineExceeded as e:
+        logger.warning(f"[PIPELINE_SUSPENDED] WEEKLY EXTRACT - {e}")
+        raise
     except Exception as e:
         logger.error(f"[PIPELINE_FAILED] WEEKLY EXTRACT - {str(e)}")
         raise
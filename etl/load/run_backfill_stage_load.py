@@ -0,0 +1,96 @@
+import sys
+import os
+import logging
+from datetime import date
+from typing import Any, Callable, Dict, Optional, Set
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from load.stage.bootstrap.pipeline import run_bootstrap_staging_backfill
+from load.stage.fixtures.pipeline import run_fixtures_staging_backfill
+from load.stage.player_details.pipeline import run_player_details_staging_backfill
+from load.stage.event_live.pipeline import run_event_live_staging_backfill
+from load.stage.player_history_past.pipeline import run_player_history_past_staging_backfill
+from load.stage.team_fixtures.pipeline import run_team_fixtures_staging_backfill
+from load.stage.manager_history.pipeline import run_manager_history_staging_backfill
+from load.stage.league_standings.pipeline import run_league_standings_staging_backfill
+from load.stage.manager_picks.pipeline import run_manager_picks_staging_backfill
+from orchestration.deadline import Deadline, check_deadline
+from orchestration.profiling import RunProfiler, profile_phase
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# (step, name, pipeline) of the datasets staged for each schedule, mirroring the daily and weekly stage loads
+BACKFILL_PIPELINES = {
+    "daily": [
+        ("stage:bootstrap", "BOOTSTRAP", run_bootstrap_staging_backfill),
+    ],
+    "weekly": [
+        ("stage:bootstrap", "BOOTSTRAP", run_bootstrap_staging_backfill),
+        ("stage:fixtures", "FIXTURES", run_fixtures_staging_backfill),
+        ("stage:player_details", "PLAYER DETAILS", run_player_details_staging_backfill),
+        ("stage:event_live", "EVENT LIVE", run_event_live_staging_backfill),
+        ("stage:player_history_past", "PLAYER HISTORY PAST", run_player_history_past_staging_backfill),
+        ("stage:team_fixtures", "TEAM FIXTURES", run_team_fixtures_staging_backfill),
+        ("stage:manager_history", "MANAGER HISTORY", run_manager_history_staging_backfill),
+        ("stage:league_standings", "LEAGUE STANDINGS", run_league_standings_staging_backfill),
+        ("stage:manager_picks", "MANAGER PICKS", run_manager_picks_staging_backfill),
+    ],
+}
+
+
+def run_backfill_load_pipelines(
+    schedule: str,
+    start_date: date,
+    end_date: date,
+    skip_steps: Optional[Set[str]] = None,
+    on_step: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    deadline: Optional[Deadline] = None,
+    profiler: Optional[RunProfiler] = None
+):
+    """
+    Bulk load every extract file in a date range into the staging tables, one COPY per dataset.
+
+    Datasets whose step is in skip_steps are left out, on_step is called after each dataset is
+    loaded, and DeadlineExceeded is raised instead of starting a dataset if the deadline is near.
+    With a profiler, each dataset is profiled as its own section.
+    """
+    if schedule not in BACKFILL_PIPELINES:
+        raise ValueError(f"Unknown schedule: {schedule}")
+    skip_steps = skip_steps or set()
+
+    logger.info(f"[PIPELINE_START] {schedule.upper()} BACKFILL STAGE LOAD - Loading {start_date} to {end_date}")
+
+    for step, name, pipeline in BACKFILL_PIPELINES[schedule]:
+        if step in skip_steps:
+            logger.info(f"[STEP_SKIPPED] {name} BACKFILL STAGING - Skipped")
+            continue
+
+        check_deadline(deadline, step)
+        try:
+            with profile_phase(profiler, step):
+                result = pipeline(start_date, end_date)
+            if result.get("success", False):
+                logger.info(f"[STEP_COMPLETE] {name} BACKFILL STAGING - Rows loaded: {result.get('rows_loaded', 0)} across {result.get('dates_requested', 0)} dates")
+                if on_step:
+                    on_step(step, result)
+            else:
+                logger.error(f"[STEP_FAILED] {name} BACKFILL STAGING - {result.get('error', 'Unknown error')}")
+            logger.info(f"[STEP_COMPLETE] {name} BACKFILL STAGING - Pipeline result: {result}")
+
+        except Exception as e:
+            logger.error(f"[PIPELINE_FAILED] {name} BACKFILL STAGING - Exception: {e}")
+            raise
+
+    logger.info(f"[PIPELINE_COMPLETE] {schedule.upper()} BACKFILL STAGE LOAD - Completed")
+
+
+if __name__ == "__main__":
+    run_backfill_load_pipelines(
+        sys.argv[1],
+        date.fromisoformat(sys.argv[2]),
+        date.fromisoformat(sys.argv[3])
+    )
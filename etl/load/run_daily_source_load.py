@@ -1,6 +1,7 @@
 import sys
 import os
 import logging
+from typing import Any, Callable, Dict, Optional, Set
 
 # Add the etl directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -12,26 +13,51 @@ from load.source.player_history.pipeline import run_player_history_source
 from load.source.players.pipeline import run_players_source
 from load.source.teams.pipeline import run_teams_source
 from load.source.transfer_history.pipeline import run_transfer_history_source
+from load.source.price_changes.pipeline import run_price_changes_source
+from load.source.transfer_features.pipeline import run_transfer_features_source
+from orchestration.profiling import RunProfiler, profile_phase
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
-def run_daily_load_pipelines():
-    """Run all load pipelines in sequence."""
-    logger.info("Starting transfer history source pipeline...")
-    try:
-        result = run_transfer_history_source()
-        if result.get("success", False):
-            logger.info(f"✅ Transfer history source completed successfully - Rows loaded: {result.get('rows_loaded', 0)}")
-        else:
-            logger.error(f"❌ Transfer history source failed - Error: {result.get('error', 'Unknown error')}")
-        logger.info(f"Pipeline result: {result}")
-    
-    except Exception as e:
-        logger.error(f"❌ Transfer history source pipeline failed with exception: {e}")
-        raise
+# (step, label, pipeline) in the order they run; price changes and transfer features read the transfer history just loaded
+DAILY_SOURCE_PIPELINES = [
+    ("source:transfer_history", "Transfer history", run_transfer_history_source),
+    ("source:price_changes", "Price changes", run_price_changes_source),
+    ("source:transfer_features", "Transfer features", run_transfer_features_source),
+]
+
+
+def run_daily_load_pipelines(
+    skip_steps: Optional[Set[str]] = None,
+    on_step: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    profiler: Optional[RunProfiler] = None
+):
+    """Run all load pipelines in sequence, leaving out any step named in skip_steps."""
+    skip_steps = skip_steps or set()
+
+    for step, label, pipeline in DAILY_SOURCE_PIPELINES:
+        if step in skip_steps:
+            logger.info(f"⏭️ {label} source skipped")
+            continue
+
+        logger.info(f"Starting {label.lower()} source pipeline...")
+        try:
+            with profile_phase(profiler, step):
+                result = pipeline()
+            if result.get("success", False):
+                logger.info(f"✅ {label} source completed successfully - Rows loaded: {result.get('rows_loaded', 0)}")
+                if on_step:
+                    on_step(step, result)
+            else:
+                logger.error(f"❌ {label} source failed - Error: {result.get('error', 'Unknown error')}")
+            logger.info(f"Pipeline result: {result}")
+
+        except Exception as e:
+            logger.error(f"❌ {label} source pipeline failed with exception: {e}")
+            raise
 
 
 if __name__ == "__main__":
@@ -1,25 +1,39 @@
 import sys
 import os
 import logging
+from typing import Any, Callable, Dict, Optional, Set
 
 # Add the etl directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from load.stage.bootstrap.pipeline import run_bootstrap_staging
+from orchestration.profiling import RunProfiler, profile_phase
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
-def run_daily_load_pipelines():
-    """Run all load pipelines in sequence."""
+def run_daily_load_pipelines(
+    skip_steps: Optional[Set[str]] = None,
+    on_step: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    profiler: Optional[RunProfiler] = None
+):
+    """Run all load pipelines in sequence, leaving out stage:bootstrap if named in skip_steps."""
+    skip_steps = skip_steps or set()
+    if "stage:bootstrap" in skip_steps:
+        logger.info("[STEP_SKIPPED] TRANSFER HISTORY STAGING - Skipped")
+        return
+
     logger.info("[PIPELINE_START] DAILY STAGE LOAD - Starting transfer history staging pipeline")
     
     try:
-        result = run_bootstrap_staging()
+        with profile_phase(profiler, "stage:bootstrap"):
+            result = run_bootstrap_staging()
         if result.get("success", False):
             logger.info(f"[PIPELINE_COMPLETE] TRANSFER HISTORY STAGING - Completed successfully - Rows loaded: {result.get('rows_loaded', 0)}")
+            if on_step:
+                on_step("stage:bootstrap", result)
         else:
             logger.error(f"[PIPELINE_FAILED] TRANSFER HISTORY STAGING - {result.get('error', 'Unknown error')}")
         logger.info(f"[STEP_COMPLETE] TRANSFER HISTORY STAGING - Pipeline result: {result}")
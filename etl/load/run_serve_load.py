@@ -0,0 +1,63 @@
+import sys
+import os
+import logging
+from typing import Any, Callable, Dict, Optional, Set
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from load.serve.players.pipeline import run_players_serve
+from orchestration.deadline import Deadline, check_deadline
+from orchestration.profiling import RunProfiler, profile_phase
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+# (step, label, pipeline) in the order they run; each reads source tables loaded by the weekly source phase
+SERVE_PIPELINES = [
+    ("serve:players", "Players", run_players_serve),
+]
+
+
+def run_serve_load_pipelines(
+    skip_steps: Optional[Set[str]] = None,
+    on_step: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    deadline: Optional[Deadline] = None,
+    profiler: Optional[RunProfiler] = None
+):
+    """
+    Run all serve pipelines in sequence, leaving out any step named in skip_steps.
+
+    on_step is called with the step name and result after each successful step. If the
+    deadline is near, DeadlineExceeded is raised instead of starting the next step. With a
+    profiler, each step is profiled as its own section.
+    """
+    skip_steps = skip_steps or set()
+
+    for step, label, pipeline in SERVE_PIPELINES:
+        if step in skip_steps:
+            logger.info(f"⏭️ {label} serve skipped")
+            continue
+
+        check_deadline(deadline, step)
+        logger.info(f"Starting {label.lower()} serve pipeline...")
+        try:
+            with profile_phase(profiler, step):
+                result = pipeline()
+            if result.get("success", False):
+                logger.info(f"✅ {label} serve completed successfully - Rows loaded: {result.get('rows_loaded', 0)}")
+                if on_step:
+                    on_step(step, result)
+            else:
+                logger.error(f"❌ {label} serve failed - Error: {result.get('error', 'Unknown error')}")
+            logger.info(f"Pipeline result: {result}")
+
+        except Exception as e:
+            logger.error(f"❌ {label} serve pipeline failed with exception: {e}")
+            raise
+
+
+if __name__ == "__main__":
+    run_serve_load_pipelines()
\ No newline at end of file
@@ -1,6 +1,7 @@
 import sys
 import os
 import logging
+from typing import Any, Callable, Dict, Optional, Set
 
 # Add the etl directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -9,122 +10,85 @@ from load.source.events.pipeline import run_events_source
 from load.source.fixtures.pipeline import run_fixtures_source
 from load.source.player_fixtures.pipeline import run_player_fixtures_source
 from load.source.player_history.pipeline import run_player_history_source
+from load.source.player_history_live.pipeline import run_player_history_live_source
+from load.source.player_history_past.pipeline import run_player_history_past_source, run_player_history_past_cached_source
 from load.source.players.pipeline import run_players_source
 from load.source.teams.pipeline import run_teams_source
 from load.source.transfer_history.pipeline import run_transfer_history_source
 from load.source.standings.pipeline import run_standings_source
+from load.source.fixture_difficulty.pipeline import run_fixture_difficulty_source
+from load.source.player_projections.pipeline import run_player_projections_source
+from load.source.team_fixtures.pipeline import run_team_fixtures_source
+from load.source.manager_history.pipeline import run_manager_history_source
+from load.source.league_standings.pipeline import run_league_standings_source
+from load.source.manager_picks.pipeline import run_manager_picks_source
+from orchestration.deadline import Deadline, check_deadline
+from orchestration.profiling import RunProfiler, profile_phase
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
-def run_weekly_load_pipelines():
-    """Run all load pipelines in sequence."""
-    logger.info("Starting events source pipeline...")
-    
-    try:
-        result = run_events_source()
-        if result.get("success", False):
-            logger.info(f"✅ Events source completed successfully - Rows loaded: {result.get('rows_loaded', 0)}")
-        else:
-            logger.error(f"❌ Events source failed - Error: {result.get('error', 'Unknown error')}")
-        logger.info(f"Pipeline result: {result}")
-
-    except Exception as e:
-        logger.error(f"❌ Events source pipeline failed with exception: {e}")
-        raise
-
-    logger.info("Starting fixtures source pipeline...")
-    try:
-        result = run_fixtures_source()
-        if result.get("success", False):
-            logger.info(f"✅ Fixtures source completed successfully - Rows loaded: {result.get('rows_loaded', 0)}")
-        else:
-            logger.error(f"❌ Fixtures source failed - Error: {result.get('error', 'Unknown error')}")
-        logger.info(f"Pipeline result: {result}")
-    
-    except Exception as e:
-        logger.error(f"❌ Fixtures source pipeline failed with exception: {e}")
-        raise
-        
-    logger.info("Starting player fixtures source pipeline...")
-    try:
-        result = run_player_fixtures_source()
-        if result.get("success", False):
-            logger.info(f"✅ Player fixtures source completed successfully - Rows loaded: {result.get('rows_loaded', 0)}")
-        else:
-            logger.error(f"❌ Player fixtures source failed - Error: {result.get('error', 'Unknown error')}")
-        logger.info(f"Pipeline result: {result}")
-    
-    except Exception as e:
-        logger.error(f"❌ Player fixtures source pipeline failed with exception: {e}")
-        raise
-
-    logger.info("Starting player history source pipeline...")
-    try:
-        result = run_player_history_source()
-        if result.get("success", False):
-            logger.info(f"✅ Player history source completed successfully - Rows loaded: {result.get('rows_loaded', 0)}")
-        else:
-            logger.error(f"❌ Player history source failed - Error: {result.get('error', 'Unknown error')}")
-        logger.info(f"Pipeline result: {result}")
-    
-    except Exception as e:
-        logger.error(f"❌ Player history source pipeline failed with exception: {e}")
-        raise
-
-    logger.info("Starting players source pipeline...")
-    try:
-        result = run_players_source()
-        if result.get("success", False):
-            logger.info(f"✅ Players source completed successfully - Rows loaded: {result.get('rows_loaded', 0)}")
-        else:
-            logger.error(f"❌ Players source failed - Error: {result.get('error', 'Unknown error')}")
-        logger.info(f"Pipeline result: {result}")
-    
-    except Exception as e:
-        logger.error(f"❌ Players source pipeline failed with exception: {e}")
-        raise
-
-    logger.info("Starting teams source pipeline...")
-    try:
-        result = run_teams_source()
-        if result.get("success", False):
-            logger.info(f"✅ Teams source completed successfully - Rows loaded: {result.get('rows_loaded', 0)}")
-        else:
-            logger.error(f"❌ Teams source failed - Error: {result.get('error', 'Unknown error')}")
-        logger.info(f"Pipeline result: {result}")
-
-    except Exception as e:
-        logger.error(f"❌ Teams source pipeline failed with exception: {e}")
-        raise
-
-    logger.info("Starting standings source pipeline...")
-    try:
-        result = run_standings_source()
-        if result.get("success", False):
-            logger.info(f"✅ Standings source completed successfully - Rows loaded: {result.get('rows_loaded', 0)}")
-        else:
-            logger.error(f"❌ Standings source failed - Error: {result.get('error', 'Unknown error')}")
-        logger.info(f"Pipeline result: {result}")
-
-    except Exception as e:
-        logger.error(f"❌ Standings source pipeline failed with exception: {e}")
-        raise
-
-    logger.info("Starting transfer history source pipeline...")
-    try:
-        result = run_transfer_history_source()
-        if result.get("success", False):
-            logger.info(f"✅ Transfer history source completed successfully - Rows loaded: {result.get('rows_loaded', 0)}")
-        else:
-            logger.error(f"❌ Transfer history source failed - Error: {result.get('error', 'Unknown error')}")
-        logger.info(f"Pipeline result: {result}")
-
-    except Exception as e:
-        logger.error(f"❌ Transfer history source pipeline failed with exception: {e}")
-        raise
+# (step, label, pipeline) in the order they run; standings and fixture difficulty depend on fixtures and teams,
+# player projections on standings, player history live on fixtures and players, the team fixtures view on players
+WEEKLY_SOURCE_PIPELINES = [
+    ("source:events", "Events", run_events_source),
+    ("source:fixtures", "Fixtures", run_fixtures_source),
+    ("source:player_fixtures", "Player fixtures", run_player_fixtures_source),
+    ("source:player_history", "Player history", run_player_history_source),
+    ("source:player_history_past", "Player history past", run_player_history_past_source),
+    ("source:player_history_past_cached", "Player history past (cached)", run_player_history_past_cached_source),
+    ("source:players", "Players", run_players_source),
+    ("source:player_history_live", "Player history live", run_player_history_live_source),
+    ("source:teams", "Teams", run_teams_source),
+    ("source:team_fixtures", "Team fixtures", run_team_fixtures_source),
+    ("source:standings", "Standings", run_standings_source),
+    ("source:fixture_difficulty", "Fixture difficulty", run_fixture_difficulty_source),
+    ("source:player_projections", "Player projections", run_player_projections_source),
+    ("source:transfer_history", "Transfer history", run_transfer_history_source),
+    ("source:manager_history", "Manager history", run_manager_history_source),
+    ("source:league_standings", "League standings", run_league_standings_source),
+    ("source:manager_picks", "Manager picks", run_manager_picks_source),
+]
+
+
+def run_weekly_load_pipelines(
+    skip_steps: Optional[Set[str]] = None,
+    on_step: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    deadline: Optional[Deadline] = None,
+    profiler: Optional[RunProfiler] = None
+):
+    """
+    Run all load pipelines in sequence, leaving out any step named in skip_steps.
+
+    on_step is called with the step name and result after each successful step. If the
+    deadline is near, DeadlineExceeded is raised instead of starting the next step. With a
+    profiler, each step is profiled as its own section.
+    """
+    skip_steps = skip_steps or set()
+
+    for step, label, pipeline in WEEKLY_SOURCE_PIPELINES:
+        if step in skip_steps:
+            logger.info(f"⏭️ {label} source skipped")
+            continue
+
+        check_deadline(deadline, step)
+        logger.info(f"Starting {label.lower()} source pipeline...")
+        try:
+            with profile_phase(profiler, step):
+                result = pipeline()
+            if result.get("success", False):
+                logger.info(f"✅ {label} source completed successfully - Rows loaded: {result.get('rows_loaded', 0)}")
+                if on_step:
+                    on_step(step, result)
+            else:
+                logger.error(f"❌ {label} source failed - Error: {result.get('error', 'Unknown error')}")
+            logger.info(f"Pipeline result: {result}")
+
+        except Exception as e:
+            logger.error(f"❌ {label} source pipeline failed with exception: {e}")
+            raise
 
 
 if __name__ == "__main__":
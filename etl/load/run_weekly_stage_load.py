@@ -1,6 +1,7 @@
 import sys
 import os
 import logging
+from typing import Any, Callable, Dict, Optional, Set
 
 # Add the etl directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -8,51 +9,68 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from load.stage.bootstrap.pipeline import run_bootstrap_staging
 from load.stage.fixtures.pipeline import run_fixtures_staging
 from load.stage.player_details.pipeline import run_player_details_staging
+from load.stage.event_live.pipeline import run_event_live_staging
+from load.stage.player_history_past.pipeline import run_player_history_past_staging
+from load.stage.team_fixtures.pipeline import run_team_fixtures_staging
+from load.stage.manager_history.pipeline import run_manager_history_staging
+from load.stage.league_standings.pipeline import run_league_standings_staging
+from load.stage.manager_picks.pipeline import run_manager_picks_staging
+from orchestration.deadline import Deadline, check_deadline
+from orchestration.profiling import RunProfiler, profile_phase
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+WEEKLY_STAGE_PIPELINES = [
+    ("stage:bootstrap", "Bootstrap", run_bootstrap_staging),
+    ("stage:fixtures", "Fixtures", run_fixtures_staging),
+    ("stage:player_details", "Player details", run_player_details_staging),
+    ("stage:event_live", "Event live", run_event_live_staging),
+    ("stage:player_history_past", "Player history past", run_player_history_past_staging),
+    ("stage:team_fixtures", "Team fixtures", run_team_fixtures_staging),
+    ("stage:manager_history", "Manager history", run_manager_history_staging),
+    ("stage:league_standings", "League standings", run_league_standings_staging),
+    ("stage:manager_picks", "Manager picks", run_manager_picks_staging),
+]
 
-def run_weekly_load_pipelines():
-    """Run all load pipelines in sequence."""
-    logger.info("Starting bootstrap staging pipeline...")
-    
-    try:
-        result = run_bootstrap_staging()
-        if result.get("success", False):
-            logger.info(f"✅ Bootstrap staging completed successfully - Rows loaded: {result.get('rows_loaded', 0)}")
-        else:
-            logger.error(f"❌ Bootstrap staging failed - Error: {result.get('error', 'Unknown error')}")
-        logger.info(f"Pipeline result: {result}")
-
-    except Exception as e:
-        logger.error(f"❌ Bootstrap staging pipeline failed with exception: {e}")
-        raise
-
-    try:
-        result = run_fixtures_staging()
-        if result.get("success", False):
-            logger.info(f"✅ Fixtures staging completed successfully - Rows loaded: {result.get('rows_loaded', 0)}")
-        else:
-            logger.error(f"❌ Fixtures staging failed - Error: {result.get('error', 'Unknown error')}")
-        logger.info(f"Pipeline result: {result}")
-    
-    except Exception as e:
-        logger.error(f"❌ Fixtures staging pipeline failed with exception: {e}")
-        raise
-        
-    try:
-        result = run_player_details_staging()
-        if result.get("success", False):
-            logger.info(f"✅ Player details staging completed successfully - Rows loaded: {result.get('rows_loaded', 0)}")
-        else:
-            logger.error(f"❌ Player details staging failed - Error: {result.get('error', 'Unknown error')}")
-        logger.info(f"Pipeline result: {result}")
-
-    except Exception as e:
-        logger.error(f"❌ Player details staging pipeline failed with exception: {e}")
-        raise
+
+def run_weekly_load_pipelines(
+    skip_steps: Optional[Set[str]] = None,
+    on_step: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    deadline: Optional[Deadline] = None,
+    profiler: Optional[RunProfiler] = None
+):
+    """
+    Run all load pipelines in sequence, leaving out any step named in skip_steps.
+
+    on_step is called with the step name and result after each successful step. If the
+    deadline is near, DeadlineExceeded is raised instead of starting the next step. With a
+    profiler, each step is profiled as its own section.
+    """
+    skip_steps = skip_steps or set()
+
+    for step, label, pipeline in WEEKLY_STAGE_PIPELINES:
+        if step in skip_steps:
+            logger.info(f"⏭️ {label} staging skipped")
+            continue
+
+        check_deadline(deadline, step)
+        logger.info(f"Starting {label.lower()} staging pipeline...")
+        try:
+            with profile_phase(profiler, step):
+                result = pipeline()
+            if result.get("success", False):
+                logger.info(f"✅ {label} staging completed successfully - Rows loaded: {result.get('rows_loaded', 0)}")
+                if on_step:
+                    on_step(step, result)
+            else:
+                logger.error(f"❌ {label} staging failed - Error: {result.get('error', 'Unknown error')}")
+            logger.info(f"Pipeline result: {result}")
+
+        except Exception as e:
+            logger.error(f"❌ {label} staging pipeline failed with exception: {e}")
+            raise
 
 
 if __name__ == "__main__":
@@ -0,0 +1,8 @@
+CREATE OR REPLACE TABLE FPL_STATS.FPL_SCHEMA.SERVE_PLAYER_COUNTS (
+    team INTEGER,
+    element_type INTEGER,
+    now_cost INTEGER,
+    player_count INTEGER,
+    served_at TIMESTAMP_NTZ
+)
+CLUSTER BY (team, element_type);
\ No newline at end of file
@@ -0,0 +1,42 @@
+CREATE OR REPLACE TABLE FPL_STATS.FPL_SCHEMA.SERVE_PLAYERS (
+    player_id INTEGER PRIMARY KEY,
+    first_name STRING,
+    second_name STRING,
+    web_name STRING,
+    team INTEGER,
+    element_type INTEGER,
+    now_cost INTEGER,
+    total_points INTEGER,
+    points_per_game FLOAT,
+    form FLOAT,
+    goals_scored INTEGER,
+    assists INTEGER,
+    expected_goals FLOAT,
+    expected_assists FLOAT,
+    expected_goal_involvements FLOAT,
+    expected_goals_conceded FLOAT,
+    clean_sheets INTEGER,
+    goals_conceded INTEGER,
+    minutes INTEGER,
+    selected_by_percent FLOAT,
+    transfers_in_event INTEGER,
+    transfers_out_event INTEGER,
+    ict_index FLOAT,
+    influence FLOAT,
+    creativity FLOAT,
+    threat FLOAT,
+    bonus INTEGER,
+    bps INTEGER,
+    yellow_cards INTEGER,
+    red_cards INTEGER,
+    saves INTEGER,
+    penalties_saved INTEGER,
+    penalties_missed INTEGER,
+    status STRING,
+    overall_rank INTEGER,
+    team_rank INTEGER,
+    position_rank INTEGER,
+    team_position_rank INTEGER,
+    served_at TIMESTAMP_NTZ
+)
+CLUSTER BY (team, element_type, overall_rank);
\ No newline at end of file
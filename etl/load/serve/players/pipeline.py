@@ -0,0 +1,69 @@
+import sys
+import os
+import logging
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from snowflake_client.snowflake_client import SnowflakeClient
+from load.source.table_swap import reload_source_table
+
+logger = logging.getLogger(__name__)
+
+def run_players_serve():
+    """
+    Execute players serving tables creation and loading pipeline
+
+    1. Create/Replace SERVE_PLAYERS, the API's player columns clustered by team and position,
+       with total points ranks overall, per team, per position and per team and position
+    2. Create/Replace SERVE_PLAYER_COUNTS, player counts per team and position (0 for any)
+       and price, so the API sums counts instead of scanning players
+    """
+
+    snowflake_client = None
+    result = {
+        "success": False,
+        "error": None,
+        "rows_loaded": 0
+    }
+
+    try:
+        # Initialize Snowflake client
+        snowflake_client = SnowflakeClient()
+
+        # Step 1: Rebuild SERVE_PLAYERS (or its shadow) from SOURCE_PLAYERS in overall rank order
+        logger.info("Building SERVE_PLAYERS from SOURCE_PLAYERS")
+        rows_affected = reload_source_table(
+            snowflake_client,
+            "SERVE_PLAYERS",
+            ["load/serve/players/populate_serve_players.sql"],
+            replace_sql_file="load/serve/players/create_serve_players_table.sql"
+        )
+
+        # Step 2: Rebuild SERVE_PLAYER_COUNTS for every filter combination
+        logger.info("Building SERVE_PLAYER_COUNTS from SOURCE_PLAYERS")
+        count_rows = reload_source_table(
+            snowflake_client,
+            "SERVE_PLAYER_COUNTS",
+            ["load/serve/players/populate_serve_player_counts.sql"],
+            replace_sql_file="load/serve/players/create_serve_player_counts_table.sql"
+        )
+
+        result["rows_loaded"] = rows_affected or 0
+        result["success"] = True
+
+        logger.info(f"Successfully served {result['rows_loaded']} players with {count_rows} filter counts")
+
+    except Exception as e:
+        result["error"] = str(e)
+        logger.error(f"Players serve pipeline failed: {e}")
+        raise
+
+    finally:
+        if snowflake_client:
+            snowflake_client.close()
+
+    return result
+
+if __name__ == "__main__":
+    run_players_serve()
\ No newline at end of file
@@ -0,0 +1,14 @@
+INSERT INTO FPL_STATS.FPL_SCHEMA.SERVE_PLAYER_COUNTS
+SELECT
+    IFF(GROUPING(team) = 1, 0, team) AS team,
+    IFF(GROUPING(element_type) = 1, 0, element_type) AS element_type,
+    now_cost,
+    COUNT(*) AS player_count,
+    CURRENT_TIMESTAMP() AS served_at
+FROM FPL_STATS.FPL_SCHEMA.SOURCE_PLAYERS
+GROUP BY GROUPING SETS (
+    (team, element_type, now_cost),
+    (team, now_cost),
+    (element_type, now_cost),
+    (now_cost)
+)
\ No newline at end of file
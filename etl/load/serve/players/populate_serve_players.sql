@@ -0,0 +1,43 @@
+INSERT INTO FPL_STATS.FPL_SCHEMA.SERVE_PLAYERS
+SELECT
+    player_id,
+    first_name,
+    second_name,
+    web_name,
+    team,
+    element_type,
+    now_cost,
+    total_points,
+    points_per_game,
+    form,
+    goals_scored,
+    assists,
+    expected_goals,
+    expected_assists,
+    expected_goal_involvements,
+    expected_goals_conceded,
+    clean_sheets,
+    goals_conceded,
+    minutes,
+    selected_by_percent,
+    transfers_in_event,
+    transfers_out_event,
+    ict_index,
+    influence,
+    creativity,
+    threat,
+    bonus,
+    bps,
+    yellow_cards,
+    red_cards,
+    saves,
+    penalties_saved,
+    penalties_missed,
+    status,
+    ROW_NUMBER() OVER (ORDER BY total_points DESC NULLS LAST, player_id) AS overall_rank,
+    ROW_NUMBER() OVER (PARTITION BY team ORDER BY total_points DESC NULLS LAST, player_id) AS team_rank,
+    ROW_NUMBER() OVER (PARTITION BY element_type ORDER BY total_points DESC NULLS LAST, player_id) AS position_rank,
+    ROW_NUMBER() OVER (PARTITION BY team, element_type ORDER BY total_points DESC NULLS LAST, player_id) AS team_position_rank,
+    CURRENT_TIMESTAMP() AS served_at
+FROM FPL_STATS.FPL_SCHEMA.SOURCE_PLAYERS
+ORDER BY overall_rank
\ No newline at end of file
@@ -6,6 +6,7 @@ import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 
 from snowflake_client.snowflake_client import SnowflakeClient
+from load.source.table_swap import reload_source_table
 
 logger = logging.getLogger(__name__)
 
@@ -32,13 +33,9 @@ def run_events_source():
         logger.info("Creating SOURCE_EVENTS table")
         snowflake_client.execute_sql_file("load/source/events/create_events_table.sql")
         
-        # Step 2: Clear existing data
-        logger.info("Truncating SOURCE_EVENTS table")
-        snowflake_client.truncate_table("SOURCE_EVENTS")
-        
-        # Step 3: Execute copy from stage with unflatten
+        # Step 2: Replace existing data with copy from stage with unflatten
         logger.info("Unflattening data from STAGING_BOOTSTRAP to SOURCE_EVENTS")
-        rows_affected = snowflake_client.execute_sql_file("load/source/events/unflatten_events_data.sql")
+        rows_affected = reload_source_table(snowflake_client, "SOURCE_EVENTS", ["load/source/events/unflatten_events_data.sql"])
         
         result["rows_loaded"] = rows_affected or 0
         result["success"] = True
@@ -56,4 +56,5 @@ SELECT
     extraction_timestamp,
     extraction_date
 FROM FPL_STATS.FPL_SCHEMA.STAGING_BOOTSTRAP,
-LATERAL FLATTEN(input => raw_data:events) as event;
\ No newline at end of file
+LATERAL FLATTEN(input => raw_data:events) as event
+WHERE extraction_date = (SELECT MAX(extraction_date) FROM FPL_STATS.FPL_SCHEMA.STAGING_BOOTSTRAP);
\ No newline at end of file
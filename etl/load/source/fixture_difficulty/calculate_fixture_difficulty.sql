@@ -0,0 +1,101 @@
+INSERT INTO FPL_STATS.FPL_SCHEMA.DIM_FIXTURE_DIFFICULTY (
+    team_id,
+    event,
+    fixture_count,
+    difficulty,
+    opponents,
+    next_3_fixtures,
+    next_3_difficulty,
+    next_3_avg_difficulty,
+    next_5_fixtures,
+    next_5_difficulty,
+    next_5_avg_difficulty,
+    next_8_fixtures,
+    next_8_difficulty,
+    next_8_avg_difficulty,
+    calculated_at
+)
+WITH team_fixtures AS (
+    -- One row per team per fixture, from the home side
+    SELECT
+        team_h as team_id,
+        event,
+        team_a as opponent_team,
+        TRUE as is_home,
+        team_h_difficulty as difficulty,
+        kickoff_time
+    FROM FPL_STATS.FPL_SCHEMA.SOURCE_FIXTURES
+    WHERE event IS NOT NULL
+
+    UNION ALL
+
+    -- and from the away side
+    SELECT
+        team_a as team_id,
+        event,
+        team_h as opponent_team,
+        FALSE as is_home,
+        team_a_difficulty as difficulty,
+        kickoff_time
+    FROM FPL_STATS.FPL_SCHEMA.SOURCE_FIXTURES
+    WHERE event IS NOT NULL
+),
+team_gameweeks AS (
+    -- Every team in every gameweek, so blank gameweeks are rows with no fixtures
+    SELECT
+        t.team_id,
+        e.event_id as event
+    FROM FPL_STATS.FPL_SCHEMA.SOURCE_TEAMS t
+    CROSS JOIN FPL_STATS.FPL_SCHEMA.SOURCE_EVENTS e
+),
+gameweek_difficulty AS (
+    -- Double gameweeks sum both fixtures
+    SELECT
+        g.team_id,
+        g.event,
+        COUNT(f.opponent_team) as fixture_count,
+        COALESCE(SUM(f.difficulty), 0) as difficulty,
+        LISTAGG(o.short_name || CASE WHEN f.is_home THEN ' (H)' ELSE ' (A)' END, ', ')
+            WITHIN GROUP (ORDER BY f.kickoff_time) as opponents
+    FROM team_gameweeks g
+    LEFT JOIN team_fixtures f
+        ON f.team_id = g.team_id
+        AND f.event = g.event
+    LEFT JOIN FPL_STATS.FPL_SCHEMA.SOURCE_TEAMS o
+        ON o.team_id = f.opponent_team
+    GROUP BY g.team_id, g.event
+),
+rolling AS (
+    -- Windows look forward from each gameweek, so a fixture run is the row for its first gameweek
+    SELECT
+        team_id,
+        event,
+        fixture_count,
+        difficulty,
+        opponents,
+        SUM(fixture_count) OVER (PARTITION BY team_id ORDER BY event ROWS BETWEEN CURRENT ROW AND 2 FOLLOWING) as next_3_fixtures,
+        SUM(difficulty) OVER (PARTITION BY team_id ORDER BY event ROWS BETWEEN CURRENT ROW AND 2 FOLLOWING) as next_3_difficulty,
+        SUM(fixture_count) OVER (PARTITION BY team_id ORDER BY event ROWS BETWEEN CURRENT ROW AND 4 FOLLOWING) as next_5_fixtures,
+        SUM(difficulty) OVER (PARTITION BY team_id ORDER BY event ROWS BETWEEN CURRENT ROW AND 4 FOLLOWING) as next_5_difficulty,
+        SUM(fixture_count) OVER (PARTITION BY team_id ORDER BY event ROWS BETWEEN CURRENT ROW AND 7 FOLLOWING) as next_8_fixtures,
+        SUM(difficulty) OVER (PARTITION BY team_id ORDER BY event ROWS BETWEEN CURRENT ROW AND 7 FOLLOWING) as next_8_difficulty
+    FROM gameweek_difficulty
+)
+SELECT
+    team_id,
+    event,
+    fixture_count,
+    difficulty,
+    opponents,
+    next_3_fixtures,
+    next_3_difficulty,
+    -- Average per fixture played, so blanks do not look easy and doubles do not look hard
+    ROUND(next_3_difficulty / NULLIF(next_3_fixtures, 0), 2) as next_3_avg_difficulty,
+    next_5_fixtures,
+    next_5_difficulty,
+    ROUND(next_5_difficulty / NULLIF(next_5_fixtures, 0), 2) as next_5_avg_difficulty,
+    next_8_fixtures,
+    next_8_difficulty,
+    ROUND(next_8_difficulty / NULLIF(next_8_fixtures, 0), 2) as next_8_avg_difficulty,
+    CURRENT_TIMESTAMP()::TIMESTAMP_NTZ as calculated_at
+FROM rolling;
\ No newline at end of file
@@ -0,0 +1,18 @@
+CREATE OR REPLACE TABLE FPL_STATS.FPL_SCHEMA.DIM_FIXTURE_DIFFICULTY (
+    team_id INTEGER,
+    event INTEGER,
+    fixture_count INTEGER,
+    difficulty INTEGER,
+    opponents STRING,
+    next_3_fixtures INTEGER,
+    next_3_difficulty INTEGER,
+    next_3_avg_difficulty FLOAT,
+    next_5_fixtures INTEGER,
+    next_5_difficulty INTEGER,
+    next_5_avg_difficulty FLOAT,
+    next_8_fixtures INTEGER,
+    next_8_difficulty INTEGER,
+    next_8_avg_difficulty FLOAT,
+    calculated_at TIMESTAMP_NTZ,
+    PRIMARY KEY (team_id, event)
+);
\ No newline at end of file
@@ -0,0 +1,59 @@
+import sys
+import os
+import logging
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from snowflake_client.snowflake_client import SnowflakeClient
+from load.source.table_swap import reload_source_table
+
+logger = logging.getLogger(__name__)
+
+def run_fixture_difficulty_source():
+    """
+    Execute fixture difficulty dimension table creation and calculation pipeline
+
+    1. Create/Replace DIM_FIXTURE_DIFFICULTY table
+    2. Calculate difficulty per team per gameweek, with rolling 3/5/8 gameweek sums,
+       from SOURCE_FIXTURES, SOURCE_TEAMS and SOURCE_EVENTS
+    """
+
+    snowflake_client = None
+    result = {
+        "success": False,
+        "error": None,
+        "rows_loaded": 0
+    }
+
+    try:
+        # Initialize Snowflake client
+        snowflake_client = SnowflakeClient()
+
+        # Step 1: Recreate DIM_FIXTURE_DIFFICULTY (or its shadow) and calculate the team x gameweek matrix
+        logger.info("Calculating fixture difficulty from SOURCE_FIXTURES, SOURCE_TEAMS and SOURCE_EVENTS")
+        rows_affected = reload_source_table(
+            snowflake_client,
+            "DIM_FIXTURE_DIFFICULTY",
+            ["load/source/fixture_difficulty/calculate_fixture_difficulty.sql"],
+            replace_sql_file="load/source/fixture_difficulty/create_dim_fixture_difficulty.sql"
+        )
+
+        result["rows_loaded"] = rows_affected or 0
+        result["success"] = True
+
+        logger.info(f"Successfully calculated fixture difficulty for {result['rows_loaded']} team gameweeks")
+
+    except Exception as e:
+        result["error"] = str(e)
+        logger.error(f"Fixture difficulty source pipeline failed: {e}")
+        raise
+
+    finally:
+        if snowflake_client:
+            snowflake_client.close()
+
+    return result
+
+if __name__ == "__main__":
+    run_fixture_difficulty_source()
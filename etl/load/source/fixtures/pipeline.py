@@ -6,6 +6,7 @@ import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 
 from snowflake_client.snowflake_client import SnowflakeClient
+from load.source.table_swap import reload_source_table
 
 logger = logging.getLogger(__name__)
 
@@ -32,13 +33,9 @@ def run_fixtures_source():
         logger.info("Creating SOURCE_FIXTURES table")
         snowflake_client.execute_sql_file("load/source/fixtures/create_fixtures_table.sql")
         
-        # Step 2: Clear existing data
-        logger.info("Truncating SOURCE_FIXTURES table")
-        snowflake_client.truncate_table("SOURCE_FIXTURES")
-        
-        # Step 3: Execute copy from stage with unflatten
+        # Step 2: Replace existing data with copy from stage with unflatten
         logger.info("Unflattening data from STAGING_FIXTURES to SOURCE_FIXTURES")
-        rows_affected = snowflake_client.execute_sql_file("load/source/fixtures/unflatten_fixtures_data.sql")
+        rows_affected = reload_source_table(snowflake_client, "SOURCE_FIXTURES", ["load/source/fixtures/unflatten_fixtures_data.sql"])
         
         result["rows_loaded"] = rows_affected or 0
         result["success"] = True
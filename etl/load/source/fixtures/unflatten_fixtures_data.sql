@@ -40,4 +40,5 @@ SELECT
     extraction_timestamp,
     extraction_date
 FROM FPL_STATS.FPL_SCHEMA.STAGING_FIXTURES,
-LATERAL FLATTEN(input => raw_data:fixtures) as fixture;
\ No newline at end of file
+LATERAL FLATTEN(input => raw_data:fixtures) as fixture
+WHERE extraction_date = (SELECT MAX(extraction_date) FROM FPL_STATS.FPL_SCHEMA.STAGING_FIXTURES);
\ No newline at end of file
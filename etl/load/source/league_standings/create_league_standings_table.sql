@@ -0,0 +1,16 @@
+CREATE TABLE IF NOT EXISTS FPL_STATS.FPL_SCHEMA.SOURCE_LEAGUE_STANDINGS (
+    league_id INTEGER,
+    league_name STRING,
+    entry INTEGER,
+    entry_name STRING,
+    player_name STRING,
+    rank INTEGER,
+    last_rank INTEGER,
+    rank_sort INTEGER,
+    total INTEGER,
+    event_total INTEGER,
+    event INTEGER,
+    extraction_timestamp TIMESTAMP_NTZ,
+    extraction_date DATE,
+    PRIMARY KEY (league_id, entry)
+)
\ No newline at end of file
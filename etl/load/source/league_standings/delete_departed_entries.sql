@@ -0,0 +1,12 @@
+DELETE FROM FPL_STATS.FPL_SCHEMA.SOURCE_LEAGUE_STANDINGS AS target
+USING (
+    SELECT league_id, MAX(extraction_timestamp) AS extraction_timestamp
+    FROM FPL_STATS.FPL_SCHEMA.SOURCE_LEAGUE_STANDINGS
+    GROUP BY league_id
+) AS latest
+WHERE target.league_id = latest.league_id
+AND target.extraction_timestamp < latest.extraction_timestamp
+AND target.league_id IN (
+    SELECT DISTINCT raw_data:league_id::INTEGER
+    FROM FPL_STATS.FPL_SCHEMA.STAGING_LEAGUE_STANDINGS
+)
\ No newline at end of file
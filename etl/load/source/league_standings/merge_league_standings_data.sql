@@ -0,0 +1,80 @@
+MERGE INTO FPL_STATS.FPL_SCHEMA.SOURCE_LEAGUE_STANDINGS AS target
+USING (
+    WITH staged_rows AS (
+        SELECT
+            raw_data:league_id::INTEGER AS league_id,
+            raw_data:league_name::STRING AS league_name,
+            raw_data:entry::INTEGER AS entry,
+            raw_data:entry_name::STRING AS entry_name,
+            raw_data:player_name::STRING AS player_name,
+            raw_data:rank::INTEGER AS rank,
+            raw_data:last_rank::INTEGER AS last_rank,
+            raw_data:rank_sort::INTEGER AS rank_sort,
+            raw_data:total::INTEGER AS total,
+            raw_data:event_total::INTEGER AS event_total,
+            raw_data:event::INTEGER AS event,
+            raw_data:page::INTEGER AS page,
+            raw_data:pages::INTEGER AS pages,
+            extraction_timestamp,
+            extraction_date
+        FROM FPL_STATS.FPL_SCHEMA.STAGING_LEAGUE_STANDINGS
+    ),
+    complete_crawls AS (
+        SELECT league_id, MAX(extraction_timestamp) AS extraction_timestamp
+        FROM (
+            SELECT league_id, extraction_timestamp
+            FROM staged_rows
+            GROUP BY league_id, extraction_timestamp, pages
+            HAVING COUNT(DISTINCT page) = pages
+        )
+        GROUP BY league_id
+    )
+    SELECT staged_rows.*
+    FROM staged_rows
+    JOIN complete_crawls
+        ON staged_rows.league_id = complete_crawls.league_id
+        AND staged_rows.extraction_timestamp = complete_crawls.extraction_timestamp
+    QUALIFY ROW_NUMBER() OVER (PARTITION BY staged_rows.league_id, staged_rows.entry ORDER BY staged_rows.page) = 1
+) AS staged
+ON target.league_id = staged.league_id AND target.entry = staged.entry
+WHEN MATCHED THEN UPDATE SET
+    league_name = staged.league_name,
+    entry_name = staged.entry_name,
+    player_name = staged.player_name,
+    rank = staged.rank,
+    last_rank = staged.last_rank,
+    rank_sort = staged.rank_sort,
+    total = staged.total,
+    event_total = staged.event_total,
+    event = staged.event,
+    extraction_timestamp = staged.extraction_timestamp,
+    extraction_date = staged.extraction_date
+WHEN NOT MATCHED THEN INSERT (
+    league_id,
+    league_name,
+    entry,
+    entry_name,
+    player_name,
+    rank,
+    last_rank,
+    rank_sort,
+    total,
+    event_total,
+    event,
+    extraction_timestamp,
+    extraction_date
+) VALUES (
+    staged.league_id,
+    staged.league_name,
+    staged.entry,
+    staged.entry_name,
+    staged.player_name,
+    staged.rank,
+    staged.last_rank,
+    staged.rank_sort,
+    staged.total,
+    staged.event_total,
+    staged.event,
+    staged.extraction_timestamp,
+    staged.extraction_date
+)
\ No newline at end of file
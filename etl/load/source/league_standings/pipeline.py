@@ -0,0 +1,69 @@
+import sys
+import os
+import logging
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from snowflake_client.snowflake_client import SnowflakeClient
+from extract.league_standings.pipeline import commit_league_standings_state
+from s3.s3_datalake import S3DataLake
+
+logger = logging.getLogger(__name__)
+
+def run_league_standings_source():
+    """
+    Execute incremental league standings load
+
+    1. Create source table
+    2. Merge the staged standings of every league whose crawl has all its pages (NO TRUNCATE - only refreshed leagues are staged)
+    3. Delete entries that have left a refreshed league
+    4. Mark the merged leagues refreshed in the extract state
+    """
+
+    snowflake_client = None
+    result = {
+        "success": False,
+        "error": None,
+        "rows_loaded": 0
+    }
+
+    try:
+        # Initialize Snowflake client
+        snowflake_client = SnowflakeClient()
+
+        # Step 1: Create source table
+        logger.info("Creating SOURCE_LEAGUE_STANDINGS table")
+        snowflake_client.execute_sql_file("load/source/league_standings/create_league_standings_table.sql")
+
+        # Step 2: Insert new entries and update those of refreshed leagues
+        logger.info("Merging data from STAGING_LEAGUE_STANDINGS into SOURCE_LEAGUE_STANDINGS")
+        rows_affected = snowflake_client.execute_sql_file("load/source/league_standings/merge_league_standings_data.sql")
+
+        # Step 3: Entries a refreshed league no longer has were not updated by the merge
+        logger.info("Deleting entries that have left their league")
+        snowflake_client.execute_sql_file("load/source/league_standings/delete_departed_entries.sql")
+
+        # Step 4: Only now are the completely crawled leagues safely in the source table
+        merged_leagues = snowflake_client.execute_sql_file("load/source/league_standings/select_complete_leagues.sql")
+        committed = commit_league_standings_state(S3DataLake(), [row[0] for row in merged_leagues or []])
+        logger.info(f"Marked {committed} leagues refreshed")
+
+        result["rows_loaded"] = rows_affected or 0
+        result["success"] = True
+
+        logger.info(f"Successfully merged {result['rows_loaded']} league standings")
+
+    except Exception as e:
+        result["error"] = str(e)
+        logger.error(f"League standings source pipeline failed: {e}")
+        raise
+
+    finally:
+        if snowflake_client:
+            snowflake_client.close()
+
+    return result
+
+if __name__ == "__main__":
+    run_league_standings_source()
@@ -0,0 +1,11 @@
+SELECT DISTINCT league_id
+FROM (
+    SELECT
+        raw_data:league_id::INTEGER AS league_id,
+        raw_data:page::INTEGER AS page,
+        raw_data:pages::INTEGER AS pages,
+        extraction_timestamp
+    FROM FPL_STATS.FPL_SCHEMA.STAGING_LEAGUE_STANDINGS
+)
+GROUP BY league_id, extraction_timestamp, pages
+HAVING COUNT(DISTINCT page) = pages
\ No newline at end of file
@@ -0,0 +1,9 @@
+CREATE TABLE IF NOT EXISTS FPL_STATS.FPL_SCHEMA.SOURCE_MANAGER_HISTORY (
+    manager_id INTEGER PRIMARY KEY,
+    last_event INTEGER,
+    current_history VARIANT,
+    past_seasons VARIANT,
+    chips VARIANT,
+    extraction_timestamp TIMESTAMP_NTZ,
+    extraction_date DATE
+)
\ No newline at end of file
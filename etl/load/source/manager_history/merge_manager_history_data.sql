@@ -0,0 +1,40 @@
+MERGE INTO FPL_STATS.FPL_SCHEMA.SOURCE_MANAGER_HISTORY AS target
+USING (
+    SELECT
+        manager.key::INTEGER AS manager_id,
+        manager.value:event::INTEGER AS last_event,
+        manager.value:current AS current_history,
+        manager.value:past AS past_seasons,
+        manager.value:chips AS chips,
+        staging.extraction_timestamp,
+        staging.extraction_date
+    FROM FPL_STATS.FPL_SCHEMA.STAGING_MANAGER_HISTORY AS staging,
+    LATERAL FLATTEN(input => staging.raw_data) AS manager
+    WHERE manager.key NOT IN ('extraction_timestamp', 'extraction_date')
+    QUALIFY ROW_NUMBER() OVER (PARTITION BY manager.key ORDER BY staging.extraction_timestamp DESC) = 1
+) AS staged
+ON target.manager_id = staged.manager_id
+WHEN MATCHED THEN UPDATE SET
+    last_event = staged.last_event,
+    current_history = staged.current_history,
+    past_seasons = staged.past_seasons,
+    chips = staged.chips,
+    extraction_timestamp = staged.extraction_timestamp,
+    extraction_date = staged.extraction_date
+WHEN NOT MATCHED THEN INSERT (
+    manager_id,
+    last_event,
+    current_history,
+    past_seasons,
+    chips,
+    extraction_timestamp,
+    extraction_date
+) VALUES (
+    staged.manager_id,
+    staged.last_event,
+    staged.current_history,
+    staged.past_seasons,
+    staged.chips,
+    staged.extraction_timestamp,
+    staged.extraction_date
+)
\ No newline at end of file
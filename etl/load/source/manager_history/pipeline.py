@@ -0,0 +1,64 @@
+import sys
+import os
+import logging
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from snowflake_client.snowflake_client import SnowflakeClient
+from extract.manager_history.pipeline import commit_manager_history_state
+from s3.s3_datalake import S3DataLake
+
+logger = logging.getLogger(__name__)
+
+def run_manager_history_source():
+    """
+    Execute incremental manager history load
+
+    1. Create source table
+    2. Merge the staged histories (NO TRUNCATE - only managers whose history changed are staged)
+    3. Save the extract's per-manager state for the managers now merged
+    """
+    
+    snowflake_client = None
+    result = {
+        "success": False,
+        "error": None,
+        "rows_loaded": 0
+    }
+    
+    try:
+        # Initialize Snowflake client
+        snowflake_client = SnowflakeClient()
+        
+        # Step 1: Create source table
+        logger.info("Creating SOURCE_MANAGER_HISTORY table")
+        snowflake_client.execute_sql_file("load/source/manager_history/create_manager_history_table.sql")
+        
+        # Step 2: Insert new managers and replace the rows of those refreshed
+        logger.info("Merging data from STAGING_MANAGER_HISTORY into SOURCE_MANAGER_HISTORY")
+        rows_affected = snowflake_client.execute_sql_file("load/source/manager_history/merge_manager_history_data.sql")
+        
+        # Step 3: Only now are the staged histories safely in the source table
+        staged_managers = snowflake_client.execute_sql_file("load/source/manager_history/select_staged_managers.sql")
+        committed = commit_manager_history_state(S3DataLake(), [row[0] for row in staged_managers or []])
+        logger.info(f"Saved the refresh state of {committed} managers")
+        
+        result["rows_loaded"] = rows_affected or 0
+        result["success"] = True
+        
+        logger.info(f"Successfully merged {result['rows_loaded']} manager history records")
+        
+    except Exception as e:
+        result["error"] = str(e)
+        logger.error(f"Manager history source pipeline failed: {e}")
+        raise
+    
+    finally:
+        if snowflake_client:
+            snowflake_client.close()
+    
+    return result
+
+if __name__ == "__main__":
+    run_manager_history_source()
\ No newline at end of file
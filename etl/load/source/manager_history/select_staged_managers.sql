@@ -0,0 +1,4 @@
+SELECT DISTINCT manager.key::INTEGER
+FROM FPL_STATS.FPL_SCHEMA.STAGING_MANAGER_HISTORY,
+LATERAL FLATTEN(input => raw_data) AS manager
+WHERE manager.key NOT IN ('extraction_timestamp', 'extraction_date')
\ No newline at end of file
@@ -0,0 +1,4 @@
+CREATE TABLE IF NOT EXISTS FPL_STATS.FPL_SCHEMA.SOURCE_MANAGER_PICKS_FILES (
+    filename STRING PRIMARY KEY,
+    loaded_at TIMESTAMP_NTZ
+)
\ No newline at end of file
@@ -0,0 +1,9 @@
+CREATE TABLE IF NOT EXISTS FPL_STATS.FPL_SCHEMA.SOURCE_MANAGER_PICKS (
+    entry_id INTEGER,
+    gw INTEGER,
+    element INTEGER,
+    multiplier INTEGER,
+    is_captain BOOLEAN,
+    PRIMARY KEY (entry_id, gw, element)
+)
+CLUSTER BY (gw, element)
\ No newline at end of file
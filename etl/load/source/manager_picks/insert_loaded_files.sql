@@ -0,0 +1,12 @@
+INSERT INTO FPL_STATS.FPL_SCHEMA.SOURCE_MANAGER_PICKS_FILES (
+    filename,
+    loaded_at
+)
+SELECT DISTINCT
+    SPLIT_PART(staging.s3_file_path, '/', -1),
+    CURRENT_TIMESTAMP()::TIMESTAMP_NTZ
+FROM FPL_STATS.FPL_SCHEMA.STAGING_MANAGER_PICKS AS staging
+WHERE SPLIT_PART(staging.s3_file_path, '/', -1) NOT IN (
+    SELECT filename
+    FROM FPL_STATS.FPL_SCHEMA.SOURCE_MANAGER_PICKS_FILES
+)
\ No newline at end of file
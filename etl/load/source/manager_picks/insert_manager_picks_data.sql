@@ -0,0 +1,20 @@
+INSERT INTO FPL_STATS.FPL_SCHEMA.SOURCE_MANAGER_PICKS (
+    entry_id,
+    gw,
+    element,
+    multiplier,
+    is_captain
+)
+SELECT DISTINCT
+    staging.entry_id,
+    staging.gw,
+    staging.element,
+    staging.multiplier,
+    staging.is_captain
+FROM FPL_STATS.FPL_SCHEMA.STAGING_MANAGER_PICKS AS staging
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM FPL_STATS.FPL_SCHEMA.SOURCE_MANAGER_PICKS AS target
+    WHERE target.entry_id = staging.entry_id
+    AND target.gw = staging.gw
+)
\ No newline at end of file
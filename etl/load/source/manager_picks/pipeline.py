@@ -0,0 +1,62 @@
+import sys
+import os
+import logging
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from snowflake_client.snowflake_client import SnowflakeClient
+
+logger = logging.getLogger(__name__)
+
+def run_manager_picks_source():
+    """
+    Execute incremental manager picks load
+
+    1. Create source table
+    2. Insert the staged picks of every manager-gameweek not loaded yet (NO TRUNCATE - picks of a finished gameweek never change)
+    3. Record the staged shards as loaded, so the stage load does not pick them up again
+    """
+
+    snowflake_client = None
+    result = {
+        "success": False,
+        "error": None,
+        "rows_loaded": 0
+    }
+
+    try:
+        # Initialize Snowflake client
+        snowflake_client = SnowflakeClient()
+
+        # Step 1: Create source table
+        logger.info("Creating SOURCE_MANAGER_PICKS table")
+        snowflake_client.execute_sql_file("load/source/manager_picks/create_manager_picks_table.sql")
+        snowflake_client.execute_sql_file("load/source/manager_picks/create_manager_picks_files_table.sql")
+
+        # Step 2: Insert picks of manager-gameweeks not already loaded, once each if a pair was fetched twice
+        logger.info("Inserting data from STAGING_MANAGER_PICKS into SOURCE_MANAGER_PICKS")
+        rows_affected = snowflake_client.execute_sql_file("load/source/manager_picks/insert_manager_picks_data.sql")
+
+        # Step 3: Only now are the staged shards' picks safely in the source table
+        logger.info("Recording staged shards in SOURCE_MANAGER_PICKS_FILES")
+        snowflake_client.execute_sql_file("load/source/manager_picks/insert_loaded_files.sql")
+
+        result["rows_loaded"] = rows_affected or 0
+        result["success"] = True
+
+        logger.info(f"Successfully inserted {result['rows_loaded']} manager picks")
+
+    except Exception as e:
+        result["error"] = str(e)
+        logger.error(f"Manager picks source pipeline failed: {e}")
+        raise
+
+    finally:
+        if snowflake_client:
+            snowflake_client.close()
+
+    return result
+
+if __name__ == "__main__":
+    run_manager_picks_source()
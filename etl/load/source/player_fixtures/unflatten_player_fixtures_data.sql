@@ -43,4 +43,5 @@ SELECT
     extraction_date
 FROM FPL_STATS.FPL_SCHEMA.STAGING_PLAYER_DETAILS,
 LATERAL FLATTEN(input => raw_data) as player_data,
-LATERAL FLATTEN(input => player_data.value:fixtures) as fixture;
\ No newline at end of file
+LATERAL FLATTEN(input => player_data.value:fixtures) as fixture
+WHERE extraction_date = (SELECT MAX(extraction_date) FROM FPL_STATS.FPL_SCHEMA.STAGING_PLAYER_DETAILS);
\ No newline at end of file
@@ -0,0 +1,6 @@
+DELETE FROM FPL_STATS.FPL_SCHEMA.SOURCE_PLAYER_HISTORY
+WHERE round IN (
+    SELECT event.value:event::INTEGER
+    FROM FPL_STATS.FPL_SCHEMA.STAGING_EVENT_LIVE,
+    LATERAL FLATTEN(input => raw_data:events) as event
+);
\ No newline at end of file
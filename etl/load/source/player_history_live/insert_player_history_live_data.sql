@@ -0,0 +1,178 @@
+INSERT INTO FPL_STATS.FPL_SCHEMA.SOURCE_PLAYER_HISTORY (
+    element,
+    fixture,
+    opponent_team,
+    total_points,
+    was_home,
+    kickoff_time,
+    team_h_score,
+    team_a_score,
+    round,
+    minutes,
+    goals_scored,
+    assists,
+    clean_sheets,
+    goals_conceded,
+    own_goals,
+    penalties_saved,
+    penalties_missed,
+    yellow_cards,
+    red_cards,
+    saves,
+    bonus,
+    bps,
+    influence,
+    creativity,
+    threat,
+    ict_index,
+    starts,
+    expected_goals,
+    expected_assists,
+    expected_goal_involvements,
+    expected_goals_conceded,
+    value,
+    transfers_balance,
+    selected,
+    transfers_in,
+    transfers_out,
+    player_id,
+    extraction_timestamp,
+    extraction_date
+)
+WITH staged_events AS (
+    -- Latest extraction of each staged gameweek (a backfill can stage several files)
+    SELECT
+        event.value as event_data,
+        extraction_timestamp,
+        extraction_date
+    FROM FPL_STATS.FPL_SCHEMA.STAGING_EVENT_LIVE,
+    LATERAL FLATTEN(input => raw_data:events) as event
+    QUALIFY ROW_NUMBER() OVER (PARTITION BY event.value:event::INTEGER ORDER BY extraction_timestamp DESC) = 1
+),
+live_element_fixtures AS (
+    -- One row per player per fixture played in the gameweek (blank gameweeks have no explain entries)
+    SELECT
+        event_data:event::INTEGER as round,
+        element.value:id::INTEGER as element,
+        element.value:stats as stats,
+        ARRAY_SIZE(element.value:explain) as fixture_count,
+        explain.value:fixture::INTEGER as fixture,
+        explain.value:stats as explain_stats,
+        extraction_timestamp,
+        extraction_date
+    FROM staged_events,
+    LATERAL FLATTEN(input => event_data:elements) as element,
+    LATERAL FLATTEN(input => element.value:explain) as explain
+),
+live_fixtures AS (
+    -- Per-fixture counting stats from the explain breakdown, so double gameweeks split correctly
+    SELECT
+        round,
+        element,
+        fixture,
+        fixture_count,
+        ANY_VALUE(stats) as stats,
+        extraction_timestamp,
+        extraction_date,
+        SUM(explain_stat.value:points::INTEGER) as fixture_points,
+        MAX(CASE WHEN explain_stat.value:identifier::STRING = 'minutes' THEN explain_stat.value:value::INTEGER END) as minutes,
+        MAX(CASE WHEN explain_stat.value:identifier::STRING = 'goals_scored' THEN explain_stat.value:value::INTEGER END) as goals_scored,
+        MAX(CASE WHEN explain_stat.value:identifier::STRING = 'assists' THEN explain_stat.value:value::INTEGER END) as assists,
+        MAX(CASE WHEN explain_stat.value:identifier::STRING = 'clean_sheets' THEN explain_stat.value:value::INTEGER END) as clean_sheets,
+        MAX(CASE WHEN explain_stat.value:identifier::STRING = 'goals_conceded' THEN explain_stat.value:value::INTEGER END) as goals_conceded,
+        MAX(CASE WHEN explain_stat.value:identifier::STRING = 'own_goals' THEN explain_stat.value:value::INTEGER END) as own_goals,
+        MAX(CASE WHEN explain_stat.value:identifier::STRING = 'penalties_saved' THEN explain_stat.value:value::INTEGER END) as penalties_saved,
+        MAX(CASE WHEN explain_stat.value:identifier::STRING = 'penalties_missed' THEN explain_stat.value:value::INTEGER END) as penalties_missed,
+        MAX(CASE WHEN explain_stat.value:identifier::STRING = 'yellow_cards' THEN explain_stat.value:value::INTEGER END) as yellow_cards,
+        MAX(CASE WHEN explain_stat.value:identifier::STRING = 'red_cards' THEN explain_stat.value:value::INTEGER END) as red_cards,
+        MAX(CASE WHEN explain_stat.value:identifier::STRING = 'saves' THEN explain_stat.value:value::INTEGER END) as saves,
+        MAX(CASE WHEN explain_stat.value:identifier::STRING = 'bonus' THEN explain_stat.value:value::INTEGER END) as bonus,
+        MAX(CASE WHEN explain_stat.value:identifier::STRING = 'bps' THEN explain_stat.value:value::INTEGER END) as bps
+    FROM live_element_fixtures,
+    LATERAL FLATTEN(input => explain_stats, OUTER => TRUE) as explain_stat
+    GROUP BY round, element, fixture, fixture_count, extraction_timestamp, extraction_date
+),
+fixture_sides AS (
+    -- The bps stat of a fixture lists every player who appeared in it under their side
+    SELECT
+        fixture.fixture_id,
+        side_player.value:element::INTEGER as element,
+        TRUE as was_home
+    FROM FPL_STATS.FPL_SCHEMA.SOURCE_FIXTURES as fixture,
+    LATERAL FLATTEN(input => fixture.stats) as stat,
+    LATERAL FLATTEN(input => stat.value:h) as side_player
+    WHERE stat.value:identifier::STRING = 'bps'
+    UNION ALL
+    SELECT
+        fixture.fixture_id,
+        side_player.value:element::INTEGER as element,
+        FALSE as was_home
+    FROM FPL_STATS.FPL_SCHEMA.SOURCE_FIXTURES as fixture,
+    LATERAL FLATTEN(input => fixture.stats) as stat,
+    LATERAL FLATTEN(input => stat.value:a) as side_player
+    WHERE stat.value:identifier::STRING = 'bps'
+),
+live_fixture_sides AS (
+    -- A player's side comes from the fixture they appeared in, so gameweeks before a transfer
+    -- get the team they played for; players who did not appear fall back to their current
+    -- team when it is one of the fixture's two teams, else the side is unknown
+    SELECT
+        live_fixture.round,
+        live_fixture.element,
+        live_fixture.fixture,
+        COALESCE(
+            fixture_side.was_home,
+            IFF(player.team IN (fixture.team_h, fixture.team_a), fixture.team_h = player.team, NULL)
+        ) as was_home
+    FROM live_fixtures as live_fixture
+    LEFT JOIN FPL_STATS.FPL_SCHEMA.SOURCE_FIXTURES as fixture ON fixture.fixture_id = live_fixture.fixture
+    LEFT JOIN fixture_sides as fixture_side
+        ON fixture_side.fixture_id = live_fixture.fixture AND fixture_side.element = live_fixture.element
+    LEFT JOIN FPL_STATS.FPL_SCHEMA.SOURCE_PLAYERS as player ON player.player_id = live_fixture.element
+)
+SELECT
+    live_fixture.element as element,
+    live_fixture.fixture as fixture,
+    CASE WHEN side.was_home THEN fixture.team_a WHEN NOT side.was_home THEN fixture.team_h END as opponent_team,
+    IFF(live_fixture.fixture_count = 1, live_fixture.stats:total_points::INTEGER, COALESCE(live_fixture.fixture_points, 0)) as total_points,
+    side.was_home as was_home,
+    fixture.kickoff_time as kickoff_time,
+    fixture.team_h_score as team_h_score,
+    fixture.team_a_score as team_a_score,
+    live_fixture.round as round,
+    COALESCE(live_fixture.minutes, 0) as minutes,
+    COALESCE(live_fixture.goals_scored, 0) as goals_scored,
+    COALESCE(live_fixture.assists, 0) as assists,
+    COALESCE(live_fixture.clean_sheets, 0) as clean_sheets,
+    COALESCE(live_fixture.goals_conceded, 0) as goals_conceded,
+    COALESCE(live_fixture.own_goals, 0) as own_goals,
+    COALESCE(live_fixture.penalties_saved, 0) as penalties_saved,
+    COALESCE(live_fixture.penalties_missed, 0) as penalties_missed,
+    COALESCE(live_fixture.yellow_cards, 0) as yellow_cards,
+    COALESCE(live_fixture.red_cards, 0) as red_cards,
+    COALESCE(live_fixture.saves, 0) as saves,
+    COALESCE(live_fixture.bonus, 0) as bonus,
+    COALESCE(live_fixture.bps, 0) as bps,
+    -- Underlying stats are only reported per gameweek, so they cannot be split across a double gameweek
+    IFF(live_fixture.fixture_count = 1, live_fixture.stats:influence::FLOAT, NULL) as influence,
+    IFF(live_fixture.fixture_count = 1, live_fixture.stats:creativity::FLOAT, NULL) as creativity,
+    IFF(live_fixture.fixture_count = 1, live_fixture.stats:threat::FLOAT, NULL) as threat,
+    IFF(live_fixture.fixture_count = 1, live_fixture.stats:ict_index::FLOAT, NULL) as ict_index,
+    IFF(live_fixture.fixture_count = 1, live_fixture.stats:starts::INTEGER, NULL) as starts,
+    IFF(live_fixture.fixture_count = 1, live_fixture.stats:expected_goals::FLOAT, NULL) as expected_goals,
+    IFF(live_fixture.fixture_count = 1, live_fixture.stats:expected_assists::FLOAT, NULL) as expected_assists,
+    IFF(live_fixture.fixture_count = 1, live_fixture.stats:expected_goal_involvements::FLOAT, NULL) as expected_goal_involvements,
+    IFF(live_fixture.fixture_count = 1, live_fixture.stats:expected_goals_conceded::FLOAT, NULL) as expected_goals_conceded,
+    -- Price, ownership and transfer snapshots are not part of the live payload
+    NULL as value,
+    NULL as transfers_balance,
+    NULL as selected,
+    NULL as transfers_in,
+    NULL as transfers_out,
+    live_fixture.element as player_id,
+    live_fixture.extraction_timestamp as extraction_timestamp,
+    live_fixture.extraction_date as extraction_date
+FROM live_fixtures as live_fixture
+LEFT JOIN FPL_STATS.FPL_SCHEMA.SOURCE_FIXTURES as fixture ON fixture.fixture_id = live_fixture.fixture
+LEFT JOIN live_fixture_sides as side
+    ON side.round = live_fixture.round AND side.element = live_fixture.element AND side.fixture = live_fixture.fixture;
\ No newline at end of file
@@ -0,0 +1,70 @@
+import sys
+import os
+import logging
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from snowflake_client.snowflake_client import SnowflakeClient
+from extract.event_live.pipeline import record_loaded_event
+from s3.s3_datalake import S3DataLake
+
+logger = logging.getLogger(__name__)
+
+def run_player_history_live_source():
+    """
+    Execute incremental player_history load from event live data
+
+    1. Create source table
+    2. Delete rows for the gameweeks being loaded (NO TRUNCATE - earlier gameweeks are kept)
+    3. Insert one row per player per fixture from the staged gameweeks
+    4. Record the last staged gameweek as loaded, so the event live extract moves past it
+    """
+    
+    snowflake_client = None
+    result = {
+        "success": False,
+        "error": None,
+        "rows_loaded": 0
+    }
+    
+    try:
+        # Initialize Snowflake client
+        snowflake_client = SnowflakeClient()
+        
+        # Step 1: Create source table
+        logger.info("Creating SOURCE_PLAYER_HISTORY table")
+        snowflake_client.execute_sql_file("load/source/player_history/create_player_history_table.sql")
+        
+        # Step 2: Replace only the staged gameweeks so reruns are idempotent
+        logger.info("Deleting staged gameweeks from SOURCE_PLAYER_HISTORY")
+        snowflake_client.execute_sql_file("load/source/player_history_live/delete_live_rounds.sql")
+        
+        # Step 3: Unflatten event live data
+        logger.info("Unflattening data from STAGING_EVENT_LIVE to SOURCE_PLAYER_HISTORY")
+        rows_affected = snowflake_client.execute_sql_file("load/source/player_history_live/insert_player_history_live_data.sql")
+        
+        # Step 4: Only now are the staged gameweeks safely in SOURCE_PLAYER_HISTORY
+        last_event = snowflake_client.execute_sql_file("load/source/player_history_live/select_last_staged_round.sql")
+        if last_event and last_event[0][0] is not None:
+            logger.info(f"Recording gameweek {last_event[0][0]} as loaded")
+            record_loaded_event(S3DataLake(), last_event[0][0])
+        
+        result["rows_loaded"] = rows_affected or 0
+        result["success"] = True
+        
+        logger.info(f"Successfully loaded {result['rows_loaded']} player history records from event live data")
+        
+    except Exception as e:
+        result["error"] = str(e)
+        logger.error(f"Player history live source pipeline failed: {e}")
+        raise
+    
+    finally:
+        if snowflake_client:
+            snowflake_client.close()
+    
+    return result
+
+if __name__ == "__main__":
+    run_player_history_live_source()
@@ -0,0 +1,3 @@
+SELECT MAX(event.value:event::INTEGER)
+FROM FPL_STATS.FPL_SCHEMA.STAGING_EVENT_LIVE,
+LATERAL FLATTEN(input => raw_data:events) as event
\ No newline at end of file
@@ -0,0 +1,7 @@
+DELETE FROM FPL_STATS.FPL_SCHEMA.SOURCE_PLAYER_HISTORY_PAST
+WHERE player_id IN (
+    SELECT player_data.key::INTEGER
+    FROM FPL_STATS.FPL_SCHEMA.STAGING_PLAYER_HISTORY_PAST,
+    LATERAL FLATTEN(input => raw_data) as player_data
+    WHERE IS_OBJECT(player_data.value)
+);
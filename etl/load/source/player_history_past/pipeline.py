@@ -6,6 +6,9 @@ import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 
 from snowflake_client.snowflake_client import SnowflakeClient
+from load.source.table_swap import reload_source_table
+from extract.player_details.pipeline import commit_history_past_index
+from s3.s3_datalake import S3DataLake
 
 logger = logging.getLogger(__name__)
 
@@ -32,13 +35,9 @@ def run_player_history_past_source():
         logger.info("Creating SOURCE_PLAYER_HISTORY_PAST table")
         snowflake_client.execute_sql_file("load/source/player_history_past/create_player_history_past_table.sql")
         
-        # Step 2: Clear existing data
-        logger.info("Truncating SOURCE_PLAYER_HISTORY_PAST table")
-        snowflake_client.truncate_table("SOURCE_PLAYER_HISTORY_PAST")
-        
-        # Step 3: Execute copy from stage with unflatten
+        # Step 2: Replace existing data with copy from stage with unflatten
         logger.info("Unflattening data from STAGING_PLAYER_DETAILS to SOURCE_PLAYER_HISTORY_PAST")
-        rows_affected = snowflake_client.execute_sql_file("load/source/player_history_past/unflatten_player_history_past_data.sql")
+        rows_affected = reload_source_table(snowflake_client, "SOURCE_PLAYER_HISTORY_PAST", ["load/source/player_history_past/unflatten_player_history_past_data.sql"])
         
         result["rows_loaded"] = rows_affected or 0
         result["success"] = True
@@ -56,5 +55,66 @@ def run_player_history_past_source():
     
     return result
 
+def run_player_history_past_cached_source():
+    """
+    Execute incremental player_history_past load from the season-cached extract
+
+    1. Create source table
+    2. Skip if no history_past was extracted this run (already cached for the season)
+    3. Delete rows for the staged players (NO TRUNCATE - cached players are kept)
+    4. Insert previous seasons for the staged players
+    5. Add the staged players to the season's history_past index, so later extracts skip them
+    """
+    
+    snowflake_client = None
+    result = {
+        "success": False,
+        "error": None,
+        "rows_loaded": 0
+    }
+    
+    try:
+        # Initialize Snowflake client
+        snowflake_client = SnowflakeClient()
+        
+        # Step 1: Create source table
+        logger.info("Creating SOURCE_PLAYER_HISTORY_PAST table")
+        snowflake_client.execute_sql_file("load/source/player_history_past/create_player_history_past_table.sql")
+        
+        # Step 2: Nothing staged means every player is already cached for the season
+        if snowflake_client.get_row_count("STAGING_PLAYER_HISTORY_PAST") == 0:
+            logger.info("No refreshed history_past staged, SOURCE_PLAYER_HISTORY_PAST is up to date")
+            result["success"] = True
+            return result
+        
+        # Step 3: Replace only the staged players so reruns are idempotent
+        logger.info("Deleting staged players from SOURCE_PLAYER_HISTORY_PAST")
+        snowflake_client.execute_sql_file("load/source/player_history_past/delete_cached_players.sql")
+        
+        # Step 4: Unflatten cached history_past data
+        logger.info("Unflattening data from STAGING_PLAYER_HISTORY_PAST to SOURCE_PLAYER_HISTORY_PAST")
+        rows_affected = snowflake_client.execute_sql_file("load/source/player_history_past/insert_cached_player_history_past_data.sql")
+        
+        # Step 5: Only now are the staged players' previous seasons safely in the source table
+        staged_players = snowflake_client.execute_sql_file("load/source/player_history_past/select_staged_players.sql")
+        season = commit_history_past_index(S3DataLake(), [row[0] for row in staged_players or []])
+        logger.info(f"Added {len(staged_players or [])} players to the history_past index for season {season}")
+        
+        result["rows_loaded"] = rows_affected or 0
+        result["success"] = True
+        
+        logger.info(f"Successfully loaded {result['rows_loaded']} players history past records from the season cache")
+        
+    except Exception as e:
+        result["error"] = str(e)
+        logger.error(f"Players history past cached source pipeline failed: {e}")
+        raise
+    
+    finally:
+        if snowflake_client:
+            snowflake_client.close()
+    
+    return result
+
 if __name__ == "__main__":
     run_player_history_past_source()
\ No newline at end of file
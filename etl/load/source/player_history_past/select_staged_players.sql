@@ -0,0 +1,4 @@
+SELECT DISTINCT player_data.key::INTEGER
+FROM FPL_STATS.FPL_SCHEMA.STAGING_PLAYER_HISTORY_PAST,
+LATERAL FLATTEN(input => raw_data) as player_data
+WHERE IS_OBJECT(player_data.value)
\ No newline at end of file
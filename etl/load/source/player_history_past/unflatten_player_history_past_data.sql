@@ -63,4 +63,5 @@ SELECT
     extraction_date
 FROM FPL_STATS.FPL_SCHEMA.STAGING_PLAYER_DETAILS,
 LATERAL FLATTEN(input => raw_data) as player_data,
-LATERAL FLATTEN(input => player_data.value:history_past) as history;
\ No newline at end of file
+LATERAL FLATTEN(input => player_data.value:history_past) as history
+WHERE extraction_date = (SELECT MAX(extraction_date) FROM FPL_STATS.FPL_SCHEMA.STAGING_PLAYER_DETAILS);
\ No newline at end of file
@@ -0,0 +1,12 @@
+CREATE TABLE IF NOT EXISTS FPL_STATS.FPL_SCHEMA.SOURCE_PLAYER_PROJECTIONS (
+    player_id INTEGER,
+    event INTEGER,
+    fixture_count INTEGER,
+    expected_minutes FLOAT,
+    expected_goals FLOAT,
+    expected_assists FLOAT,
+    expected_goals_conceded FLOAT,
+    clean_sheet_probability FLOAT,
+    expected_points FLOAT,
+    PRIMARY KEY (player_id, event)
+);
\ No newline at end of file
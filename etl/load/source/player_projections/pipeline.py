@@ -0,0 +1,77 @@
+import sys
+import os
+import time
+import logging
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from snowflake_client.snowflake_client import SnowflakeClient
+from load.source.table_swap import reload_source_table
+from analytics.arrays import to_rows
+from analytics.projections import PROJECTION_COLUMNS, compute_projections, load_projection_inputs
+
+logger = logging.getLogger(__name__)
+
+def run_player_projections_source():
+    """
+    Execute player projections source table creation and calculation pipeline
+
+    1. Create source table
+    2. Fetch players, player history, team strengths and standings, and upcoming fixtures as Arrow
+    3. Project expected points for every player and upcoming gameweek in one batch
+    4. Replace existing projections with the new ones
+    """
+    
+    snowflake_client = None
+    result = {
+        "success": False,
+        "error": None,
+        "rows_loaded": 0
+    }
+    
+    try:
+        # Initialize Snowflake client
+        snowflake_client = SnowflakeClient()
+        
+        # Step 1: Create source table
+        logger.info("Creating SOURCE_PLAYER_PROJECTIONS table")
+        snowflake_client.execute_sql_file("load/source/player_projections/create_player_projections_table.sql")
+        
+        # Step 2: Fetch inputs
+        logger.info("Fetching projection inputs from SOURCE_PLAYERS, SOURCE_PLAYER_HISTORY, DIM_STANDINGS and SOURCE_FIXTURES")
+        inputs = load_projection_inputs(snowflake_client)
+        
+        # Step 3: Project expected points
+        start = time.perf_counter()
+        projections = compute_projections(inputs)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"Projected {len(projections['player_id'])} player gameweeks for {len(inputs.players['player_id'])} players in {elapsed_ms:.1f}ms")
+        
+        # Step 4: Replace existing projections
+        rows = to_rows(projections, PROJECTION_COLUMNS)
+        rows_affected = reload_source_table(
+            snowflake_client,
+            "SOURCE_PLAYER_PROJECTIONS",
+            [],
+            insert=lambda table: snowflake_client.insert_rows(table, PROJECTION_COLUMNS, rows)
+        )
+        
+        result["rows_loaded"] = rows_affected or 0
+        result["success"] = True
+        
+        logger.info(f"Successfully loaded {result['rows_loaded']} player projections records")
+        
+    except Exception as e:
+        result["error"] = str(e)
+        logger.error(f"Player projections source pipeline failed: {e}")
+        raise
+    
+    finally:
+        if snowflake_client:
+            snowflake_client.close()
+    
+    return result
+
+if __name__ == "__main__":
+    run_player_projections_source()
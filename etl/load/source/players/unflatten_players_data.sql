@@ -184,4 +184,5 @@ SELECT
     extraction_timestamp,
     extraction_date
 FROM FPL_STATS.FPL_SCHEMA.STAGING_BOOTSTRAP,
-LATERAL FLATTEN(input => raw_data:elements) as player;
\ No newline at end of file
+LATERAL FLATTEN(input => raw_data:elements) as player
+WHERE extraction_date = (SELECT MAX(extraction_date) FROM FPL_STATS.FPL_SCHEMA.STAGING_BOOTSTRAP);
\ No newline at end of file
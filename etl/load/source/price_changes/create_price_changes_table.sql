@@ -0,0 +1,13 @@
+CREATE TABLE IF NOT EXISTS FPL_STATS.FPL_SCHEMA.SOURCE_PRICE_CHANGES (
+    player_id INTEGER,
+    date DATE,
+    previous_date DATE,
+    now_cost INTEGER,
+    price_change INTEGER,
+    net_transfers INTEGER,
+    net_transfers_since_change INTEGER,
+    transfer_momentum FLOAT,
+    ownership_change INTEGER,
+    selected_by_percent_change FLOAT,
+    PRIMARY KEY (player_id, date)
+);
\ No newline at end of file
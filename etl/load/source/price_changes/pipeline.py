@@ -0,0 +1,82 @@
+import sys
+import os
+import time
+import logging
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+import numpy as np
+
+from snowflake_client.snowflake_client import SnowflakeClient
+from analytics.arrays import to_rows
+from analytics.price_changes import PRICE_CHANGE_COLUMNS, compute_price_changes, load_snapshots
+
+logger = logging.getLogger(__name__)
+
+def run_price_changes_source(full_refresh: bool = False):
+    """
+    Execute price changes source table creation and calculation pipeline
+
+    1. Create source table
+    2. Load every daily snapshot from SOURCE_TRANSFER_HISTORY as arrays
+    3. Diff consecutive snapshots per player in one vectorized pass
+    4. Insert days not yet in SOURCE_PRICE_CHANGES (NO TRUNCATE unless full_refresh)
+
+    The whole season is recomputed each run, since net transfers since the last price change
+    reach back an arbitrary number of days; only the new days are written.
+    """
+    
+    snowflake_client = None
+    result = {
+        "success": False,
+        "error": None,
+        "rows_loaded": 0
+    }
+    
+    try:
+        # Initialize Snowflake client
+        snowflake_client = SnowflakeClient()
+        
+        # Step 1: Create source table
+        logger.info("Creating SOURCE_PRICE_CHANGES table")
+        snowflake_client.execute_sql_file("load/source/price_changes/create_price_changes_table.sql")
+        
+        if full_refresh:
+            logger.info("Truncating SOURCE_PRICE_CHANGES table")
+            snowflake_client.truncate_table("SOURCE_PRICE_CHANGES")
+        last_date = snowflake_client.execute_sql("SELECT MAX(date) FROM FPL_STATS.FPL_SCHEMA.SOURCE_PRICE_CHANGES")[0][0]
+        
+        # Step 2: Load snapshots, all of them: net transfers since a price change can reach back to the first day
+        logger.info("Loading daily snapshots from SOURCE_TRANSFER_HISTORY")
+        snapshots = load_snapshots(snowflake_client)
+        
+        # Step 3: Diff consecutive snapshots
+        start = time.perf_counter()
+        changes = compute_price_changes(snapshots)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"Computed {len(changes['player_id'])} player-day changes from {len(snapshots['player_id'])} snapshots in {elapsed_ms:.1f}ms")
+        
+        # Step 4: Insert new days
+        new_days = changes["date"] > np.datetime64(last_date, "D") if last_date else None
+        rows = to_rows(changes, PRICE_CHANGE_COLUMNS, new_days)
+        logger.info(f"Inserting {len(rows)} rows into SOURCE_PRICE_CHANGES")
+        result["rows_loaded"] = snowflake_client.insert_rows("SOURCE_PRICE_CHANGES", PRICE_CHANGE_COLUMNS, rows)
+        
+        result["success"] = True
+        
+        logger.info(f"Successfully loaded {result['rows_loaded']} price change records")
+        
+    except Exception as e:
+        result["error"] = str(e)
+        logger.error(f"Price changes source pipeline failed: {e}")
+        raise
+    
+    finally:
+        if snowflake_client:
+            snowflake_client.close()
+    
+    return result
+
+if __name__ == "__main__":
+    run_price_changes_source(full_refresh="--full-refresh" in sys.argv)
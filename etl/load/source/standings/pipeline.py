@@ -6,6 +6,7 @@ import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 
 from snowflake_client.snowflake_client import SnowflakeClient
+from load.source.table_swap import reload_source_table
 
 logger = logging.getLogger(__name__)
 
@@ -28,13 +29,14 @@ def run_standings_source():
         # Initialize Snowflake client
         snowflake_client = SnowflakeClient()
 
-        # Step 1: Create/Replace DIM_STANDINGS table (drops and recreates)
-        logger.info("Creating/Replacing DIM_STANDINGS table")
-        snowflake_client.execute_sql_file("load/source/standings/create_dim_standings.sql")
-
-        # Step 2: Calculate standings from fixtures and teams
+        # Step 1: Recreate DIM_STANDINGS (or its shadow) and calculate standings from fixtures and teams
         logger.info("Calculating standings from SOURCE_FIXTURES and SOURCE_TEAMS")
-        rows_affected = snowflake_client.execute_sql_file("load/source/standings/calculate_standings.sql")
+        rows_affected = reload_source_table(
+            snowflake_client,
+            "DIM_STANDINGS",
+            ["load/source/standings/calculate_standings.sql"],
+            replace_sql_file="load/source/standings/create_dim_standings.sql"
+        )
 
         result["rows_loaded"] = rows_affected or 0
         result["success"] = True
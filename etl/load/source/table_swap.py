@@ -0,0 +1,114 @@
+import sys
+import os
+import re
+import logging
+from typing import Callable, List, Optional
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = "FPL_STATS.FPL_SCHEMA"
+
+# How a source table is reloaded: emptied in place, or built aside and swapped in
+LOAD_STRATEGIES = ("truncate", "swap")
+
+# Read by the source pipelines, so a single pipeline run directly picks them up too
+LOAD_STRATEGY_ENV = "SOURCE_LOAD_STRATEGY"
+KEEP_SHADOW_ENV = "SOURCE_KEEP_SHADOW"
+
+SHADOW_SUFFIX = "_SHADOW"
+
+
+def set_load_strategy(strategy: str, keep_shadow: bool = False) -> None:
+    """Select the load strategy for source pipelines run in this process"""
+    if strategy not in LOAD_STRATEGIES:
+        raise ValueError(f"Invalid load strategy '{strategy}'. Must be one of: {', '.join(LOAD_STRATEGIES)}")
+    os.environ[LOAD_STRATEGY_ENV] = strategy
+    os.environ[KEEP_SHADOW_ENV] = "true" if keep_shadow else "false"
+
+
+def get_load_strategy() -> str:
+    strategy = os.getenv(LOAD_STRATEGY_ENV, "truncate")
+    if strategy not in LOAD_STRATEGIES:
+        raise ValueError(f"Invalid {LOAD_STRATEGY_ENV} '{strategy}'. Must be one of: {', '.join(LOAD_STRATEGIES)}")
+    return strategy
+
+
+def keep_shadow() -> bool:
+    return os.getenv(KEEP_SHADOW_ENV, "false").lower() == "true"
+
+
+def shadow_table(table: str) -> str:
+    return f"{table}{SHADOW_SUFFIX}"
+
+
+def retarget_sql(sql: str, table: str, target: str) -> str:
+    """Point every reference to a table in the schema at another table"""
+    return re.sub(rf"\b{re.escape(SCHEMA)}\.{re.escape(table)}\b", f"{SCHEMA}.{target}", sql, flags=re.IGNORECASE)
+
+
+def _execute_sql_file_on(snowflake_client, sql_file_path: str, table: str, target: str) -> Optional[int]:
+    with open(sql_file_path, "r") as f:
+        sql = f.read().strip()
+    logger.info(f"Executing SQL file: {sql_file_path} against {target}")
+    return snowflake_client.execute_sql(retarget_sql(sql, table, target))
+
+
+def reload_source_table(
+    snowflake_client,
+    table: str,
+    insert_sql_files: List[str],
+    replace_sql_file: Optional[str] = None,
+    strategy: Optional[str] = None,
+    insert: Optional[Callable[[str], int]] = None
+) -> int:
+    """
+    Replace the contents of a source table with the rows its insert SQL files produce.
+
+    Rows computed in Python are written by insert instead, called with the name of the
+    table to fill (the live table or its shadow) and returning the number of rows inserted.
+
+    "truncate" empties the live table and inserts into it, so readers see an empty or
+    partial table until the inserts finish. "swap" inserts into {table}_SHADOW, a copy of
+    the live table's definition and grants, then exchanges the two with ALTER TABLE ... SWAP
+    WITH, so readers see the old rows until the new ones appear all at once. The shadow,
+    holding the previous rows after the swap, is dropped unless SOURCE_KEEP_SHADOW is set.
+
+    Tables rebuilt by CREATE OR REPLACE rather than truncated pass that DDL as
+    replace_sql_file; it recreates the live table or creates the shadow. Otherwise the
+    live table must already exist. Returns the number of rows inserted.
+    """
+    strategy = strategy or get_load_strategy()
+
+    if strategy == "truncate":
+        if replace_sql_file:
+            logger.info(f"Replacing {table} table")
+            snowflake_client.execute_sql_file(replace_sql_file)
+        else:
+            logger.info(f"Truncating {table} table")
+            snowflake_client.truncate_table(table)
+        rows = sum(snowflake_client.execute_sql_file(sql_file) or 0 for sql_file in insert_sql_files)
+        return rows + (insert(table) if insert else 0)
+
+    shadow = shadow_table(table)
+    logger.info(f"Building {shadow} to swap with {table}")
+    if replace_sql_file:
+        _execute_sql_file_on(snowflake_client, replace_sql_file, table, shadow)
+    else:
+        snowflake_client.execute_sql(f"CREATE OR REPLACE TABLE {SCHEMA}.{shadow} LIKE {SCHEMA}.{table} COPY GRANTS")
+
+    rows = sum(_execute_sql_file_on(snowflake_client, sql_file, table, shadow) or 0 for sql_file in insert_sql_files)
+    rows += insert(shadow) if insert else 0
+
+    # SWAP needs both tables; on the first run there is no live table to exchange with yet
+    snowflake_client.execute_sql(f"CREATE TABLE IF NOT EXISTS {SCHEMA}.{table} LIKE {SCHEMA}.{shadow}")
+    snowflake_client.execute_sql(f"ALTER TABLE {SCHEMA}.{table} SWAP WITH {SCHEMA}.{shadow}")
+    logger.info(f"Swapped {shadow} into {table} with {rows} rows")
+
+    if keep_shadow():
+        logger.info(f"Keeping previous {table} rows in {shadow}")
+    else:
+        snowflake_client.execute_sql(f"DROP TABLE IF EXISTS {SCHEMA}.{shadow}")
+    return rows
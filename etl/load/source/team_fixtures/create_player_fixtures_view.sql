@@ -0,0 +1,25 @@
+CREATE OR REPLACE VIEW FPL_STATS.FPL_SCHEMA.VIEW_PLAYER_FIXTURES AS
+SELECT
+    team_fixtures.fixture_id,
+    team_fixtures.event,
+    team_fixtures.opponent_team,
+    team_fixtures.opponent_team_name,
+    team_fixtures.opponent_team_short_name,
+    team_fixtures.is_home,
+    team_fixtures.difficulty,
+    team_fixtures.kickoff_time,
+    team_fixtures.team_h,
+    team_fixtures.team_a,
+    team_fixtures.team_h_score,
+    team_fixtures.team_a_score,
+    team_fixtures.finished,
+    team_fixtures.minutes,
+    team_fixtures.provisional_start_time,
+    team_fixtures.finished_provisional,
+    team_fixtures.event_name,
+    players.player_id,
+    team_fixtures.extraction_timestamp,
+    team_fixtures.extraction_date
+FROM FPL_STATS.FPL_SCHEMA.SOURCE_TEAM_FIXTURES as team_fixtures
+JOIN FPL_STATS.FPL_SCHEMA.SOURCE_PLAYERS as players
+    ON players.team = team_fixtures.team_id;
\ No newline at end of file
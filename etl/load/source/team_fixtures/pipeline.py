@@ -0,0 +1,62 @@
+import sys
+import os
+import logging
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from snowflake_client.snowflake_client import SnowflakeClient
+from load.source.table_swap import reload_source_table
+
+logger = logging.getLogger(__name__)
+
+def run_team_fixtures_source():
+    """
+    Execute team_fixtures source table creation and data loading pipeline
+    
+    1. Create source table
+    2. Execute copy from stage with unflatten
+    3. Create VIEW_PLAYER_FIXTURES joining team fixtures to SOURCE_PLAYERS
+    """
+    
+    snowflake_client = None
+    result = {
+        "success": False,
+        "error": None,
+        "rows_loaded": 0
+    }
+    
+    try:
+        # Initialize Snowflake client
+        snowflake_client = SnowflakeClient()
+        
+        # Step 1: Create source table
+        logger.info("Creating SOURCE_TEAM_FIXTURES table")
+        snowflake_client.execute_sql_file("load/source/team_fixtures/create_team_fixtures_table.sql")
+        
+        # Step 2: Replace existing data with copy from stage with unflatten
+        logger.info("Unflattening data from STAGING_TEAM_FIXTURES to SOURCE_TEAM_FIXTURES")
+        rows_affected = reload_source_table(snowflake_client, "SOURCE_TEAM_FIXTURES", ["load/source/team_fixtures/unflatten_team_fixtures_data.sql"])
+        
+        # Step 3: Expose one row per player per fixture without storing it
+        logger.info("Creating VIEW_PLAYER_FIXTURES view")
+        snowflake_client.execute_sql_file("load/source/team_fixtures/create_player_fixtures_view.sql")
+        
+        result["rows_loaded"] = rows_affected or 0
+        result["success"] = True
+        
+        logger.info(f"Successfully loaded {result['rows_loaded']} team fixtures records")
+        
+    except Exception as e:
+        result["error"] = str(e)
+        logger.error(f"Team fixtures source pipeline failed: {e}")
+        raise
+    
+    finally:
+        if snowflake_client:
+            snowflake_client.close()
+    
+    return result
+
+if __name__ == "__main__":
+    run_team_fixtures_source()
\ No newline at end of file
@@ -0,0 +1,15 @@
+CREATE TABLE IF NOT EXISTS FPL_STATS.FPL_SCHEMA.SOURCE_TRANSFER_FEATURES (
+    player_id INTEGER,
+    date DATE,
+    now_cost INTEGER,
+    net_transfers_1d INTEGER,
+    net_transfers_3d INTEGER,
+    net_transfers_7d INTEGER,
+    transfer_share_1d FLOAT,
+    transfer_share_3d FLOAT,
+    transfer_share_7d FLOAT,
+    days_since_price_change INTEGER,
+    ownership_change INTEGER,
+    ownership_acceleration INTEGER,
+    PRIMARY KEY (player_id, date)
+);
\ No newline at end of file
@@ -0,0 +1,90 @@
+import sys
+import os
+import time
+import logging
+from datetime import date
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from snowflake_client.snowflake_client import SnowflakeClient
+from s3.s3_datalake import S3DataLake
+from analytics.arrays import to_rows
+from analytics.price_changes import load_snapshots
+from analytics.transfer_features import FEATURE_COLUMNS, compute_transfer_features, load_feature_state, save_feature_state
+
+logger = logging.getLogger(__name__)
+
+def run_transfer_features_source(full_refresh: bool = False):
+    """
+    Execute transfer features source table creation and calculation pipeline
+
+    1. Create source table
+    2. Load the window state saved by the last run from S3
+    3. Load snapshots after the state's last day from SOURCE_TRANSFER_HISTORY
+    4. Compute features for the new days in one vectorized pass
+    5. Replace rows for the new days, then save the state
+
+    Rows after the state's last day are deleted before inserting, so a run that inserted
+    but failed to save its state is repaired by the next one.
+    """
+    
+    snowflake_client = None
+    result = {
+        "success": False,
+        "error": None,
+        "rows_loaded": 0
+    }
+    
+    try:
+        # Initialize Snowflake client
+        snowflake_client = SnowflakeClient()
+        s3_datalake = S3DataLake()
+        
+        # Step 1: Create source table
+        logger.info("Creating SOURCE_TRANSFER_FEATURES table")
+        snowflake_client.execute_sql_file("load/source/transfer_features/create_transfer_features_table.sql")
+        
+        # Step 2: Load window state
+        state = None if full_refresh else load_feature_state(s3_datalake)
+        last_date = date.fromisoformat(state.last_date) if state and state.last_date else None
+        logger.info(f"Computing transfer features after {last_date}" if last_date else "Computing transfer features for the full history")
+        
+        # Step 3: Load new snapshots; the state's last day is included but only later days are computed
+        snapshots = load_snapshots(snowflake_client, since=last_date)
+        
+        # Step 4: Compute features
+        start = time.perf_counter()
+        features, new_state = compute_transfer_features(snapshots, state)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"Computed {len(features['player_id'])} player-day features from {len(snapshots['player_id'])} snapshots in {elapsed_ms:.1f}ms")
+        
+        # Step 5: Replace rows for the new days and save the state
+        if last_date:
+            snowflake_client.execute_sql(
+                "DELETE FROM FPL_STATS.FPL_SCHEMA.SOURCE_TRANSFER_FEATURES WHERE date > %s", (last_date,)
+            )
+        else:
+            snowflake_client.truncate_table("SOURCE_TRANSFER_FEATURES")
+        rows = to_rows(features, FEATURE_COLUMNS)
+        logger.info(f"Inserting {len(rows)} rows into SOURCE_TRANSFER_FEATURES")
+        result["rows_loaded"] = snowflake_client.insert_rows("SOURCE_TRANSFER_FEATURES", FEATURE_COLUMNS, rows)
+        save_feature_state(s3_datalake, new_state)
+        
+        result["success"] = True
+        
+        logger.info(f"Successfully loaded {result['rows_loaded']} transfer features records")
+        
+    except Exception as e:
+        result["error"] = str(e)
+        logger.error(f"Transfer features source pipeline failed: {e}")
+        raise
+    
+    finally:
+        if snowflake_client:
+            snowflake_client.close()
+    
+    return result
+
+if __name__ == "__main__":
+    run_transfer_features_source(full_refresh="--full-refresh" in sys.argv)
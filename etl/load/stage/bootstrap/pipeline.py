@@ -1,12 +1,12 @@
 import sys
 import os
-from datetime import datetime
+from datetime import date, datetime
 from zoneinfo import ZoneInfo
 
 # Add the etl directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 
-from load.stage.s3_to_snowflake_pipeline import load_s3_files_to_staging_pipeline
+from load.stage.s3_to_snowflake_pipeline import load_s3_files_to_staging_pipeline, load_s3_date_range_to_staging_pipeline
 
 def run_bootstrap_staging():
     now = datetime.now(ZoneInfo("Australia/Sydney"))
@@ -18,3 +18,13 @@ def run_bootstrap_staging():
         bucket_name="fpl-stats-data-lake-dev"
     )
 
+def run_bootstrap_staging_backfill(start_date: date, end_date: date):
+    return load_s3_date_range_to_staging_pipeline(
+        staging_table_sql_file="load/stage/bootstrap/create_bootstrap_staging.sql",
+        staging_table_name="STAGING_BOOTSTRAP",
+        data_type="bootstrap",
+        start_date=start_date,
+        end_date=end_date,
+        stage_name="fpl_s3_stage",
+        bucket_name="fpl-stats-data-lake-dev"
+    )
@@ -0,0 +1,30 @@
+import sys
+import os
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from load.stage.s3_to_snowflake_pipeline import load_s3_files_to_staging_pipeline, load_s3_date_range_to_staging_pipeline
+
+def run_event_live_staging():
+    now = datetime.now(ZoneInfo("Australia/Sydney"))
+    return load_s3_files_to_staging_pipeline(
+        staging_table_sql_file="load/stage/event_live/create_event_live_staging.sql",
+        staging_table_name="STAGING_EVENT_LIVE",
+        s3_file_path=f"fpl-data/event_live/event_live_{now.strftime('%Y%m%d')}.json.gz",
+        stage_name="fpl_s3_stage",
+        bucket_name="fpl-stats-data-lake-dev"
+    )
+
+def run_event_live_staging_backfill(start_date: date, end_date: date):
+    return load_s3_date_range_to_staging_pipeline(
+        staging_table_sql_file="load/stage/event_live/create_event_live_staging.sql",
+        staging_table_name="STAGING_EVENT_LIVE",
+        data_type="event_live",
+        start_date=start_date,
+        end_date=end_date,
+        stage_name="fpl_s3_stage",
+        bucket_name="fpl-stats-data-lake-dev"
+    )
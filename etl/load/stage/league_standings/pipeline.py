@@ -0,0 +1,61 @@
+import sys
+import os
+import logging
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from load.stage.s3_to_snowflake_pipeline import backfill_dates, load_s3_file_list_to_staging_pipeline
+from extract.league_standings.pipeline import LEAGUE_STANDINGS_DATA_TYPE, manifest_filename
+from s3.s3_datalake import S3DataLake
+
+logger = logging.getLogger(__name__)
+
+def run_league_standings_staging():
+    now = datetime.now(ZoneInfo("Australia/Sydney"))
+    # Standings are written as NDJSON shards, one row per entry, listed in the day's manifest
+    manifest = S3DataLake().load_json(LEAGUE_STANDINGS_DATA_TYPE, manifest_filename(now.strftime('%Y%m%d')))
+    if not manifest or not manifest.get("shards"):
+        logger.info("No league standings extracted today, nothing to stage")
+        return {
+            "success": True,
+            "rows_loaded": 0,
+            "error": None
+        }
+    return load_s3_file_list_to_staging_pipeline(
+        staging_table_sql_file="load/stage/league_standings/create_league_standings_staging.sql",
+        staging_table_name="STAGING_LEAGUE_STANDINGS",
+        s3_prefix=f"fpl-data/{LEAGUE_STANDINGS_DATA_TYPE}/",
+        filenames=[shard["filename"] for shard in manifest["shards"]],
+        stage_name="fpl_s3_stage",
+        bucket_name="fpl-stats-data-lake-dev"
+    )
+
+
+def run_league_standings_staging_backfill(start_date: date, end_date: date):
+    # Every day's shards are listed in its manifest; days without one had no league crawl
+    s3_client = S3DataLake()
+    dates = backfill_dates(start_date, end_date)
+    filenames = []
+    for day in dates:
+        manifest = s3_client.load_json(LEAGUE_STANDINGS_DATA_TYPE, manifest_filename(day.strftime('%Y%m%d')))
+        filenames += [shard["filename"] for shard in (manifest or {}).get("shards", [])]
+    if not filenames:
+        logger.info(f"No league standings extracted between {start_date} and {end_date}, nothing to stage")
+        return {
+            "success": True,
+            "rows_loaded": 0,
+            "dates_requested": len(dates),
+            "error": None
+        }
+    result = load_s3_file_list_to_staging_pipeline(
+        staging_table_sql_file="load/stage/league_standings/create_league_standings_staging.sql",
+        staging_table_name="STAGING_LEAGUE_STANDINGS",
+        s3_prefix=f"fpl-data/{LEAGUE_STANDINGS_DATA_TYPE}/",
+        filenames=filenames,
+        stage_name="fpl_s3_stage",
+        bucket_name="fpl-stats-data-lake-dev"
+    )
+    return {**result, "dates_requested": len(dates)}
\ No newline at end of file
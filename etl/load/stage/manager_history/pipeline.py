@@ -0,0 +1,30 @@
+import sys
+import os
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from load.stage.s3_to_snowflake_pipeline import load_s3_files_to_staging_pipeline, load_s3_date_range_to_staging_pipeline
+
+def run_manager_history_staging():
+    now = datetime.now(ZoneInfo("Australia/Sydney"))
+    return load_s3_files_to_staging_pipeline(
+        staging_table_sql_file="load/stage/manager_history/create_manager_history_staging.sql",
+        staging_table_name="STAGING_MANAGER_HISTORY",
+        s3_file_path=f"fpl-data/manager_history/manager_history_{now.strftime('%Y%m%d')}.json.gz",
+        stage_name="fpl_s3_stage",
+        bucket_name="fpl-stats-data-lake-dev"
+    )
+
+def run_manager_history_staging_backfill(start_date: date, end_date: date):
+    return load_s3_date_range_to_staging_pipeline(
+        staging_table_sql_file="load/stage/manager_history/create_manager_history_staging.sql",
+        staging_table_name="STAGING_MANAGER_HISTORY",
+        data_type="manager_history",
+        start_date=start_date,
+        end_date=end_date,
+        stage_name="fpl_s3_stage",
+        bucket_name="fpl-stats-data-lake-dev"
+    )
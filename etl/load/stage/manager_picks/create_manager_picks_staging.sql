@@ -0,0 +1,8 @@
+CREATE TABLE IF NOT EXISTS FPL_STATS.FPL_SCHEMA.STAGING_MANAGER_PICKS (
+    entry_id INTEGER,
+    gw INTEGER,
+    element INTEGER,
+    multiplier INTEGER,
+    is_captain BOOLEAN,
+    s3_file_path STRING
+)
\ No newline at end of file
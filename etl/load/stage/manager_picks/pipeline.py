@@ -0,0 +1,99 @@
+import sys
+import os
+import logging
+from datetime import date, datetime
+from typing import List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from load.stage.s3_to_snowflake_pipeline import backfill_dates, load_s3_file_list_to_staging_pipeline
+from extract.manager_picks.pipeline import MANAGER_PICKS_DATA_TYPE, manifest_filename
+from snowflake_client.snowflake_client import SnowflakeClient
+from s3.s3_datalake import S3DataLake
+
+logger = logging.getLogger(__name__)
+
+# Parquet columns of a picks shard and their staging column types
+PICKS_COLUMNS = {
+    "entry_id": "INTEGER",
+    "gw": "INTEGER",
+    "element": "INTEGER",
+    "multiplier": "INTEGER",
+    "is_captain": "BOOLEAN",
+}
+
+def _load_picks_shards(filenames: List[str]):
+    return load_s3_file_list_to_staging_pipeline(
+        staging_table_sql_file="load/stage/manager_picks/create_manager_picks_staging.sql",
+        staging_table_name="STAGING_MANAGER_PICKS",
+        s3_prefix=f"fpl-data/{MANAGER_PICKS_DATA_TYPE}/",
+        filenames=filenames,
+        stage_name="fpl_s3_stage",
+        bucket_name="fpl-stats-data-lake-dev",
+        parquet_columns=PICKS_COLUMNS
+    )
+
+def _loaded_shards_since() -> Tuple[Optional[date], Set[str]]:
+    """
+    The day of the latest shard inserted into SOURCE_MANAGER_PICKS (None before the first load),
+    and the shards loaded from that day on
+    """
+    snowflake_client = SnowflakeClient()
+    try:
+        snowflake_client.execute_sql_file("load/source/manager_picks/create_manager_picks_files_table.sql")
+        latest = snowflake_client.execute_sql_file("load/stage/manager_picks/select_latest_loaded_file.sql")[0][0]
+        if latest is None:
+            return None, set()
+        # Shards are named manager_picks_YYYYMMDD_HHMMSS_shard_NNN.parquet
+        since = datetime.strptime(latest[len(f"{MANAGER_PICKS_DATA_TYPE}_"):][:8], '%Y%m%d').date()
+        rows = snowflake_client.execute_sql_file(
+            "load/stage/manager_picks/select_loaded_files.sql", (f"{MANAGER_PICKS_DATA_TYPE}_{since.strftime('%Y%m%d')}",)
+        )
+        return since, {row[0] for row in rows or []}
+    finally:
+        snowflake_client.close()
+
+def run_manager_picks_staging():
+    # Picks are written as Parquet shards listed in daily manifests. The queue marks pairs done once their shard
+    # is in S3, so every shard not yet in SOURCE_MANAGER_PICKS is staged. Each load stages every shard left over,
+    # so only manifests from the day of the latest loaded shard on can still list unloaded ones
+    s3_client = S3DataLake()
+    since, loaded = _loaded_shards_since()
+    if since is None:
+        manifest_names = [name for name in s3_client.list_json(MANAGER_PICKS_DATA_TYPE) if name.endswith(".json.gz")]
+    else:
+        today = datetime.now(ZoneInfo("Australia/Sydney")).date()
+        manifest_names = [manifest_filename(day.strftime('%Y%m%d')) for day in backfill_dates(since, max(since, today))]
+    filenames = []
+    for manifest_name in manifest_names:
+        manifest = s3_client.load_json(MANAGER_PICKS_DATA_TYPE, manifest_name) or {}
+        filenames += [shard["filename"] for shard in manifest.get("shards", []) if shard["filename"] not in loaded]
+    if not filenames:
+        logger.info("No manager picks shards left to load, nothing to stage")
+        return {
+            "success": True,
+            "rows_loaded": 0,
+            "error": None
+        }
+    logger.info(f"Staging {len(filenames)} manager picks shards not yet loaded from {len(manifest_names)} manifests")
+    return _load_picks_shards(filenames)
+
+def run_manager_picks_staging_backfill(start_date: date, end_date: date):
+    # Every shard listed in the range's manifests; the source load skips pairs already inserted
+    s3_client = S3DataLake()
+    dates = backfill_dates(start_date, end_date)
+    filenames = []
+    for day in dates:
+        manifest = s3_client.load_json(MANAGER_PICKS_DATA_TYPE, manifest_filename(day.strftime('%Y%m%d')))
+        filenames += [shard["filename"] for shard in (manifest or {}).get("shards", [])]
+    if not filenames:
+        logger.info(f"No manager picks extracted between {start_date} and {end_date}, nothing to stage")
+        return {
+            "success": True,
+            "rows_loaded": 0,
+            "dates_requested": len(dates),
+            "error": None
+        }
+    return {**_load_picks_shards(filenames), "dates_requested": len(dates)}
\ No newline at end of file
@@ -0,0 +1,2 @@
+SELECT MAX(filename)
+FROM FPL_STATS.FPL_SCHEMA.SOURCE_MANAGER_PICKS_FILES
\ No newline at end of file
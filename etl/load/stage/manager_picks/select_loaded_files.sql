@@ -0,0 +1,3 @@
+SELECT filename
+FROM FPL_STATS.FPL_SCHEMA.SOURCE_MANAGER_PICKS_FILES
+WHERE filename >= %s
\ No newline at end of file
@@ -1,15 +1,35 @@
 import sys
 import os
-from datetime import datetime
+import logging
+from datetime import date, datetime
 from zoneinfo import ZoneInfo
 
 # Add the etl directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 
-from load.stage.s3_to_snowflake_pipeline import load_s3_files_to_staging_pipeline
+from load.stage.s3_to_snowflake_pipeline import (
+    load_s3_files_to_staging_pipeline,
+    load_s3_date_range_to_staging_pipeline,
+    load_s3_file_list_to_staging_pipeline,
+)
+from extract.player_details.sharding import SHARDS_DATA_TYPE, load_shard_manifest, progress_filename
+from s3.s3_datalake import S3DataLake
+
+logger = logging.getLogger(__name__)
 
 def run_player_details_staging():
     now = datetime.now(ZoneInfo("Australia/Sydney"))
+    # A sharded extract is loaded from the shard artifacts listed in its manifest
+    shard_manifest = load_shard_manifest(S3DataLake(), now.strftime('%Y%m%d'))
+    if shard_manifest:
+        return load_s3_file_list_to_staging_pipeline(
+            staging_table_sql_file="load/stage/player_details/create_player_details_staging.sql",
+            staging_table_name="STAGING_PLAYER_DETAILS",
+            s3_prefix=f"fpl-data/{SHARDS_DATA_TYPE}/",
+            filenames=[shard["filename"] for shard in shard_manifest["shards"]],
+            stage_name="fpl_s3_stage",
+            bucket_name="fpl-stats-data-lake-dev"
+        )
     return load_s3_files_to_staging_pipeline(
         staging_table_sql_file="load/stage/player_details/create_player_details_staging.sql",
         staging_table_name="STAGING_PLAYER_DETAILS",
@@ -18,3 +38,31 @@ def run_player_details_staging():
         bucket_name="fpl-stats-data-lake-dev"
     )
 
+def sharded_player_details_files(s3_client, day: date):
+    """The shard files of a date whose latest player details extract was sharded, else None"""
+    run_date = day.strftime('%Y%m%d')
+    shard_manifest = load_shard_manifest(s3_client, run_date)
+    if shard_manifest:
+        return f"fpl-data/{SHARDS_DATA_TYPE}/", [shard["filename"] for shard in shard_manifest["shards"]]
+    # A checkpointed (Lambda) extract only writes its manifest once the last continuation finishes
+    progress = s3_client.load_json(SHARDS_DATA_TYPE, progress_filename(run_date))
+    if progress and not progress.get("complete", True):
+        logger.warning(
+            f"[STEP_SKIPPED] PLAYER DETAILS BACKFILL - Checkpointed extract for {run_date} never completed; "
+            f"{len(progress['done_ids'])} players in {len(progress['shards'])} shards are not loaded"
+        )
+    return None
+
+def run_player_details_staging_backfill(start_date: date, end_date: date):
+    # Sharded and checkpointed days have no player_details_YYYYMMDD file, only the shards listed in their manifest
+    s3_client = S3DataLake()
+    return load_s3_date_range_to_staging_pipeline(
+        staging_table_sql_file="load/stage/player_details/create_player_details_staging.sql",
+        staging_table_name="STAGING_PLAYER_DETAILS",
+        data_type="player_details",
+        start_date=start_date,
+        end_date=end_date,
+        stage_name="fpl_s3_stage",
+        bucket_name="fpl-stats-data-lake-dev",
+        date_files=lambda day: sharded_player_details_files(s3_client, day)
+    )
\ No newline at end of file
@@ -1,7 +1,8 @@
 import logging
 import sys
 import os
-from typing import Optional, Dict, Any
+from datetime import date, timedelta
+from typing import Callable, Optional, Dict, Any, List, Tuple
 
 # Add the etl directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -11,6 +12,9 @@ from s3.s3_datalake import generate_config
 
 logger = logging.getLogger(__name__)
 
+# COPY ... FILES accepts at most 1,000 file names
+MAX_COPY_FILES = 1000
+
 def create_s3_stage(
     snowflake_client: SnowflakeClient,
     stage_name: str,
@@ -77,6 +81,231 @@ def load_s3_to_staging(
         raise
 
 
+def backfill_dates(start_date: date, end_date: date) -> List[date]:
+    """Return every date in the inclusive range start_date..end_date"""
+    if start_date > end_date:
+        raise ValueError(f"Backfill start {start_date} is after end {end_date}")
+    return [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+
+
+def load_s3_pattern_to_staging(
+    snowflake_client: SnowflakeClient,
+    stage_name: str,
+    s3_prefix: str,
+    file_pattern: str,
+    staging_table: str,
+) -> int:
+    """Load every raw JSON object under an S3 prefix matching a regex into a staging table with one COPY"""
+
+    copy_sql = f"""
+    COPY INTO FPL_STATS.FPL_SCHEMA.{staging_table} (raw_data, extraction_timestamp, extraction_date, s3_file_path)
+    FROM (
+        SELECT
+            parse_json($1),
+            to_timestamp($1:extraction_timestamp),
+            to_date($1:extraction_date),
+            METADATA$FILENAME
+        FROM @FPL_STATS.FPL_SCHEMA.{stage_name}/{s3_prefix}
+    )
+    PATTERN = '{file_pattern}'
+    """
+
+    try:
+        logger.info(f"[STEP] S3 TO STAGING - Bulk loading {s3_prefix} files matching {file_pattern} into {staging_table}")
+        rows_affected = snowflake_client.execute_sql(copy_sql)
+        logger.info(f"[STEP_COMPLETE] S3 TO STAGING - Successfully loaded {rows_affected} rows from {s3_prefix}")
+        return rows_affected or 0
+    except Exception as e:
+        logger.error(f"[STEP_FAILED] S3 TO STAGING - Failed to bulk load {s3_prefix} into {staging_table}: {e}")
+        raise
+
+
+def load_s3_file_list_to_staging(
+    snowflake_client: SnowflakeClient,
+    stage_name: str,
+    s3_prefix: str,
+    filenames: List[str],
+    staging_table: str,
+) -> int:
+    """Load a list of raw JSON objects under one S3 prefix into a staging table, one COPY per 1,000 files"""
+
+    if len(filenames) > MAX_COPY_FILES:
+        return sum(
+            load_s3_file_list_to_staging(
+                snowflake_client, stage_name, s3_prefix, filenames[offset:offset + MAX_COPY_FILES], staging_table
+            )
+            for offset in range(0, len(filenames), MAX_COPY_FILES)
+        )
+
+    files_clause = ", ".join(f"'{filename}'" for filename in filenames)
+    copy_sql = f"""
+    COPY INTO FPL_STATS.FPL_SCHEMA.{staging_table} (raw_data, extraction_timestamp, extraction_date, s3_file_path)
+    FROM (
+        SELECT
+            parse_json($1),
+            to_timestamp($1:extraction_timestamp),
+            to_date($1:extraction_date),
+            METADATA$FILENAME
+        FROM @FPL_STATS.FPL_SCHEMA.{stage_name}/{s3_prefix}
+    )
+    FILES = ({files_clause})
+    """
+
+    try:
+        logger.info(f"[STEP] S3 TO STAGING - Loading {len(filenames)} files from {s3_prefix} into {staging_table}")
+        rows_affected = snowflake_client.execute_sql(copy_sql)
+        logger.info(f"[STEP_COMPLETE] S3 TO STAGING - Successfully loaded {rows_affected} rows from {s3_prefix}")
+        return rows_affected or 0
+    except Exception as e:
+        logger.error(f"[STEP_FAILED] S3 TO STAGING - Failed to load files from {s3_prefix} into {staging_table}: {e}")
+        raise
+
+
+def load_s3_parquet_file_list_to_staging(
+    snowflake_client: SnowflakeClient,
+    stage_name: str,
+    s3_prefix: str,
+    filenames: List[str],
+    staging_table: str,
+    columns: Dict[str, str],
+) -> int:
+    """Load a list of Parquet files under one S3 prefix into a staging table's typed columns, one COPY per 1,000 files"""
+
+    if len(filenames) > MAX_COPY_FILES:
+        return sum(
+            load_s3_parquet_file_list_to_staging(
+                snowflake_client, stage_name, s3_prefix, filenames[offset:offset + MAX_COPY_FILES], staging_table, columns
+            )
+            for offset in range(0, len(filenames), MAX_COPY_FILES)
+        )
+
+    files_clause = ", ".join(f"'{filename}'" for filename in filenames)
+    column_list = ", ".join(columns)
+    select_list = ",\n            ".join(f"$1:{name}::{column_type}" for name, column_type in columns.items())
+    copy_sql = f"""
+    COPY INTO FPL_STATS.FPL_SCHEMA.{staging_table} ({column_list}, s3_file_path)
+    FROM (
+        SELECT
+            {select_list},
+            METADATA$FILENAME
+        FROM @FPL_STATS.FPL_SCHEMA.{stage_name}/{s3_prefix}
+    )
+    FILES = ({files_clause})
+    FILE_FORMAT = (TYPE = 'PARQUET')
+    """
+
+    try:
+        logger.info(f"[STEP] S3 TO STAGING - Loading {len(filenames)} Parquet files from {s3_prefix} into {staging_table}")
+        rows_affected = snowflake_client.execute_sql(copy_sql)
+        logger.info(f"[STEP_COMPLETE] S3 TO STAGING - Successfully loaded {rows_affected} rows from {s3_prefix}")
+        return rows_affected or 0
+    except Exception as e:
+        logger.error(f"[STEP_FAILED] S3 TO STAGING - Failed to load Parquet files from {s3_prefix} into {staging_table}: {e}")
+        raise
+
+
+def load_s3_date_range_to_staging_pipeline(
+    staging_table_sql_file: str,
+    staging_table_name: str,
+    data_type: str,
+    start_date: date,
+    end_date: date,
+    bucket_name: str,
+    stage_name: str = "fpl_s3_stage",
+    date_files: Optional[Callable[[date], Optional[Tuple[str, List[str]]]]] = None,
+) -> Dict[str, Any]:
+    """
+    Backfill pipeline to load every daily file of a dataset within a date range into a staging table
+
+    Files follow the extract naming convention fpl-data/{data_type}/{data_type}_YYYYMMDD.json.gz.
+    All matching objects are loaded with a single COPY ... PATTERN so Snowflake can parallelise
+    across files; dates without a file are simply not matched.
+
+    Args:
+        staging_table_name: Name of the staging table
+        data_type: Dataset folder and file prefix (e.g. bootstrap)
+        start_date: First date to load (inclusive)
+        end_date: Last date to load (inclusive)
+        stage_name: Name for the Snowflake stage (default: fpl_s3_stage)
+        date_files: For datasets whose extract can be split across several files (shards listed
+            in a manifest), returns the S3 prefix and file names of a date's extract, or None
+            when the date has the daily file. Those dates are loaded with COPY ... FILES instead.
+
+    Returns:
+        Dict with pipeline results including total rows loaded and the number of dates requested
+    """
+
+    dates = backfill_dates(start_date, end_date)
+    # S3 prefix -> files, for the dates whose extract is not the daily file
+    listed_files: Dict[str, List[str]] = {}
+    pattern_dates = []
+    for day in dates:
+        files = date_files(day) if date_files else None
+        if files:
+            listed_files.setdefault(files[0], []).extend(files[1])
+        else:
+            pattern_dates.append(day)
+
+    snowflake_client = None
+    result = {
+        "success": False,
+        "rows_loaded": 0,
+        "dates_requested": len(dates),
+        "files_requested": sum(len(filenames) for filenames in listed_files.values()),
+        "error": None
+    }
+
+    try:
+        snowflake_client = SnowflakeClient()
+
+        # Step 1: Create staging table
+        snowflake_client.execute_sql_file(staging_table_sql_file)
+
+        # Step 2: Clear staging table once for the whole range
+        snowflake_client.truncate_table(staging_table_name)
+
+        # Step 3: Create S3 stage
+        create_s3_stage(
+            snowflake_client,
+            stage_name,
+            bucket_name
+        )
+
+        # Step 4: Single bulk COPY covering every daily file in the range
+        if pattern_dates:
+            date_alternation = "|".join(d.strftime('%Y%m%d') for d in pattern_dates)
+            file_pattern = f".*{data_type}_({date_alternation})[.]json[.]gz"
+            result["rows_loaded"] = load_s3_pattern_to_staging(
+                snowflake_client,
+                stage_name,
+                f"fpl-data/{data_type}/",
+                file_pattern,
+                staging_table_name
+            )
+
+        # Step 5: COPY ... FILES for the dates whose extract is listed in a manifest
+        for s3_prefix, filenames in listed_files.items():
+            result["rows_loaded"] += load_s3_file_list_to_staging(
+                snowflake_client,
+                stage_name,
+                s3_prefix,
+                filenames,
+                staging_table_name
+            )
+        result["success"] = True
+
+    except Exception as e:
+        result["error"] = str(e)
+        logger.error(f"[PIPELINE_FAILED] S3 TO SNOWFLAKE - Backfill of {data_type} failed: {e}")
+        raise
+
+    finally:
+        if snowflake_client:
+            snowflake_client.close()
+
+    return result
+
+
 def load_s3_files_to_staging_pipeline(
     staging_table_sql_file: str,
     staging_table_name: str,
@@ -142,4 +371,84 @@ def load_s3_files_to_staging_pipeline(
         if snowflake_client:
             snowflake_client.close()
     
+    return result
+
+
+def load_s3_file_list_to_staging_pipeline(
+    staging_table_sql_file: str,
+    staging_table_name: str,
+    s3_prefix: str,
+    filenames: List[str],
+    bucket_name: str,
+    stage_name: str = "fpl_s3_stage",
+    parquet_columns: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    Pipeline to load a set of files that together make up one extract, such as the shards
+    of a sharded player details extract, into a staging table with a single COPY
+
+    Args:
+        staging_table_name: Name of the staging table
+        s3_prefix: S3 prefix the files are under
+        filenames: File names relative to s3_prefix
+        stage_name: Name for the Snowflake stage (default: fpl_s3_stage)
+        parquet_columns: For Parquet files, the column name and Snowflake type of each column to load (default: JSON files into raw_data)
+
+    Returns:
+        Dict with pipeline results including total rows loaded and the number of files
+    """
+
+    snowflake_client = None
+    result = {
+        "success": False,
+        "rows_loaded": 0,
+        "files_requested": len(filenames),
+        "error": None
+    }
+
+    try:
+        snowflake_client = SnowflakeClient()
+
+        # Step 1: Create staging table
+        snowflake_client.execute_sql_file(staging_table_sql_file)
+
+        # Step 2: Clear staging table
+        snowflake_client.truncate_table(staging_table_name)
+
+        # Step 3: Create S3 stage
+        create_s3_stage(
+            snowflake_client,
+            stage_name,
+            bucket_name
+        )
+
+        # Step 4: Single COPY covering every file
+        if parquet_columns:
+            result["rows_loaded"] = load_s3_parquet_file_list_to_staging(
+                snowflake_client,
+                stage_name,
+                s3_prefix,
+                filenames,
+                staging_table_name,
+                parquet_columns
+            )
+        else:
+            result["rows_loaded"] = load_s3_file_list_to_staging(
+                snowflake_client,
+                stage_name,
+                s3_prefix,
+                filenames,
+                staging_table_name
+            )
+        result["success"] = True
+
+    except Exception as e:
+        result["error"] = str(e)
+        logger.error(f"[PIPELINE_FAILED] S3 TO SNOWFLAKE - Load of {len(filenames)} files from {s3_prefix} failed: {e}")
+        raise
+
+    finally:
+        if snowflake_client:
+            snowflake_client.close()
+
     return result
\ No newline at end of file
@@ -0,0 +1,6 @@
+CREATE TABLE IF NOT EXISTS FPL_STATS.FPL_SCHEMA.STAGING_TEAM_FIXTURES (
+    raw_data VARIANT,
+    extraction_timestamp TIMESTAMP_NTZ,
+    extraction_date DATE,
+    s3_file_path STRING
+)
\ No newline at end of file
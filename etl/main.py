@@ -2,20 +2,64 @@
 import os
 import sys
 import argparse
+import importlib
 import logging
 import json
-from typing import Dict, Any, Optional
+from datetime import date
+from typing import Callable, Dict, Any, Optional, Set, Tuple
 
 # Add the etl directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Import pipeline functions
-from extract.run_daily_extract import run_daily_extract_pipelines
-from extract.run_weekly_extract import run_weekly_extract_pipelines
-from load.run_daily_source_load import run_daily_load_pipelines as run_daily_source_load
-from load.run_weekly_source_load import run_weekly_load_pipelines as run_weekly_source_load
-from load.run_daily_stage_load import run_daily_load_pipelines as run_daily_stage_load
-from load.run_weekly_stage_load import run_weekly_load_pipelines as run_weekly_stage_load
+# Only lightweight orchestration modules are imported up front. Pipeline runners pull in
+# requests, boto3, snowflake.connector and cryptography, so each is imported when its
+# phase runs (see PHASE_RUNNERS) to keep Lambda cold starts short.
+from orchestration.run_options import RunOptions
+from orchestration.planner import RunPlan, plan_run, record_run_state
+from orchestration.run_manifest import RunManifest
+from orchestration.profiling import RunProfiler, profile_phase
+from load.source.table_swap import set_load_strategy
+from extract.manager_history.managers import parse_manager_ids
+from extract.league_standings.leagues import parse_league_ids
+from orchestration.deadline import (
+    DEFAULT_MARGIN_SECONDS,
+    MAX_CONTINUATIONS,
+    Deadline,
+    DeadlineExceeded,
+    RunProgress,
+    RunSuspended,
+    check_deadline,
+    continuation_event,
+    invoke_continuation,
+)
+
+# (module, function) running each schedule's phase, imported on first use
+PHASE_RUNNERS = {
+    ("daily", "extract"): ("extract.run_daily_extract", "run_daily_extract_pipelines"),
+    ("weekly", "extract"): ("extract.run_weekly_extract", "run_weekly_extract_pipelines"),
+    ("daily", "stage"): ("load.run_daily_stage_load", "run_daily_load_pipelines"),
+    ("weekly", "stage"): ("load.run_weekly_stage_load", "run_weekly_load_pipelines"),
+    ("daily", "source"): ("load.run_daily_source_load", "run_daily_load_pipelines"),
+    ("weekly", "source"): ("load.run_weekly_source_load", "run_weekly_load_pipelines"),
+    ("weekly", "serve"): ("load.run_serve_load", "run_serve_load_pipelines"),
+    ("weekly", "export"): ("export.run_export", "run_export_pipelines"),
+    ("daily", "backfill"): ("load.run_backfill_stage_load", "run_backfill_load_pipelines"),
+    ("weekly", "backfill"): ("load.run_backfill_stage_load", "run_backfill_load_pipelines"),
+}
+
+
+def load_phase_runner(schedule: str, phase: str) -> Callable[..., Any]:
+    """Import and return the runner for a schedule's phase."""
+    if (schedule, phase) not in PHASE_RUNNERS:
+        raise ValueError(f"Unknown schedule: {schedule}")
+    module_name, function_name = PHASE_RUNNERS[(schedule, phase)]
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def create_s3_datalake():
+    """Construct the S3 data lake client, importing boto3 only when it is needed."""
+    from s3.s3_datalake import S3DataLake
+    return S3DataLake()
 
 
 def setup_logging(log_level: str) -> None:
@@ -28,106 +72,343 @@ def setup_logging(log_level: str) -> None:
     )
 
 
-def run_extract_phase(schedule: str) -> Dict[str, Any]:
+def run_extract_phase(
+    schedule: str,
+    skip_steps: Optional[Set[str]] = None,
+    options: Optional[RunOptions] = None,
+    on_artifact: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    deadline: Optional[Deadline] = None,
+    profiler: Optional[RunProfiler] = None
+) -> Dict[str, Any]:
     """Run the extract phase for the specified schedule."""
     logger = logging.getLogger(__name__)
     logger.info(f"[PHASE_START] {schedule.upper()} EXTRACT PHASE - Starting")
     
     try:
         if schedule == "daily":
-            run_daily_extract_pipelines()
+            load_phase_runner(schedule, "extract")(
+                on_artifact=on_artifact, options=options, skip_steps=skip_steps, profiler=profiler
+            )
             logger.info(f"[PHASE_COMPLETE] {schedule.upper()} EXTRACT PHASE - Completed successfully")
             return {"success": True, "phase": "extract", "schedule": "daily"}
         elif schedule == "weekly":
-            run_weekly_extract_pipelines()
+            load_phase_runner(schedule, "extract")(
+                on_artifact=on_artifact, skip_steps=skip_steps, options=options, deadline=deadline, profiler=profiler
+            )
             logger.info(f"[PHASE_COMPLETE] {schedule.upper()} EXTRACT PHASE - Completed successfully")
             return {"success": True, "phase": "extract", "schedule": "weekly"}
         else:
             raise ValueError(f"Unknown schedule: {schedule}")
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         logger.error(f"[PHASE_FAILED] {schedule.upper()} EXTRACT PHASE - {str(e)}")
         return {"success": False, "error": str(e), "phase": "extract", "schedule": schedule}
 
 
-def run_source_phase(schedule: str) -> Dict[str, Any]:
+def run_source_phase(
+    schedule: str,
+    skip_steps: Optional[Set[str]] = None,
+    on_step: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    deadline: Optional[Deadline] = None,
+    profiler: Optional[RunProfiler] = None
+) -> Dict[str, Any]:
     """Run the source load phase for the specified schedule."""
     logger = logging.getLogger(__name__)
     logger.info(f"[PHASE_START] {schedule.upper()} SOURCE PHASE - Starting")
     
     try:
         if schedule == "daily":
-            run_daily_source_load()
+            load_phase_runner(schedule, "source")(skip_steps=skip_steps, on_step=on_step, profiler=profiler)
             logger.info(f"[PHASE_COMPLETE] {schedule.upper()} SOURCE PHASE - Completed successfully")
             return {"success": True, "phase": "source", "schedule": "daily"}
         elif schedule == "weekly":
-            run_weekly_source_load()
+            load_phase_runner(schedule, "source")(
+                skip_steps=skip_steps, on_step=on_step, deadline=deadline, profiler=profiler
+            )
             logger.info(f"[PHASE_COMPLETE] {schedule.upper()} SOURCE PHASE - Completed successfully")
             return {"success": True, "phase": "source", "schedule": "weekly"}
         else:
             raise ValueError(f"Unknown schedule: {schedule}")
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         logger.error(f"[PHASE_FAILED] {schedule.upper()} SOURCE PHASE - {str(e)}")
         return {"success": False, "error": str(e), "phase": "source", "schedule": schedule}
 
 
-def run_stage_phase(schedule: str) -> Dict[str, Any]:
+def run_serve_phase(
+    schedule: str,
+    skip_steps: Optional[Set[str]] = None,
+    on_step: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    deadline: Optional[Deadline] = None,
+    profiler: Optional[RunProfiler] = None
+) -> Dict[str, Any]:
+    """Run the serve phase, rebuilding the backend's serving tables from the weekly source tables."""
+    logger = logging.getLogger(__name__)
+    logger.info(f"[PHASE_START] {schedule.upper()} SERVE PHASE - Starting")
+
+    try:
+        if schedule == "weekly":
+            load_phase_runner(schedule, "serve")(
+                skip_steps=skip_steps, on_step=on_step, deadline=deadline, profiler=profiler
+            )
+            logger.info(f"[PHASE_COMPLETE] {schedule.upper()} SERVE PHASE - Completed successfully")
+            return {"success": True, "phase": "serve", "schedule": "weekly"}
+        else:
+            raise ValueError(f"No serve phase for schedule: {schedule}")
+    except DeadlineExceeded:
+        raise
+    except Exception as e:
+        logger.error(f"[PHASE_FAILED] {schedule.upper()} SERVE PHASE - {str(e)}")
+        return {"success": False, "error": str(e), "phase": "serve", "schedule": schedule}
+
+
+def run_export_phase(
+    schedule: str,
+    skip_steps: Optional[Set[str]] = None,
+    on_step: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    deadline: Optional[Deadline] = None,
+    profiler: Optional[RunProfiler] = None
+) -> Dict[str, Any]:
+    """Run the export phase, writing JSON snapshots of the backend's read-mostly datasets to S3."""
+    logger = logging.getLogger(__name__)
+    logger.info(f"[PHASE_START] {schedule.upper()} EXPORT PHASE - Starting")
+
+    try:
+        if schedule == "weekly":
+            load_phase_runner(schedule, "export")(
+                skip_steps=skip_steps, on_step=on_step, deadline=deadline, profiler=profiler
+            )
+            logger.info(f"[PHASE_COMPLETE] {schedule.upper()} EXPORT PHASE - Completed successfully")
+            return {"success": True, "phase": "export", "schedule": "weekly"}
+        else:
+            raise ValueError(f"No export phase for schedule: {schedule}")
+    except DeadlineExceeded:
+        raise
+    except Exception as e:
+        logger.error(f"[PHASE_FAILED] {schedule.upper()} EXPORT PHASE - {str(e)}")
+        return {"success": False, "error": str(e), "phase": "export", "schedule": schedule}
+
+
+def run_stage_phase(
+    schedule: str,
+    options: Optional[RunOptions] = None,
+    skip_steps: Optional[Set[str]] = None,
+    on_step: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    deadline: Optional[Deadline] = None,
+    profiler: Optional[RunProfiler] = None
+) -> Dict[str, Any]:
     """Run the stage load phase for the specified schedule."""
     logger = logging.getLogger(__name__)
     logger.info(f"[PHASE_START] {schedule.upper()} STAGE PHASE - Starting")
     
     try:
-        if schedule == "daily":
-            run_daily_stage_load()
+        if options and options.is_backfill:
+            load_phase_runner(schedule, "backfill")(
+                schedule, options.backfill_start, options.backfill_end,
+                skip_steps=skip_steps, on_step=on_step, deadline=deadline, profiler=profiler
+            )
+            logger.info(f"[PHASE_COMPLETE] {schedule.upper()} STAGE PHASE - Backfill {options.backfill_start} to {options.backfill_end} completed successfully")
+            return {"success": True, "phase": "stage", "schedule": schedule, "backfill": True}
+        elif schedule == "daily":
+            load_phase_runner(schedule, "stage")(skip_steps=skip_steps, on_step=on_step, profiler=profiler)
             logger.info(f"[PHASE_COMPLETE] {schedule.upper()} STAGE PHASE - Completed successfully")
             return {"success": True, "phase": "stage", "schedule": "daily"}
         elif schedule == "weekly":
-            run_weekly_stage_load()
+            load_phase_runner(schedule, "stage")(
+                skip_steps=skip_steps, on_step=on_step, deadline=deadline, profiler=profiler
+            )
             logger.info(f"[PHASE_COMPLETE] {schedule.upper()} STAGE PHASE - Completed successfully")
             return {"success": True, "phase": "stage", "schedule": "weekly"}
         else:
             raise ValueError(f"Unknown schedule: {schedule}")
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         logger.error(f"[PHASE_FAILED] {schedule.upper()} STAGE PHASE - {str(e)}")
         return {"success": False, "error": str(e), "phase": "stage", "schedule": schedule}
 
 
-def run_pipeline(schedule: str, phase: str) -> int:
-    """Run the specified pipeline phase(s) for the given schedule."""
+def plan_pipeline_run(schedule: str) -> Optional[RunPlan]:
+    """Run the gameweek-aware pre-flight planner, falling back to a full run if it fails."""
+    logger = logging.getLogger(__name__)
+    try:
+        from api.fpl_client import FPLAPIClient
+        plan = plan_run(schedule, FPLAPIClient(), create_s3_datalake())
+        plan.report()
+        return plan
+    except Exception as e:
+        logger.warning(f"[PLAN] Pre-flight planning failed, running all steps: {e}")
+        return None
+
+
+def load_run_manifest(schedule: str, skip_steps: Set[str], run_extract: bool) -> Tuple[Optional[RunManifest], Set[str]]:
+    """Load today's run manifest and the steps it lets this run skip, falling back to running every step."""
+    logger = logging.getLogger(__name__)
+    try:
+        manifest = RunManifest.load(schedule, create_s3_datalake())
+        done_steps = manifest.completed_steps(skip_steps, run_extract)
+        for step in sorted(done_steps):
+            logger.info(f"[MANIFEST] {schedule.upper()} - Skipping {step}: already completed today with unchanged inputs")
+        return manifest, done_steps
+    except Exception as e:
+        logger.warning(f"[MANIFEST] Failed to load run manifest, running all steps: {e}")
+        return None, set()
+
+
+def run_pipeline(
+    schedule: str,
+    phase: str,
+    options: Optional[RunOptions] = None,
+    deadline: Optional[Deadline] = None,
+    progress: Optional[RunProgress] = None
+) -> int:
+    """
+    Run the specified pipeline phase(s) for the given schedule.
+
+    Steps in progress.completed_steps were completed by earlier invocations of the same run
+    and are skipped; steps completed now are added to it. With a deadline, DeadlineExceeded
+    is raised instead of starting work too close to it.
+    """
     logger = logging.getLogger(__name__)
+    options = options or RunOptions()
+    progress = progress or RunProgress()
+    # Set on every run so a warm Lambda container never keeps an earlier invocation's strategy
+    set_load_strategy(options.load_strategy, options.keep_shadow)
     
     phases_to_run = []
     if phase == "all":
+        # Serving tables and exports are built from the weekly source tables, so only weekly runs end with them
         phases_to_run = ["extract", "stage", "source"]
+        if schedule == "weekly":
+            phases_to_run += ["serve", "export"]
     else:
         phases_to_run = [phase]
-    
-    results = []
-    
-    for current_phase in phases_to_run:
-        logger.info(f"[PIPELINE_START] {current_phase.upper()} - Starting for {schedule} schedule")
-        
-        if current_phase == "extract":
-            result = run_extract_phase(schedule)
-        elif current_phase == "source":
-            result = run_source_phase(schedule)
-        elif current_phase == "stage":
-            result = run_stage_phase(schedule)
-        else:
-            logger.error(f"Unknown phase: {current_phase}")
+
+    if options.is_backfill and "extract" in phases_to_run:
+        # The FPL API only serves the current state, so a backfill replays files already in S3
+        logger.info("[PIPELINE_SKIPPED] EXTRACT - Backfill reloads existing S3 files, skipping extract")
+        phases_to_run.remove("extract")
+
+    profiler = RunProfiler(options.profile, f"{schedule}_{phase}") if options.profile else None
+
+    # Plans compare against the last full run, so only full runs are planned and recorded
+    plan = None
+    if options.plan and phase == "all" and not options.is_backfill:
+        with profile_phase(profiler, "plan"):
+            plan = plan_pipeline_run(schedule)
+    skip_steps = (plan.skip_steps if plan else set()) | options.disabled_steps
+
+    # Reruns skip steps that already completed today with unchanged inputs
+    manifest = None
+    done_steps = set()
+    if options.resume and not options.is_backfill:
+        manifest, done_steps = load_run_manifest(schedule, skip_steps, "extract" in phases_to_run)
+    progress.manifest = manifest
+    for step in sorted(progress.completed_steps - done_steps):
+        logger.info(f"[STEP_SKIPPED] {schedule.upper()} - {step} completed by an earlier invocation of this run")
+    done_steps |= progress.completed_steps
+
+    if options.streaming and phase == "all" and not options.is_backfill:
+        logger.info(f"[PIPELINE_START] STREAMING - Overlapping extract, stage and source for {schedule} schedule")
+        # The streaming run's extract steps and loads are each profiled with cProfile, so the
+        # run as a whole only records stack samples and memory
+        with profile_phase(profiler, "streaming", cprofile=False):
+            from orchestration.streaming import run_streaming_pipeline
+            result = run_streaming_pipeline(
+                schedule, skip_steps, options, done_steps, recorder=progress, deadline=deadline, profiler=profiler
+            )
+        if not result.success:
+            logger.error(f"[PIPELINE_FAILED] STREAMING - Failed steps: {list(result.failed)}, not run: {result.not_run}")
             return 1
+    else:
+        results = []
         
-        results.append(result)
-        
-        if not result.get("success", False):
-            logger.error(f"[PIPELINE_FAILED] {current_phase.upper()} - Failed, stopping pipeline")
-            return 1
+        for current_phase in phases_to_run:
+            logger.info(f"[PIPELINE_START] {current_phase.upper()} - Starting for {schedule} schedule")
+            
+            if current_phase not in ("extract", "stage", "source", "serve", "export"):
+                logger.error(f"Unknown phase: {current_phase}")
+                return 1
+
+            check_deadline(deadline, f"{current_phase} phase")
+            with profile_phase(profiler, current_phase):
+                if current_phase == "extract":
+                    result = run_extract_phase(
+                        schedule, skip_steps | done_steps, options, progress.record_artifact, deadline, profiler
+                    )
+                elif current_phase == "source":
+                    result = run_source_phase(
+                        schedule, skip_steps | done_steps, progress.record_step, deadline, profiler
+                    )
+                elif current_phase == "serve":
+                    result = run_serve_phase(
+                        schedule, skip_steps | done_steps, progress.record_step, deadline, profiler
+                    )
+                elif current_phase == "export":
+                    result = run_export_phase(
+                        schedule, skip_steps | done_steps, progress.record_step, deadline, profiler
+                    )
+                else:
+                    # Backfills load every dataset they are given, apart from those an earlier invocation loaded
+                    stage_skip_steps = done_steps if options.is_backfill else skip_steps | done_steps
+                    result = run_stage_phase(
+                        schedule, options, stage_skip_steps, progress.record_step, deadline, profiler
+                    )
+            
+            results.append(result)
+            
+            if not result.get("success", False):
+                logger.error(f"[PIPELINE_FAILED] {current_phase.upper()} - Failed, stopping pipeline")
+                return 1
+
+            logger.info(f"[PIPELINE_COMPLETE] {current_phase.upper()} - Completed successfully")
 
-        logger.info(f"[PIPELINE_COMPLETE] {current_phase.upper()} - Completed successfully")
+    if plan:
+        for step, reason in plan.skipped.items():
+            logger.info(f"[PIPELINE_SKIPPED] {step} - {reason}")
+        try:
+            record_run_state(plan, create_s3_datalake())
+        except Exception as e:
+            logger.warning(f"[PLAN] Failed to record run state: {e}")
     
     logger.info(f"[PIPELINE_COMPLETE] ALL PHASES - Completed successfully for {schedule.upper()} schedule")
     return 0
 
 
+def suspend_run(event: Dict[str, Any], context: Any, progress: RunProgress, error: DeadlineExceeded) -> Dict[str, Any]:
+    """Build the continuation for a run stopped before the Lambda timeout, and optionally start it."""
+    logger = logging.getLogger(__name__)
+    detail = event.get("detail", {})
+    attempt = (detail.get("continuation") or {}).get("attempt", 0) + 1
+    if attempt > MAX_CONTINUATIONS:
+        error_msg = f"Run still unfinished after {MAX_CONTINUATIONS} continuations: {error}"
+        logger.error(f"[PIPELINE_FAILED] FPL ETL LAMBDA - {error_msg}")
+        return {
+            "statusCode": 500,
+            "success": False,
+            "error": error_msg
+        }
+
+    next_event = continuation_event(event, progress.completed_steps, attempt)
+    logger.warning(f"[PIPELINE_SUSPENDED] FPL ETL LAMBDA - {error}; continuation {attempt} after {len(progress.completed_steps)} completed steps")
+    if not detail.get("self_invoke", False):
+        # Nothing will run the continuation: fail the invocation so Lambda retries it and the
+        # retry resumes from today's run manifest, as it would after a timeout
+        logger.error(f"[PIPELINE_FAILED] FPL ETL LAMBDA - Run stopped without self_invoke; continuation: {json.dumps(next_event)}")
+        raise RunSuspended(f"Stopped before the Lambda timeout: {error}", next_event)
+
+    invoke_continuation(next_event, context.function_name)
+    return {
+        "statusCode": 202,
+        "success": True,
+        "message": f"Stopped before the Lambda timeout: {error}",
+        "self_invoked": True,
+        "continuation": next_event
+    }
+
+
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     AWS Lambda handler for EventBridge scheduled events.
@@ -136,9 +417,39 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     {
         "detail": {
             "schedule": "daily" | "weekly",
-            "phase": "extract" | "source" | "stage" | "all"
+            "phase": "extract" | "source" | "stage" | "serve" | "export" | "all",  # serve, export: weekly only
+            "backfill": {                      # optional
+                "start_date": "YYYY-MM-DD",
+                "end_date": "YYYY-MM-DD"
+            },
+            "streaming": true | false,         # optional, phase "all" only
+            "plan": true | false,              # optional, default true; false forces a full run
+            "history_source": "element-summary" | "event-live",  # optional
+            "history_past_mode": "inline" | "cached",             # optional
+            "player_fixtures_mode": "player" | "team",            # optional
+            "projection": true | false,        # optional, default true; false writes full API responses
+            "archive_raw": true | false,       # optional, also keep full responses under fpl-data/raw/
+            "resume": true | false,            # optional, default true; false ignores today's run manifest
+            "profile": true | "s3://bucket/prefix",  # optional, write per-phase and per-step profiles (true: fpl-data/profiles/)
+            "shards": 4,                       # optional, split the player details crawl into shards
+            "shard_executor": "local" | "process" | "lambda",   # optional, where shards run
+            "load_strategy": "truncate" | "swap",   # optional, how source tables are reloaded
+            "keep_shadow": false,              # optional, keep the previous rows after a swap
+            "manager_ids": [123, 456],         # optional, managers to crawl instead of the registered users
+            "league_ids": [314, 2718],         # optional, leagues to crawl instead of the managers' private leagues
+            "picks_first_event": 1,            # optional, also queue picks of every finished gameweek from this one
+            "deadline_margin_seconds": 60,     # optional, stop this long before the Lambda timeout
+            "self_invoke": true | false        # optional, invoke the function again to continue a stopped run
         }
     }
+
+    A detail of {"shard": {...}} instead runs one player details shard, as sent by the
+    "lambda" shard executor, and returns its result.
+
+    When the invocation is about to time out, the run stops before its next step (the player
+    details crawl saves where it got to). With self_invoke it starts the "continuation" event,
+    which carries on from where the run stopped, and returns status 202; otherwise it raises
+    RunSuspended so the invocation fails and is retried like a timeout.
     """
     # Setup logging for Lambda
     setup_logging("INFO")
@@ -149,6 +460,11 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         
         # Extract parameters from EventBridge event
         detail = event.get("detail", {})
+        if "shard" in detail:
+            from extract.player_details.sharding import run_player_details_shard
+            result = run_player_details_shard(detail["shard"], context)
+            return {"statusCode": 200 if result["success"] else 500, **result}
+
         schedule = detail.get("schedule")
         phase = detail.get("phase", "all")
         
@@ -170,8 +486,19 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 "error": error_msg
             }
         
-        if phase not in ["extract", "source", "stage", "all"]:
-            error_msg = f"Invalid phase '{phase}'. Must be one of: extract, source, stage, all"
+        if phase not in ["extract", "source", "stage", "serve", "export", "all"]:
+            error_msg = f"Invalid phase '{phase}'. Must be one of: extract, source, stage, serve, export, all"
+            logger.error(error_msg)
+            return {
+                "statusCode": 400,
+                "success": False,
+                "error": error_msg
+            }
+        
+        try:
+            options = RunOptions.from_event_detail(detail)
+        except ValueError as e:
+            error_msg = f"Invalid run options: {e}"
             logger.error(error_msg)
             return {
                 "statusCode": 400,
@@ -181,8 +508,15 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         
         logger.info(f"[PIPELINE_START] FPL ETL LAMBDA - Schedule: {schedule.upper()}, Phase: {phase.upper()}")
         
+        deadline = Deadline.from_context(context, float(detail.get("deadline_margin_seconds", DEFAULT_MARGIN_SECONDS)))
+        continuation = detail.get("continuation") or {}
+        progress = RunProgress(continuation.get("completed_steps", []))
+
         # Run the pipeline
-        exit_code = run_pipeline(schedule, phase)
+        try:
+            exit_code = run_pipeline(schedule, phase, options, deadline, progress)
+        except DeadlineExceeded as e:
+            return suspend_run(event, context, progress, e)
 
         if exit_code == 0:
             logger.info(f"[PIPELINE_COMPLETE] FPL ETL LAMBDA - Completed successfully")
@@ -199,6 +533,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 "error": f"Pipeline failed for schedule '{schedule}' and phase '{phase}'"
             }
             
+    except RunSuspended:
+        raise
     except Exception as e:
         error_msg = f"Lambda handler error: {str(e)}"
         logger.error(error_msg, exc_info=True)
@@ -219,7 +555,33 @@ Examples:
   %(prog)s --schedule daily                    # Run daily pipeline (all phases)
   %(prog)s --schedule weekly --phase extract   # Run weekly extract only
   %(prog)s --schedule daily --phase source     # Run daily source load only
+  %(prog)s --schedule weekly --phase serve     # Rebuild the backend's serving tables only
+  %(prog)s --schedule weekly --phase export    # Write JSON snapshots of teams, standings and players to S3
   %(prog)s --schedule weekly --log-level DEBUG # Run weekly pipeline with debug logging
+  %(prog)s --schedule daily --backfill-start 2025-08-01 --backfill-end 2025-08-31
+                                               # Reload a month of daily files from S3
+  %(prog)s --schedule weekly --streaming       # Start loads as soon as each extract lands in S3
+  %(prog)s --schedule weekly --no-plan         # Full run even if no gameweek has finished
+  %(prog)s --schedule weekly --history-source event-live
+                                               # Build player history from event/{gw}/live/
+  %(prog)s --schedule weekly --history-past-mode cached
+                                               # Extract previous seasons once per season
+  %(prog)s --schedule weekly --player-fixtures-mode team
+                                               # Store upcoming fixtures once per team
+  %(prog)s --schedule daily --archive-raw      # Keep full API responses alongside the slim artifacts
+  %(prog)s --schedule weekly --no-resume       # Rerun every step even if it already completed today
+  %(prog)s --schedule weekly --profile         # Write per-phase and per-step profiles to ./profiles
+  %(prog)s --schedule daily --profile s3://my-bucket/profiles
+  %(prog)s --schedule weekly --phase extract --shards 4 --shard-executor process
+                                               # Crawl player details in 4 worker processes
+  %(prog)s --schedule weekly --phase source --load-strategy swap
+                                               # Reload source tables without an empty window
+  %(prog)s --schedule weekly --phase extract --manager-ids 123,456
+                                               # Crawl these managers' history
+  %(prog)s --schedule weekly --phase extract --league-ids 314,2718
+                                               # Crawl these classic leagues' standings
+  %(prog)s --schedule weekly --phase extract --picks-first-gameweek 1
+                                               # Backfill tracked managers' picks for the season so far
         """
     )
     
@@ -232,7 +594,7 @@ Examples:
     
     parser.add_argument(
         "--phase",
-        choices=["extract", "source", "stage", "all"],
+        choices=["extract", "source", "stage", "serve", "export", "all"],
         default="all",
         help="Pipeline phase to run (default: all)"
     )
@@ -244,8 +606,157 @@ Examples:
         help="Logging level (default: INFO)"
     )
     
+    parser.add_argument(
+        "--backfill-start",
+        type=date.fromisoformat,
+        help="First date (YYYY-MM-DD) of existing S3 files to bulk load; requires --backfill-end"
+    )
+    
+    parser.add_argument(
+        "--backfill-end",
+        type=date.fromisoformat,
+        help="Last date (YYYY-MM-DD) of existing S3 files to bulk load; requires --backfill-start"
+    )
+    
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="With --phase all, start each stage/source load as soon as its inputs are ready"
+    )
+    
+    parser.add_argument(
+        "--no-plan",
+        dest="plan",
+        action="store_false",
+        help="Skip the gameweek-aware pre-flight planner and run every step"
+    )
+    
+    parser.add_argument(
+        "--history-source",
+        choices=["element-summary", "event-live"],
+        default="element-summary",
+        help="Source of per-gameweek player history (default: element-summary)"
+    )
+    
+    parser.add_argument(
+        "--history-past-mode",
+        choices=["inline", "cached"],
+        default="inline",
+        help="Reload previous seasons' history every week (inline) or once per season and for new players (cached)"
+    )
+    
+    parser.add_argument(
+        "--player-fixtures-mode",
+        choices=["player", "team"],
+        default="player",
+        help="Store upcoming fixtures per player (player) or once per team behind VIEW_PLAYER_FIXTURES (team)"
+    )
+    
+    parser.add_argument(
+        "--no-projection",
+        dest="projection",
+        action="store_false",
+        help="Write full API responses instead of only the fields the source loaders read"
+    )
+    
+    parser.add_argument(
+        "--archive-raw",
+        action="store_true",
+        help="Also save full API responses under fpl-data/raw/"
+    )
+    
+    parser.add_argument(
+        "--no-resume",
+        dest="resume",
+        action="store_false",
+        help="Ignore today's run manifest and rerun steps that already completed"
+    )
+    
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="profiles",
+        metavar="DEST",
+        help="Profile each phase and step (cProfile, tracemalloc, stack samples) into a local directory "
+             "(default: profiles), an s3://bucket/prefix, or 's3' for the data lake bucket"
+    )
+    
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Split the weekly player details crawl into this many shards (default: 1, unsharded)"
+    )
+    
+    parser.add_argument(
+        "--shard-executor",
+        choices=["local", "process", "lambda"],
+        default="local",
+        help="Run shards on threads (local), worker processes (process) or Lambda invocations (lambda)"
+    )
+    
+    parser.add_argument(
+        "--load-strategy",
+        choices=["truncate", "swap"],
+        default="truncate",
+        help="Reload source tables in place (truncate) or build them in a shadow table and swap it in (swap)"
+    )
+    
+    parser.add_argument(
+        "--keep-shadow",
+        action="store_true",
+        help="With --load-strategy swap, keep the previous rows in {TABLE}_SHADOW instead of dropping it"
+    )
+    
+    parser.add_argument(
+        "--manager-ids",
+        type=parse_manager_ids,
+        default=[],
+        metavar="ID,ID,...",
+        help="Crawl these managers' history instead of the backend's registered users (USERS_DATABASE_URL)"
+    )
+    
+    parser.add_argument(
+        "--league-ids",
+        type=parse_league_ids,
+        default=[],
+        metavar="ID,ID,...",
+        help="Crawl these classic leagues' standings instead of the tracked managers' private leagues"
+    )
+    
+    parser.add_argument(
+        "--picks-first-gameweek",
+        type=int,
+        metavar="GW",
+        help="Queue tracked managers' picks for every finished gameweek from GW, not just the latest"
+    )
+    
     args = parser.parse_args()
     
+    try:
+        options = RunOptions(
+            backfill_start=args.backfill_start,
+            backfill_end=args.backfill_end,
+            streaming=args.streaming,
+            plan=args.plan,
+            history_source=args.history_source,
+            history_past_mode=args.history_past_mode,
+            player_fixtures_mode=args.player_fixtures_mode,
+            projection=args.projection,
+            archive_raw=args.archive_raw,
+            resume=args.resume,
+            profile=args.profile,
+            shards=args.shards,
+            shard_executor=args.shard_executor,
+            load_strategy=args.load_strategy,
+            keep_shadow=args.keep_shadow,
+            manager_ids=args.manager_ids,
+            league_ids=args.league_ids,
+            picks_first_event=args.picks_first_gameweek
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    
     # Setup logging
     setup_logging(args.log_level)
     
@@ -253,7 +764,7 @@ Examples:
     logger.info(f"[PIPELINE_START] FPL ETL - Schedule: {args.schedule.upper()}, Phase: {args.phase.upper()}")
     
     try:
-        exit_code = run_pipeline(args.schedule, args.phase)
+        exit_code = run_pipeline(args.schedule, args.phase, options)
         if exit_code == 0:
             logger.info(f"[PIPELINE_COMPLETE] FPL ETL - Completed successfully")
         else:
@@ -0,0 +1 @@
+# Orchestration package
\ No newline at end of file
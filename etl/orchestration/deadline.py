@@ -0,0 +1,189 @@
+import sys
+import os
+import json
+import time
+import uuid
+import logging
+import argparse
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger(__name__)
+
+# Stop starting new work this long before the Lambda timeout, leaving time to save progress
+DEFAULT_MARGIN_SECONDS = 60
+
+# Continuations allowed for one run before it is treated as failed
+MAX_CONTINUATIONS = 10
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a run stops at a step, before or part way through it, because the invocation is about to time out"""
+
+    def __init__(self, step: str, progress: str = ""):
+        self.step = step
+        self.progress = progress
+        message = f"Deadline reached at {step}"
+        super().__init__(f"{message} ({progress})" if progress else message)
+
+
+class Deadline:
+    """Time left in the current invocation, with a safety margin kept back for saving progress"""
+
+    def __init__(self, remaining_ms: Callable[[], int], margin_seconds: float = DEFAULT_MARGIN_SECONDS):
+        self._remaining_ms = remaining_ms
+        self.margin_seconds = margin_seconds
+
+    @classmethod
+    def from_context(cls, context: Any, margin_seconds: float = DEFAULT_MARGIN_SECONDS) -> Optional["Deadline"]:
+        """Deadline of a Lambda context, or None when there is no context to read it from"""
+        if context is None or not hasattr(context, "get_remaining_time_in_millis"):
+            return None
+        return cls(context.get_remaining_time_in_millis, margin_seconds)
+
+    def remaining_seconds(self) -> float:
+        return self._remaining_ms() / 1000
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining_seconds() <= self.margin_seconds
+
+    def check(self, step: str) -> None:
+        """Raise DeadlineExceeded instead of starting step if too little time is left"""
+        if self.expired:
+            logger.warning(f"[DEADLINE] {self.remaining_seconds():.0f}s left, stopping before {step}")
+            raise DeadlineExceeded(step)
+
+
+def check_deadline(deadline: Optional[Deadline], step: str) -> None:
+    """Deadline.check that is a no-op when the run has no deadline"""
+    if deadline is not None:
+        deadline.check(step)
+
+
+class RunProgress:
+    """
+    Steps completed across every invocation of one run.
+
+    Passed wherever a run manifest records artifacts and steps, forwarding to the manifest
+    if there is one, so a stopped run can say in its continuation what is already done.
+    """
+
+    def __init__(self, completed_steps: Iterable[str] = (), manifest=None):
+        self.completed_steps: Set[str] = set(completed_steps)
+        self.manifest = manifest
+        self._lock = threading.Lock()
+
+    def record_artifact(self, dataset: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self.completed_steps.add(f"extract:{dataset}")
+        if self.manifest:
+            self.manifest.record_artifact(dataset, result)
+
+    def record_step(self, step: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self.completed_steps.add(step)
+        if self.manifest:
+            self.manifest.record_step(step, result)
+
+
+class RunSuspended(Exception):
+    """
+    Raised by the Lambda handler for a run stopped before the timeout that it is not continuing itself,
+    so the invocation counts as failed and Lambda's async retry resumes the run from its manifest
+    """
+
+    def __init__(self, message: str, continuation: Dict[str, Any]):
+        super().__init__(message)
+        self.continuation = continuation
+
+
+def continuation_event(event: Dict[str, Any], completed_steps: Iterable[str], attempt: int) -> Dict[str, Any]:
+    """The event that resumes a stopped run: the original event plus the steps already completed"""
+    detail = dict(event.get("detail", {}))
+    detail["continuation"] = {
+        "attempt": attempt,
+        "completed_steps": sorted(completed_steps),
+    }
+    return {**event, "detail": detail}
+
+
+def invoke_continuation(event: Dict[str, Any], function_name: str) -> None:
+    """Start the next invocation asynchronously so the run carries on without a scheduler"""
+    import boto3
+
+    boto3.client("lambda").invoke(
+        FunctionName=function_name,
+        InvocationType="Event",
+        Payload=json.dumps(event).encode("utf-8")
+    )
+    logger.info(f"[DEADLINE] Invoked {function_name} to continue the run")
+
+
+class SimulatedLambdaContext:
+    """Stand-in for the Lambda context with a configurable timeout, for testing deadline handling locally"""
+
+    def __init__(self, timeout_seconds: float, function_name: str = "fpl-etl-local"):
+        self.function_name = function_name
+        self.aws_request_id = str(uuid.uuid4())
+        self._deadline = time.monotonic() + timeout_seconds
+
+    def get_remaining_time_in_millis(self) -> int:
+        return max(0, int((self._deadline - time.monotonic()) * 1000))
+
+
+def run_with_simulated_deadline(
+    event: Dict[str, Any],
+    timeout_seconds: float,
+    handler: Optional[Callable[[Dict[str, Any], Any], Dict[str, Any]]] = None,
+    max_invocations: int = MAX_CONTINUATIONS + 1
+) -> List[Dict[str, Any]]:
+    """
+    Invoke the handler with a simulated timeout, following continuation payloads.
+
+    Each invocation gets a fresh SimulatedLambdaContext, as a new Lambda invocation would.
+    Returns every response, the last being the one that finished (or gave up) the run.
+    """
+    if handler is None:
+        from main import lambda_handler as handler
+
+    responses = []
+    while len(responses) < max_invocations:
+        try:
+            response = handler(event, SimulatedLambdaContext(timeout_seconds))
+        except RunSuspended as e:
+            # Follow the continuation a scheduled retry would otherwise resume from the run manifest
+            response = {"statusCode": 202, "success": False, "error": str(e), "continuation": e.continuation}
+        responses.append(response)
+        logger.info(f"[DEADLINE] Invocation {len(responses)} returned status {response.get('statusCode')}")
+        if "continuation" not in response:
+            break
+        event = response["continuation"]
+    return responses
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Run the Lambda handler locally with a simulated timeout, following continuations"
+    )
+    parser.add_argument("event", help="Event JSON file, e.g. lambda-event-weekly.json")
+    parser.add_argument("--timeout", type=float, required=True, help="Simulated Lambda timeout in seconds")
+    parser.add_argument("--margin", type=float, help="Override the event's deadline_margin_seconds")
+    parser.add_argument("--max-invocations", type=int, default=MAX_CONTINUATIONS + 1)
+    args = parser.parse_args()
+
+    with open(args.event, "r") as f:
+        event = json.load(f)
+    if args.margin is not None:
+        event.setdefault("detail", {})["deadline_margin_seconds"] = args.margin
+
+    responses = run_with_simulated_deadline(event, args.timeout, max_invocations=args.max_invocations)
+    print(json.dumps({"invocations": len(responses), "final": responses[-1]}, indent=2))
+    return 0 if responses[-1].get("success") and "continuation" not in responses[-1] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
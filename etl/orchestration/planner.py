@@ -0,0 +1,147 @@
+import sys
+import os
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger(__name__)
+
+RUN_STATE_DATA_TYPE = "run_state"
+
+# Steps that only change when matches have been played
+MATCH_DEPENDENT_STEPS = [
+    "extract:player_details",
+    "stage:player_details",
+    "source:player_fixtures",
+    "extract:team_fixtures",
+    "stage:team_fixtures",
+    "source:team_fixtures",
+    "source:player_history",
+    "source:player_history_past",
+    "extract:player_history_past",
+    "stage:player_history_past",
+    "source:player_history_past_cached",
+    "extract:event_live",
+    "stage:event_live",
+    "source:player_history_live",
+    "extract:manager_history",
+    "stage:manager_history",
+    "source:manager_history",
+    "extract:league_standings",
+    "stage:league_standings",
+    "source:league_standings",
+    "extract:manager_picks",
+    "stage:manager_picks",
+    "source:manager_picks",
+]
+
+
+@dataclass
+class EventState:
+    """Snapshot of gameweek and fixture progress used to decide whether a run would produce new data"""
+    last_checked_event: Optional[int]
+    current_event: Optional[int]
+    current_event_finished: bool
+    finished_fixture_ids: List[int] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, bootstrap_data: Dict[str, Any], fixtures_data: Optional[List[Dict[str, Any]]]) -> "EventState":
+        events = bootstrap_data.get("events", [])
+        checked = [event["id"] for event in events if event.get("finished") and event.get("data_checked")]
+        current = next((event for event in events if event.get("is_current")), None)
+        finished_fixtures = sorted(
+            fixture["id"] for fixture in (fixtures_data or []) if fixture.get("finished")
+        )
+        return cls(
+            last_checked_event=max(checked) if checked else None,
+            current_event=current["id"] if current else None,
+            current_event_finished=bool(current and current.get("finished") and current.get("data_checked")),
+            finished_fixture_ids=finished_fixtures,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EventState":
+        return cls(
+            last_checked_event=data.get("last_checked_event"),
+            current_event=data.get("current_event"),
+            current_event_finished=bool(data.get("current_event_finished")),
+            finished_fixture_ids=list(data.get("finished_fixture_ids", [])),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "last_checked_event": self.last_checked_event,
+            "current_event": self.current_event,
+            "current_event_finished": self.current_event_finished,
+            "finished_fixture_ids": self.finished_fixture_ids,
+        }
+
+
+@dataclass
+class RunPlan:
+    """Steps to skip for this run, each with the reason it was skipped"""
+    schedule: str
+    state: Optional[EventState] = None
+    skipped: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def skip_steps(self) -> Set[str]:
+        return set(self.skipped)
+
+    def report(self) -> None:
+        if not self.skipped:
+            logger.info(f"[PLAN] {self.schedule.upper()} - Running all steps")
+            return
+        for step, reason in self.skipped.items():
+            logger.info(f"[PLAN] {self.schedule.upper()} - Skipping {step}: {reason}")
+
+
+def plan_run(schedule: str, api_client, s3_client) -> RunPlan:
+    """
+    Cheap pre-flight check comparing gameweek and fixture state with the last successful run.
+
+    Daily runs always go ahead because prices and transfers change every day. Weekly runs skip
+    the element-summary fan-out and its loads when no gameweek has been checked and no fixture
+    has finished since the last run (e.g. international breaks), since they would reproduce
+    identical data.
+    """
+    bootstrap_data = api_client.get_bootstrap_data()
+    if bootstrap_data is None:
+        logger.warning("[PLAN] Could not fetch bootstrap data, running all steps")
+        return RunPlan(schedule)
+
+    state = EventState.from_api(bootstrap_data, api_client.get_fixtures())
+    plan = RunPlan(schedule, state=state)
+
+    if schedule != "weekly":
+        return plan
+
+    previous = s3_client.load_json(RUN_STATE_DATA_TYPE, f"{schedule}_last_run.json")
+    if previous is None:
+        logger.info("[PLAN] No previous run state recorded, running all steps")
+        return plan
+
+    previous_state = EventState.from_dict(previous)
+    if (
+        state.last_checked_event == previous_state.last_checked_event
+        and state.finished_fixture_ids == previous_state.finished_fixture_ids
+    ):
+        reason = (
+            f"no gameweek checked and no fixture finished since last run "
+            f"(last checked gameweek: {state.last_checked_event})"
+        )
+        for step in MATCH_DEPENDENT_STEPS:
+            plan.skipped[step] = reason
+
+    return plan
+
+
+def record_run_state(plan: RunPlan, s3_client) -> None:
+    """Persist the event state of a successful run for the next run's plan"""
+    if plan.state is None:
+        return
+    s3_client.save_json(plan.state.to_dict(), RUN_STATE_DATA_TYPE, f"{plan.schedule}_last_run.json")
+    logger.info(f"[PLAN] {plan.schedule.upper()} - Recorded run state: last checked gameweek {plan.state.last_checked_event}")
@@ -0,0 +1,274 @@
+import sys
+import os
+import io
+import time
+import pstats
+import cProfile
+import logging
+import tempfile
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import Iterator, List, Optional
+from zoneinfo import ZoneInfo
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger(__name__)
+
+# Destination meaning the data lake bucket under fpl-data/profiles/
+DATALAKE_DESTINATION = "s3"
+
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+
+
+class StackSampler:
+    """
+    Samples the stack of every thread at a fixed interval.
+
+    cProfile only sees the thread that enabled it, so the API fan-out and streaming loads
+    running on worker threads are covered by these samples instead. Stacks are prefixed
+    with the thread name and counted in flame-graph collapsed format, into one Counter per
+    section being profiled, so nested and concurrent sections share a single sampling thread.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self._counters: List[Counter] = []
+        self._lock = threading.Lock()
+        self._stop = None
+        self._thread = None
+
+    def subscribe(self) -> Counter:
+        """A Counter that receives every sample until it is unsubscribed"""
+        counter = Counter()
+        with self._lock:
+            self._counters.append(counter)
+            if self._thread is None:
+                self._stop = threading.Event()
+                self._thread = threading.Thread(target=self._run, args=(self._stop,), name="profile-sampler", daemon=True)
+                self._thread.start()
+        return counter
+
+    def unsubscribe(self, counter: Counter) -> None:
+        thread = None
+        with self._lock:
+            # By identity: Counters with the same samples compare equal
+            self._counters = [subscribed for subscribed in self._counters if subscribed is not counter]
+            if not self._counters:
+                self._stop.set()
+                thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    def _run(self, stop: threading.Event) -> None:
+        own_ident = threading.get_ident()
+        while not stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            stacks = []
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                stacks.append(";".join(reversed(stack)))
+            with self._lock:
+                for counter in self._counters:
+                    counter.update(stacks)
+
+
+def collapsed(samples: Counter) -> str:
+    return "".join(f"{stack} {count}\n" for stack, count in samples.most_common())
+
+
+class _Section:
+    """One profiled phase or step: its cProfile, stack samples and memory peak"""
+
+    def __init__(self, name: str, profile: Optional[cProfile.Profile], samples: Counter):
+        self.name = name
+        self.profile = profile
+        self.samples = samples
+        self.peak = 0
+        # Stats of the steps profiled inside this section on the same thread, merged into its pstats
+        self.children: List[pstats.Stats] = []
+
+
+class RunProfiler:
+    """
+    Profiles each phase of a run, and each step or pipeline within it, with cProfile,
+    tracemalloc and a stack sampler.
+
+    For every phase and step it writes {name}.pstats (load with pstats or snakeviz),
+    {name}.collapsed (feed to flamegraph.pl or speedscope) and {name}.txt with wall time,
+    peak traced memory, the top functions by cumulative time and the top allocation sites.
+    Output goes to a local directory, an s3://bucket/prefix, or "s3" for fpl-data/profiles/
+    in the data lake bucket, under a folder per run.
+
+    Sections nest: a step's cProfile takes over from its phase's on the same thread, and the
+    phase's pstats include its steps'. Steps running concurrently on other threads (streaming
+    loads) get their own cProfile where the interpreter allows one per thread; on Python 3.12+
+    only one cProfile can be active at a time, so a step started while another is being
+    profiled only gets stack samples and memory figures. Stack samples cover every thread.
+    """
+
+    def __init__(self, destination: str, run_name: str, sample_interval: float = 0.005):
+        self.destination = destination
+        self.sample_interval = sample_interval
+        now = datetime.now(ZoneInfo("Australia/Sydney"))
+        self.run_folder = f"{run_name}_{now.strftime('%Y%m%dT%H%M%S')}"
+        self._s3 = None
+        self._sampler = StackSampler(sample_interval)
+        self._lock = threading.Lock()
+        self._sections: List[_Section] = []
+        self._thread_sections = threading.local()
+        self._started_tracing = False
+
+    def _reset_peak(self) -> None:
+        """Fold the traced memory peak into every open section, then start a new one"""
+        peak = tracemalloc.get_traced_memory()[1]
+        for section in self._sections:
+            section.peak = max(section.peak, peak)
+        tracemalloc.reset_peak()
+
+    def _start_cprofile(self, outer: Optional[_Section]) -> Optional[cProfile.Profile]:
+        if outer is not None and outer.profile is not None:
+            outer.profile.disable()
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12+ allows one active cProfile, which another thread's section holds
+            return None
+        return profile
+
+    def _resume_cprofile(self, section: _Section) -> None:
+        try:
+            section.profile.enable()
+        except ValueError:
+            # Another thread's section took the only cProfile while this one was suspended
+            logger.warning(f"[PROFILE] cProfile for {section.name} could not resume; its pstats stop here")
+
+    @contextmanager
+    def phase(self, name: str, cprofile: bool = True) -> Iterator[None]:
+        """
+        Profile a phase or step. With cprofile=False only stack samples and memory are
+        recorded, for sections whose work runs on worker threads profiled as steps.
+        """
+        stack = getattr(self._thread_sections, "stack", None)
+        if stack is None:
+            stack = self._thread_sections.stack = []
+        outer = stack[-1] if stack else None
+
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                # One frame per allocation is enough for allocation sites and keeps tracing overhead down
+                tracemalloc.start(1)
+                self._started_tracing = True
+            before = tracemalloc.take_snapshot()
+            self._reset_peak()
+            section = _Section(name, None, self._sampler.subscribe())
+            self._sections.append(section)
+        stack.append(section)
+
+        logger.info(f"[PROFILE] Profiling {name}")
+        start = time.perf_counter()
+        if cprofile:
+            section.profile = self._start_cprofile(outer)
+        try:
+            yield
+        finally:
+            stats = None
+            if section.profile is not None:
+                section.profile.disable()
+                stats = pstats.Stats(section.profile, *section.children, stream=io.StringIO())
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            self._sampler.unsubscribe(section.samples)
+            with self._lock:
+                after = tracemalloc.take_snapshot()
+                peak = max(section.peak, tracemalloc.get_traced_memory()[1])
+                self._sections.remove(section)
+                if not self._sections and self._started_tracing:
+                    tracemalloc.stop()
+                    self._started_tracing = False
+            try:
+                self._write_phase(section, stats, before, after, elapsed, peak)
+            except Exception as e:
+                # Profiling must never fail the run it is observing
+                logger.warning(f"[PROFILE] Failed to write profile for {name}: {e}")
+            # Resumed only now: collecting a cProfile's stats disables profiling on the thread
+            if outer is not None and outer.profile is not None:
+                if stats is not None:
+                    outer.children.append(stats)
+                self._resume_cprofile(outer)
+
+    def _write_phase(self, section: _Section, stats: Optional[pstats.Stats], before, after, elapsed, peak) -> None:
+        name = section.name
+        # Step names such as "stage:bootstrap" become stage_bootstrap.*
+        filename = name.replace(":", "_")
+        if stats is not None:
+            with tempfile.NamedTemporaryFile(suffix=".pstats") as stats_file:
+                stats.dump_stats(stats_file.name)
+                with open(stats_file.name, "rb") as f:
+                    self._write(f"{filename}.pstats", f.read())
+
+        summary = io.StringIO()
+        summary.write(f"phase: {name}\n")
+        summary.write(f"wall time: {elapsed:.3f}s\n")
+        summary.write(f"peak traced memory: {peak / (1024 * 1024):.1f} MiB\n")
+        summary.write(f"stack samples: {sum(section.samples.values())} every {self.sample_interval * 1000:.0f}ms\n\n")
+        if stats is not None:
+            summary.write(f"Top {TOP_FUNCTIONS} functions by cumulative time (profiled thread only)\n")
+            stats.stream = summary
+            stats.sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+        else:
+            summary.write("No cProfile for this section; see the collapsed stacks\n")
+        summary.write(f"\nTop {TOP_ALLOCATIONS} allocation sites still held at the end of the phase\n")
+        for stat in after.compare_to(before, "lineno")[:TOP_ALLOCATIONS]:
+            summary.write(f"{stat}\n")
+        self._write(f"{filename}.txt", summary.getvalue().encode("utf-8"))
+
+        self._write(f"{filename}.collapsed", collapsed(section.samples).encode("utf-8"))
+        logger.info(f"[PROFILE] {name} - {elapsed:.1f}s, peak traced memory {peak / (1024 * 1024):.1f} MiB")
+
+    def _write(self, filename: str, body: bytes) -> None:
+        if self.destination == DATALAKE_DESTINATION or self.destination.startswith("s3://"):
+            bucket, key = self._s3_location(filename)
+            self._s3_client().put_object(Bucket=bucket, Key=key, Body=body)
+            logger.info(f"[PROFILE] Wrote s3://{bucket}/{key}")
+            return
+        folder = os.path.join(self.destination, self.run_folder)
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, filename)
+        with open(path, "wb") as f:
+            f.write(body)
+        logger.info(f"[PROFILE] Wrote {path}")
+
+    def _s3_client(self):
+        if self._s3 is None:
+            from s3.s3_datalake import S3DataLake
+            self._s3 = S3DataLake()
+        return self._s3.s3_client
+
+    def _s3_location(self, filename: str):
+        if self.destination == DATALAKE_DESTINATION:
+            self._s3_client()
+            config = self._s3.config
+            return config.bucket_name, f"{config.prefix}/profiles/{self.run_folder}/{filename}"
+        bucket, _, prefix = self.destination[len("s3://"):].partition("/")
+        prefix = prefix.strip("/")
+        key = f"{prefix}/{self.run_folder}/{filename}" if prefix else f"{self.run_folder}/{filename}"
+        return bucket, key
+
+
+def profile_phase(profiler: Optional[RunProfiler], name: str, cprofile: bool = True):
+    """Context manager profiling a phase or step, or a no-op when profiling is off"""
+    return profiler.phase(name, cprofile) if profiler else nullcontext()
@@ -0,0 +1,241 @@
+import sys
+import os
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Set
+from zoneinfo import ZoneInfo
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_DATA_TYPE = "manifests"
+
+# Extract step that writes each dataset; the player details fan-out also writes the side artifacts
+DATASET_EXTRACT_STEPS = {
+    "bootstrap": "extract:bootstrap",
+    "fixtures": "extract:fixtures",
+    "player_details": "extract:player_details",
+    "player_history_past": "extract:player_details",
+    "team_fixtures": "extract:player_details",
+    "event_live": "extract:event_live",
+    "manager_history": "extract:manager_history",
+    "league_standings": "extract:league_standings",
+    "manager_picks": "extract:manager_picks",
+}
+
+# Side artifacts are only written in some modes; their own pseudo-step says whether they are enabled
+SIDE_ARTIFACTS = {
+    "player_history_past": "extract:player_history_past",
+    "team_fixtures": "extract:team_fixtures",
+}
+
+# Extract datasets each load step reads, directly or through the source tables it joins
+STEP_INPUTS = {
+    "stage:bootstrap": ["bootstrap"],
+    "stage:fixtures": ["fixtures"],
+    "stage:player_details": ["player_details"],
+    "stage:event_live": ["event_live"],
+    "stage:player_history_past": ["player_history_past"],
+    "stage:team_fixtures": ["team_fixtures"],
+    "stage:manager_history": ["manager_history"],
+    "stage:league_standings": ["league_standings"],
+    "stage:manager_picks": ["manager_picks"],
+    "source:events": ["bootstrap"],
+    "source:players": ["bootstrap"],
+    "source:teams": ["bootstrap"],
+    "source:transfer_history": ["bootstrap"],
+    "source:price_changes": ["bootstrap"],
+    "source:transfer_features": ["bootstrap"],
+    "source:fixtures": ["fixtures"],
+    "source:standings": ["bootstrap", "fixtures"],
+    "source:fixture_difficulty": ["bootstrap", "fixtures"],
+    "source:player_projections": ["bootstrap", "fixtures", "player_details", "event_live"],
+    "source:player_fixtures": ["player_details"],
+    "source:player_history": ["player_details"],
+    "source:player_history_past": ["player_details"],
+    "source:player_history_past_cached": ["player_history_past"],
+    "source:player_history_live": ["event_live", "fixtures", "bootstrap"],
+    "source:team_fixtures": ["team_fixtures", "bootstrap"],
+    "source:manager_history": ["manager_history"],
+    "source:league_standings": ["league_standings"],
+    "source:manager_picks": ["manager_picks"],
+    "serve:players": ["bootstrap"],
+    "export:teams": ["bootstrap"],
+    "export:standings": ["bootstrap", "fixtures"],
+    "export:players": ["bootstrap"],
+}
+
+
+class RunManifest:
+    """
+    Record of one schedule's run on one day, stored at fpl-data/manifests/{schedule}_{YYYYMMDD}.json.gz.
+
+    Artifacts are recorded with their S3 key, content hash and counts as they are written,
+    and every load step with the content hashes of the artifacts it read. A rerun on the
+    same day skips extracts whose artifact is still in S3 unchanged, and load steps whose
+    input hashes match and whose output is present. Stage output is checked in the staging
+    table; source output is trusted from the manifest record.
+    """
+
+    def __init__(self, schedule: str, s3_client, run_date: Optional[str] = None, data: Optional[Dict[str, Any]] = None):
+        self.schedule = schedule
+        self.s3_client = s3_client
+        self.run_date = run_date or datetime.now(ZoneInfo("Australia/Sydney")).strftime('%Y%m%d')
+        data = data or {}
+        self.artifacts: Dict[str, Dict[str, Any]] = data.get("artifacts", {})
+        self.steps: Dict[str, Dict[str, Any]] = data.get("steps", {})
+        self._lock = threading.Lock()
+
+    @property
+    def filename(self) -> str:
+        return f"{self.schedule}_{self.run_date}.json"
+
+    @classmethod
+    def load(cls, schedule: str, s3_client, run_date: Optional[str] = None) -> "RunManifest":
+        manifest = cls(schedule, s3_client, run_date)
+        data = s3_client.load_json(MANIFEST_DATA_TYPE, manifest.filename)
+        if data is None:
+            logger.info(f"[MANIFEST] No manifest for {schedule} run on {manifest.run_date}, running every step")
+            return manifest
+        return cls(schedule, s3_client, manifest.run_date, data)
+
+    def save(self) -> None:
+        with self._lock:
+            data = {
+                "schedule": self.schedule,
+                "run_date": self.run_date,
+                "artifacts": dict(self.artifacts),
+                "steps": dict(self.steps),
+            }
+        self.s3_client.save_json(data, MANIFEST_DATA_TYPE, self.filename)
+
+    def _artifact_filename(self, dataset: str) -> str:
+        return f"{dataset}_{self.run_date}.json"
+
+    def record_artifact(self, dataset: str, result: Dict[str, Any]) -> None:
+        """Record an extract artifact with its content hash; datasets with nothing new are recorded without one"""
+        try:
+            entry: Dict[str, Any] = {"s3_key": None, "sha256": None}
+            if result.get("s3_path"):
+                head = self._head(dataset)
+                if head:
+                    entry.update(head)
+            entry["counts"] = {
+                key: value for key, value in result.items()
+                if isinstance(value, int) and not isinstance(value, bool)
+            }
+            with self._lock:
+                self.artifacts[dataset] = entry
+            self.save()
+        except Exception as e:
+            # The manifest only saves work on reruns, so failing to write it never fails the run
+            logger.warning(f"[MANIFEST] Failed to record artifact {dataset}: {e}")
+
+    def record_step(self, step: str, result: Dict[str, Any]) -> None:
+        """Record a completed load step with the hashes of the artifacts it read"""
+        try:
+            entry = {
+                "input_hashes": {dataset: self.current_hash(dataset) for dataset in STEP_INPUTS.get(step, [])},
+                "rows_loaded": result.get("rows_loaded", 0),
+                "completed_at": datetime.now(ZoneInfo("Australia/Sydney")).strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            with self._lock:
+                self.steps[step] = entry
+            self.save()
+        except Exception as e:
+            logger.warning(f"[MANIFEST] Failed to record step {step}: {e}")
+
+    def _head(self, dataset: str) -> Optional[Dict[str, Any]]:
+        if dataset == "player_details":
+            # A sharded extract is represented by its shard manifest, which lists each shard's hash
+            from extract.player_details.sharding import player_details_head
+            return player_details_head(self.s3_client, self.run_date)
+        return self.s3_client.head_json(dataset, self._artifact_filename(dataset))
+
+    def current_hash(self, dataset: str) -> Optional[str]:
+        """Content hash of today's artifact for a dataset as it is in S3 now, or None if there is none"""
+        head = self._head(dataset)
+        return head["sha256"] if head else None
+
+    def _artifact_present(self, dataset: str) -> bool:
+        entry = self.artifacts.get(dataset)
+        if entry is None:
+            return False
+        if entry.get("sha256") is None:
+            return True
+        head = self._head(dataset)
+        return head is not None and head["sha256"] == entry["sha256"]
+
+    def completed_extracts(self, skip_steps: Set[str]) -> Set[str]:
+        """Extract steps whose artifacts were recorded today and are still in S3 unchanged"""
+        completed = set()
+        for step in sorted(set(DATASET_EXTRACT_STEPS.values())):
+            datasets = [
+                dataset for dataset, extract_step in DATASET_EXTRACT_STEPS.items()
+                if extract_step == step and SIDE_ARTIFACTS.get(dataset) not in skip_steps
+            ]
+            if all(self._artifact_present(dataset) for dataset in datasets):
+                completed.add(step)
+                completed |= {SIDE_ARTIFACTS[dataset] for dataset in datasets if dataset in SIDE_ARTIFACTS}
+        return completed
+
+    def completed_loads(self, steps: Iterable[str], extracts_done: Set[str]) -> Set[str]:
+        """
+        Load steps that can be skipped: every input comes from an extract that is not rerun,
+        the input hashes match those recorded, and the step's output is present.
+        """
+        candidates = {}
+        for step in steps:
+            record = self.steps.get(step)
+            inputs = STEP_INPUTS.get(step)
+            if record is None or inputs is None:
+                continue
+            if any(DATASET_EXTRACT_STEPS[dataset] not in extracts_done for dataset in inputs):
+                continue
+            if record["input_hashes"] != {dataset: self.current_hash(dataset) for dataset in inputs}:
+                continue
+            candidates[step] = inputs
+
+        staged = {
+            step: inputs[0] for step, inputs in candidates.items()
+            if step.startswith("stage:") and self.artifacts.get(inputs[0], {}).get("s3_key")
+        }
+        missing = _missing_staged_output({
+            step: (f"STAGING_{dataset.upper()}", self.artifacts[dataset]["s3_key"])
+            for step, dataset in staged.items()
+        })
+        return set(candidates) - missing
+
+    def completed_steps(self, skip_steps: Set[str], run_extract: bool = True) -> Set[str]:
+        """
+        Every extract and load step a rerun can skip.
+
+        When the extract phase is not part of this run its artifacts cannot change, so
+        load steps are compared against whatever is in S3 now.
+        """
+        if run_extract:
+            extracts_done = self.completed_extracts(skip_steps)
+        else:
+            extracts_done = set(DATASET_EXTRACT_STEPS.values())
+        loads_done = self.completed_loads(STEP_INPUTS, extracts_done)
+        return (extracts_done if run_extract else set()) | loads_done
+
+
+def _missing_staged_output(checks: Dict[str, Any]) -> Set[str]:
+    """Stage steps whose artifact no longer has rows in its staging table"""
+    if not checks:
+        return set()
+    from snowflake_client.snowflake_client import SnowflakeClient
+
+    missing = set()
+    snowflake_client = SnowflakeClient()
+    try:
+        for step, (table, s3_key) in checks.items():
+            if snowflake_client.get_row_count(table, f"s3_file_path = '{s3_key}'") == 0:
+                missing.add(step)
+    finally:
+        snowflake_client.close()
+    return missing
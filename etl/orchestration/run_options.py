@@ -0,0 +1,185 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Any, List, Optional, Set
+
+from load.source.table_swap import LOAD_STRATEGIES
+
+# Where per-gameweek player stats in SOURCE_PLAYER_HISTORY come from
+HISTORY_SOURCES = ("element-summary", "event-live")
+
+# Steps that only run for one history source
+HISTORY_SOURCE_STEPS = {
+    "element-summary": {"source:player_history"},
+    "event-live": {"extract:event_live", "stage:event_live", "source:player_history_live"},
+}
+
+# How SOURCE_PLAYER_HISTORY_PAST is maintained
+HISTORY_PAST_MODES = ("inline", "cached")
+
+# Steps that only run for one history_past mode
+HISTORY_PAST_MODE_STEPS = {
+    "inline": {"source:player_history_past"},
+    "cached": {"extract:player_history_past", "stage:player_history_past", "source:player_history_past_cached"},
+}
+
+# Whether upcoming fixtures are stored per player or once per team
+PLAYER_FIXTURES_MODES = ("player", "team")
+
+# Steps that only run for one player fixtures mode
+PLAYER_FIXTURES_MODE_STEPS = {
+    "player": {"source:player_fixtures"},
+    "team": {"extract:team_fixtures", "stage:team_fixtures", "source:team_fixtures"},
+}
+
+# Where player details shards run: threads or processes here, or separate Lambda invocations
+SHARD_EXECUTORS = ("local", "process", "lambda")
+
+
+@dataclass
+class RunOptions:
+    """Optional switches that change how a pipeline run behaves"""
+    backfill_start: Optional[date] = None
+    backfill_end: Optional[date] = None
+    # Overlap extract, stage and source loads instead of running them as strict phases
+    streaming: bool = False
+    # Run the gameweek-aware pre-flight planner before a full run
+    plan: bool = True
+    # "event-live" builds player history from one event/{gw}/live/ call per finished gameweek
+    history_source: str = "element-summary"
+    # "cached" extracts history_past once per season and for new players instead of every week
+    history_past_mode: str = "inline"
+    # "team" stores one upcoming fixture list per team and serves player fixtures through a view
+    player_fixtures_mode: str = "player"
+    # Write only the keys and fields the source loaders read to the bootstrap and fixtures artifacts
+    projection: bool = True
+    # Also keep the full API responses under fpl-data/raw/
+    archive_raw: bool = False
+    # Skip steps already completed today with unchanged inputs, according to the run manifest
+    resume: bool = True
+    # Where to write per-phase and per-step profiles: a local directory, s3://bucket/prefix, or "s3" for the data lake
+    profile: Optional[str] = None
+    # Split the player details crawl into this many shards, each fetched and written by its own worker
+    shards: int = 1
+    shard_executor: str = "local"
+    # "swap" builds each reloaded source table in a shadow table and swaps it in, so readers never see it empty
+    load_strategy: str = "truncate"
+    # With "swap", keep the previous rows in the shadow table instead of dropping it
+    keep_shadow: bool = False
+    # Managers whose history is crawled; empty for the backend's registered users (USERS_DATABASE_URL)
+    manager_ids: List[int] = field(default_factory=list)
+    # Classic leagues whose standings are crawled; empty for the tracked managers' private leagues
+    league_ids: List[int] = field(default_factory=list)
+    # Also queue tracked managers' picks for every finished gameweek from this one, not just the latest
+    picks_first_event: Optional[int] = None
+
+    def __post_init__(self):
+        if self.history_source not in HISTORY_SOURCES:
+            raise ValueError(f"Invalid history source '{self.history_source}'. Must be one of: {', '.join(HISTORY_SOURCES)}")
+        if self.history_past_mode not in HISTORY_PAST_MODES:
+            raise ValueError(f"Invalid history_past mode '{self.history_past_mode}'. Must be one of: {', '.join(HISTORY_PAST_MODES)}")
+        if self.player_fixtures_mode not in PLAYER_FIXTURES_MODES:
+            raise ValueError(f"Invalid player fixtures mode '{self.player_fixtures_mode}'. Must be one of: {', '.join(PLAYER_FIXTURES_MODES)}")
+        if self.shards < 1:
+            raise ValueError(f"Invalid shard count {self.shards}. Must be at least 1")
+        if self.shard_executor not in SHARD_EXECUTORS:
+            raise ValueError(f"Invalid shard executor '{self.shard_executor}'. Must be one of: {', '.join(SHARD_EXECUTORS)}")
+        if self.load_strategy not in LOAD_STRATEGIES:
+            raise ValueError(f"Invalid load strategy '{self.load_strategy}'. Must be one of: {', '.join(LOAD_STRATEGIES)}")
+        if self.picks_first_event is not None and not 1 <= self.picks_first_event <= 38:
+            raise ValueError(f"Invalid picks first gameweek {self.picks_first_event}. Must be between 1 and 38")
+        if (self.backfill_start is None) != (self.backfill_end is None):
+            raise ValueError("Backfill requires both a start date and an end date")
+        if self.backfill_start and self.backfill_start > self.backfill_end:
+            raise ValueError(f"Backfill start {self.backfill_start} is after end {self.backfill_end}")
+
+    @property
+    def is_backfill(self) -> bool:
+        return self.backfill_start is not None
+
+    @property
+    def disabled_steps(self) -> Set[str]:
+        """Steps that do not apply to the selected modes"""
+        disabled = set()
+        for source, steps in HISTORY_SOURCE_STEPS.items():
+            if source != self.history_source:
+                disabled |= steps
+        for mode, steps in HISTORY_PAST_MODE_STEPS.items():
+            if mode != self.history_past_mode:
+                disabled |= steps
+        for mode, steps in PLAYER_FIXTURES_MODE_STEPS.items():
+            if mode != self.player_fixtures_mode:
+                disabled |= steps
+        return disabled
+
+    @property
+    def cache_history_past(self) -> bool:
+        return self.history_past_mode == "cached"
+
+    @property
+    def team_fixtures(self) -> bool:
+        return self.player_fixtures_mode == "team"
+
+    @property
+    def player_detail_sections(self) -> tuple:
+        """element-summary sections to keep in the player details artifact"""
+        sections = ["fixtures", "history", "history_past"]
+        if self.history_source == "event-live":
+            sections.remove("history")
+        if self.cache_history_past:
+            sections.remove("history_past")
+        if self.team_fixtures:
+            sections.remove("fixtures")
+        return tuple(sections)
+
+    def projection_for(self, dataset: str) -> Optional[Dict[str, Any]]:
+        """Field manifest to project a dataset's extract artifact with, or None to write it in full"""
+        if not self.projection:
+            return None
+        from extract.projection import load_manifest
+        return load_manifest().get(dataset)
+
+    @classmethod
+    def from_event_detail(cls, detail: Dict[str, Any]) -> "RunOptions":
+        """
+        Build options from a Lambda event detail, e.g.
+
+        {"backfill": {"start_date": "2025-08-01", "end_date": "2025-08-31"}, "streaming": true, "plan": false,
+         "history_source": "event-live", "history_past_mode": "cached", "player_fixtures_mode": "team",
+         "projection": true, "archive_raw": false, "resume": true, "profile": true, "shards": 4,
+         "shard_executor": "lambda", "load_strategy": "swap", "keep_shadow": false, "manager_ids": [123, 456],
+         "league_ids": [314, 2718], "picks_first_event": 1}
+
+        "profile" is true for fpl-data/profiles/ in the data lake bucket, or an s3://bucket/prefix.
+        """
+        backfill = detail.get("backfill") or {}
+        return cls(
+            backfill_start=_parse_date(backfill.get("start_date")),
+            backfill_end=_parse_date(backfill.get("end_date")),
+            streaming=bool(detail.get("streaming", False)),
+            plan=bool(detail.get("plan", True)),
+            history_source=detail.get("history_source", "element-summary"),
+            history_past_mode=detail.get("history_past_mode", "inline"),
+            player_fixtures_mode=detail.get("player_fixtures_mode", "player"),
+            projection=bool(detail.get("projection", True)),
+            archive_raw=bool(detail.get("archive_raw", False)),
+            resume=bool(detail.get("resume", True)),
+            profile=_parse_profile(detail.get("profile")),
+            shards=int(detail.get("shards", 1)),
+            shard_executor=detail.get("shard_executor", "local"),
+            load_strategy=detail.get("load_strategy", "truncate"),
+            keep_shadow=bool(detail.get("keep_shadow", False)),
+            manager_ids=[int(manager_id) for manager_id in detail.get("manager_ids") or []],
+            league_ids=[int(league_id) for league_id in detail.get("league_ids") or []],
+            picks_first_event=int(detail["picks_first_event"]) if detail.get("picks_first_event") else None,
+        )
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    return date.fromisoformat(value) if value else None
+
+
+def _parse_profile(value: Any) -> Optional[str]:
+    # Lambda only has /tmp locally, so true means the data lake bucket
+    if value is True:
+        return "s3"
+    return value or None
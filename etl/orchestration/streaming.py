@@ -0,0 +1,327 @@
+import sys
+import os
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set
+
+# Add the etl directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from orchestration.deadline import Deadline, DeadlineExceeded, RunProgress
+from orchestration.profiling import RunProfiler, profile_phase
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StreamingTask:
+    """A load step that becomes runnable once all of its dependencies have completed"""
+    name: str
+    run: Callable[[], Dict[str, Any]]
+    depends_on: Set[str]
+    # Steps sharing a lock group never run concurrently
+    lock_group: str = ""
+
+
+@dataclass
+class StreamingResult:
+    completed: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    not_run: List[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return not self.failed and not self.not_run
+
+
+def build_streaming_tasks(schedule: str, skip_steps: Optional[Set[str]] = None) -> List[StreamingTask]:
+    """
+    Dependency graph of stage, source and serve loads and exports for a schedule.
+
+    Extract artifacts complete as "extract:<dataset>", stage loads as "stage:<dataset>",
+    source loads as "source:<table>", serving tables as "serve:<table>" and exports as
+    "export:<dataset>". Steps in skip_steps are left out of the graph.
+    """
+    skip_steps = skip_steps or set()
+    from load.stage.bootstrap.pipeline import run_bootstrap_staging
+    from load.stage.fixtures.pipeline import run_fixtures_staging
+    from load.stage.player_details.pipeline import run_player_details_staging
+    from load.stage.event_live.pipeline import run_event_live_staging
+    from load.stage.player_history_past.pipeline import run_player_history_past_staging
+    from load.stage.team_fixtures.pipeline import run_team_fixtures_staging
+    from load.stage.manager_history.pipeline import run_manager_history_staging
+    from load.stage.league_standings.pipeline import run_league_standings_staging
+    from load.stage.manager_picks.pipeline import run_manager_picks_staging
+    from load.source.events.pipeline import run_events_source
+    from load.source.fixtures.pipeline import run_fixtures_source
+    from load.source.player_fixtures.pipeline import run_player_fixtures_source
+    from load.source.player_history.pipeline import run_player_history_source
+    from load.source.player_history_live.pipeline import run_player_history_live_source
+    from load.source.player_history_past.pipeline import run_player_history_past_source, run_player_history_past_cached_source
+    from load.source.players.pipeline import run_players_source
+    from load.source.teams.pipeline import run_teams_source
+    from load.source.transfer_history.pipeline import run_transfer_history_source
+    from load.source.price_changes.pipeline import run_price_changes_source
+    from load.source.transfer_features.pipeline import run_transfer_features_source
+    from load.source.standings.pipeline import run_standings_source
+    from load.source.fixture_difficulty.pipeline import run_fixture_difficulty_source
+    from load.source.player_projections.pipeline import run_player_projections_source
+    from load.source.team_fixtures.pipeline import run_team_fixtures_source
+    from load.source.manager_history.pipeline import run_manager_history_source
+    from load.source.league_standings.pipeline import run_league_standings_source
+    from load.source.manager_picks.pipeline import run_manager_picks_source
+    from load.serve.players.pipeline import run_players_serve
+    from export.pipeline import run_teams_export, run_standings_export, run_players_export
+
+    # Stage loads all CREATE OR REPLACE the shared fpl_s3_stage, so they are serialised
+    if schedule == "daily":
+        tasks = [
+            StreamingTask("stage:bootstrap", run_bootstrap_staging, {"extract:bootstrap"}, "s3_stage"),
+            StreamingTask("source:transfer_history", run_transfer_history_source, {"stage:bootstrap"}),
+            StreamingTask("source:price_changes", run_price_changes_source, {"source:transfer_history"}),
+            StreamingTask("source:transfer_features", run_transfer_features_source, {"source:transfer_history"}),
+        ]
+    elif schedule == "weekly":
+        tasks = [
+            StreamingTask("stage:bootstrap", run_bootstrap_staging, {"extract:bootstrap"}, "s3_stage"),
+            StreamingTask("stage:fixtures", run_fixtures_staging, {"extract:fixtures"}, "s3_stage"),
+            StreamingTask("stage:player_details", run_player_details_staging, {"extract:player_details"}, "s3_stage"),
+            StreamingTask("source:events", run_events_source, {"stage:bootstrap"}),
+            StreamingTask("source:players", run_players_source, {"stage:bootstrap"}),
+            StreamingTask("source:teams", run_teams_source, {"stage:bootstrap"}),
+            StreamingTask("source:transfer_history", run_transfer_history_source, {"stage:bootstrap"}),
+            StreamingTask("source:fixtures", run_fixtures_source, {"stage:fixtures"}),
+            StreamingTask("source:standings", run_standings_source, {"source:fixtures", "source:teams"}),
+            StreamingTask(
+                "source:fixture_difficulty",
+                run_fixture_difficulty_source,
+                {"source:fixtures", "source:teams", "source:events"}
+            ),
+            StreamingTask("source:player_fixtures", run_player_fixtures_source, {"stage:player_details"}),
+            StreamingTask("source:player_history", run_player_history_source, {"stage:player_details"}),
+            StreamingTask("source:player_history_past", run_player_history_past_source, {"stage:player_details"}),
+            StreamingTask(
+                "stage:player_history_past",
+                run_player_history_past_staging,
+                {"extract:player_history_past"},
+                "s3_stage"
+            ),
+            StreamingTask(
+                "source:player_history_past_cached",
+                run_player_history_past_cached_source,
+                {"stage:player_history_past"}
+            ),
+            StreamingTask("stage:team_fixtures", run_team_fixtures_staging, {"extract:team_fixtures"}, "s3_stage"),
+            StreamingTask(
+                "source:team_fixtures",
+                run_team_fixtures_source,
+                {"stage:team_fixtures", "source:players"}
+            ),
+            StreamingTask("stage:event_live", run_event_live_staging, {"extract:event_live"}, "s3_stage"),
+            StreamingTask(
+                "source:player_history_live",
+                run_player_history_live_source,
+                {"stage:event_live", "source:fixtures", "source:players"}
+            ),
+            # Player history comes from whichever of its two loaders runs in this mode
+            StreamingTask(
+                "source:player_projections",
+                run_player_projections_source,
+                {"source:players", "source:teams", "source:fixtures"}
+                | ({"source:player_history", "source:player_history_live"} - skip_steps)
+            ),
+            StreamingTask(
+                "stage:manager_history",
+                run_manager_history_staging,
+                {"extract:manager_history"},
+                "s3_stage"
+            ),
+            StreamingTask("source:manager_history", run_manager_history_source, {"stage:manager_history"}),
+            StreamingTask(
+                "stage:league_standings",
+                run_league_standings_staging,
+                {"extract:league_standings"},
+                "s3_stage"
+            ),
+            StreamingTask("source:league_standings", run_league_standings_source, {"stage:league_standings"}),
+            StreamingTask("stage:manager_picks", run_manager_picks_staging, {"extract:manager_picks"}, "s3_stage"),
+            StreamingTask("source:manager_picks", run_manager_picks_source, {"stage:manager_picks"}),
+            StreamingTask("serve:players", run_players_serve, {"source:players"} - skip_steps),
+            StreamingTask("export:teams", run_teams_export, {"source:teams"} - skip_steps),
+            StreamingTask("export:standings", run_standings_export, {"source:standings"} - skip_steps),
+            StreamingTask("export:players", run_players_export, {"serve:players"} - skip_steps),
+        ]
+    else:
+        raise ValueError(f"Unknown schedule: {schedule}")
+
+    return [task for task in tasks if task.name not in skip_steps]
+
+
+class StreamingScheduler:
+    """
+    Starts each task on a worker thread as soon as its dependencies have completed.
+
+    Once the deadline is near no further tasks are started; they are reported as not run.
+    With a profiler, each task is profiled as its own section on the worker thread running it.
+    """
+
+    def __init__(
+        self,
+        tasks: List[StreamingTask],
+        max_workers: int = 4,
+        on_complete: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        deadline: Optional[Deadline] = None,
+        profiler: Optional[RunProfiler] = None
+    ):
+        self.tasks = {task.name: task for task in tasks}
+        self.on_complete = on_complete
+        self.deadline = deadline
+        self.profiler = profiler
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stream")
+        self.result = StreamingResult()
+        self._done: Set[str] = set()
+        self._started: Set[str] = set()
+        self._lock = threading.Lock()
+        self._all_settled = threading.Condition(self._lock)
+        self._group_locks: Dict[str, threading.Lock] = {}
+
+    def mark_done(self, name: str) -> None:
+        """Record a completed step and start any tasks it unblocks"""
+        with self._lock:
+            self._mark_done_locked(name)
+
+    def _mark_done_locked(self, name: str) -> None:
+        """mark_done with self._lock already held"""
+        self._done.add(name)
+        if self.deadline is not None and self.deadline.expired:
+            return
+        ready = [
+            task for task in self.tasks.values()
+            if task.name not in self._started and task.depends_on <= self._done
+        ]
+        for task in ready:
+            self._started.add(task.name)
+            logger.info(f"[STEP] STREAMING - Starting {task.name}")
+            self.executor.submit(self._run_task, task)
+
+    def _run_task(self, task: StreamingTask) -> None:
+        try:
+            if task.lock_group:
+                with self._group_lock(task.lock_group), profile_phase(self.profiler, task.name):
+                    result = task.run()
+            else:
+                with profile_phase(self.profiler, task.name):
+                    result = task.run()
+            if not result.get("success", False):
+                raise Exception(result.get("error") or "Unknown error")
+        except Exception as e:
+            logger.error(f"[STEP_FAILED] STREAMING - {task.name} - {e}")
+            with self._lock:
+                self.result.failed[task.name] = str(e)
+                self._all_settled.notify_all()
+            return
+
+        logger.info(f"[STEP_COMPLETE] STREAMING - {task.name} - Rows loaded: {result.get('rows_loaded', 0)}")
+        if self.on_complete:
+            self.on_complete(task.name, result)
+        # Completing the task and starting its dependents is one step to wait(), so it never
+        # sees every started task settled while dependents are still to be submitted
+        with self._lock:
+            self.result.completed.append(task.name)
+            self._mark_done_locked(task.name)
+            self._all_settled.notify_all()
+
+    def _group_lock(self, group: str) -> threading.Lock:
+        with self._lock:
+            return self._group_locks.setdefault(group, threading.Lock())
+
+    def wait(self) -> StreamingResult:
+        """Block until every started task has finished, then report anything left unrun"""
+        with self._lock:
+            self._all_settled.wait_for(
+                lambda: len(self.result.completed) + len(self.result.failed) == len(self._started)
+            )
+            self.result.not_run = sorted(set(self.tasks) - self._started)
+        self.executor.shutdown(wait=True)
+        return self.result
+
+
+def run_streaming_pipeline(
+    schedule: str,
+    skip_steps: Optional[Set[str]] = None,
+    options=None,
+    done_steps: Optional[Set[str]] = None,
+    recorder: Optional[RunProgress] = None,
+    deadline: Optional[Deadline] = None,
+    profiler: Optional[RunProfiler] = None
+) -> StreamingResult:
+    """
+    Run extract, stage and source with overlap instead of strict phase barriers.
+
+    Each extract artifact triggers its staging load as soon as it is written to S3, and
+    source loads start once the staging tables they read from are loaded. Steps in
+    done_steps already completed in an earlier attempt: they are not rerun but still
+    unblock the steps that depend on them. Artifacts and completed loads are recorded
+    with the recorder if one is given, which tracks them for a continuation and in the
+    run manifest.
+
+    With a deadline, no load is started once it is near, and DeadlineExceeded is raised
+    after the loads already running have finished if anything was left for later.
+    With a profiler, every extract pipeline and load is profiled as its own section.
+    """
+    skip_steps = skip_steps or set()
+    done_steps = done_steps or set()
+    from extract.run_daily_extract import run_daily_extract_pipelines
+    from extract.run_weekly_extract import run_weekly_extract_pipelines
+
+    logger.info(f"[PIPELINE_START] {schedule.upper()} STREAMING - Starting overlapped extract, stage and source")
+
+    scheduler = StreamingScheduler(
+        build_streaming_tasks(schedule, skip_steps | done_steps),
+        on_complete=recorder.record_step if recorder else None,
+        deadline=deadline,
+        profiler=profiler
+    )
+    for step in sorted(done_steps):
+        logger.info(f"[STEP_SKIPPED] STREAMING - {step} already completed")
+        scheduler.mark_done(step)
+
+    def on_artifact(dataset: str, result: Dict[str, Any]) -> None:
+        logger.info(f"[STEP_COMPLETE] STREAMING - Artifact ready for {dataset}: {result.get('s3_path')}")
+        if recorder:
+            recorder.record_artifact(dataset, result)
+        scheduler.mark_done(f"extract:{dataset}")
+
+    extract_error = None
+    suspended = None
+    try:
+        if schedule == "daily":
+            run_daily_extract_pipelines(
+                on_artifact=on_artifact, options=options, skip_steps=skip_steps | done_steps, profiler=profiler
+            )
+        else:
+            run_weekly_extract_pipelines(
+                on_artifact=on_artifact, skip_steps=skip_steps | done_steps, options=options, deadline=deadline,
+                profiler=profiler
+            )
+    except DeadlineExceeded as e:
+        suspended = e
+    except Exception as e:
+        # Let loads for artifacts that already landed finish before reporting the failure
+        extract_error = str(e)
+        logger.error(f"[STEP_FAILED] STREAMING - Extract failed: {e}")
+
+    result = scheduler.wait()
+    if extract_error:
+        result.failed["extract"] = extract_error
+    elif not result.failed and (suspended or (result.not_run and deadline is not None and deadline.expired)):
+        logger.warning(f"[PIPELINE_SUSPENDED] {schedule.upper()} STREAMING - Deadline reached, not run: {result.not_run}")
+        raise suspended or DeadlineExceeded(result.not_run[0])
+
+    if result.success:
+        logger.info(f"[PIPELINE_COMPLETE] {schedule.upper()} STREAMING - Completed {len(result.completed)} loads")
+    else:
+        logger.error(f"[PIPELINE_FAILED] {schedule.upper()} STREAMING - Failed: {result.failed}, not run: {result.not_run}")
+    return result
@@ -2,11 +2,13 @@ import os
 import boto3
 import json
 import gzip
+import hashlib
+import tempfile
 from dataclasses import dataclass
 from datetime import datetime
 from dotenv import load_dotenv
 from zoneinfo import ZoneInfo
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 @dataclass
 class S3Config:
@@ -60,10 +62,182 @@ def generate_config(env: str):
         )
 
 
+class JSONObjectStreamWriter:
+    """
+    Incrementally writes a single JSON object to a gzip-compressed S3 object.
+
+    Items are serialised and compressed one at a time into a spooled temporary file
+    (in memory up to spool_max_bytes, then on local disk), so memory use does not grow
+    with the number of items. The object is uploaded when the writer is closed; the
+    extraction metadata keys are appended last, matching save_json, and the sha256 of
+    the uncompressed JSON is stored in the object metadata.
+    """
+
+    def __init__(self, s3_client, bucket_name: str, s3_key: str, spool_max_bytes: int = 32 * 1024 * 1024):
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.s3_key = s3_key
+        self.s3_path = f"s3://{bucket_name}/{s3_key}"
+        self.items_written = 0
+        self.bytes_written = 0
+        self._sha256 = hashlib.sha256()
+        self._spool = tempfile.SpooledTemporaryFile(max_size=spool_max_bytes)
+        self._gzip = gzip.GzipFile(fileobj=self._spool, mode='wb')
+        self._write(b'{')
+
+    def _write(self, chunk: bytes) -> None:
+        self._gzip.write(chunk)
+        self._sha256.update(chunk)
+        self.bytes_written += len(chunk)
+
+    def write_item(self, key: str, value: Any) -> None:
+        """Append one key/value pair to the JSON object"""
+        separator = b',' if self.items_written else b''
+        self._write(separator + json.dumps(str(key)).encode('utf-8') + b':' + json.dumps(value).encode('utf-8'))
+        self.items_written += 1
+
+    def close(self) -> str:
+        """Finish the JSON object, upload it and return its S3 path"""
+        now = datetime.now(ZoneInfo("Australia/Sydney"))
+        metadata = {
+            "extraction_timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "extraction_date": now.strftime("%Y-%m-%d"),
+        }
+        for key, value in metadata.items():
+            self.write_item(key, value)
+        self._write(b'}')
+        self._gzip.close()
+
+        self._spool.seek(0)
+        self.s3_client.upload_fileobj(
+            self._spool,
+            self.bucket_name,
+            self.s3_key,
+            ExtraArgs={
+                'ContentType': 'application/json',
+                'ContentEncoding': 'gzip',
+                'Metadata': {'sha256': self.sha256}
+            }
+        )
+        self._spool.close()
+        return self.s3_path
+
+    @property
+    def sha256(self) -> str:
+        """Hex sha256 of the uncompressed JSON written so far"""
+        return self._sha256.hexdigest()
+
+    def abort(self) -> None:
+        """Discard everything written without uploading"""
+        self._gzip.close()
+        self._spool.close()
+
+
+class NDJSONShardWriter:
+    """
+    Streams rows as newline-delimited JSON into a series of gzip-compressed S3 objects.
+
+    Each shard holds at most rows_per_shard rows and is compressed into a spooled temporary
+    file, then uploaded as soon as it is full, so only one shard is ever held locally however
+    many rows are written. Every row gets the extraction metadata keys of the writer, so each
+    line loads into a staging table like a whole save_json object does. Shards are named
+    {key_prefix}_shard_NNN.ndjson.gz and recorded with their row count and sha256.
+    """
+
+    def __init__(self, s3_client, bucket_name: str, key_prefix: str, rows_per_shard: int = 100_000,
+                 spool_max_bytes: int = 32 * 1024 * 1024):
+        if rows_per_shard < 1:
+            raise ValueError(f"Invalid shard size {rows_per_shard}. Must be at least 1")
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.key_prefix = key_prefix
+        self.rows_per_shard = rows_per_shard
+        self.spool_max_bytes = spool_max_bytes
+        self.rows_written = 0
+        self.shards: List[Dict[str, Any]] = []
+        now = datetime.now(ZoneInfo("Australia/Sydney"))
+        self._metadata = {
+            "extraction_timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "extraction_date": now.strftime("%Y-%m-%d"),
+        }
+        self._spool = None
+        self._gzip = None
+        self._sha256 = None
+        self._shard_rows = 0
+
+    def _open_shard(self) -> None:
+        self._spool = tempfile.SpooledTemporaryFile(max_size=self.spool_max_bytes)
+        self._gzip = gzip.GzipFile(fileobj=self._spool, mode='wb')
+        self._sha256 = hashlib.sha256()
+        self._shard_rows = 0
+
+    def _upload_shard(self) -> None:
+        self._gzip.close()
+        s3_key = f"{self.key_prefix}_shard_{len(self.shards):03d}.ndjson.gz"
+        sha256 = self._sha256.hexdigest()
+        self._spool.seek(0)
+        self.s3_client.upload_fileobj(
+            self._spool,
+            self.bucket_name,
+            s3_key,
+            ExtraArgs={
+                'ContentType': 'application/x-ndjson',
+                'ContentEncoding': 'gzip',
+                'Metadata': {'sha256': sha256}
+            }
+        )
+        self._spool.close()
+        self._spool = None
+        self.shards.append({
+            "s3_key": s3_key,
+            "filename": s3_key.rsplit("/", 1)[-1],
+            "rows": self._shard_rows,
+            "sha256": sha256,
+        })
+
+    def write_row(self, row: Dict[str, Any]) -> None:
+        """Append one row, uploading the current shard first if it is full"""
+        if self._spool is None:
+            self._open_shard()
+        line = json.dumps({**row, **self._metadata}).encode('utf-8') + b'\n'
+        self._gzip.write(line)
+        self._sha256.update(line)
+        self._shard_rows += 1
+        self.rows_written += 1
+        if self._shard_rows >= self.rows_per_shard:
+            self._upload_shard()
+
+    def close(self) -> List[Dict[str, Any]]:
+        """Upload the last, partly filled shard and return every shard written"""
+        if self._spool is not None:
+            self._upload_shard()
+        return self.shards
+
+    def abort(self) -> None:
+        """Discard the shard being written; shards already uploaded are left in place but not returned"""
+        if self._spool is not None:
+            self._gzip.close()
+            self._spool.close()
+            self._spool = None
+
+
 class S3DataLake:
     def __init__(self):
-        self.config = generate_config("prd")
-        self.s3_client = self._create_boto3_client()
+        # SSM secrets and the boto3 client are resolved on first use, not at construction
+        self._config: Optional[S3Config] = None
+        self._s3_client = None
+
+    @property
+    def config(self) -> S3Config:
+        if self._config is None:
+            self._config = generate_config("prd")
+        return self._config
+
+    @property
+    def s3_client(self):
+        if self._s3_client is None:
+            self._s3_client = self._create_boto3_client()
+        return self._s3_client
     
     def _create_boto3_client(self):
         """Create boto3 S3 client with optional credentials"""
@@ -82,6 +256,102 @@ class S3DataLake:
         return f"{self.config.prefix}/{data_type}/{filename}"
         
     
+    def open_json_writer(self, data_type: str, filename: str) -> JSONObjectStreamWriter:
+        """Open a streaming writer for a gzip-compressed JSON object, keyed like save_json"""
+        compressed_filename = filename if filename.endswith('.gz') else filename.replace('.json', '.json.gz')
+        s3_key = self._generate_s3_key(data_type, compressed_filename)
+        return JSONObjectStreamWriter(self.s3_client, self.config.bucket_name, s3_key)
+
+    def open_ndjson_writer(self, data_type: str, filename_prefix: str, rows_per_shard: int = 100_000) -> NDJSONShardWriter:
+        """Open a writer streaming rows to gzip-compressed NDJSON shards named {filename_prefix}_shard_NNN.ndjson.gz"""
+        key_prefix = self._generate_s3_key(data_type, filename_prefix)
+        return NDJSONShardWriter(self.s3_client, self.config.bucket_name, key_prefix, rows_per_shard)
+
+    def load_json(self, data_type: str, filename: str) -> Optional[Dict[str, Any]]:
+        """Load a gzip-compressed JSON object written by save_json, or None if it does not exist"""
+        compressed_filename = filename if filename.endswith('.gz') else filename.replace('.json', '.json.gz')
+        s3_key = self._generate_s3_key(data_type, compressed_filename)
+        try:
+            response = self.s3_client.get_object(Bucket=self.config.bucket_name, Key=s3_key)
+        except self.s3_client.exceptions.NoSuchKey:
+            return None
+        return json.loads(gzip.decompress(response['Body'].read()))
+
+    def list_json(self, data_type: str) -> List[str]:
+        """Filenames of every object stored under a data type, e.g. bootstrap_20250801.json.gz"""
+        prefix = self._generate_s3_key(data_type, "")
+        filenames = []
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.config.bucket_name, Prefix=prefix):
+            for item in page.get('Contents', []):
+                filename = item['Key'][len(prefix):]
+                if filename and "/" not in filename:
+                    filenames.append(filename)
+        return sorted(filenames)
+
+    def head_json(self, data_type: str, filename: str) -> Optional[Dict[str, Any]]:
+        """Return the S3 key, content hash, size and upload time of an object written by save_json, or None if it does not exist"""
+        compressed_filename = filename if filename.endswith('.gz') else filename.replace('.json', '.json.gz')
+        s3_key = self._generate_s3_key(data_type, compressed_filename)
+        try:
+            response = self.s3_client.head_object(Bucket=self.config.bucket_name, Key=s3_key)
+        except self.s3_client.exceptions.ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            raise
+        return {
+            "s3_key": s3_key,
+            # Objects written before content hashes were recorded fall back to the ETag
+            "sha256": response.get('Metadata', {}).get('sha256') or response['ETag'].strip('"'),
+            "compressed_bytes": response['ContentLength'],
+            "last_modified": response['LastModified'].isoformat(),
+        }
+
+    def put_bytes(
+        self,
+        data_type: str,
+        filename: str,
+        body: bytes,
+        content_type: str = 'application/json',
+        content_encoding: Optional[str] = None,
+        cache_control: Optional[str] = None
+    ) -> str:
+        """Upload bytes as they are under a data type, with the HTTP headers readers should get, and return the S3 path"""
+        s3_key = self._generate_s3_key(data_type, filename)
+        extra_args = {'ContentType': content_type}
+        if content_encoding:
+            extra_args['ContentEncoding'] = content_encoding
+        if cache_control:
+            extra_args['CacheControl'] = cache_control
+        self.s3_client.put_object(Bucket=self.config.bucket_name, Key=s3_key, Body=body, **extra_args)
+        return f"s3://{self.config.bucket_name}/{s3_key}"
+
+    def get_bytes(self, data_type: str, filename: str) -> Optional[bytes]:
+        """Download an object written by put_bytes as stored, or None if it does not exist"""
+        s3_key = self._generate_s3_key(data_type, filename)
+        try:
+            response = self.s3_client.get_object(Bucket=self.config.bucket_name, Key=s3_key)
+        except self.s3_client.exceptions.NoSuchKey:
+            return None
+        return response['Body'].read()
+
+    def download_file(self, data_type: str, filename: str, path: str) -> bool:
+        """Stream an object to a local file without holding it in memory; False if it does not exist"""
+        s3_key = self._generate_s3_key(data_type, filename)
+        try:
+            self.s3_client.download_file(self.config.bucket_name, s3_key, path)
+        except self.s3_client.exceptions.ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+        return True
+
+    def upload_file(self, data_type: str, path: str, filename: str, content_type: str = 'application/octet-stream') -> str:
+        """Stream a local file to S3 under a data type (multipart when large) and return the S3 path"""
+        s3_key = self._generate_s3_key(data_type, filename)
+        self.s3_client.upload_file(path, self.config.bucket_name, s3_key, ExtraArgs={'ContentType': content_type})
+        return f"s3://{self.config.bucket_name}/{s3_key}"
+
     def save_json(self, data: Dict[str, Any], data_type: str, filename: str) -> str:
         """Save JSON data to S3 with gzip compression"""
         # Add .gz extension for compressed files
@@ -101,13 +371,14 @@ class S3DataLake:
         json_data = json.dumps(data).encode('utf-8')
         compressed_data = gzip.compress(json_data)
         
-        # Upload compressed data to S3
+        # Upload compressed data to S3, recording the content hash for run manifests
         self.s3_client.put_object(
             Bucket=self.config.bucket_name,
             Key=s3_key,
             Body=compressed_data,
             ContentType='application/json',
-            ContentEncoding='gzip'
+            ContentEncoding='gzip',
+            Metadata={'sha256': hashlib.sha256(json_data).hexdigest()}
         )
         
         return s3_path
\ No newline at end of file
@@ -4,13 +4,22 @@ import logging
 import os
 from dataclasses import dataclass
 from dotenv import load_dotenv
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List, Sequence
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.backends import default_backend
 
 
 logger = logging.getLogger(__name__)
 
+# First column of the one-row summary Snowflake returns for DML, COPY and DDL statements. These are
+# lower case, unlike unquoted query columns; callers get the statement's row count instead
+SUMMARY_COLUMNS = ("number of rows inserted", "number of rows updated", "number of rows deleted", "file", "status")
+
+def returns_rows(cursor) -> bool:
+    """Whether an executed statement produced a result set, judged from the cursor's description"""
+    description = cursor.description
+    return description is not None and not description[0][0].startswith(SUMMARY_COLUMNS)
+
 @dataclass
 class SnowflakeConfig:
     """Snowflake configuration for data warehouse"""
@@ -146,8 +155,8 @@ class SnowflakeClient:
             else:
                 cursor.execute(sql)
             
-            # Return results if it's a SELECT statement
-            if sql.strip().upper().startswith('SELECT'):
+            # Return results for statements that produce a result set
+            if returns_rows(cursor):
                 return cursor.fetchall()
             
             # Return affected rows count for DML statements
@@ -160,6 +169,70 @@ class SnowflakeClient:
         finally:
             cursor.close()
     
+    def _execute(self, sql: str, params: Optional[tuple] = None):
+        """Execute a statement and return its open cursor; the caller closes it"""
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(sql, params) if params else cursor.execute(sql)
+            return cursor
+        except Exception as e:
+            cursor.close()
+            logger.error(f"SQL execution failed: {e}")
+            logger.error(f"SQL: {sql}")
+            raise
+
+    def fetch_arrow(self, sql: str, params: Optional[tuple] = None):
+        """Execute a query and return the whole result as a pyarrow.Table, empty if there are no rows"""
+        cursor = self._execute(sql, params)
+        try:
+            return cursor.fetch_arrow_all(force_return_table=True)
+        finally:
+            cursor.close()
+
+    def iter_arrow_batches(self, sql: str, params: Optional[tuple] = None) -> Iterator[Any]:
+        """
+        Execute a query and yield its result as pyarrow.RecordBatch objects, one result chunk at a time.
+
+        Only the chunk being read is held in memory, so large results can be scanned without
+        materialising them. Close the generator (or exhaust it) to release the cursor.
+        """
+        cursor = self._execute(sql, params)
+        try:
+            for table in cursor.fetch_arrow_batches():
+                yield from table.to_batches()
+        finally:
+            cursor.close()
+
+    def iter_rows(self, sql: str, params: Optional[tuple] = None, batch_size: int = 10000) -> Iterator[tuple]:
+        """Execute a query and yield its rows as tuples, fetching batch_size rows at a time"""
+        cursor = self._execute(sql, params)
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
+    def insert_rows(self, table_name: str, columns: Sequence[str], rows: Sequence[Sequence[Any]], batch_size: int = 10000) -> int:
+        """Insert rows into a table in batched statements and return the number inserted"""
+        # Snowflake caps a VALUES list at 16,384 rows
+        placeholders = ", ".join(["%s"] * len(columns))
+        sql = f"INSERT INTO FPL_STATS.FPL_SCHEMA.{table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+        inserted = 0
+        cursor = self.connection.cursor()
+        try:
+            for offset in range(0, len(rows), batch_size):
+                cursor.executemany(sql, [tuple(row) for row in rows[offset:offset + batch_size]])
+                inserted += cursor.rowcount
+            return inserted
+        except Exception as e:
+            logger.error(f"Insert into {table_name} failed: {e}")
+            raise
+        finally:
+            cursor.close()
+
     def execute_sql_file(self, sql_file_path: str, params: Optional[tuple] = None) -> Optional[Any]:
         """Execute SQL from a file"""
         try: